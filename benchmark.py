@@ -0,0 +1,188 @@
+import argparse
+import contextlib
+import importlib.util
+import inspect
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from notebook_assets import ASSET_MODES, DEFAULT_ASSET_MODE
+from notebook_creation import REQUIRED_COLUMNS, StageTimings, generate_notebook
+from notebook_writer import orjson
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+DEFAULT_FORMATS = ["csv", "xlsx"]
+
+_WORDS = ["נתונים", "מודל", "למידה", "פונקציה", "רשימה", "גרף", "משתנה", "ממוצע", "אימון", "בדיקה",
+          "data", "model", "pandas", "numpy", "<b>שימו לב</b>", "<br>"]
+
+
+def _text(rng, low, high):
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(low, high)))
+
+
+def make_cells_sheet(n_rows, seed=0):
+    """
+    Synthetic cells sheet shaped like a real assignment: a header, then sections of questions,
+    each with content, sub-questions, code cells, hints, images and the occasional stop cell.
+    :return: DataFrame with REQUIRED_COLUMNS and n_rows rows.
+    """
+    rng = random.Random(seed)
+    rows = []
+
+    def add(element_type, cell_type, raw_content=None, serial_number=None, header_level=None):
+        rows.append({'Element_Type': element_type, 'Serial_Number': serial_number, 'Raw_Content': raw_content,
+                     'Cell_Type': cell_type, 'Header_Level': header_level, 'Anchor_ID': f"cell-{len(rows)}"})
+
+    add('HEADER', 'text', _text(rng, 3, 6), header_level=1)
+    section = 0
+    while len(rows) < n_rows:
+        section += 1
+        add('SECTION_TITLE', 'text', _text(rng, 2, 5), section, 2)
+        add('SECTION_TEXT', 'text', _text(rng, 20, 80))
+        for question in range(1, rng.randint(2, 6)):
+            add('Q_TITLE', 'text', _text(rng, 0, 4), question, 3)
+            add('Q_CONTENT', 'text', _text(rng, 10, 60))
+            if rng.random() < 0.2:
+                add('IMAGE', 'text', f"https://example.com/images/{section}_{question}.png")
+            for sub_question in range(1, rng.randint(1, 4)):
+                add('SUB_Q_TITLE', 'text', _text(rng, 0, 10), sub_question, 4)
+                add('CODE', 'code', None if rng.random() < 0.7 else "df = pd.read_csv('data.csv')\ndf.head()")
+            if rng.random() < 0.3:
+                add('HINT_CONTENT', 'text', _text(rng, 5, 20))
+            if rng.random() < 0.2:
+                add('EXPLANATION', 'text', _text(rng, 10, 40))
+        if rng.random() < 0.5:
+            add('STOP_CELL', 'text')
+    return pd.DataFrame(rows[:n_rows], columns=REQUIRED_COLUMNS)
+
+
+def write_cells_sheet(df, path):
+    if path.endswith(".csv"):
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False)
+
+
+def load_generate_notebook(module_file):
+    """
+    Loads generate_notebook from another copy of notebook_creation.py, e.g. one taken from an older revision with
+    `git show <rev>:notebook_creation.py`, so both revisions are measured by the same harness.
+    """
+    spec = importlib.util.spec_from_file_location("benchmarked_notebook_creation", module_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.generate_notebook
+
+
+def benchmark_file(input_file, n_rows, repeat=3, generate=generate_notebook, **generate_kwargs):
+    """
+    Times generate_notebook on one sheet: best of `repeat` runs, then one more run under tracemalloc for peak memory.
+    :param generate: generate_notebook to measure; per-stage timings are only reported if it accepts `timings`.
+    :return: Result dict with seconds, rows_per_sec, per-stage seconds, peak memory and output size.
+    """
+    output_notebook = os.path.splitext(input_file)[0] + ".ipynb"
+    timed = "timings" in inspect.signature(generate).parameters
+    best = None
+    # Keep stdout for the JSON report.
+    with contextlib.redirect_stdout(sys.stderr):
+        for _ in range(repeat):
+            timings = StageTimings()
+            kwargs = dict(generate_kwargs, timings=timings) if timed else generate_kwargs
+            start = time.perf_counter()
+            generate(input_file, output_notebook, **kwargs)
+            seconds = time.perf_counter() - start
+            if best is None or seconds < best[0]:
+                best = (seconds, timings.seconds)
+
+        tracemalloc.start()
+        generate(input_file, output_notebook, **generate_kwargs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    seconds, stages = best
+    return {"rows": n_rows, "format": os.path.splitext(input_file)[1][1:],
+            "stream": generate_kwargs.get("stream", False), "assets": generate_kwargs.get("assets", DEFAULT_ASSET_MODE),
+            "seconds": seconds, "rows_per_sec": n_rows / seconds, "stages": stages,
+            "peak_memory_bytes": peak_memory, "input_bytes": os.path.getsize(input_file),
+            "output_bytes": os.path.getsize(output_notebook)}
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, formats=DEFAULT_FORMATS, repeat=3, work_dir=None, generate=generate_notebook,
+                   **generate_kwargs):
+    """
+    :return: Report dict with environment info and one result per (size, format).
+    """
+    results = []
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp_dir:
+        for n_rows in sizes:
+            df = make_cells_sheet(n_rows)
+            for file_format in formats:
+                input_file = os.path.join(tmp_dir, f"bench_{n_rows}_cells.{file_format}")
+                write_cells_sheet(df, input_file)
+                result = benchmark_file(input_file, n_rows, repeat, generate, **generate_kwargs)
+                print(f"{n_rows:>7} rows {file_format:>4}: {result['seconds']:.3f}s, "
+                      f"{result['rows_per_sec']:,.0f} rows/s, peak {result['peak_memory_bytes'] / 2 ** 20:.1f} MB",
+                      file=sys.stderr)
+                results.append(result)
+    return {"python": platform.python_version(), "pandas": pd.__version__, "orjson": orjson is not None,
+            "platform": platform.platform(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}
+
+
+def compare_reports(baseline, current):
+    """
+    Prints the speedup of current over baseline for every (rows, format, stream, assets) both reports contain.
+    """
+    def key(result):
+        return result["rows"], result["format"], result["stream"], result["assets"]
+
+    baseline_results = {key(result): result for result in baseline["results"]}
+    for result in current["results"]:
+        old = baseline_results.get(key(result))
+        if old is None:
+            continue
+        print(f"{result['rows']:>7} rows {result['format']:>4}: {old['seconds']:.3f}s -> {result['seconds']:.3f}s "
+              f"({old['seconds'] / result['seconds']:.2f}x), "
+              f"peak {old['peak_memory_bytes'] / 2 ** 20:.1f} -> {result['peak_memory_bytes'] / 2 ** 20:.1f} MB",
+              file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark notebook generation on synthetic cells sheets.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Sheet sizes in rows.")
+    parser.add_argument("--formats", nargs="+", choices=DEFAULT_FORMATS, default=DEFAULT_FORMATS)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per sheet, the best one is reported.")
+    parser.add_argument("--stream", action="store_true", help="Benchmark stream mode.")
+    parser.add_argument("--assets", choices=ASSET_MODES, default=DEFAULT_ASSET_MODE, help="Asset mode to benchmark.")
+    parser.add_argument("--module", help="Benchmark the generate_notebook of this notebook_creation.py instead, "
+                                         "e.g. an older revision. Only default options are passed to it.")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against.")
+    args = parser.parse_args(argv)
+
+    if args.module:
+        report = run_benchmarks(args.sizes, args.formats, args.repeat, generate=load_generate_notebook(args.module))
+    else:
+        report = run_benchmarks(args.sizes, args.formats, args.repeat, stream=args.stream, assets=args.assets)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare_reports(json.load(f), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+from notebook_assets import ASSET_MODES, DEFAULT_ASSET_BASE_URL, DEFAULT_ASSET_MODE
+from notebook_cache import CACHE_DIR, DEFAULT_MAX_BYTES, NotebookCache
+from notebook_creation import StageTimings, generate_notebook
+from notebook_writer import validate_notebook
+
+CELLS_DIR = "extracted_cells"
+NOTEBOOKS_DIR = "new_notebooks"
+CELLS_SUFFIX = "_cells"
+SUPPORTED_FORMATS = (".xlsx", ".csv")
+
+# One cache connection per worker process, opened on first use.
+_caches = {}
+
+
+def notebook_path_for(input_file, output_dir=NOTEBOOKS_DIR):
+    """
+    Maps extracted_cells/<name>_cells.<ext> to <output_dir>/<name>.ipynb.
+    """
+    name = os.path.splitext(os.path.basename(input_file))[0]
+    if name.endswith(CELLS_SUFFIX):
+        name = name[:-len(CELLS_SUFFIX)]
+    return os.path.join(output_dir, f"{name}.ipynb")
+
+
+def mirrored_dir(path, source_dir, target_dir):
+    """
+    Maps the directory of source_dir/<dir>/<file> to target_dir/<dir>.
+    """
+    relative_dir = os.path.relpath(os.path.dirname(path), source_dir)
+    return os.path.normpath(os.path.join(target_dir, relative_dir))
+
+
+def mirrored_notebook_path(input_file, cells_dir=CELLS_DIR, output_dir=NOTEBOOKS_DIR):
+    """
+    Maps extracted_cells/<dir>/<name>_cells.<ext> to <output_dir>/<dir>/<name>.ipynb.
+    """
+    return notebook_path_for(input_file, mirrored_dir(input_file, cells_dir, output_dir))
+
+
+def is_cells_file(name):
+    # Excel keeps "~$<name>" lock files next to open workbooks.
+    if name.startswith(("~$", ".")):
+        return False
+    return any(name.endswith(f"{CELLS_SUFFIX}{file_format}") for file_format in SUPPORTED_FORMATS)
+
+
+def iter_cells_files(cells_dir=CELLS_DIR):
+    """
+    Yields every *_cells.xlsx / *_cells.csv file under cells_dir, subdirectories included.
+    """
+    for root, dirs, names in os.walk(cells_dir):
+        dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+        for name in sorted(names):
+            if is_cells_file(name):
+                yield os.path.join(root, name)
+
+
+def find_cells_files(cells_dir=CELLS_DIR, output_dir=NOTEBOOKS_DIR):
+    """
+    Finds every cells file under cells_dir, mirroring its subdirectories under output_dir.
+    When a sheet exists in both formats the Excel one wins, same as the default in notebook_creation.
+
+    :return: List of (input_file, output_notebook) pairs, sorted by input name.
+    """
+    jobs = {}
+    for input_file in iter_cells_files(cells_dir):
+        output_notebook = mirrored_notebook_path(input_file, cells_dir, output_dir)
+        if output_notebook not in jobs or input_file.endswith(".xlsx"):
+            jobs[output_notebook] = input_file
+    return sorted(((input_file, output_notebook) for output_notebook, input_file in jobs.items()),
+                  key=lambda job: job[0])
+
+
+def read_manifest(manifest_file, output_dir=NOTEBOOKS_DIR):
+    """
+    Reads a build manifest: one "input_file[,output_notebook]" per line, '#' starts a comment.
+    A missing output_notebook is derived from the input name.
+
+    :return: List of (input_file, output_notebook) pairs in manifest order.
+    """
+    jobs = []
+    with open(manifest_file, newline='', encoding='utf-8') as f:
+        for line in csv.reader(f):
+            fields = [field.strip() for field in line]
+            if not fields or not fields[0] or fields[0].startswith("#"):
+                continue
+            input_file = fields[0]
+            output_notebook = fields[1] if len(fields) > 1 and fields[1] else notebook_path_for(input_file, output_dir)
+            jobs.append((input_file, output_notebook))
+    return jobs
+
+
+def _get_cache(cache_dir, cache_max_bytes):
+    key = (cache_dir, cache_max_bytes)
+    if key not in _caches:
+        _caches[key] = NotebookCache(cache_dir, cache_max_bytes)
+    return _caches[key]
+
+
+def run_jobs(pool, work, jobs, summary=None, details=None):
+    """
+    Runs work(job) for every (input_file, output_file) job on pool and prints a status line as each one finishes.
+    A worker process that dies only fails its own job, the rest of the batch goes on.
+
+    :param work: Picklable function returning a result dict with input, output, ok, seconds and error.
+    :param summary: Optional function of a result giving the text in parentheses, defaults to its seconds.
+    :param details: Optional function of a result giving extra lines to print under it.
+    :return: List of results, in the order of jobs.
+    """
+    results = [None] * len(jobs)
+    futures = {pool.submit(work, job): index for index, job in enumerate(jobs)}
+    for future in as_completed(futures):
+        index = futures[future]
+        input_file, output_file = jobs[index]
+        try:
+            result = future.result()
+        except Exception as e:
+            # The worker process itself died (e.g. killed or out of memory).
+            result = {"input": input_file, "output": output_file, "ok": False,
+                      "seconds": 0.0, "error": f"{type(e).__name__}: {e}"}
+        results[index] = result
+
+        status = "OK  " if result["ok"] else "FAIL"
+        text = summary(result) if summary is not None else f"{result['seconds']:.2f}s"
+        print(f"[{status}] {result['input']} -> {result['output']} ({text})")
+        for line in details(result) if details is not None else ():
+            print(f"       {line}")
+        if not result["ok"]:
+            print(f"       {result['error']}")
+    return results
+
+
+def build_notebook(job, cache_dir=None, cache_max_bytes=DEFAULT_MAX_BYTES, force=False,
+                   assets=DEFAULT_ASSET_MODE, asset_base_url=DEFAULT_ASSET_BASE_URL, stream=False):
+    """
+    Runs generate_notebook for a single (input_file, output_notebook) pair, reporting errors in the result.
+
+    :param cache_dir: Directory of the incremental build cache, None to build without a cache.
+    :param force: Rebuild even when the cache says the notebook is up to date.
+    :param assets: How banner images are stored, see notebook_assets.ASSET_MODES.
+    :param asset_base_url: Where the images are hosted in "linked" mode.
+    :param stream: Generate in bounded memory, see generate_notebook.
+    :return: Dict with input, output, ok, seconds, per-stage seconds and error (None on success).
+    """
+    input_file, output_notebook = job
+    timings = StageTimings()
+    start = time.perf_counter()
+    error = None
+    try:
+        output_dir = os.path.dirname(output_notebook)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        cache = _get_cache(cache_dir, cache_max_bytes) if cache_dir else None
+        generate_notebook(input_file, output_notebook, cache=cache, force=force,
+                          assets=assets, asset_base_url=asset_base_url, stream=stream, timings=timings)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {"input": input_file, "output": output_notebook, "ok": error is None,
+            "seconds": time.perf_counter() - start, "stages": timings.seconds, "error": error}
+
+
+def _stage_timings(result):
+    stages = result.get("stages")
+    return [", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in stages.items())] if stages else []
+
+
+def check_notebook(output_notebook):
+    """
+    Validates one generated notebook against the nbformat schema.
+    :return: None when valid, else the error message.
+    """
+    try:
+        validate_notebook(output_notebook)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def build_course(jobs, workers=None, cache_dir=None, cache_max_bytes=DEFAULT_MAX_BYTES, force=False,
+                 assets=DEFAULT_ASSET_MODE, asset_base_url=DEFAULT_ASSET_BASE_URL, stream=False, validate=False,
+                 show_timings=False):
+    """
+    Generates all notebooks in jobs, spread over a pool of worker processes.
+
+    :param jobs: List of (input_file, output_notebook) pairs.
+    :param workers: Number of worker processes, defaults to the number of CPUs.
+    :param cache_dir: Directory of the incremental build cache, None to build without a cache.
+    :param cache_max_bytes: Size limit of the cached cells.
+    :param force: Rebuild every notebook, ignoring the cache.
+    :param assets: How banner images are stored, see notebook_assets.ASSET_MODES.
+    :param asset_base_url: Where the images are hosted in "linked" mode.
+    :param stream: Generate in bounded memory, see generate_notebook.
+    :param validate: After the build, validate every generated notebook against the nbformat schema.
+    :param show_timings: Print the per-stage timings of every notebook.
+    :return: List of per-notebook results (see build_notebook), in the order of jobs.
+    """
+    if not jobs:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        build = partial(build_notebook, cache_dir=cache_dir, cache_max_bytes=cache_max_bytes, force=force,
+                        assets=assets, asset_base_url=asset_base_url, stream=stream)
+        results = run_jobs(pool, build, jobs, details=_stage_timings if show_timings else None)
+
+        if validate:
+            built = [result for result in results if result["ok"]]
+            for result, error in zip(built, pool.map(check_notebook, [result["output"] for result in built])):
+                if error is not None:
+                    result.update(ok=False, error=error)
+                    print(f"[FAIL] {result['output']} is not a valid notebook")
+                    print(f"       {error}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build every course notebook from its cells sheet.")
+    parser.add_argument("--cells-dir", default=CELLS_DIR, help="Directory tree with *_cells.xlsx / *_cells.csv files.")
+    parser.add_argument("--output-dir", default=NOTEBOOKS_DIR, help="Directory for the generated notebooks.")
+    parser.add_argument("--manifest", help="Build only the files listed in this manifest instead of scanning cells-dir.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Directory of the incremental build cache.")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / 2 ** 20,
+                        help="Size limit of the cached cells, in MB.")
+    parser.add_argument("--no-cache", action="store_true", help="Build without reading or updating the cache.")
+    parser.add_argument("--force", action="store_true", help="Rebuild every notebook, even unchanged ones.")
+    parser.add_argument("--assets", choices=ASSET_MODES, default=DEFAULT_ASSET_MODE,
+                        help="Embed banner images inline, or link them from asset-base-url.")
+    parser.add_argument("--asset-base-url", default=DEFAULT_ASSET_BASE_URL,
+                        help="Where the banner images are hosted, for --assets linked.")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read, render and write sheets incrementally, for very large workbooks.")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate every generated notebook against the nbformat schema after the build.")
+    parser.add_argument("--timings", action="store_true", help="Print per-stage timings of every notebook.")
+    args = parser.parse_args(argv)
+
+    if args.manifest:
+        jobs = read_manifest(args.manifest, args.output_dir)
+    else:
+        jobs = find_cells_files(args.cells_dir, args.output_dir)
+    if not jobs:
+        print("No cells files found.")
+        return 0
+
+    start = time.perf_counter()
+    cache_dir = None if args.no_cache else args.cache_dir
+    results = build_course(jobs, args.workers, cache_dir, int(args.cache_max_mb * 2 ** 20), args.force,
+                           args.assets, args.asset_base_url, args.stream, args.validate, args.timings)
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if not result["ok"]]
+    total_work = sum(result["seconds"] for result in results)
+    print(f"Built {len(results) - len(failed)}/{len(results)} notebooks in {elapsed:.2f}s "
+          f"({total_work:.2f}s of notebook work).")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import base64
+import hashlib
+import os
+from functools import lru_cache
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+# inline: data URI in the cell source, linked: URL under base_url.
+# There is no attachment mode: nbformat attachments belong to a single cell, so every stop cell
+# would carry its own copy of the image and the notebook would be no smaller than inline.
+ASSET_MODES = ("inline", "linked")
+DEFAULT_ASSET_MODE = "inline"
+# Relative to new_notebooks/, so linked notebooks render from a checkout of the repo.
+DEFAULT_ASSET_BASE_URL = "../assets"
+
+
+@lru_cache(maxsize=None)
+def load_asset(file_name):
+    """
+    Reads an image from ASSETS_DIR once per process.
+    :return: The image encoded as base64 text.
+    """
+    with open(os.path.join(ASSETS_DIR, file_name), 'rb') as f:
+        return base64.b64encode(f.read()).decode('ascii')
+
+
+@lru_cache(maxsize=None)
+def _asset_digest(file_name):
+    with open(os.path.join(ASSETS_DIR, file_name), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def assets_fingerprint(file_names, mode=DEFAULT_ASSET_MODE, base_url=DEFAULT_ASSET_BASE_URL):
+    """
+    Identifies how the images end up in a notebook, so cached notebooks are rebuilt when it changes.
+    Linked notebooks only depend on the URLs, not on the image bytes.
+    """
+    if mode == "linked":
+        return f"linked:{base_url}"
+    return f"{mode}:" + ",".join(_asset_digest(file_name) for file_name in file_names)
+
+
+def image_cell(template, file_name, mode=DEFAULT_ASSET_MODE, base_url=DEFAULT_ASSET_BASE_URL):
+    """
+    Fills the {image} slot of a banner cell template.
+    :param template: Markdown with an {image} slot, e.g. notebook_creation.STOP_CELL.
+    :param file_name: Image in ASSETS_DIR.
+    :param mode: One of ASSET_MODES.
+    :return: The cell source.
+    """
+    if mode == "inline":
+        return template.format(image=f"data:image/png;base64,{load_asset(file_name)}")
+    if mode == "linked":
+        return template.format(image=f"{base_url.rstrip('/')}/{file_name}")
+    raise ValueError(f"Unsupported asset mode: {mode} --> {' / '.join(ASSET_MODES)} only.")
@@ -0,0 +1,192 @@
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import time
+
+import notebook_creation as nc
+
+CACHE_DIR = ".notebook_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when generated notebooks change in a way the fingerprint cannot see, e.g. the JSON layout or the cell ids.
+FORMAT_VERSION = 2
+
+_ROW_FIELDS = ['element_type', 'serial_number', 'raw_content', 'cell_type', 'header_level']
+
+
+def _rendering_code():
+    """
+    Source of the functions that turn a sheet into cell sources, so editing e.g. a title format invalidates the cache.
+    """
+    functions = [nc.normalize_rows, nc.render_rows, nc._serial_number, nc.DEFAULT_TEMPLATE[0]]
+    functions.extend(content for content, _ in nc.ELEMENT_TEMPLATES.values())
+    return sorted({inspect.getsource(function) for function in functions})
+
+
+def styling_fingerprint():
+    """
+    Hash of everything besides the sheet itself that affects the generated notebook.
+    """
+    styling = {
+        "format_version": FORMAT_VERSION,
+        "rendering_code": _rendering_code(),
+        "colors": nc.colors,
+        "font_sizes": nc.font_sizes,
+        "open_cell": nc.OPEN_CELL,
+        "stop_cell": nc.STOP_CELL,
+        "end_cell": nc.END_CELL,
+        "default_code": nc.DEFAULT_CODE_TEMPLATE,
+        "instructions": nc.INSTRUCTIONS_CELL,
+        "templates": {element_type: template for element_type, (_, template) in nc.ELEMENT_TEMPLATES.items()},
+        "default_template": nc.DEFAULT_TEMPLATE[1],
+    }
+    return hashlib.sha256(json.dumps(styling, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class _RowsHasher:
+    def __init__(self, fingerprint, options):
+        self._digest = hashlib.sha256(fingerprint.encode('utf-8'))
+        self.update(options)
+
+    def update(self, part):
+        self._digest.update(b"\x1f")
+        self._digest.update(part.encode('utf-8'))
+
+    def hexdigest(self):
+        return self._digest.hexdigest()
+
+
+class NotebookCache:
+    """
+    On-disk cache of rendered cells, keyed by a hash of each normalized row plus the styling constants,
+    and of the inputs each generated notebook was last built from.
+    Cells are evicted least-recently-used first once the cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.fingerprint = styling_fingerprint()
+        self._db = sqlite3.connect(os.path.join(cache_dir, "cache.sqlite"), timeout=60)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS cells "
+                         "(key TEXT PRIMARY KEY, cells TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS notebooks "
+                         "(output TEXT PRIMARY KEY, file_key TEXT, rows_key TEXT, mtime_ns INTEGER, size INTEGER)")
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def _hash(self, *parts):
+        digest = hashlib.sha256(self.fingerprint.encode('utf-8'))
+        for part in parts:
+            digest.update(b"\x1f")
+            digest.update(part.encode('utf-8'))
+        return digest.hexdigest()
+
+    def file_key(self, input_file, options=""):
+        """
+        Hash of the raw input file and the styling, used to skip a notebook without parsing its sheet.
+        :param options: Other build settings the notebook depends on, e.g. notebook_assets.assets_fingerprint.
+        """
+        digest = hashlib.sha256(self.fingerprint.encode('utf-8'))
+        digest.update(options.encode('utf-8'))
+        with open(input_file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def row_keys(self, rows):
+        """
+        :param rows: DataFrame returned by normalize_rows.
+        :return: List with one key per row.
+        """
+        columns = [rows[field].astype(str) for field in _ROW_FIELDS]
+        return [self._hash(*fields) for fields in zip(*columns)]
+
+    def rows_hasher(self, options=""):
+        """
+        Incremental rows_key: update() it with each row key in order, then call hexdigest().
+        """
+        return _RowsHasher(self.fingerprint, options)
+
+    def rows_key(self, row_keys, options=""):
+        rows_hasher = self.rows_hasher(options)
+        for row_key in row_keys:
+            rows_hasher.update(row_key)
+        return rows_hasher.hexdigest()
+
+    def is_fresh(self, output_notebook, file_key=None, rows_key=None):
+        """
+        True when output_notebook is still on disk, untouched, and was built from the same file or rows.
+        """
+        entry = self._db.execute("SELECT file_key, rows_key, mtime_ns, size FROM notebooks WHERE output = ?",
+                                 (os.path.abspath(output_notebook),)).fetchone()
+        if entry is None or not os.path.exists(output_notebook):
+            return False
+        stat = os.stat(output_notebook)
+        if (stat.st_mtime_ns, stat.st_size) != (entry[2], entry[3]):
+            return False
+        return (file_key is not None and file_key == entry[0]) or (rows_key is not None and rows_key == entry[1])
+
+    def mark_built(self, output_notebook, file_key, rows_key):
+        stat = os.stat(output_notebook)
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO notebooks VALUES (?, ?, ?, ?, ?)",
+                             (os.path.abspath(output_notebook), file_key, rows_key, stat.st_mtime_ns, stat.st_size))
+
+    def render_rows(self, rows, row_keys, force=False):
+        """
+        Same as notebook_creation.render_rows, but only rows missing from the cache are rendered.
+        :param force: Render every row again, ignoring cached cells.
+        """
+        rendered = [None] * len(rows)
+        if not force:
+            unique_keys = list(set(row_keys))
+            cached = {}
+            for start in range(0, len(unique_keys), 500):
+                batch = unique_keys[start:start + 500]
+                query = f"SELECT key, cells FROM cells WHERE key IN ({','.join('?' * len(batch))})"
+                cached.update(self._db.execute(query, batch).fetchall())
+            for position, key in enumerate(row_keys):
+                if key in cached:
+                    rendered[position] = tuple(tuple(cell) for cell in json.loads(cached[key]))
+            if cached:
+                now = time.time()
+                with self._db:
+                    self._db.executemany("UPDATE cells SET used = ? WHERE key = ?", ((now, key) for key in cached))
+
+        missing = [position for position, cells in enumerate(rendered) if cells is None]
+        if missing:
+            fresh = nc.render_rows(rows.iloc[missing].reset_index(drop=True))
+            entries = {}
+            for position, cells in zip(missing, fresh):
+                rendered[position] = cells
+                payload = json.dumps(cells, ensure_ascii=False)
+                entries[row_keys[position]] = (payload, len(payload.encode('utf-8')))
+            now = time.time()
+            with self._db:
+                self._db.executemany("INSERT OR REPLACE INTO cells VALUES (?, ?, ?, ?)",
+                                     ((key, payload, size, now) for key, (payload, size) in entries.items()))
+        return rendered
+
+    def evict(self):
+        """
+        Drops the least recently used cells until the cache fits in max_bytes.
+        """
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cells").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM cells ORDER BY used"):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        with self._db:
+            self._db.executemany("DELETE FROM cells WHERE key = ?", doomed)
@@ -1,7 +1,12 @@
 import pandas as pd
-import nbformat as nbf
+import numpy as np
 import os
 import re
+import time
+from contextlib import contextmanager
+
+import notebook_assets
+from notebook_writer import NotebookWriter, new_code_cell, new_markdown_cell, write_notebook
 
 element_list = ["header_title",
                 "section_title", "section_text",
@@ -31,189 +36,421 @@ DEFAULT_CODE_TEMPLATE = (
     "# ==================="
 )
 
+# Banner cells. {image} is filled with the matching BANNER_IMAGES file from assets/,
+# as a data URI or a hosted URL (see notebook_assets).
 OPEN_CELL = ("<center>\n\n"
-             "![up.png](data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAgYAAACuCAIAAADCjVJdAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAI9bSURBVHhe7Z0HnCRVtf+7qvP0xJ3ZvEtWEFAQxAQIhmfAjDmBAVAxAQrmnDACCiJifvL8q5jRZ8aAgCJPQSRIXNi8Ozt5Olf9v6duTU11dVV3dZrpWef3uTvbVV1964Zzz++cG7XTIpsjraF/tT610zBN+1LTI73DOn+ndxtG2b7ZHGIJLdmrzewx7OsGocciqV49Go+Ui5HctGGU7PsKLUZeG6k+jb+5qblCaQTxlJbo0bITgaWX7tcMI5Kfbibyumg0clKbzGgRTTJbygf+SpPyiEQTWiKtzY53pMzTA7pRMvMznSmWDkdeLpqF2U5FHo3JB1podtLbClpEz6BeKkjKa4gNzTDZo8XTmiRgopaQeEDkxbxZzM4/H0tq0rIaKSeErbodIY2ZFfosTawdpYGuS/VqekyjCVCP3OkZ0kl2MVeR0HaJkG/kTYPEZ4b0WEo0IdFSLLr9TftgGhGlZ4md9y0iqG+YAD6AFeAGRLP7gbCiZGlmLbLpwoD6panDB7TzcsFfRskOQty7Uu8d0XsGNepiGQsJ6ghNygcRqrbygQKKnldE45pbd7uhaVQ6Ih3JTZoodMwd+4u9BWg8RQbkDkPTvlsJ2jXEDMPZ190Bmw+SNh+omx3R2aiz6VED2uR9yjxcLCw5VsCO1qORdpkAnQbNm9TSJLATHTfRDYzHzLCOG0FTIWvJjC6XvXubUuhmxJNSR5jwQSq7dcD65ZK0+trAbsBmx01UPvTeBIQfD4kMItuKgD1A+KmCTlBy03D4AF3tlo1OmfFkHubhfbhL9q1FgpcVovb9LgT0SYPpkDXXdqDlUTd8KGT9fRociGSf1D4NRghD/pr4pel+XXyLZXQelosgH9BWHfI7qVAoIRTfaJZaGBNjEbWwuMZi2yGsMGPSFrCTaMX23TnEEpEgN3pRgBrMrLD5wNOV1wZ9bTf4KvAmWEH0QrNWoWH4256NAkHMThq4rhREstfuzmpX5L4IKpPaoKnQbOr2KUvMnUx5yMjjKflLLQepg6TqIlARWgXiFEuqV2u/RqA+w6W8GSzNyKUfQ5OxtA4NVJiGGY1rkA12jH2rCjwjuaPqrSEk/s6OGdysywrqV25IDC5BChX8xq1qfNUiaAu5KSOasDpUXaBpt831txLfCij2niE9GtOmdnn5gDLRzhrZal81CxmooY4DUpnM4Cfq2QlDhLJBLYC0wbdoc/u6NSg+ECe6BJ8b6CQZxW1T5B6oDtNG22HIQWmKlNLuUCOXyA0x/O3rAFAvsZQM9GEZqSE1D+Dd3mFKe77KSTO2EoaJGoTEXKihR5oAlodZrp/y5kCxoPg61KFHypHJtkcuAp/RU/1S4LTQRltfGJByXjE77tUsbtCKpWqkwx0msG8CipSvuCk+sV/a+BVk5o4ZhktkGstGbtJ/eDnVr+enW53/4g8zkhmWIf3ctFhLZNnqMpUJIy2qcgW0RClfi4Nrg4bZM6hT8j61ZqVce218i33dLPpW6dO7auU23W/P7Snm7DshgQZBAmbH2lGQFmgkFCiMbZRMnAbinx1vW+RuhFTubpAY4c5J6eOqDSKntMNPCmoIYSKXqVwUY1S6C4JmUFDUfSt1LSpy5kDNOKJtoAKy422ewCOTXspCUfZ1W9HpyMul9nM8jQ6hwgyaGTU6lPLeET2WjExsrdX8o3HpKsQpz06IfnQDR5PkwQrouGqkB7RywSxk7UvAu2gjbomqi6AZRz1DmIOd6qHtGZQKhRWECKelK4k3NqQNaoDIsR4a1aUKtEqZUxSLIBIoQA+4v2JjtD2TUCd31LG18VPiKW16N/qugXKBylA9cIl93Q4IK/Trui5siRyTJPuLtqIJSuAnmm6py3oQ9bSok1BJKsa+6o7zNHI30BdU+ryywEtIinsxOyG3xERoq0Xfrkl+vuh05G2fhErzRhHzAcsatdgh/2ZoQ5RKnB6tJbSkpIfSMzACfJiDNo7qp2CrhcFnEmpCw+lpiBJmpJPK/uwGLqwvW7QFqDtq05qDpKpATM+GVF8NND0JFY0HH1DgFh94f863pJa6aMNYAqjdJwiQBkpEehIamfNTN9omILbetImA4itgRrWpAFoFxYK4t1dFdghoeemhtkaVa/ABqCW1pnTfLaNzgHqRbWhMJj52oB0B4hehDe4yUpgfNfJLBmoB1ZzsCTfi2HhGfHWIfTNcbDyMHUloCPxKXIQpA19B9EzjKW8vSD/ql/ry7bBVfMAHmGyBNCLWAUnBeRS3ZbHn/CCFVremGY3JOMeipwegZ+GqdtkRnQOi4yxEqNF9rKAMJf/GoMlwy6K3k70VWIKKtos5a8CwM+UM65RLbZjIhHGALU+Cu3MakuXHyETqJtJG4UOZpYJ0gKsaWRSg4pR/UD2/CJAvyZ0uBEZtLpyRTOngsOhRDX+w0cIlMyjNNupupBBfgSRF49KbSXEsIsiXWFu5Ts5paRPQ46SWcgszihuTGfGa4jmpcajEqnicoeyEgRRmGvQalxEGlHEiLaUtY7NtHcB3g7dQv+3ya5EoGQCPRNIoh+5w3N2wpLdJhS6KeLdRLlgL2fyWLHQatfkA0Kj5tjAj+pBcLmjxQ0GwAuVCxdu3wgERx/ki3fZ1O0CDyc8IK8p6hb7FFETsbsigrtG96IC35hci1Ov24eHMkA7PTe0ycBDzM2YpJ93ls+My+wU+5j5l3rcyCtnbv1lGO0AzUS1Fddw1q8rqgFaMBqERtSt+mgCGglEyEZu9xlBAHeu6eP/IP60m1Sumrf3dgkDxAZZZEB+gfEgSDdOxHhZaEfJinER4Kd2/+IoAh07GFRaVFZaKi0DLV11GYnvWG9oiUz1D0qsgE++sdbPQAEI5Oy5zkVVOaSdYT4gpvoIMrS++OOwNmK+mQuAWI20BTdipyjYiN2XmZ001S7LLW0QYQJzlkvhAgOIia5QbYWGkvS4fkLwk9Vg5WL0IWlD6DcaNZJ90z9m3FglUjBD4orICFI3od7+LgKKhiBDuuoqAUpW+QV1mD1OwXrjqnNhwIKCNVL/eDYNMewGiCU02uTOtUYSOyRRGDLWMedcJ1YZ+gBiwElCdDU0u6kKgc91Nm6zhLtDkE02NTDQEPC3pmLX4QHXeegDp4rUU896pbovTXUK55KeM9GBXbGywiKzAuxAacRFqTt1ZdCBeyuFFvn3Fyw30eywFH4SdcEzh4y4goNYk98WXh6ULtIxUk6WsOzeKAGi2bruy7UDMspOyG1KoaUjdCqpD9RrZ1xbIGgKPtHd0uiMNVqZ36oF8gPlFAvjKwwdgcSgBZCclNbLv0uINxDugaBaFFRw9qy67E0g23iVlQvnUHVXG88O+w/BvSGVQAlO7ykZJ5HhJa4HFBYTquAidA9qEZtJRSgAIw+y4jDsu3U5FEk+TqXaUYevclEy06ZCqUXxAqQXxAS9N9sqKv5w1xcaDRaMEkB2XGbJdMu1k4VkBQUdo0IZd7iKIorGGK6XLqGZSeTI9oIsL2PgyOkp+Zo9BUyGGzGJvq74UIS6CNYpQDOHJtYJEjywqrtZ0bQfChq+p6TIbZSnKQywRuBs2hIeo8yHd32btV58PnCmn0/6L+BazpE21WKFsLWHrgn5kSlDNxBJW6PwqtlhKzJ9OW1stgnpRigbqqu3N8CSqnDLERbBvNQjkITclWyVCLdKJ1AXu4xIC1UQVIL0dlShlx7g3megoEIn5aUhLaqgJ7aHHhDvt6yrAqWp1FAaoMrlaR10+ADA6rxPzN2DS4CKTLxI8Myo70PUs9skKCngtGLnCCgkZe+kcK4hNh4vQ9UflIEBK0dTuMiI78AGuKAqdh1tBMSudSEQFKyz6BISlAgQVTc0HaLvu/OBWgB2DxHbUC6kGhgLi1zOIlYDKsG92NWSHR5mkW7st8C1ZozDbsmQhDB9gN8StKac1anDx/TEkjDxAXN3CCvmFYAUiR9V2uYuAWCtTnQZZW9Hg2lODM2Pt2TSGd03vlqUMRGtNXrLvLyMItPMFcBFAIr04266gxWQakjVzoXMzqdqIaELsy7pJ5YHCjPjfLS5ZCMMHsE71lNNqdEVrIw9YlzAYVW7fWlR0mhVgPpqWuAhdvM8PuVZdRnUXIiR77cOia/csNQTVY4BUEDPuQrs8670SkIGyMWnqHXU6lX1Qo5aRGWrKE1RfOTLvua9CeCuQ9iKT1zNLYBqSKoeQzQFRl+G3WZOsIe323UYQhg9ID/EjIdVTjDzoFgOM4psdM6jsLqnvjrKCchHqzt5ZXGCzREMsROAxGVKeluKyb7UPVicS7rfssy38tAw/KBcBMui0i0AV0C5qCAN6Jz0gq1DdQZ2khOqnHXm+IjTUskoFcR/JLKpT+q+s0z0VC5Iq9dkTaqS2c0BH03B4e3ioJQsy77bBJQuKD8hmDT7gGfSqUarPB6BbKAGIbzgpE06ao8q2o3OsQBum8rrXRTCtUeUQCxEQtZ4hHR+CirNvtRu8HVlHNjIrdGSjodbynwCqwHERkNXOAZHARFhcOwZhwHEc3VTOTcn2rvlpez08X6ETc1Oy7NETOlomQYAaa7SaIFCD5Eu6d9A24eScFyk+mAnmAxRXyplyGiJRXUQJQMaRZky0TJfMNukEK5A1y0WwL7sRapvSegsRyAVq2jRkc+OO2mKUP69QnQa9I8s75VUAu1JqqiSyat/qDBCJcqGzrBMSSh6weTEREEJH9vhQHRYFMv20KY+tJEsWZCGbrMaop23QJDQH8ggfBHkkUAuthhYdNOW0Gt1FCQBix+q0lmIvWo260XZWiKdE1TZhRCwMKHOry0goWbqMAsQIUaNBRmPazJ4FmjRFLUgnkhbpG1neKc8G1aSMp067CFQ31ms+RLfDggHVSa7VNKRuUBQOMFkw8ptuFGiG7KSsxkgF79tPfql6lKRRNmvwAUhYp5nWmHJajTZQAulrY5UQleoUwwIVVrAEXeLnLW0V+vDH8cMKyB/lrsfCjv8ElQk50qIyCcy+bgqqNDoEZNHuiMjWWoiAb4texotviNtaTDnvmt4l66LxI33GnKjPjhVLd0aOeQEw3mvYpMTcesoRiXJRfBEPPJFLC7XuNBCCGzXf1pYW2lF2Uub1kzziCa8f6r7aDVtRhK4jVDCCarZgJ1HOVpeXqc6K94Bkw4KZFfKW6d21+EDZdvBB+EZKHjt+HH9zoCCIFtukmJdFzsk+sYawE9voHVNYON3hj+NH7KQ7xdpARla01UyIYo5q1Y8Tp0cbeKkviIS3t8grQVBrxCjqwMPKcSPScugFrmje6tIND2KOJcW+s6+bBSWAIkAP5lyHuUMS/1HH8SPAqk9AZjEGL4lqLnIPqG4Ktrr1eSKnfttyXL4Ckctst9pN3pS21r8mSnOY2lUOqeVpxanQx/GrTBklWZMfRsul+/VoXIS8RqWEgaaL1GGikbV5nW5GelbIeh3KHK1bI/2S7B6ZDtBQiyDxC3Ecf3PA/xpcG+Xv6H1lhEP81umGD/SvAZiWmm7orH85PTyj0wipj9qskPI7e5m8pPsVsdl3mgOR82oE1L5uHxDlwXVR2tXkznJQIik3aAM5y46HtZscUIBYLrPjbUg51CJLFjQ5kEsllbKlhVC81vdtRqcjb/Q4flFqfVo0If37iFmNipBD7YstGRDUOA2QllL9Fk/k7TouX0EirzyO3xcIbXpA9ldHRYYULUov/HH8ZJ9MlUtmbrK+wNPGZRgAnp7FdbNvNg3iQUeRAEdpkNmVB8TyM8bEtlp8wGMkg5+QjIYaKcWyQMfxNwcEcXif6NjmMrmCEoR42+olUGozDZ71j0ZTppmaNGbfrQIx89dDCWQnGpOz0e3rZiHqqQPH8Sstgw2CJE1s8xc3vDcZ0TKkcy+kReYGpYeHQdO1r1sDiZGu5KR4XZRGZ7V2lx3Hjw1IZdEuyHhta5QiEr+2BUqokTxP5JKqNh2XD4i8WHkcvy94KS1LfUYAcDvCKMHe0MfxoyiEs6WLv368GOaIpR4VK75Fz8wBcdJwkD0KCpVNsaASa1QoCcAHQlw9+icMpLve/tga0CadALppdkI61JTp0d63NBcb1Sx6weo8QRDDR0I9IbtB22B1A0SaY9KegxohmZUV5rqsUm6CD9oO2jOMrnbKo51o0aWxrrV1UBGySkOL0OzDdxM3B8zeaCx0v1PjbaotjZpIqHoxtkwZZ6Kt1Yb90qpXk1lagSfg+gCky3OfgKb2pB8DRZnzbQTan5AZ0ldsjNI8kfkaTKZZB+vTPJs2X7puxpEbFDdlkZ0wMIiogC5p8POs0MhRGDxM+uueR7ZYoDEgzXxAoPGR1U0P0Lw8Iz2YXbOigiLFFLJObxW7D9K1v9irQS2oTbALWSmBjkIts+8GCyAMMORLeWEFTHv7ViPAuk9aS4jdgZYrX+k+bEFw8wpUhDYQp63dYggHxFLSSFE+fA7SOdxP4TBp8EHzRlvXUQJVAgEQsMHVB3iPgsAVSg/M31QBh07MpQVHo6xAFmjG/KpLWM0D0l/3RARKnpxCz+TCvtU1IEnW1AuZuyytdK8GlSVKylI9nXYRlNx2aMS+Q6BhSi/iQJNbBkkLrQ4KnpvWtCU3otZWd20Hhg7mDpna80BZTlmwlD6Q2kmIAqSOFBvRQnH0ebIVo627KIFckSVySIhjClnbrkH4ZJJm3zeip3rFElQPqFDXSewQGmIFnkF62jgQ0l7EKhYi+CSS9OMiFJo6CGFhYHUiSb9zz96+Ux6VhbWI6lkATU29o1y6xykMCdpmVjqcLSt+AYFqarvBhIrD0MFxn9ljIN65KUOLiisgTbJfBtXFhsZQ5nO/PVewRUOhPcPLUzvbM+MIxUrGxCmGg60NZtG2s2OGKFyrIxsCkK60kjxp/cBSzU3pKSJHaBodXvaAirFHmyvnIFFV/FXDO6gnGaCztt22vmwV7R1epkgpc/7CWCS4OnIUUN/KKHI2M9pqLVNcbRxe9oBCNkriVmdW2E2ojbpMRd6uGvRAxCPc8LKSJSorvNhDkO4RYF8MrI0e+qTkfsfEVz0oJmp07lnsM1O2CQr8rTwgCwLsBzS4uEETTXopA6L3RB4EzDHhSFNGVuxbCtiXUckL7qN9xwVsoOpXN5p+z0udOEOl3OoV33ln6b4birf+Ju87oYP2gjBTfQiz43/gMciLqvW+tUNlyNH1IMjU/6VCCVxSW6SYD6qAFE8sLiUAX1ZwUwJKUBZATISa3hAG7aUEkoolQnmqFHoiRwf1jshcz9qLYkJiASgBrU2D6RkUv2dmTAwr++vW0CWUoPqvncoKg9qUsGJj9MQzM489tQdWsG8tY8EBH1z7jdnffX5mfOt8pfryAbBGSiJBS+Hys/XnaNUAb1wyDjZaiTYwOy77IErPgPISugDCScE9SFx281E58CKBD4Wsfwop6oXctaItQL3aO+UN7VU75SH5kDcf8OfaUh2HPy311t+NPO0dfct8sLig/KmFc38/Qo2oO0F8ABADmmSQCY62aVHgl1KfK1nFM5odN2XxSL+V744YbQ3Dwwr2XQvRhDU83pUDdCRMBueDT0TAY8AmhYZ9vNTuBq2IZGNK48B1yeHerQPpQh1ABsibfasFHPGs1On/M7TqoOVNBLsFqx4Uo0aolxp8AGprfCREa43ftTN7togN20Kv6wKNJcyB+ygyrNf8tCxQKuYXuePIgXLq+UB6xLOzlhGRzrK1FF490xa0q+MIdUlJInM567Q/ddOJnK+Qy/yUEWaFTkgg6wvQcWRfW4jGyQV2kxBbK5p00TuOYDXZbECXGTUNWRi+HUcHPibx5p8N9wxVWITZCXP7HcXJ7QZvWUanQbvrX6OvOTieHqjQ8Qjq104du+vagi8fALXlDMIcxA002KZtOJq89ubBrUgApgfeKKLjm4jaWGBKAHyFNk/16blJOXiruYbadkogkVCCUrJQAqkq5UXDzsp54vYzbUFbKAFdmbIm+KIs3PpCIscOzZv9q6KIHYXflppVWHhKAOQRtch7oTfIr7nsLDolIKuUHoKUnfTXFEGopgRMgbN+MXLQcQn72tpo6Lefm7nm6zNjD4hHGKBqltFOUB+0waGN+nGvzDzxzRn0nv1FJHLPXwqffdLuoAYOkccSgdPAEO9Whi2hhOjD8mfze9wNBE7mdKKOEYlGJB9hLbSpqaBVJQ1zhaNHZR5qNR9yWSpIU4cVYLLabSkIRC5k29YunXJR0qbHrAFnK52Wm6++bBviSelJLBfsyyZAwmSTxZgIlqg5VxlQJjL3uU+ITeyUdhaP9IHSDNrS71ENBJg0UwVeWOuxyQjSQu7E7mn8/YGRtwN1I6emkj0yKFLIYgDaN0NCiEQ2Y7cvwTEv6nnSWb32RSQyvqX8xReNXf3VGaF/S5VQPMuh0wFQL9Njxi1X5zf9pXjok5IOKwxtiG65pbjlFn+tj3FTLpga4lBN3ShGLPsWlk8n0ppM4KGRYD2JZ501lTrAbOHF8ETXguLIqw3Tm12p6AaagpbTlvyiYdWEcTwGuKHtfNAWWAsR5ANs6jE5KdieIVgZW37JrFkNA2yu6VEDUelbGVWDtEsIbTwnhxJ47Kk99oU1Uv0/b5j459W5hHRBi5JZDgsZKHNKnvKnFtyVe9yrMzXUGgaxbQe7H5ENTtowbDnvrdD+0bA4HXimOI+oSIhBzVD0oaPuAKklqb3WeTutQLY47bWXa7UOasVZRqQ0b1eBskLF8IHqxhpQNx0kLVN6ZmzpDSnXBU1ualdZCQzV3bVS7QFiSY1gWCJUrZP04Hp9v0fOdxndfFXubz+ejVeolmUsNCh/auGmq+btR+qImrIv/EDjlSFAy+UlGJb2lr3iW56K5vNW1ZmQHZc+eppNMqOlB2WfgG6ctmFGZvcYhmGfwtY9KBekngDKV405dw9IDyanWABVBgVfYQTgL7ZujXYnaDAzzk55soWffb9rQQNMpMUALJfkqBz7bgtYdWAsrWbrWfjr/8vCMsuEsLig/KmFG/7f/D7g1FHdyWDYc9lJ6d0RO35C5tq0zgcgsE1Ih1JeXsnL4B/slLTsMqTjPXRRQ7I662dGDV3XpIV3jWjH0zIS6PQgdQ8rUI9iclpdRh4Bkioe0LnfrpGh7gSCjXklO+UltL6V4hLZX3QlcBHEeTXFBlRGRosY3nfedMpPGzvvKnV1/v9jQC1QF9SIfV1ZUzWAbUdDbmMfb33tzvswJxULmYaJdusZFL8bSe0KFaxYYY+0cLwZ++aiAsqMWedxU2785U6XsAIJk2SohQiVfgAuoGylgt0xsTfzgQPqZWp3GcnpHZEzquy7XQbaF7aFVV/SRWDfbRGuvOLLFvPuG8tYNFAL1IV7zshiqdewOlSchrlR6PyMqctsH9lryXIa2rZttcTTaFzW46QNVkikpd/Dulsf1e9pVy7UHA/VTS+jzbMypYe0SfNeVKghdAwK2TvXlVlkLzMkJ1JYByG0f2vf7gRu3PRuDB0DSwIrp3tcTAfRhGyCTX11ahNs6OY/o66XBKQuuqA6mjloEw9W12VoAcM8moj0jcipaphd2J4tCi6FkuqXo8f4zFtwRLDgIKFAwqzc48ga9tCy46Hmj2PIW4se5Mk0L0205yBPdK7KAkygkkHasc2FD+TAZKPuwYF1Ae1RzkHTloNAfZFNUMh6p+32DIoTMz0qJ1Y2F3lItPGgzWqoFRVhqt6DRDoCK8AQMCJ/fdF05GFA5NUHbeLSURc0Afw5cdCbfbPnLMxjX9XzissG1efZMeP843ZvvrUQ/Q+xAroY5Yi54dDEO64ZcdYPfut149d8dVZ9doPWKj0QnZnKKAdtNn8cvyVjCG7fqihWp9p2w/Jw53Y3bFzMhBL6dHtBtinTddCkucladisOtbuhJnu1VK+enUDz1mlDNDYsd3UyPr+C3oin9WFVdKuyxCkNdyPnvpr76PQmNQ2YzxN5XVCwqq+PCqrQL2YkibfnKjGJvGMbL1PIbTmO3xdksMnj+EXS5IRI/uYm/SWHYoESWqy4IJByqMgTOdypzAjqSxpUs/BE/uiX9bzowgH1eUlTQlCJuHPSltrqaIQOqinhO2dPXP8tH0rAUMB0U50QbYeskG99J9S+lfrULlkELw1epjcjgrJcorlEK8uID6gtYktmdGy3QCfBWrzjUY7pAR1dj81bexolVjP0o1bS8lISj6pqsaBJD/ZmQTbjlJr32NriK1gHJ/BAKy8SQ146fxqIATZCqfEBCnQbwtzvHdZz1rJedaeJyMOD11E1uH32dVvha2s3BJGcHnEWq0mr9chrgMhLRe8EMBITtU7RarEuiAdhcyI/7jU9p355SH1e0pRAgxXb0V021sR8d6tvqeDm4C6atkfooJoSvnn6+J++PKM+u9GDhsm2wXj1hUzSae/m2OhEPYbik79cUj1wAwwxb5bWBD8Ps6HFPPw2x+ZhWZYd12T8MHgnCSLHgJqxNrSgTVodR63a78oVyI4bxMylR7OQMLITt3wF2nnT7yK1DW1ogdeCXoCzPWVFEUHnyBaF4FRQo5E3BGX5KhpuO8hj63tOSN+jpUPhLbfwtCXyIBA5LcXjUxLgZg+FNwHPhhZ7ByUUI+bLPjt44GMSFJEDJPzvP8pe9YmpWEQrRcyDjkk87R19LWlxLZKbNK94w3jeKr1URnv+Jwb618qoW/PQIj967+TmW4ueMm+AEob01nsagiB7HHXovATbabBOPaPainmZMoHrXRttoQTA23tHpGRnRgPXbrSdEnipaBNrgw1sbe5UG5ttYYVGtbb4QEnp98ihX+ZKg3pRReQ5COE/nBIAgiE9qpU75S0kJShBooJo+a2/sUsoAZUHtfGauDSCVlGImO/4zchDnmhvJe3gmq/OfPk1Y7yCBx59cvr13x+2v2gWNIRz12+bsXZ+7B3SP/jPVYPrW10A9enH77rl93nP8sDuoQT79W2H0MDirYXm7WqxgpBep7LohcpabYcOnivABNYzGKQUi7rfOZAqdBwfECNH9ZNONIUeXWIHISwMUKBTuwz+ZoZFYhdAXD1AKmxDqjPNfuGBvjvokclXXzL07Hf0J9NaW3Llu9eT26Nqi2BXVIG1OsT+3ALcnk0XouP6kkrC0vGsheZvp9dCIxB4AHpMVlHYtzoJskZLhg/qCuJCsgJ0mFAT2wsVnY+4YrHU3rlrRVsgJsUeWRGa6tNtq8LjBXcMkIESCbTP3sHWFFwyqb3q60Mnnpk5+eP9x766p9iePvlldATWwoLO20E0KFSSsxY6Gl+ItdAYejTseFocFPtWx6BcBKXo62LBWAE+gHpRcO6J7Qlr14rcZNsOodxbkZ/bKU92qLfmBSwAEFdaBIbUXuMiYBMj4YPr7P6WkQNi3W0l/6dD1iGLzbhQe0Ni+KCJIIbcFEaQrIVGX5MGGh4qte2tDh6aHZPBXjXe2yHYLkIjJxEtACtQpKpaUS6ONyAd5YM6HluHRgv2MiA/U7tkkkJmaCEWOau1PnxAMLq8eyEkyEQsHnn+pwbSA9rue8u5SfPRL+s55JhkoWVHQRWUB8i8/cnyt1pHRcO0tu63P7eABevKbg7aWcNb1ThHuWBiSzbRk9DKETqUDlVLQdudp3kzbn0GRMhXzQ0ve4BRDO0Rj3tSB5G3a3iZ9Kd6K47K4Y38rR5e9oB8NTHaHGYEmJhJA5kiSRCwqh0KFoOXcsb4DdI4y8PLvhhcH1Uzm6Uw2518Uq6Gl6kyZEmqrMFzcmpgEYeXyUE0Fnn5JYOPOyPzk/dP/uRjU/sfnXjD91eUipHPP3N00y2FpndgLUXMk97Wt88RccNV28j87b/L//Frs+gPGuIBR8WffE6f4X6iQRAhHPbdt02opSrJHu3ZH+pH3bViuRLnzz4yteWOkoewumjG0Rmxzci6UC61Y+1aUcw1RgxtOVUN+wjNiApzBrzbSAlA+SLTu+f3+GwXJZA2UUZl2e3DvhWaEgA/JxlifZiR3HSo6cZhtDaaV6xaa4s36pQ7vCgzbM3NtczeICxTgi+IHO2mBsBmx1pdv+KBogTitI/SbHkytBuLRQnUMcX1iosHH/fazE8/MPXDD07yDhTfgx+ZePPPRuA8WOH+W4tNswL5qS4j4nKi832gCbht+rYIrq+T0EUzjtAOaI3spK2M0E0oBTSakv4FA8mgMWOCdWhILTdplHKmZLjd+ULJYn03vb4c5iPjsqmZNfYu3NAySI+MKlv9D47yQu8QORRYgw+WUQOYipgUGO8d2imPKoMPqnckXIpQfPDyz1t88EHhA/QcAQL4918LXzl1DDvytd9ZsXJDDHvf/k2DoAJUnO7grhXfB5oIbni+ai50OewUYqRADASZ2mV1mWGwYL0uMDEgHi16G0EgWmsHmzact+MGpnc8JaVHzPatxoGWwT+AFdAIbWGFhHUighq2UXeoSvyt7N57EMICgLqmSGWnvBmzLTvl8XMn4LOqfnCsvw41gbYAgy0fMQk17GXhg2jkZZ8bPOF1mas+NPnDD0yQMaeoYIW//zx72YvHRvaPnXnliuH10eaMQAqpOnjg+dY3NATPbxsKSwUVpIVFaQ/8lkRMcfOFGDJ2534NoIB4hr/dDKRYdRNJf1mrWteGbh8m3CqTtZEV+K10A6Jc5hYiSD0OyDYbHepUWVqghHGC8b7FFW7cOKCiaSNqJlvvyiYPeVWNK9Uvx/jALqREWNyaKyz+YsdA3tWeks3BiJjrD46ddtnQKRcODq3RfVnB5oPPD574+sxVH576wQcmoTyPYoAVbrwq+7VXju33yMSZVw4PrNIdViDzRVnUVr8QYrFIPKF5gtuE5a3xpPcBb1CnzYdGLF4VQ+jgLYVuhf/qZaQzmpDtaFR5ib2Zk54lX9ugb5X0baGGqrcbahS8ty2rl2uANozjT17QjyjfFscSLLXis2kP9/kLuarLkBBt1SspoZxJXpBFX6O7nxhgcWoNzcLbKUM+962M4sfMjIYa79m7xxIQJAwC2SvCegobqMb6djeqI0eQeoZky1u8T8cbCwPSQAIoCnVJSlKUubWBEsXudPS1C+6xBNKMpn7xRU1ue4eyfuvPRx76NFkz/PtLZy4/c086ort/afPB5wZPPDPzs49Mff99kxoSaH9ZAVJTjpgnvqb31C8P3vTT3OUv3zM9aRBVVNMe9ZIepPdvV2ZrpAlyOuKk9Mj+UXfd8eot/yze/scCbyQlK/eLHvGMdO0dA6m++/9RuOOafN0SIBbU+lHPT/cMNDMdmbT9/Ue5PVvKQbzQRWMJ9sdKkGf0EdYQbQBhJT9oT1oF7dmX60Rl1ynSbkE0Lv08mWF9cJ04QOhughaV1IvhZl06Af1Yw2BH2yoitK9bRuu+gmJxYZRZ4QPioY4R59mxcjI9nekfT/dOafM2WViYmpnPmNl+M99DrA3nV9ONVLrYkykkkos8joFXR6nCeZINy+ZApO3vGgRSNL1b5rBRwjSNQKulClB+0EuVBdadQMkmotrKA+wkHvOi9HHPy5i6TP5RdxQfvFTxwUfhg4kgPgDkHy38+69Mf/OM8SOemTrtmys2Hhrf8JD4a74+dPoVQw95YrK2kPEtht2KDdGh9a6wIYq6VD/kL22BOxUPVIeNUSiz9rsc0Jr6V+v14/QLJDXWseVH7UX9PY4oCFoR6pL6BjCE7THMFSReQilnIug0j4X2EqzHSEwxH2pNgBM/1dO3UqZjjm0uC8k5qa58Ec9DikGZSmLRxzSZlVj1PXTC30a9BAXSU9tXCDLksQF5Lz93KkK0VV/hRW8+e9WGTXrUts1J7dSe4a998CO7t25Ud9zwRD47aPzkQ7npla79yY1I/w7tWe9Lp6bqi/iqNVMvfuVNvX0FpwYNQ9uxrfcbXzy6HGgwNYkwXgIShSpx8qLqN4zXUiNyZS1hiXt2ygsCJezubqI6HC+By7bPsGiLl0ABoQFeeuHA416b2XV3aXbSTPfJ4cA3/yz3kw9O3nVDgSQnNe1lnx98/BsyP//Y1PffM0mbqlvBpAlGec67+5/zkX4uylbGf/3Z6Z99fDI7btZIEzb1sS/PrD0kVnYVOIR6718K//fTHIqKmNYfEnvMKzIwt/21H2hld12T//vPs7F6JUAsiZRG9nuHRW80CnTOn746u/OeUlCZdI+XEHbbOxQNMgE3CDGY0pXkbNDaLkrY7+nG6V8fWTWStq8tZHPFXbsKE1vLU/dHdtxX2HZffsc/jclb560pUkKjIlV8ID1If40KcyiBn1Cy/av0PQ+USbOjsLzQ5tWrB7wxszby0Jfrhzy8F4tz+93FTXfObrvZ2HMjHoeoZp5pjhJAbVbwpQQ7a3HhbMVSPPa0V1525PE/Ccrdfbce9tX3f9zE0nPBHfkvz809cHSgfjrwmujjL/buO+ZA08xXvv5v6zZM2deVIHnX/XGfq395kH3dDtSlBC1uPubs2CHHZPR4ZPSB4qa7sjtvMyZuipbz4urhnJGqINSOXHUiSRfi2PxOeb6gLohKWVcKvNShBL4NORE5PFqnBFpYqlc/7RtDR52cvurDkz/92FQpF0EzPuENmae8rQ+1cP0Vs4ZhDm+IHfrk5P9+fPp7767lH3iASl+xOvqpzWuUh/TLT09dce5EQsqpFpYpYfEpQQFRVsQgljXZsDZ5Tw9qrVPCg15cPu/b+9gXjWPTtkksGc2Rw7lUmJrcBfuu6//33RM/PSu76U+mogQMRtxAJGZ2XMp3nyeaL7yof8PaXut3kWy+uHM094+fzf7mfYXcdp96fOH34v/1/FX2RTvwwy9t//nrSxHpUBV4WOHQF2vP+2TfulV28naPZWdmS3+4dOaaT5RM60D1eOVChESP9rw3febQY36nng/CzET/J077lpsVHEr4/idnx/apU5ur7tCf9f4KCrehmee8+0/pnjo2843Xr//FTw62LyoR6zUf/9HoSacP96YT9i0LD2ybuvGqmd+8t5Df4VKrFmpr7Sd8Qn/JeWvti3bgJ1/d8dPTikiYuqRpkABqIW8dPhHELnUpgbor5rBv2rZ6uUVKQFX1Deuv+vLQkc9J//h9kz/+sD1cTOr4av3B8We8q+8xp/Soh//5s9wFzxzVGzmqlXgQufOuHtnnqATK5KKTRm/5fa7uYoVlSugcJQSl0B9Y4jS57KQ1l9E69Uz63Ht11RffCt7wlTX2p6aw79r+fdf377O+1w4b7MBNyIDAMw8+cOCtP13z6j/H1U+QASwyml96QHvO1+LnfHedwwcgnYzvu67v2aev/vy2jQ9+vn3Tweqn5NvLB+C5Z6z58HZ7DRFA7OxxBS3y3k0Db/r6WocPwMhQet/1fad8ZM2XihsyDyqhYtwLEWC7Rz3tV3X5AGQGJl9w1iftCxeufWW+Lh+AnQcbf3+u6wTxObzklTfV5QNw9KO3HHzYTvvChdSG0qVTG1745rUePgAb1/Y95/Q1F2/fZ+TJDawEWX1Srr18AJ716tXvvd8+sRLQNGasnfKS1k55bqXvBgQgA57BzUWPiYuJHoc5kr0y6oAeRwfXMZs7g1LEHFgdfcMPhuGDK94wDh+QEKUy+Ivi3nZH8cunjm27za7rsS1krlaHTzWIJztpfuHkPV9+2dgFT9l9e9Wu0UGghNE/qNr5EJebDigxiq7igepgLSoKD1jHG0PIQK4WowabQPSoyDn2x9BAW5UKYs5QdzjLSDCsxX0Y23fH2jB43kfntWFHsWZVz6SZvf8aMxqVxjY7biSGzFdfuNr+2g/HvrD/ht9MTD8wX6WfvG1DNNoYm4ZBbyZxz71Tu26yLyHdciHysDeVH/+cEfuOH550Zt9vPz+ta9bhwFMyNI1Ketm5Z+vhhs1W73P/tVc9u1y0lS90wnt/fk4uXMOMbDvMOOr7FYo7nS6e9Nw77It6ePChu/589f72xRw+8O+R3t455g7AE142+KuLJ8uuaSnxZAT/xlcCz/rRqsGVdSJsAgP9iZ2RiS1/mE8D9VXKyyYleGmkhBqpBs1HCnkOkETcGvFWKc9NyfwlnAbui9azxsN5IJaQzzQ36zfyJyRkOL0s3YkA2TjgkYnDn2p392FpXvPV2cld5fnRFRdIwuoDYq/7zvCBj07CB7+9dBpnwvMcPzQi5tQ2Y92hse23l378/qnpXUajDYM4ZybM+/5ZGL2/XHdUYw5SJng5ex4oj22eD7vvKU/utB1tFDFF7XmgOuy6pzw195Ma4AEyH4trxL+nKpIwYeddJXEE7fi8oEr7V0aPe3WPM/Xgpp/m7v8/H2mOpwJFq3UQufbGvoaP4wfKL6aMMGqG1keRY3VTevPzlh1kfRsen59cZ3/qPMbG8+cfMQYfYFnj8ZzwufJJz15vfxeAe++Z/uyRk3wgj7T2z+5os8np4J67pi44ar7/nde97YbB/Q6xHfMgXPez8R+/IYcDR/njVx50xF+eeeoH7O9C4K6bHvGdCz/IB16X6tN/9YLsPx/bALc/8ieJR/50nhVeeuoNa9dJWYXEd694+AP3r7AvLIQUhi+cse22/2drR5Vyoyw9JNWC965/Da3d6NfB1TL27M6//4BR+8ICKUFx9wxKp5+c5KymflUmCRFCU9sXknL7YGeCel5B/QpBlS5B6xRJcRfQuKaQn1mWhsYPzbL8xPmVgvotN9P91gZKltEGqTz+DRkZy7VQo+OI6NccHH/jD1esOih++Uv3XHflbCJYWaOdFA3wjvYbSgHgXZU5FpBEJ5W+D1TD/ZO6CBmnL2qXTHXH0bffNH7tN7xnL0uFDsjYbTEfPALaLIgc97TJGiQ1BKJA2nLThjJwuAPJpPpFgmkVfEsIiXtun7Y/dR5Dg0n7k4W1+waOkTrY/4D5ThtK7YFt/qOmrWPjfhXanyKNViTWHwcckxS/LW+m+mW/8cc+5cv2F+Gw/qDb7U8W7j68fp+PG/9+ZAV/jKxsrCqPPeEe+1ODMId8+qx8sf3uBhiuIfT0evsdqDKYaWaPkZ82ab3Sxqy24AZ6X/S71YgsnSReAlpbedvqPkG1ILEHecba+CQ7YWQnZLykbPno0tx6Zb4TAUYUpklI03N+6wF0gg1nX9QE73zEyem+ldEvvbgOHwCKQOVjwfgAqNd5gjuVvg9UB/dP6iJknL5hqUDPWftYNBcQekJhhs/SAGgG2B1cKnMGUba+ChU+fti4naIFAW8kbbRMPlz3kwn7bk2odJLNUsH88kk+wz5tQTyGyzVfLITsjvpCS+Of3FFWQ23jW8qpngaMdJDqmVbvsirUyKcbs4Rm+udTm58pxxrcD7+nJ+/8XIVCKZRXXCralUKw5FCEkODcdMJlzwxVxU3A1ObT4ASVholt5dFNZRnaSUpvUsUDyF5WPkyPGlM7jald5cnt0n2RnZx/Rh6zsyPj1bm5D7ACDW1ql0H80iOxpTyx3SAevi0XRBIsT0JkhmYobod1WqeKisQUc6FqJxbR/vz12Q8ftfP6H8zymd8sZAgjfzyjnnRC9Q89D9QOYd7rfr65wFtCopjzFy1RqgFy3mIQIZkx27Hhz5yxg0qSeKGEsnSDynztwcDVbV4Y2hnJzT/4wvZaMwHbB5VglfI7PxeqS0FamrX7Ew0vtydy6Ru32l90GBe/xGcA1gtT+gQyQzokR/ljdNr3w0FKYw58bmx8kJe76lcKtcGfV6x/tfDF12+3PzUEjOOAVyf06IWndKS+knEM70CJxW9DWVM7vSNiwtt3rY4jGgiSTn2htUs1D1AjU06ohimDEOJe0J5hC+mqmhHVz8PiQ/ThQNhHktAS0/26GlSoC141tq08O24OrYj2rdAXNAzr8WT9wzhTGa13UM+4ApdJVyFH43JasvuB2oGH1RyNIFCk6X7N86tGA4lU022bR4AktAUiZm9du03MK0uPN4fqdQloTxkTc69uy4vc19X2UugDuhYzL9zl35u8e082O2NEXALDJ0+8/f2J3oyUuq5pQYPAZw1vI4W0TNwaXvrQV+ivvqDWCDPgJxSRZC0h7VAG+qLmuqeU3nDJumTKh1eLfqZuvlAeHc3zYWAwMdjn3yV0uuYd3XnGZfFnn1FrgtOO7dlPPXyiXBJHjbS99dJXDa7cZX8XAsV84kMv+4H6jNB/6YLpfEZdhUJmt/aSN873d73jw1dHo/Vq2oXtW3u/cvEj7Ys5HPiC8ss/M7xmXToWPIx/0TmbbrlgvnkhOb6TUGMJdKK1Baxh7vPs0qmfXrXPgT5jM771VSgYu0dlalO6J7Zq2N90OCO22SzXUSWpPi3ZJ9tMobW1qPTvI0iQAXqcB0i5dPcHTOCmEfEAH/htQ41UFIcmCwgQCd6VkLX6+hHPSL3owvqTUEsR8ylv7vuvs+f7SxcMlMzWW4qXvWQPPlNQsZYj5qNe0LP6Qd5JqJtuLNz8yzytkXJa+6DYMS9M+0438AXt+s5rCv/6fc53Qip1k0hqj3llD4YX5dk0SOR1/z07+oB3oWb3TELV3tS/JZGRROSnZSisCWIIWqpG1cIKaF5FDNQN2ai9IAhgy/D8xVP+lPCJd97xwMV99oUFopUZsX540qeiL3qb/9xWDyWA2Irym68aXntAMhbz10Fnj2zjb4wcJWQag2IFdNDns2uSSR9KeFP/Vnwm+6IKD3pt4bwvemfaKFRTAsgcXHr7VWtX7R/zJbmdO7KfPHJCDkKwqu+JL/nmic/7rvVNKGy9Z/9Lz/u8+gwlfPcdszsOaEDq9/tL9EkXzI/HnPm2Pw+tENoLid/8/KC/XFNrScrlpv/gfxhKQAiRcjSv04Q+OT48NOAzeuRb7A4e/uromQHzpM9avaU0I4vdamsKBLtnUAbAkVg1hId4YM7zoUOUoMBLMchQIkRCaTzmFT1h1iXwnoeckESl+qnHzkLXtW23F6++dIZ2XYMSjnuF/7qEG38yvy7hsafUWZfgBqbDbVfnb/6V/xoFYkmktBNe1+S6BAck8o9fmtm1qYsp4bTIZmQumdEcYqBRNZTn2quXiVwRA+IIFDEEKXEHQVrg42+7/Z7PVFBCDTRECQrn/HHFxkP9jXf5SUIGz2mZqtONm/EB4wvjPttCzGQL71i9uwYlHHxa8W2X72dfVKKGbvrorhWe1d0KUML79x1zlar54SufaX8MgT8/8M1fnG3P+YESZnrMr17YwGDJKa/sSeTmC/EZl84eMXa9fRECH33X48WaDUYrlOAoU3UJfGObzRXfkq7VQXfYS7WzrvA3U948vAUzAtlA+Hl7DdlGHfSvjvYMaNi/qp9HmUcLQAmkCvOW5D3ujLBL1XiVLD5aJNReO4YCbctSNTeowduhhF/XooSml6o5IJF/uryrKUFej5who9iYCCWuZf+qaLI33ABACBA5gpidtBb6z61uQ+9Em9pVuOMI7sOkLuEDtDysJn1ili4a2XdeJbnxs+9vr+0MRcv+P6yNoCbKuyo1kXbTn06wP9bDpL7/un33tS8spKe1kXvCVv/aW3Q3H4CDH7E2m64/iUvhb9ehoDslCVQT8qZmSCuk1/m35uuuqjO7YWxXYAdE2RCRoPzRPhgZNCoMLN/mY5RkWbi1OrJiaGEBkEjL2eBqdnhIoFhRjosV7EQsY8ExL7nIK2bI5M4yujvdbxEDkt2mqlGNYXZibtlzQlgBbug2YtCC1zPRjKFM0q+6aKPWZL6HnuVvtt1xWRyjrEbu7vpLM8ewrR7xX6BQ/ZorLzp3ZtKefl4DhhlZ++RvbTjCm+1nvi+lhRiHjBYiT/uYV/uv2ie+/rRnhtE901OJX/7Uf0OL1iG+b69QuNume+Kn/Knu1h/WMb/1GguwLDOCtyAe2N3IuR4TYkDCMTzVIwpckipaWW7SgKsywz4jjUiXJ7hr1/MVoS4wFzD8YEe1NGEZy6gNr6Cju2fHZYobziZKsHelmDNhJC8MiJwmikeiTNrYIh3qWQOwoP2pCmVroxinKJQZ+IyX+g9Kj94lXhG5E3/LL8pYU15CILBKq4YzPvGabxULtZbsGpHY0DOu68v0bDzA2xkVLWmnvKZHq6kn4YNTXtWjVy781JPmilXJ/t7UijOfV1sD5XLRiz5+rH3RAeDvImZK0hw84Wn+9bXppjpLHPTKzQHdSKTmvrJKAmMcpQ83GIY4xLj5qGMlAzL7zvpAK5jYbiBCfSujtAK5ZcHyRGWRgTvIhjHWI9b0IW+orvdqkACcdVofr/eVxqUIMo7J5Qnu0iCnnm/rhrqFSQV5ftJE6PIqqLXtHalHo+Fy4m8ixMUAK6O5nVCxmGgh2EoAC0tmTGfnB7cXayzhHTcPrV7n3+mhhpdtWJsqk2DfdBZL5XOGt5uGFIgcaBP12d6y76DyZ+/0H1OtMZYQVCz33D590WOmclM+fc2PetpPn/7qy6qlcHT4pQcf/1ZnPs//XLTl6rPkAzSGLsPU5TMO3V9eXrjlGT7+wsOvjB99pXcDIvDEy4wXn2EPrpTLxu1XXZ+59W516QC79ec/POQffwu7Xr2JsQREK9kjs4wqu+/MS0trY1Gfdn+6Riuo1VIzB5UuvLOie83B2eu2GDkdSxwnGLXrBsWOmMmMCauYtajoZYAwkE4EgzTzAB9IKtJCi4NFGlIZsiN3TebmFcSJkcdLedEJr8u89GJ7a6baYwnhUZYqFai11QsAXrf24Bh063YBeffkjvKue2X6Fw/gpq85OBa+35/CGdtc3l01F8gBD6w/PC7HHlQIVWMgkVv/VcxOeUfOu2t42b4KALobkaIgMJNln7gqYmhlc2xpMCnZmgqZpPLIJ4EPi0UJ779zeHDIR9MBfuJ+kvbff2jpUzf5qIld23IfOngPH+BR/pJBmFWVniOgsQHjUr9xadAEJdz1r+lLTpyynDB/BbF2/7sOfNg/egfHcjO927KPOPi4I/d/snb4UfYwo8LZGzdPbxa/zaEEBYhhxyHG9kPK2X4zPaGtvTW6+k5/a2rwYPNTt2+wLyz8/brxTb817/rD1pXGnlSqPDub3Lx1+P5/NzLFtXFKoOki2dkJez6Pg5615kVbK5LnoPZ0I9C3n/nZe/1/e86GLeVZf0pwgK7vXy1rdBCDUl4IwEkbjunQhijJHt8qR3fI/NRG9HNdSugdETcFZacuj3tNz6lftvcTa50SyANh9QGxjAy6mjvuLE9P4v82GVtDoCXxas+buHTu8C3PhE8Kz6OMaz8fml9qwZ1IB901vFwbyO70qDG9Sya884O+lWLX2N8ptJA2LJfcpIGuFK9WlyU8NGxajv31giMW0PtfLBk0XdsWsk73JMHHPMOfnLbfWaEYeBgVwAdKj8apbpYmAkveSPnrlRqagoShF6Tboc+/J2HbvQdd8+Pn/+Ibp//+ypfc8bMH/eSdMxcdPX1GfPO9d8zL3KfvW6clfWRei2hrbo8e+aPEY76ZPPLHiSA+iPWZH//XvOF/x01TmN5feOzMz947e8dvBq/53QG/+fmDbrh+3927wjJ600j164Wslw/AmiP8y/yftwl/1waFYH+qQjJRr7vBMjBpxrO4AlkznpZ5CtIfayUHMkA8cJdpWYhHpVvTBuDlV5txbQGRYgi+4JMD7/rrynf/deV7/rbqvD+OHPHUFNrNfqKToPAod/66g7uS+Fz9QI3Aw8EtzIbnJ82Fum9ZXJDCULCJYbeBEGDUDK6XA+rQ3SqozbEx9hF0T/CMsFWDNgAxZNWhnnPLnu3vFhxBU3qA4ipSSwNTztDBJ/uX3k+/vsP+NAfYVO1VQNasTW/s+75Y83D/7Nc6qM+w/YMarFANs6R97JDxv19jT7aJRvXP7KqzXq8GPrltldMN9fsf7f607BK4CPWIyMGdhaoFa+BJH/H3/3538bT9KRhmofm8oPrFyrHOQsBFmNpl5CaljygzJEPQVFmpIDfLRTEaUr3tLDRezYuKlZ2W7YIRMZ/zwb6nntvbO2zX+8Yj4qdfsWKfw+ILwAoYL9XB/VY+e75tLrjh+SpM6HhBtBthKUFB+kCtVT80PDmDdIMQA2aI6CCZYOrlAzRgLMSubUCpWkUMTu/KwiOdDtSmMGIsIXuTSQqtej7sSH+D974r/FUPpYc9WC7JZqWiIwJQivl4CSgOx8PwhdNr1BArgC8cP33nPfYWQH19ibf+X0VvUkh8aOtQX8bO9V13T17x3AaWqrUNpuhZpC476XP0KTjmaP89xu/+Xv3CKgav00jvW7Pjxuo5pDqQalQ/H2QDbTUEbfX5UFmybWpc+jAxGlJ94iijyn2z0ChkILDY/MYENUCUq/eLHX+atw8QVjvh9b2dbsGUTf+IPrIxOrxhPnApS4vnHiDvngcaDhujK9ZFlTMH+DC0Rm56HwsOJCCB52dHsDTQ2Klq2F945Yg1HzBa0fiIMn/3PFBG36kHKmD1sbg7psOA+C8rLc5Ywqe2r4rFfBREsWScGd+GNYSTJIuEUdqaebkR2DFNw+aDGkuoBoXGAxeO+u+w/b7n3b3tBxVD3KQwae1RE7Qp9503T3/yCFHrDh84DBEGWsL8wsxaJ+O/vnLXd19QMQMHpUZ7oCp92fr1f8wcdbw9YrlnNP/21bsiARs8EA+5oMzt63AIP5aQHpBxVP9+Et28vOxTX9D763q2GJVLK6pB5J8b9y/8z5+x5a4rA8cSqAvVZEgV1UH2IQN3MVK5vSv1aEyT4jXlKL2EdTqeGgvxNqgq1BhL4LcoaNogRoxTJu0aSyhGzMNPTL31tyOOxnRw1zWFzzxxd5HE2zfaD7yQ407JrHuId6naPdcXbvyxvVRtw0Nijz21gaVq1SBr6K5ffXZauVko9xPPbGypGi39mq/ObP13qa7RsZTGEqqhxJRkzYyKpUPBEREJjSUa2xA7CJ0wakJiz07/FUmloqRpZozmZ0qpRSMbn+//5NhE/QUHiKkaXfDFhsO8M0fhIQgMh6xc9v9Vadpufc35CmZBe318e0HOVBf81/NXHvvuecGgulFkEH914wcnX5Zy+CCXLb99ZHcQH3QaWIVk3J8PKNUn+RfdzEypLh/URjFWaxsd5SJIwnImXqZR8tIq7aWUk6P8oQqKmrqW6pMRcjFZ7IeaArWGxiwX7Qa7YCCbIQWvFVCMFJQnuMuWgvV821xww/NVmNC6PlxgNEMJCg4xIM2y9CYmS29QW9G4lEKHCkK3JvbaFx3AFR/134Pzl5eIDY7AwYK6LguRnn76sPrKg1v/nLU/NQsjWqEzUMSoBqxUPl/zPf9dr6/89Pwmd033IJ21dn6v0Fd+ZO2hp7taQ0CFHvKG/NPOmC+Ht653zdNtE2qM7rhBZjGukUP7ugpHneS/g9v0zlYldeTBgY2IwldzMZQPrce0ku/6B6stUWXZSSGGwqxZtDreaE2pfhmEaK41wZGNzgBsCxpNbSli4nOowGf77jIWCc1TgoIIs7XH7/SoSDN8gGMlI6jWkfdtB15N51a3keDtV6VuvsG7t/74dO5n59m2P+2WnEJLBxzlv3zhzl+H3noxAIOrK/KGmUl++Tu5vXzFy6dnc974//V/k/f/sMKxaI4Vinv0D54434t49pf2edqn/QdFFE76XPytFx9gX0Qi73z45sJY+9n6vJsDxzb+61X2Vwhhul/2Ga3h0R/2LP9Ve9f8Zrf9qVkMbwiURdXhRkXgIiAzCFjtfgxN08gCZlZ23JjZY+ZnjESPnOQMr/DbhhqUmtbB6xbYRWgIZIgaO+LJ6dO/tuK8X6889ZKhBz0y6T/fbhkLhVYpwYaLGHLTcmZI34gskJGuhrYSg7R5a/kPKiDZ205ioL3haNOGv/702d9+e7Rg9RSVyuW//3rqvBW73WcI0MxmJ8pDw/7q8rY/teolbNx3ftcK9Aj8SmbxTrKTplnW3tK7419/mlE9SPli6ZdfG73waJ8j3mCF/LQ1gysWSfbKcGUYbP6Dds0v54+NPPmtKz+fX33oc6Naal7X6j3G4c+PXpxf/dw3ze/X/b3Lt+z+R/t1zyk/6HnwQ/vsiyoc+tDBA54t4oWkkdPCbDAhRCIH7O8fz58uaHUkvBSt7FyYAyWvXAQ1BsPn6l4jXyglbg1BS98sl3bHLLGF9hjwLLt/BwsjYj7t3N43XTV87Ct7Dn1S8vFnZt7625FjX9qz7CssIhqjBBFHUwbBPIEalL+WEZ2bMqd2ytwJ1CseQ8raGr5dQB3TTsrWlHNrDZ1M3WnCDlJpVskmGAbKV1rR7JhRLkV++sbCeWt2njW87dzVOy9/1pRZrHpB8Bv33Cg0paJtDlps/pcou/SAhsk/uWNO75S1Lz594i0D20/XtrwxsePKVwcOXVBWuUkZ8IzCCqG3q/rey3OyFcMcUonYWd9fc+G29RfsWntZcf3l5vrLZja+5Xtrkol5Nub5X702VG7tYg+HQ88uHP9ceyA0COf9YB2sSZAx2xplHnzKzezttTyheQRX5xFHDdiCVKnuxUXQqAWx+vlAKAbVldWm5H8yoaKae1sxb07vNnAXiK1nUPoPZYBBE4lVwZdjpMVpYqLx2R1bVwG9f+AxyWd/qF9tYaCAnffiiwbWHRT3p1kX8H0RbE9wj41S4J5vmwgeo5NLzwN1Q8h21wA6WaHErJ010sBpU2TPss0rctkzoM+6Nh8WWCmmzhBfPaoh0DLnAVuJeg5XQCgg+1MlPvXuO7Ze1o/ERxNaPKlp1twneKiUl+kZnviPf59+8pv8J9q/+0E7EEToJDcpaSWpNLb8tCFdvZUpLFlHFdoXczjyXcVTz/bfjuLsldKfLu3WOmLXuicWIq8oF+T8dHUHBOVx063ZLz1nsjBjIn8Da6Nk0JnQpYB+p+ZCdhOjLtXIMAwRZoIvD7/tuhUja8MpSgv3/St70YmhzkmFxfEggyZiuTHwEON9v18r83jq4R9/nrjiRVmqKdmnIQC+pvGhbyye/n6f+iqVjXPXeBeR+IJiOf8+/9lrm7dPfeG4WUo4PzW/1agqdmQJPiDEUuKAQu2+5U+bgrlV55L6VQWIUpOBAb4SDrCUJS+ShdBF2USvIk7r/UTIT9RMPydy+SISefTLesIcoVMXNWYc3fuXwqcfvzsPEdo3/JGPmC/4wMAz3+/jvX31lD1/+O9aBz6TmYE10WSPNAQHtJTspDG1W3bd4jbf8kyL2tMom2Ob5XAUQE4H10fVfpchQZImtpfzs/UnX1XPOPrO2RPXf8t7HD/ATCzlxYm0r9sKWTz/2nidpfxukMNUv+YplMywLvNnqlKoLB/EETkmG3xGRtFKlHJdk/WLBf8NcM4/7477LrRliDjQL7Q0OeBMbFU5uA1DzBGCJ5wffeE5/pTw1jVy+IG4BTJjSssMwVtCWt6EWaZWtfL95Nhwf8ZnwcW/75r47KEyb0zl19F9aQotIRqBunRwSXaN73k42+4sfPThu9OD6iT3yPjWMo6R/Z0FIieP4af2Qn5C5FGZok6SarMCkT/ra9EnPKvWIW4efOdzW69+m/25NuIpqa/Z8Top793P+PS//Sf4+uKcAzbPbpZlXxgH1KN914Xzbhg84AifTWT/fcfkZx86bV/UBJFfsNufwh/YPnnBETO6rjmTUKWZ9EmNW46atANJW+U2IW7wLb4pYkZN8UPf1kEsEAaGC4oJQaK5UZLI5/Qua/F/WWKmYWJ88AD8QZOkNABeJp6KI8PHvqrnFZe1YY+jtlDCyz85+ORzfYb9v3n62G+/PFODEgBSTJbcT3BJWpw7XPJMwxlzQcXvzl/1S2vDk6QaqKaEb71u/Jqv+lACziKaKtDjbA09Q5qc3RE+QE2Il+emgcFSeUcFIQNrYA3JG98iek05v1j3QT9xgp3AKuBZO8+QGBQcbjVNkbdgPdFm0PLIqHqAh+2fVUFyYc3PI/ATGhVRkWAncidYWfYGXz4Af/zSjOfJioCX4Lq0f1MFwxTiRJrQDIqQ3L8i1C09TyAGFISyE+NJMXw8D7gDkf/9usZO8992V9ETSXBQxe65WREwej/2L397PAifvWdDuSg9fp6onLDqIP9Bp7t+UfY8GRiCBz03rum3G8WcqHATGpBdraxz0yhw+AC3z46qOsyl3Ld9qYBwUo9TO8vEo6xjkXxrv1W8BzgAyodO4H7kWVlFzg+dSOTSIo8ugUpnNYLuu4HijFp/ncClW/ny2fNAo0H93A3nZsjgSVJDQHm6K24+SIUGfNVyQFpIdgPwM1/qwfoJ2cPDndxZxkzG0ulf3bZTepAemaExKbvH8FmPyWIfXqFG9urAcnpQQphvQVmrvp9eH9jPee8v7A/+qIxKtL4faNj4B5kVOsbgxLYyGcFwwF1oBdQ0eaQWMF1TfXVGdx76KNsPC4mV+7dvlD8S+cjmkUS84QhP+FBgAWkxs3duZbUHt1w3bX8KgZmquV5eWPWLwMj4lrJL5ga9+OvuMwxCbe+ZL/HwaEcwDZWIVKhmpfqOMLYcmbc6QtvTvtoFMh9CzzcADHbaIX+dwKX7FXz2POAOnodDwhOJb1AvXbpYUKlBMc2OW6f0WIcx9LXvMAaaBDYUbUPchbmz21RTDIQp5hW2FQ2soTQc8IjAI8PGHkAewmLrNh+vUKCbA2tl4zZsQNwF/qJZaP/Sy9wC0FA2K0jh1GKFR51gH7oZEo9/bmPP18BpV6dXrQ4s3hp4+XvX6oP+hZ9aE9j276lN4ZUINVsIwzAhW77zrNOH6btCrRUgFbh9WD9ql1PqlDvuPknLNrI7VBcdJWsIPGVNcCiGcgDqg0jWHBg74Oj4fg+fD1wO7xNV8fO3Z0D3POAOfLViY+UKoHqAaDccFt/vKG9UnrD/0fF1h7TDSNKaMsFbxiIYEkIMY8bUThnLxRzuXdnkrKFqSNuYFo9BBmOtjpcaiKVEOcIijVoLh51qf/CgWDISNMTQGcnnAwTS2t8mOy58oG4oYkDX9FrncDXdqkKyQqa/ManoX9maCzOHx75Tf9SJgeyyc3vudG3L3f/2mXGr8PY/+S8efPLFgdkpB+9H64f6VUuRJqzdq1TnHsKAHglcodYsiBYJl9GCkrCCshVKnvFGmZfSrKC0D+WI+Yhnp9/265F3/WXlO69dedI5ffEerXVypNEedFzimBekj37efHjEC9L7HhVXkfN3cJ1+zAt73A+4A1/t83AeDltEPBeNa4c9NfmI53uj8oRjnp9+yBOTrRc9gmQNLNmXC4ZFoAQFGgxqbnq3YZZl2rUQQ81t3RRkTHjATAya8UGjd22EkFlvrj5UX3WYvuLI8iPP0R/+jtKh78idfGXsGd81j3hWoL1JPMmMjn/QhO123En+MyNLORkswfuxrxWi5nO/p180vvaCXWsvza273JR5nCo86ED/RVjpjC7+wazobgd8VjexfWSdQbOCEt5XCI9Uqg2UsPL44qs+5j9+C9BuHzhUVmiff/Bk0K4eazemDzrVp2/nGc/23yIpX/AZH9Di5hMuMS8rV9QU4XPja3vTgbOw1MSoVK+sIJEuPsyRqKbOR8PcQTNT7NaDdQCRIJPZyYqAQUAMBD44N3lsdszcc78M0aWtbkZIQtkQSjby09KyFhEkBT548pv7Xv/94Yc8KbnusPgBj0688DMDp3xxULwo+6nmgQxLr3plcDcZKfaqB9yhibYPB3si8Q3uZDQN2qbsML3wlNAWpdA0MG1kz+1dFjEMS1dSbWI492MHXzK+4ZKxDV8Y23jB1vWECzdv+Mi/1n70lrWf+Ps+p39m7Zkf3/ctHz7w8U9e9cQnrDtw38CFr8k+jTZDBTeBdNJ/HewffrdjZsxIZGSyoLLPtKRxaW7tSc9f2xDX89Nizt4CwYNi1uQVKJ2emgc714ZiBdqDsILfiE4221hb2bOrVRs4mjE//Hv/Sb0KHz5xa3HMTujX3h+4bcabP78xlgmrbX72narpp5p5wZ41Lzlzg643U7biEMyRIyQRjcklxkf4XiNFHtVBfeu5SaD54ObOyB69Gs1H5hFYmwjYCxvDlkRHgAG+7kHxZ3+ozykThce8oufIp6eWF6N1LayVL4sNmxjwGEwhBnxh+4uOoaD6XhvP+uAjAscYf/3uogx0TxiYh8IKRuTkryZ991WtC9p2kBLhPq/gAZzKdH+TQ4hoE7E9YQXxlryR3H9bYwuw77i+pQXbGOafH1sbDV6C8Ivvbn/gj/ZnUnvLpfqu3f5T8HRdf9O1ffaFhRUPDVTGd17hfePT/1vL9LZzqBxIJ09be42qUcyZU7uxyGUvGaoSB0LNLltcYCgf+NiE12m2cPCJMmFvmRO6E813QbQd2MWwAgaOfd1JSJtpKuMnvLJC47gxeYsMJCifcWBtFF/+v17kv0F/bWR64qhs+8IPvAXumbW2mM5Yp72r+w1B9TPACrGklxUuf3GodWcO/t8ZwYcJhMDRr43G44HEue3+7PdfZPvhunVGU3bS+Ngjd6o71Tj0YQNR13b9Bz02sLdn2+1eJ/E5L/PvYmoFhhG216gV4O/SdqhQ3MeewXY2aooei94J4RsneUY47YtKUImB/B8e1uirJ3gatedbT2hCA3hiqBG6B40mqQ1V016grBFu+6L78JAn+q9IsDeB0GQBUVmmokf6V0d9V6LVRbEUoifS2utG+pSnTRQ6tpjHPQ+DKlYwCXrMjEzqd9zu3fsvCP/4x+6YZsZ6DH7Iz5sw/l7wkcBdKyjV9+1v77mETPcM6CRY1N+90Z/9KHCJ5T7/NZ+Gx7zRnxKIeWZT5xsuJkJb5xrVgMjDhKxUQOHiZzfdr+gGHLB6/+hLPzv43utWvffaVS88f2Bwtc5N++t6COq5akuPFq2sYB3V7g5llw9PsVc/4AS+cj8cEsW8Nx7/4Nfr2yRajimakJ2bw49Ua2/s24KnaV/VA5Gm+vVopW+N/E1j2vvG0dQROuDygFNT2oLpmcJ79hlFD9J4aEK1Sqpq9fIlhdW+s+Yf2DTzof3GMX7QzlJKfbKY4NzrhtIp/4GHGth2X87Rg77wLIXldclemZOOusR7UDfDQIua+z0hd9AzZvs3llOD5WhKDrJXMMzI8Y86xr4IRqlkXHfjje6Od7iwOKNlR6Ojd8Rv+25m978qNDJ8Ga86Qufs2zOHHmyvp/Xg3Y+5f+f1dprII2rO9VvzwpnVeFT2lQvvOm7Trj/bdRQkSMWCcWbSOyZxcX5NmIOUPZjNFd69IaC+rF0laAL2ZQCQGTwJt5i5QaWo7hc0fphxS0pJ1qBGZd8n4sRpKKE95yIPf4QOr9p4eOyNPxpeeeC8wN/718IlJ+/Zs6VMg6+9enkyazzjLX3O5hlu/PFLM19/7RgK+eWfGHzKeT6rl79x2tjvvlJn9TKtAGVnX8zBrW1iCU22Fg8GD2NR1XqiEjS0dL1TchWwWmbHGzME/De0+O9Z2MUa0xbDQtkWVKiwTui+QRodbQf+ywWcNugG5NF1XoLC+GRn1mtb+NVXG+sYcWP3dv+O4b98t2KRgTLZrnh7Lc0ehA8fG2rXHQe8S6apTJiJtLWorV5neKLXOP6DY6f8eeup12474SNj6x+d71tfimfm+QCg5a/56421/ZWZXOHav1XwASCSZL85uH/pwKdmn/HV3a/8y9aTv79j7SNq7Tb6ozf7r8/4/ud2OHyAmiN3lcchaOef5D/O7PABuPte/0mrv/6Zz8EYH39aA/t9Ofj48fOHVXhhNjOtpUXALvjZqAyEAdMEvdqcVa5FI8/50ICbD8D+j0w8+wN9QassFxKzk+bkbsMTUPH218L6Pg+4Q0N8ACjGmTFvJL5hpkE+CAJvhNqxotL90h+IZYAVi4qnjdcyZFtDl1LCZS/bY39qN+6+deZPHypToE4ItEX8OuC+8nqf7fWz+dIvz6ugCn6IQXfrt80ffmNr0KTJahDPB558f3FrPaXuBxTBzB5rUdtgrUVtiX7jpb/djr6uyxzk4K//93//untzqSr9+WLppjs2/ePmm8J0jPVvKD/54tFEX2Ah3Psrc8v93tGIO2+d+sVb7L5+ChOTkAbssZG3/yF63a8rSNcwjI89taJD6Wsv8Nmco5Av//BkH6W25Xf6d87fEb6+CsXyx0+5d/rermtE8BAeQHbcSPbK/FSPWx8GFMHQquh+x/g4YQ86Ltk/0Ngir04AEafcPcEt974PuENgIwlG3ThVaCJmX1jWntSj7M4wi7tgUpWxFM1Bx1+BITD/YQgMpnYMztjo0o4j8KLfak96gv/md2Gwe2I2IlsiRv587c5kJL7rvtLWfxU3fTMZMeyZ407HEYmkTG1/iV9YiUX7qB0I1OHpcmsO+z7FeM8vNtoXUm3m63o3G7Pye3fHkTLeqbDMcMTUzbWPqywEa4k1/E/58IrCrHHf/+rTOyjG+uLk6TgCirqUMUjuqCOyk52UeYpyqxKP/8SefU9swAmTaDUtZyT3zJSGMtG0XuCWemMYUJI/P21k963Sg+TbcaTw/O9Gn/ICe2ujr338gWvfNS/jMrEq6v8rcNR55dedv1HTKBPzQ0/avOVqb+MYeEj5k//a6Ay5FsvG2au25vcEZ0A3U4Pafk8zkRD7jpVy2aqoJB+UkNz780gRD6RefSEDHvmpRns7jtxAsIf3jZLyiW32JlchO44o6+GN0Xdet3JovbejZMedpfMfu2t0d/lhi9pxRGaqy4sfOL/hW3JRp3pCwJ2/thChO5EOfDuOrv3GLJXucTRlDYq1FxaCgSqmaSjRRjZERPkrCyPmR7CQ2IY6jrqXEkDv/sbhx2aUM7hrNKfxv6FNjBYTyahZ1IycVpwxZ0flYBn1fDUoNTJJDNWd7LJarVc2jOSz6peUZ7RIXB1UYk0UKWRFC/gic2Bpxdr4ngfKM5vmZcZDCSrjKEEs9/y0bE2jKo+vZCL5ClnUqjgpZIUpeCiBOMmIHtNkZu2c9uGl+AoUPjero9Wi5srDC/gK+z0pm+wP99ZGUMppW65P3nVVz85/xvPj8zqlBiUEQfUIU011e2AoecyovN9OqCBzYHlobWxyR3nyziodFgJKa5esjVhUJYZE65TA66hcPshIdeN1hYpBEig97E1k5thXh6aEDRYlbKiihH9blDC6mJRAMex3dKJvVcXJ+KRkz6bSlltL/IwHMkP62kNiatpH0zCK5gM3FRUTo0zWPzQewyZovBYckMittxSzqAL7ho3wlMADaCpF8ADx0GRBjObPECVJNo1uL6EEt9b2gJJF0PGL+VywzmOoNqBILTks5v0TUE0JPEZqMaziKflWBNK05xgEEYMH1ZTAZz6QVMpNDffxmCIqPjiaLsii90U1JfBSPWZpH9dUB96Ssk7ZrK+VNLNnpTF0UHFwv9LIg43EQDmWNuIZI95j6nEKRJiSDzxoFETcygWtlNdKWb04q+XG9Nld+tTW6OSm2Njd8dndeg3DuVFKoDwpKFUv9q1gUAg1KKFFKK29KJTQItTwshIS0v/wk1OnfGnJUwIK9PhTM+seEiu7GiZN4J7rC3/7UY4Uoww2PCR27Kt6wzerapC1/JTxy89MqxlEiZR24hsyfSPRutZJDZDIP1w6vfO+sqfYmqYED6joaoYgoIUQA8eHQLP50gPNrao+lwgoJhqbtVewkcjofSujaGFKwY30oI7E+PJBDSBDxEyAV5FJtFhaHerpbRphQX2gp/IzBm2S2FTjJLbZcasfwGLNVgQ3CETOK3g1Vrb0vdSoalOb3Rndcm3q1m/3/vMrQzdeMPLHd6383Vmrf3nGmv991dqrXr7uqpet+8kL1xPk88vX/e+r1/769WuuPmfVNe9Z+ecPr/jrBQO3fad3y/Wp2V3RMB1f4QGlUQth+GAZtYEYYLdh7lCk9q0lDsTb2UDCCW67EJVHs2o1VNqC6FPvA40HX13cLhA5iYT7sTAwNLPjVoehRQkoe/QPelKNVKPTsM/UOARKycHSlg8kgGwLMWRlu+C+Vdae21b2yDkfKueoNAAYFX6GGChf4pGi7Jfh/uaIgRjyU9J5lR7QIKpYUo6RQdlRGWTB9yCwdgGBUKv/4H9yoW4uCZDaaFy6O+zrZbQG1MTUrnIbNj4SVStWbZDrbOtiHgh4F/Yc3xJaMbeXEQbUhSpkZUPLSPWEmInoNx+GsFpcY5TQDL+1oO5Cvk6IwTqMAWKEGHpXyoStWEI6KGrEUP1V9R1aEYa2zHUpCcdaexPW3Le15utIJEmVyZRTcrqDiqRcaLVhzCc74O3y6kk53itpLWqr4S5Ul0B9NPGTECCRyKgcSdZNWqOJ8mmmSDsGxC83HbZAsX58DSAMmnWHxjY+OD5ygP9pbFhO6w6P88DgOn8DCutkw8EJHqCp2reWEYSW5ceRQD4QkAHHh0BDSkfCtKytQx2pGTfaW1ZshT3sH9UDPwt/0Kag1bGESCKDZm/g53pMOk9Ru9AgLkIhSymQWx/JdUc+N5aAk6W+9IIIZIAhpakN0Yyy9OWV8t4GjyKTo0tkvFenQPIzhvNqkgFL9QxJTzQ21MwYys7UdI26abQT2RmoUJdEyEv1mPcgz2pYCbMWtQXklAcG15NCOS47mPcqUJiVQg6JkAdtgp5BOQYgvGQCGWIJOGizdRB52fLHrfoNVTIKUin19jhSkTcqBiFBgjHqnchDHrRZipj7PSzx7htWyqBaFQozck5cNGHNxfADtYAXIF613/xXR3ppgL5d1988Y+y3l9cZSzjuFP+xhBt/bI8lrH9I7NhTM7Q1++vGQXNGAn99wfxYwgmvz/SNVIxpNwoZS7hsZleIsYTvvW3iuv+ezU54raJGD9qk0aGOKAd15qsvlJJErmFr7e37bgvfipROUfMfHPgcx+8CVnDTrTRqLVDKNtL5A11BWjQARBlzHt2N+FKCUqyVAuaOXBQllCB74QUnVXY8lmFnVCrWE4WL0CMrtplvRY4M4UZQSjQGLqUdqpdax73BVZaaM9QHGTgy/Y/7rw2ZQOI6jp/X8VLip5lBhOpmIExZ4C62gCYpEd/fVSzc7F8t+kFNvgqDGiNd1bBKr76ihzaoO5zcIAn2BZVIjXSoF44yp8poVxR1yJJRcE8DCwIppyLCF2ND8EQe8jh+nqZdP+IFaUSluhZs7wGT069pEhctBdAufGsQMVOuqu8DRP6vX+U231r090Es8LuHPzO98gAvJWy+qXjb7/PETbpWHRA98llpGRFsFiSSVoZeVjUI/z3ihWkar0dHNwQSeeP3snu21qeEH7578obvZGmkntdhEWL51W/pc0BfIb2ILvqhToMyZZhTe0PvloaseCwaDyX0jugzo/6tl7qniTrKq1FQfLRABNe+rgdeJxNULA7gUv0c/WKUxEvyqHt35JQy2gpVFaageQvuAvKhxJrIMZMdYwSJQZKJkPKV5ZHWwI5KGLI+PSp9RzgoXFIy8DaF06guEN1nnSJnX4slKNPAyGN4mwidCyOSBtH+LgxtiJJalfIwqMOjlRDPNI2XUKtCpayGdRl7D+iqDkJnbe1+rVQU/k43uKkcNkfdjKjIPRXRLiAbSLUTefgNLfhB+O2M2gvS49GY1aDBKuJxg6J2mgDNjWdazYA159AuBi0Sx2eqm7J6oL1Uk0o1Jfy/syau+8ZsdWNBw9BsG2h0crauUAL6wb4VDN7emHzLw5Z/4QkUlueOCnK/hRKU1IVOHi9Cz1J/joZFPhB6oStDeMtzGIM78oaSioqngeWmDcUfGN00aRqeyCgxuPNuBVxjahEaoEpICZdYLviDyYwue7CEzqCCRGjNMFORS1ATBuY+eEIQyAJuCgVCoeEwqZv2TypjqBMaqV+er5tfdC5pa5QPBJZkdgpW5L4lXDuEOnqhkylXyWgC/Cge0RYlhJGpYkHca08ouUwi6UWseqDhgDJxosQ1z1c90Hio5gNfSK1Rd9Vl0WCFSgwSVSgZ45lGGnQXg5yglDESqz0eFDe2uZzSYx3G4BBDHR+qHtBZvAsbUNG1HEfTJ4PPnnLnLYmMdIOIC2KN4QD+wlu5SSPV29iJytQuscmL+qETmScgod8aMeZFPcJMnuBmQQ9oM1AmMpoekCUapKrFMmkdlAaU2SFLfxl7ExBr3+CG56vmghuer5oLXY69hBLQkmi0GlNOhRiswxiEGFbovcPoyjZoQIgBXe/0SsnaEFedEz8aGZ7IW4vpnK9WPn/mmT+QO7kpa7GCdVpvSCgXwRNUzChTz31CXRnEJIcYiBafMRYwWrgw0K3jEGatIZZlLGMZi4K9gRIwLaMJ6aGuq0qwzYUY9hiY1XgMGZSgNaGiRR1UVqvbqhwUGKJnUIMt8nNbWSgMH6A/8YT13MHPQCM7yVgsqLFuKApmXUR3wTkOoXvRbCfMMpaxVLDkKQEzXEzLMe+4fA1ADFO7jNkxE7O0d0QX6xiNbE3abQXuBBAVrEPMhnUuZo2YZZJi3oSfSMzigmRIMVqzDuJJn3kmHYVMjKkcM+9COIMuy1jG3oqlTQk0UQzb2fGKdZLxQSM5bLqDFvNRNGbcKBrlmTEjGreJIRqXh6Np+2F+1bdO613Da/x+HpGHI64ZDXBAfMBIDNl30v0yxSg7bsb6jXi/D18lhozECiKJlKPlWJ8xdIDVz+OCk34nuF9XG0+7IHHB7rWE1/8lbd+qxIHPMi831xMeffr8KTewGo4LpnpCFrXJaLk/MURNsqlCUrJgJgbDJkzBnSlCz+pIosen3y/eb1JE9sUc1E+iPT5vTJKeuTidiqgGJe88poKvhHiAz1djYGYZy9g7sFS3vQMo0IzfLqfn3d37oAMqNtsqlcvvPHLL+C0VGve9/xzZ5/Dk6doWMtW/OtozpBVzxvtuG9l078xnHjKTObj4qVs2xq3D9Iul8vnP3Hr/Lyros9xf+OrE/m9Yv6kwd7xBPK3172ecf+uGrZtnL3vKVCKjj28pk/1PbF95920zlz9h/qCYQ87Lvva8A+yLOdx5z8QXHjXrbIQHqk8Ey2VL563d1TM4v6deED69Y7VzzOcZqQdMmatdgYe8QDvnu7L3+LfeOPaHS+y0EaHa5gxrHVaIJWWFR6lqjmzyiNnzf3ugfTGH638/+pXH11k/g0qllPBFqrOWz5fe1LfdLFZk6c3X9W88NHHuQMUZFZcW18RiUcMwvnTW9hs/P582nJvPja+1LyxMjBbfNuJzSvP7t/VvWNNnX1golcrnPXTz1O2Bnpo1UC9TxRrtOAozs5nIyx3e9s6JPPwk1GUsJKonoTa37V01aMXYzdYsR39F6gYaVQ+/Cq6rIN0y1vxcDx8ojO7Of/SkzXZ4+uZyOfLcz2bs76og6nXGmN5tZCciV1+555BDBjMbTPjg/3439bYj7vvIUzfzwNt+VKFrfCEm9s7op561bd2Gntf8byY/be1aETWT8di2v1Uk8u6vJT79wi1OuOCM+7n5w0/vxukhU47Smc+CFT7x7C2pdOyR77C/rYH9XlSED5x1Kc/6dI/6EBbWWAKUg9mOEkdhadbSPAeFu5Pu9J//nM1XX7Xz0SfixYQVUzC2u6Dy9cnnbSaSZDL2nM+GSuf5z9zGryamC6/7nPc4jU8+Z4uKk/Cl1+0YGI4/5TP+B52WiobzJIHcveYrw/Z3fsD+WNzxnmUsoy5k+W2PN8St0+JRmJ77BFp3tYkj5on9cemAbCjDKsj/KOSM+/5Xs8PPtfEdpf0elrK/8wMRihKcMX/0ChncPPeGQfyDK14wO/Wv+KZfald9fWc6Wb+nH0ogkh03aF97/5Z99ul9yifjRBu16uNP364426u4K7rld7oKD/xGj1k91HdemsJFoJLww9Rj81mwwl0/kZtHPtJnt2EPXvVRIbBNt2enZmUvhSe/tv5PqkHixbIYNyhnSltNllXEYE7Pp5+w45rot18slkXmwQ0MDZfzksHNv9O3/TH67+9HZrKFtQ+t7DgLwKZfSGl873KfQzHv/818cd1wWWnLltlHnexvClBZzpMS7poZ2LeWxlddRmRflcAyltGFiMZlro1H70etgVLdlxLSWrV/6O1PWBKwp5yG7u+SlhyiF14Rw9+vH1+/pvdPf9ohe26viqb7tYmdoXaPNMrSk9MzpL3qg+snJwvHPmPFo98XOeqjecMwJv4efCi/GTnqeFtll/KyfCzZK91lXMZSso2MB4ZWx/tLjhj9g/K6//nQzs88T04nTsRjA8c37gzq4uLwN5/FfypjgKQHdWROdKJmxiyqA2pLg0xa3liONbbNJpYLxQuvo6CRzfpurQuxUn3+mNpdWr9PKM9DWkYwI+gxqQgyvhTtp2X8R0GaZ3VQ8NxUoQoNU4Kc1CPn9VQEFTWp8dw3ShXzcNqC8FNOm8Pfvilbx333uUXnMAZlIXrGfhViibmzT6ETQ9aRHXKyPPyxo0ev/v7oi9685qWn7H/JKT7d2TbkiGZzw2P0iSl7vzpZrDApixXg8Euz6197w5zqDY2nf8mmn12/Tk7ckDAMKaZ3XTl/MmgYlDXjgp3rVLhw17pHvF12hC3mTDwYYawjsp/aYvekcdPp1my0ayXVp5cKEoN93X40lh5fULPKv0aYa+8quDRQWdg0Im4sh64I/HPDc9leWB0tjmHnRmOUQKILM2LJukNuSvoWeAdt2/MVob2DZjROdGVDU06D8LmXbH/PCZvsCxcefVoyXyjnRoXSstZhDIZ1CDMeg3gncwWWsKxPfAJZEb1Kl1UOK2T30xPfmNmxOR8par84p3jv3dPlsrHpmlq2czEX2WefzPY757tc8H4o5J7Bphw43Tz+cav4f9vW2ad/MEOY2CP7fq1YlUiNNFARUVN/05oHnPDXj4tOLGZlv3WoMZmRtDkSDI2pEZ14WsbY1c360Oofh/CVV+z58HHi6DQHXENcNPuiWcD3iuoQb9Pi1+4E9YI3Uzdo0YoKiuIALYeuCW6gajx15x9C9bb6AD7QdOlT8kA7LbLZ/tgsUIilnInljvZvLwF4ZhzJ6OuQbGdd238/7+7e3kTifRv32NeRyIc3jZRTxQ+snrCvLbgjl5LVtXJJejAuN9ff/teZzzxqXD0GHvth81Xv2fCWoW2wEUY9Klvqb23xgtv3fedRD5R2ilWOxiSg4C4aW/etix645YI4GhM36VP3rd26Y/bTh1eMJdjQZJvYQqn8xZmN3/30jl+fO88KRNUzpF84uvYf/9x9ycPmTVPSdvPV0//zqmki951x9LBXRF91gVBCNX73qx3ffsr8K2rNOLLW0FVHrsCrex6R/dgvD3jHftshA55UZj5pO/ex95TuTDsMUQ0Y3ZlxNLqt+J79djmzcS6aXXXbX2e/eOK0uqyLx5xfevXb9z1d22JfW/N2PAdtnj86PDtV/tB+81Wp8P5t/auHMmem5snm7bf2pwb0D673Pkkh4BhZLKhNj8oKEt4SVDK+WLAZR6f/z4r9H+XTP4lgU2XOXAM8s765UwqQ9vEtZfe+QMtYRMTi2uD6qGN0Im/5KWwab+14KvS+vxa/9BJb16kRglDuhSYzRbMT5uT28lxMAuzaJUMJNEuZcjpVf/bVpcU12+4rfOhBDVCCg9VPKnzk1/u/+8T7dv5hvnUpSkD7wBypXusIHT1SzOQvvGOeEoDo00cW3vn9fd604f5MLEFBoy7T+5Q+/veNV350158v8A694oXENxY+8tf1qVTsdH2z54hKXvGl8vp/3LL70iPzPKlQlxI+eN9wf6+MP3z32/eJZCAe5cjzX7KPmpDqfkvTlACSD5s9/3cHQglU+vQuOYWDm6Tt7KPvidwvyyCCWEFRQj4PC264+f/GPn/0/MTctlPC8PGF8/+4/48u2fmzN3r3R76svLZYiLwxXZ8S1AQ+VCfiR8zdTAlvv2blQcdWDT0tY2/H3dcWzj92l/rcFkpoqndiwYF+tKec1uQDtBIhFot+6ZSKmezhccr5YmIrPnjeF3pUhPCB9aW1teq4UZDjZdSNClCyBzxefL/clihJ5QOP5R6I3X3z7PPeNWLqrpTLEELkRd9If/rmfeGDjz3rgeoji52eMeHtcLUUX1NSfPCTb2677k3J696c5O8fzkj88vIx9cAxp/lYkc3ASizKDivGWtQmdjSgdqSCTLGp0f5yqxJ63Lxoz1r4ANvni08Mq/09UJUCH9jXLlw8vU59S4APRsdyV72x4vyaS/Jr+ErX9fcfW98SovpULtDprWy7vzBQ3ZvL+E9Dud31vgS8hNkxQ3aGsM48sL8IwPqTSoOro7d92zRyFUq072HFiG5O/aPChvL1EgaOKtD4p/8pT6b3KSdXzw8DjN9g/zzdL/NEjYjRe3hx5tZEpDyv+xJrStGh8rbfxDAt9ZjsUc5b0IOZw4vGlD57Twx1aRgyswjV2bN/KdZrTtwUqKYHjymQEW130tlqYvCRBb0U1UZtF8TDTPGV5eQ6SfD0LXEnVflZs2wa/Q8VlZbbpeXus1+n9xj9h4njMv3vWGnCLi4iDOMlRFJG78Gl6ZskGWQExkJ1Jg/Oj/4tqhV0SEI0qTWp10PhGN2HnmKWDeO2b+pGpZIdOLpQmtZm7qhPWhSL/clVKQBm6ntooZC3KzS7Vc9v8U4d3nBSaWB19NYrTLNQKSGHWxJyc4WE4NDAbXBzVqaBiSHfzV7Cub8fefAJDU9GWMZSx7//mP/UCbYF/B/RcYR+QaVpUSEG+26b4EsJYYC6pw27y9EByoL2P7XTkN4GS2tjPst8JGuffe7gZ6gRi/BAjfYOy35wKCbiSfXpYVYvO4ASgnr2q0GEoSjBBRU/eVRZzlkntVGwvqxAXgbX6ZSP073TRlApnrGEVkD2iVCPCedRGkprLxVK2H1v+ZZfLM01qMsIgcOfkpKDry10JSWs1Gk2aNhqq7BFoE/710TROE0o7rqQgYFGjmxzQE4pTfvCA2taDqlFJ3KFKlG3WwTqlaqCEihhOa5nUKY2hTz4DEXTUKVACUTb3Klq4itkNEUSiKawQuUDPYN6ekAb3VRrClbToGSCTlUjMbBpYabeQYMukHh+xfMUOxRO5F1+qpqbEm78Xu6iF+4mukZSuowlAFWnb/nOyNEvtNfeuilBNcAwQo4MK0qY2F7RGHuGdO2sEZ9VoA2BWFQPCTKt+tDbA1OMTdI9trnsjK+2ERi2jR7srEBpkmUMXh82ts5sQAkKV1vqWN1uFRRFn5bq1UktNAmTUetEHmaMgUoJTwlkraWzl60jpp3kRePiFnATqUCZahD8qmjR6gSzn28rkBbfs5fJlJo1lJs0Q3a8Km+Mn0Bm1CZ3aGkIIXLO/YYU7YKdvfzGHw8f+Fi74+vvP8x94eRRolumhL0Mqk7P/P7ww0+2KeHu6woXP2tUfUahxfzG8KpBo8DKRFlNWWeLOZDzuF4bn5+z0RzwEmg5be84QqH0rdLLhQiJtm+1FbGErCybHWsmwaSNArWX8s6BUi5mIzPWmolUn1RMLvT66jDAloQYsuMUtYiGY8jzFwbSo3KQMjrLenYeKLLw/VRENbgeKxiHz5CVCCFQmDUKWfuzg0SaJMlua2hV6BP2lcUrhYiB+EnXfDuLxQHlQ2aVBneDfOCa6DFZ3ljXYFdQw+OkFhZR5ohyQayOIwomVMkokPFSxQi3D1TkLbadc34z8uDHLVPCXg5Vp25KuPNPhc88samOo2ExMSe3V1BCz5DWzrEEWmOLzq8DpUrKhY6MIiio7u+mu6Qwh2FUrGBlqqPpsPJUJwPoBCUA8U4SsvUQ73JrkPSA8BP6q65BWhcrNjY4lhDQWyiGdi8CKudL40FafoPsLQh1qUmrbQeFEDSW0DMoowIIUhh3k5QTlZz3idc7V8iqu5+cuvclDIMsrkm9if8NjSUgcuLdVh3C4e44uuknuYufvTdTAgIUsPeyAD8uhP+8JKHq9I0/Gj7i2X4dR9aEiBqU4MgMMuzbcYSl286ia6ip1AD1KVNO8TmybYuzGi3GjL0JnUztKvNXfUDjhLfHmwOKgPdmhsXutm9ZGbHz0nJZNVMmAT+hKEQ7a2L8QlTEDD2QcvvrBcR8psLlznK5ZGJYNdU1UT7NFGlNkDYZpKmK1u1Mr9gn6paQvQzosIGV+iHHpg45zi8cm+LbDvQ0dwuo2RX7zi9ZnnbVe11hU4MNBIQcNRtLSaeluoPNpNB1bEqu4ANlNLW9ObUd0gVsbdAdskeiRaBnpWOqbPl3S8IQkmWW86yQzPhvq8JXXVLXNAx8Gj7AB50m+KbhO0q++755NQgl9K9yL4TZe0Am9zsyfu4fVr71t8Nv/Y1f+O0w3/LMXskK1Ck1S/3a15HIrnsbyCgEgEuqgqaLu4lb0DM0d7Kkha7TK6l+GZysuwThPxbCCnuMaKziZIXuhFGOFPMmjqhiBWjeKMnAu4w5u0AuqHTxWOtvQN5x0EjgWgjemSXlgZS5CnLh+gycS3doExRrqlB9CR74x/xCD1r4g45PlGr0ICxZlCPmU97Wu/YhMaQoKPAtz/Ck/Zu9CNTpQcclqF/7OhLZfFPDqyhpj/NGhfV5/hJKcESqG4D/Eo2FOv3nPxlGWea5IvpQvX2rW0FV5qy9r6GHyZ0GLg62CbXsmCQKIoRdIIe45Kq/JchFoOXkrTkUBD5DG3zAR1Qtil+pr9yByrJ+2hLw9/tXR/tWyQaL1lQomYmnLtEOyl+857qCM3ZFeT7iRelYN5RpB4Dk25+CEeaZpQjq9JgXY7bYl9T43dfWm73QIOZFatERT0sP1+x4x3vklzoQCJQRrJDI2AvEuhZU5eyYMbWzPLlDxlpkGmjR6kHq9bJCNyCRlnGsctHfRSDZZAcCQNGr/S3U+DN/bUpQl5UhzIB2fWgyyU0xlhZVl/KZMnRcq9FNpbuvnd8h8bAnpw45Plnc6yxldNVvPzc9vrVWsfItz3S7udQ4qM2Dj09Ss/a1NQOVercv2gTtDb1b4klrfl6zsuvMOFJtwL7bIBDu9ADJqJiewU10B7rPvm4rOhp5h2YcKchsS+vcfMzt9KAsYcNslBlHU/OLwpoDWq+51cv2RT1gu5FmqpjCF4t72h5jwN2RGUGhJ4n6gmLhLyXjSTmXekwmjpbl9A5vUos5+2AckiS1Zh3NVF2MpNA9nQnJocxzkzLtR49a6x70yKw1+N8EiJw01Gg7WEu9wz4L5skUBTi927aiHv3yntf8t32uMrjn+sIFTxmdmTTmO573CqCo1hwY2/AwObXQS3nQthnZfHNx+90hjlhaUiDXmX797F8OH/Do+W1XvnrK2HX/Pb93JCY1oYYZkBmWMQNHkGgOtEG1fzwWGxIoc+uPKJxDOSLTGD7Nmec0cloCLYQYlPXUKNSUU2mKlXMoiZMMhNc4DaGjkSu/te6E9OYAhVOp5YKUNq3CGimSnhkuW7RJJbZ+WYpF5NLeQkBeGloPYtiKJp2W3cVR01ya1rKJeEp68Fsc0aVYNF2LWtES+XyQ5dgCtHbFfSs4hZbslbVpXBb9VDMpJG18C4gukZG1OPalLtXNzWK+yfS7I/cFOZKmXgVeSuKFS6wk77yrdNiTk4PrbWUIu0MkN/8vxUqV7j3A/J8aMzbfXtxyW3ELf93BujMzZu5lfIBYIZwvvXDgyOfITsMK991Q+N55k+7Wh5wQ7As/IEU0B/sCWGpEMQStDwlMpK0+I0QKrugZlJEZ+XJhQRLgg6Dp7cuojeykWJdUnGiolhclLASs7hdYQRad6FYPUlulTuS7Ojjw3FfBonDcLICJ4NhQQRAukf6les/VA9m3mqh92TqQhB+/f8ptVz3ujMxLPjuQyGh72VAzZRaPaEFhL+MD6o4apB4f99r5g8RR3z/5wFQnLFq7ww11PDsu++fgoqo7CwPMnJ5BMbjE0llGUxCPb0Y2WrD4fWlgnhWspdeS8sWrf0mDJfakJ4yijyXFNse/aRHkGg+vtlnXKG7539zVl8zYFxae+ObeN/1weL8jE8WIiXIhe8strfuhqon6otaoO2qQerS/s/CnL8/8+w8dOfc1elTkHPWJVop9IXtcaLV82GpIx1FZZgrxq4Z+CGgSmI1BOxwsdxz5wuk4ckDFqcF5yU4LGaLqO9txZPXq2O6gnG4vhwtKx471rqY7XhSk44iIXPMyw4A6wuoXS0j2bQ3seXP6dog80SNd/07lotmpbu43mn5+mMzIlpEkQEUeBAqNVsYHJ2uSUSvwQ6fjSOHuawvrD4uvOXh+Su/KA2PHvDC9Yl00N25M7zbLJRmopNLI63LowiDdRBEtkdL2f0Ti6e/oe+GnBtYfXrFp/M1X5a54wzjqyxoes2+CtnQceTe0kG59zPaCHCdp36qHvlV6blI6AYixIW862avRjNWmQL4gz8vDy9VwhpftawtUXN/KaLkkM5EaUkxuoGI6OryMYkUocWvsa6UWe3WIAeRde6Y6qNuN44BikbNkNRkzCA+cFek/jcksoxr15Qwv0+SoXJ50RJ2Sb254mZdSZZQGjEJsNRxlZDVlDZ4DSgxmdXqHeGP15hYDa6Kv/Nrg4U+dn5qiQB6331G6/+/F0ftKHbJXltE6YonI8H6xfR4uvF7drXrbb/PfeM3Y6Kay3ZpcUzS5JNQwCsMML/vscYTM0QB4jZpQURf9q/XJHQ0rIeyylKWRa4yILlOCL3wpAZCj3hGxOqnd8JrUjU5TAvLat1LmEdjXc3DeVZ1sX57wRXOUgC5Gy/Pe2rtYO5SAtc7zbi28AJTgBmWIdMkGljUll9J46cWDj35Fj329jL0C13xl9qoPT6JvlattKep5U6YtlODTehC1rLUxmWwNH651hVQfDkiW8EG4bciWERJYjjCccK1FSE0AWZG59jOi+zCfVeCzCI0mXzk3ndCQXyiY6/FwBwee+4ROQxxta51HGG1OenieLFdTV7chO2l++80T/+8tE3vuX25jewN23lX66qlj3zhtzL2zQ27KQJcS7Ot2wF/li9EkJo+ZGbKP1W0jMI7Sg+J6N2RSLSMMsB2g82SfjgNk32oQKEci4a8TxB6xhNB90wl7QSViAymbqzZoFBoelN7SEBGk0jOk48wRaFxcwt+ZFbLsgEDTCAN77CUEbrwy++WX7/n1BdO77i51P40toxrU2vY7Sj96z+Qnj9993TfnlyAoSF/OtIkIhbTdw2B+eLkaiD5vSvXqJcyiYC8V7YNdaV/UAxHSEng+TG/D8vCyL6qHl91Qo5R4lOVSAwO/DmQclUhckaN/uEnFtTj8CzCxZalaI8VCGYZ0JZsbXgYWt9mfg6CGl5EZXffKDCUTfniZh3sGxXmPWqsiuEOclImmS50WZqWR14a8yayfYECapU/MiNz7l+Jfv52978bixFYD8eDtTVsMy1gYjG8t3/e34t++l/vFJ6Z+/J7JW3+TdzqK42lZB+Y0bVpHVM6qsg6t6cTwcjVIASJbYy/+/tVymm4YGwRhxkTC7w7Zya5kd3kswYOgsQQ30DtU//RuI6jWglAdObUGwWDAtri6GJCkvlV6vpFiwQhC1u2LmmhuLIHM5ibrd2DKWELZpDm51zArNDSWACX0r4pWzJw3+bk08sKsObULld1YfdWAkoH0gCzHk4GKOVVAhSKZWb+dxNQkhaCJ/TOjdhe2AzUVxT0Kgq6gWdUd6vBAttXRZD9H+9oCkcOynTDaeFdmhd70avMgoI57BrXpUSPdLylHCdCO6g4RoYh4EgOOGkHZ9gzoU7tqnSNJWVEm7opQdraIpWw23IGxBA94PQKEYFWPfTcKGQyRE9vbX8fL8ADxQmiQgJB9Ef+xKBfCbkOEXU/bW56oswxfQDNodrSqcGGrmrIx8EaUKmQgM/daVq6hDCrMtJkxI9VrH7DuAVo+jIsg9KUJF9nXISDnMnaMPjoaecgyaQ4Sc73IeYaixuRUHdbhUR25nRf+NmL3+cKOp5EQHvbzlT+vG8KqeNOEXHERqq14KRYVW4jy4RkROyudKnBl/1xi8EbeCuw454L7jUEvqk6eO0gklbBjdgGT04rfvgyLgMjlvR2ASnbDiayJmNW1aHuQKuXhXmErIiv/qvzr/MqvrMRXy8IKYnPXDc6nuUsrTuulXIY+jt8UtwgPF9vT4wqJC1Z71qNp73IqQ9aNTH/gjYmmTswPg45GTmb5W9dnbA6QK6UdJnIM254hOZG4TgW5IJEbFYfaW+aPeBuyj2m44+yDgEnRO6znGykWScxMqPeScqx4DQZspOOIyMP0rSV7tWSPzIlwl4yCHpWlFbw0P1U/nTwmw8iu/lzqhZQbZbOYk56TNnYcpft16fWVs/4l8nnLQJNc+0o+yZOug7kCVCMcltoQzE54O/GsyCsG55F8sjM9Wr/jCJs60WMdpgFU4uY+F7OSPCIvB+xK2yJEpPv1/HTbZjxSbj2DMrtaVR9Zw9TAhpb5eyE6jhKyTZx0xtBA+C1iUCNhEnleOMC+dqF/teznJdURYAViIKqNWxSoIzhM1RTKmdTKUuWGjuO3ci5C4J4I1bdKn6485t+DWFKkU6acNthz18qJ+XXR0cipNv52qIuMyCnt2mMJDpAAtVghO24ZI/VQHTlC1uhx9kGQsYSVNMXGigUzip+oYfMaIOXIJ0HXAxqEH3LTRpih2swKWeE8ucOnBKyxBBl2DjmWQAm4Z/FR2rQOuAQ9aI0l2PdbB02VArd2tKzskbfWnQRtGeAwhxaN9I3otHT3bz0iND9QMYdEmlqWxl6XEkgeSr9aJkkAeoqGKZGL8WvfbyN4BaYSWWtRnh2QVPLrtHeyBpMl+0TUQ1ACoisCQI1QemkZS6hFCUROc4bjq0ET6F8tVQbB+E5LQ4yjifnBBmvU0K6p2XFJajPH8VsKwjr4bG54qvZSNaQfu4NUNsH24pe0cGJ+bXQ0cmLmb4coIczwshuxpGWbTxtuIg+Cb+RYQDK83PI6EqGEBoeXkTREjiTlpuoo3OaGl6mjMF4CQk7kE9t88o+Wl+F33Rp+r1c+5EVMuYDh5cmd5XYpKVBreHmyvjCQr/5VUTLldgI8qB5eDg9+W5MSDB7o0PAyoEWEqa8wUOPDbhaUEeCcDC8jXXXTjyJCdO3h5ZSclogY1CDU6uFlB+KFj4gfoPiekvSgxvAympBoQw0ve0B0FCUfZJKA42D6EJKAB3iMCm7O+wuKti3oaORtROvppPCpsqYXK8wnYDFKDGeW1iKWeF+bd4izES5KGlJQl05j5VPzGV/LriMI8SL7kYVK0UKijVkjKlR/Xo0qu2EJS5j6rHjG+hzmV75A36LWkaKktSNWQ3Be2jAlKMiowNxCtmqeV+AdYkQs73LaAlCC0H7rs4aoAgxDjFnMRvvWEoFZFt8W2xlJg9LcXS4LBl5KY6vTpSPrIZZY2S6jdcgwQFkUsbqkqRKiMekOQhz4QBNWobZ08C0ypp5R42EqNAFZ0mxt9u7rgVmCOveiykuFJikBiE+UM3ECyK0vK0j/kqt/bRlNgKqyhMlVY82CiijMmJB065OJFxTWKTE5ayRQ+Qo1WMEoi/3hbLahAk6qco0RV/lgHa/mfBtmOFe6X4m8xtCxKaZiWNNsrhHatao+qLCMJQW0fzylIZzqknrMrND7VkYzw7rM/45quOZ9K+2gpMgXfIWt1r86SvPUojL4x2eCmION2kDqVKWsqaY8eEBbgDBUMA2ZK5GdEGOR4Fg8cvYyoQlHA/CCvLWculrLKIPOGW9YRtMIcsKagOoXlu7CpbZYAS9BOj2thZqBrKDJEB9eqSdIr+tcGUpHqTVZy/m2RqetAu08FrcO6QyoCFKFnNMWQul0U5hJBd7OZblgfbZCqAkAy+gaIIrUnXv4RzG9Feakgf9VqA1+gnBajzkuQsiJEuqNDviM14LGh2Y8AmX1FsjUJloTXxWzIrrZSZPg2EZCBkELDsKAEiH29IDEADGk+8VWgg/i1nnOyxLebZAhtZJpzYO07ywVILJIGqq5Fiv4wWktYrhYhxWH8QwcYLVpUZlAYl/7ATkXagkRK0/OjhnTuyXIgKS1cnNmjzk9ahDaOLa8jE4DjYeFgedtXy8eMMox6+0LC8g8jSVm7YjnVsKKPKRFqEZRySUK80sbmgZtbHbMTPVLr3eq33I7BmVIGetpGW4Ia7Z1z8ImgOZSk6zwFar9yi5H06yggPSTfd/ZezUgjaoslmB141kCcLd/qwRU2AuA9EpXxCL5u/L2jJwi3ormbBv8upYRdXyCJobf2qAVSI3qZuWDwy5LbhhzAQCZx72HmiwCoGrMUj0m092WnHaoxQqW5NFWnQE9vq3IYBMugiaUUCq2ZDMtFshpyZrALl1ShgzUq8mLhazMW7cfWrKgahCAqLV14MIj1SvTRmv7jgsPahnbhQauAnY51R1Pi6NAcO47wXcRexsoQVqLTAavqBta7JJTN/85QFnMjMok6PTAgnsKc16pO9jfVN0nVMNhBSxENyvAAdhE6X493S8dmBIGdAJNQpnJ4iI0OMldeo3acfL+ogCNMD1q4BTylyygHaR7yuqzkpGPvQCLlAkxOBJafm5UuUuAvqWKZWxgLuQmjfGtstKFlo4RkJ2c/4pAI0IMqptYe7wE6gb7y80BQkF7hdTtrZDuvnEjkZFVNvatzgOljBS65VLCpKEmAvl8NWGU/daRKVZAxmCFZK+MlsvODdY0B3dvGAIJYeCwquU32HT8pCFIr5FleXUIy2bTUgRNBlltVJYWBo4tZQdrjSfNXIvKomXnvrCpClVoj5HIO2i9xTk3iia0PPe0+1GYFRWc6l/QxQo0JE8waVqWsBhlaWaeIOLrB4cVojHZECKBKwB8H25WEtHXUELnXASaK3TY4rZRnQPJmw2g5P9kqMmZjbqbi4hSQWa1hZ9T2h5KoPHQOGUSxR5jdsyY2lXutl62ZfhCnMdpWVyyxBYrWLBZwQhra+NJSCdSaMz1GtmXbYf4TKS/W2cZQcYoPtr1MhzgdCJCS8vepXVg/ClP2r5VE+2hBAVEHBni9cti1C4oG7mj0xpyk/beJtHg7SLk/V3ZCnAs7E9hYMqhUTWy6QFPkvGuteKXsfBI9cl2DJ1zHDsEMT6mZJlCxXSMALSTEpbRFsj8NhkmtRd5QPKpXnvINNXWQ1YV0Hqyn521WIHIq9mHO9AG/l8X2rOxhD1OEBJkMJ4K61WoXiOaU0hUF90y9g4ogcGTxtZekiPzmrjURdmJr35rWaaEroNwQJ+s8CDADVQnf9UlgW/brnqIUDS+YS1stoahPOCB7tR3Udfm76FgHftRsRFpALCnCLV7jTC7FFUTeNjaBN6+jDe79nMZXQjaXc+gnuqVgzPDmwjdBc0+Id8ZOAw6Q2yZEroS7rkBcxpZPndMLxuyWMFAr/UM2VM2lwQqzhYPBzg1zGT2qLXss3YXgVDCgE3VekzWIarP9szXZewtUI57ufKwoG6D0hU1wAO5aUP1nfJ5erf0GNvfubBMCXshxGJtfJm0UYrMjpmIyyIsVmgKIft/vNBk6mpdUIBGqZ5JGMDcctm9qmMvgSrzBQOto6sWIuCGqu3prLkh4vs6l0ETCGkvkgtrSbN0NlhHolajPY2/Q9XT0VpfGJGiqmJJO6CMtOj8ZdCoQO2EhUk2kacHfda410WpYOIrIFLSYbVQIEeSKRUaQdM1WLtkqBdKAFoNc9raMhYY0LkKtCy5jM7fCS/wtuSElp9oTPyDurNm6ghkwLe1f+X7LdpczmLrtTaUy4jVr0VldiyBmx5z0IlBfcAz4OeJ4Dmp2tv33Yaq4rmZPTWTFoy6B202jQU4aDM3aaJAESxASVkbHlhftwa1/is3JWO2sRRRq9suaGKSF/xOkiAxfSv9NyCikKd2GqpTIh98qpoIR682RaU0btbwQ35OGtTBe/bdNiGeEuuGmO3rOUj5Y7Y0vrwx3W/PIDJNGTpTm2PXIUNN1qzVmEeYSCPSUYrXfU4WL0IjeIYWa1RuYcaszmYQiLxsnapmX7cV6lQ1Sp70Bx2u2TTmj2xrHHIOKIrJt/Rm/Q/apGJ7V+ooaOTEqWRHZmbHjJAbWPHb8AdtUnSZYV0lyb4VAKJFGSLMqX6ZmOSZiD896n+kK4qI+H1lFvGrPnSTcitkzXhS1maGkT3Sn+yVw1bRdaqs0C2ZFXpu0igVrCdckIM233/4DmKBEmats9KaALFTGY025jCgtXfwOP6YdQZhSQrIDSpSiLS17CjfDTGicKAc35rLjsv51/alC4iUPcxbBVI1vbssEVqRq5vV4O0E7P1mKME6jp8yQcOqzbTtL9oB7Bec3DZO64Zg7F57dai92rLCr3W5QRXXKr201r8mOrWr7CZdibzs7UrGSZdh5OqYgs+79wU0jG7qUD+1ilymTuGNtbsltZLytDrQya/0lDoicvjGrViFEuREKb9fRSJQuEcLB4F40NpyNFM9w5+GQDohIbRntt5W/0RrH5MgKYcS5I4D2iMWp33hAo0CLS9nxFYBE0fmfVQmEnOTmKPWic1hZA91gfSSHhkbV8+bchM+RgV5FJ0cx/+2deIlWBzYpLxAjJiu9kVbgTMoiqnZhNUGhTKwVsdu8vAzl/nZVk98RSb4Sx1YhqS/3M+M+itcEmDZGj4iQv1Nbi8r26rGZDi0JHLTXKXwQ0QQeZAWm9amdrfzNGARxLTsmm5ftwzVYikxSsYx5D0VWg04qca4MXpqaEN0dFPFcktfQx7mFkKqjsnamriuBnFA5KWiRWYdAOWDJurCyGkjDiUoabdXmViUQB1J5Oq4CxdoGuIX+r1were/zvWFGLIoxHpVRHNAtNR8hDByq1outqaV8gpKwN73lTq0XN9I1GOYKlAgtGKP1lb7TGP7w2phZA/KIRe82nPatqOj1KUCVo5OFKS7biuqgRZ/XgM6jb0zMQMZeY9J/J6gvqKeWoETlSpe/nqCPBAwlsB9K1kVz6ugfmVHGAyp1eD4a8P5oRy0VDIR1haLwo26KW8UNGlk3SkTSXy9QAOzVU8AlBPmfYYqqUq5ilBVjTvY98PDL/J2oeHENIJWIseYnd5lb8NXzJtoc/WZm0pPScyVkavX2ferQniBt+Op97zl1GrYAfIkr6gHJ3lWsOo0RPJkw9DKJ50gcVT/yopKvcX9sAr2fRfsxKv0uEC+4mqM0wVNi/x/9elIyRnphdAAAAAASUVORK5CYII=)"
+             "![up.png]({image})"
              "<center>")
 
 STOP_CELL = ("<div dir='rtl' align='center'>\n\n"
-             "![image.png](data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAALcAAAC3CAIAAADfDFjIAAAgAElEQVR4nO2deXgT1733f+fMjDbLu0y84UU2CSaboaRPLjehhZJ0efq+T5fb24SSQEjaJhhS2gLecA04tmVDcgkYct9mwTSEJO9773MbSpMUzFKaktRA+mRpCYsXHLyAjW0k2ZZmOef9Y8CRbckey5JmpPj78IfRjGaORl+d+czv/M7vIEopjCtKqSRJhBBK6YQ7B0lOp3Pbtm379u1DCKnSgGCLUrps2bJ169aZzWZVGoAQQghhjBmGGXuR0ThfPKVUFEVJkoLcwgnU1dVVU1ODECorK8MYq9uYIIkQUlFRQSktLCxMTk5WtzEMw7As6+kVny6RJEkQhFA1zKe6urqqq6uzsrJWr17NcZzazQmiBEGoq6trbW0tLi5W3SgAwHEcwzDy395/mqIoasEiTqezqqoqKytr1apVkW0RAOA4btWqVVlZWVVVVU6nU+3mgCAIoijKf3vpSzTSizidzs2bNxNCbDabbBHC8/2nTrs6Oqkkqt26gAkxrCE1Je6e+VinAwBBEIqKijDG5eXlajGKp+QeZbRLKKVut1utNg2rs7Ozurqa47jq6mqdTgcAhOc7Xn/zkq1W6OhUu3UBFpeaklm0IfXhH8tG4Xm+uLhYEITi4uKUlBS1Wwd6vX60SwRBUB1X29vbq6qqcnJy1qxZM3yj+bz+d201W6W+AYRYdZsXcFEqMvFRGYXrZ654VH5FEISdO3c2NzeXlpaqbpTRfYkWOhKHw1FUVJSTk1NQUKDX6+UX216ubyktxhAFCBOnnZABdRsZQGEchc0xQAmBgezK6ozHV8ivu93uXbt2NTU12Wy26OhodRs5wiWiKA4DiypyOBybNm0CAE8Wad//RnNRIUbRQCmFoeSCVbeWFFKJqNjOQAkx+HxVTdeu3QiMgBChDqutJm3pQ56MAgCbNm1S1ygjXMLzPCGqXX35RmMwGMayCOkbAkDIgJKfWJH9q7WMyaRWIwMuaXCwedtzV17ZS10AQHG8cSyjuFyukpKStLQ0tRrJyL9dWSp2JO3t7ZWVlbm5uaWlpbJFAODyq6/dZBGGwlDKkz/NKHiKi4lRq5HBEOa46DvvFAXeceoDhHRkyG0/cwrHxsbm3w0ADMMsXrz4woULb731Vn5+foxKn10TLnE4HOXl5bm5uQUFBcMWaXu5vqWkCFwIIUZ0Xk395Vrrr9dGmEVkMUZj3D3zBVG6fuwQo4+mQ0Jvw9s43hI7Lx8AGIaZN29eU1PTgQMHFi5cOMxqIW2h6i6RWYRl2eFehPD85VdfaykpwigaACgMpf5y7a1lJThyA2uY4xK/dr8gEWfjSQQcQvq+I28zlhnRc/IQw7AsO3/+/OPHjx8/fnzBggWhN4rKLmlvby8vL2dZdhSLtNVsBRcCAGRAKU/+1PrrtRFskWHF3fMVSZIGPv4IRIqAs59pZOLizHPyEMMwDLNo0aIjR468++67ob/1qOmSLy2L+BLmOPOdd0iS6Gh8X1OMoppLvuQs4kuM0Rg7/ytaYxR1XDLNIuNIg4yigkumWUSJNMUoI6JqLpcr2OcbZhFfYzSUDqauXpVR8JQuPl7JAa9/8inf3Y1QeGQnUUp0SUmxd96hZGe+r69t1wsddbsRMvka62lqatq4cWOwx3pC6pIJx2hE59W0DRtyfq00utpz4r3PHlmGBHXyLP0T5dDsV/dZFt6nZGdpcLDp2e3ttbWseYavsZ7W1taqqqqgphmEziVe80W8jNGUlSg5GhXFa8dPnH1sBYiG4LU5WGJdeXvqE7++ELGKxrfPV1SNP9YT7HyUEHFJZ2fn5s2bMcYBYREqij2HG5pLN0r9PIRjvrSE7Y0n9ZmZpuwspCCTd0JGaWhoOHz4cH5+fpAGBUPhks7OzsrKyuzs7EDFRa4dPd5cutF9uRshJhgNDroQEu1Ox5lGQ+4skzV7wt2VxFHOnz9/4MCBuXPnBsMoQXeJfKPJzs4OVFyk58R7Zx99ROrnw9UiAACAEJbsgz1/+O+o+feYMjMm3F9JHOXixYsHDx68//77h69zoBRcl8gWwRgHJC5CRfHa0eNnH30ERENY3mhGCSEgbM/v34y6625jxswJbz1K4ijHjh07ceLEggULAmuUILpkmkUUKRwYJVgumWYRpQoHRgmKS6ZZZFLSPqME3iXTLOKPtM0oAXZJwFmk+0+HmzeWRRqL+JJWGSWQLvHOInv3tdX6ySLdhxqaN/6Gb++JyBuNF2mVUQLmEq8scum3r7RsLPGPRbobjp1buZJcj0wW8SVtMkpgXOKdRfbua9lY4h+LdB9qOLdyJUgRzSK+pD1GCYBLvLPIa6+31W4FFwY/WOSdPzWXlZPrXw4W8SUJX//gr/r0dFOOVXVGmapLxmOR/kE/WaSsnO/40rCILyEkOZz2M6f02dlRuTkT7h5URpmSS3zGRUqLwYWnWWSKQggTx+C1g/9juis/SgHMBo9R/HeJTxYpLZ5mkYAJIaBsz4H/Ms653ZSV6SejJCRF3z5nKozip0u8s8j+N9pqt/kZF9EMi1CBp8QFBIAIlLgRYlVvEhBsb3zff0b58BQTGzsVRvHHJT7HaGy14c4ihHfG3Hdv2uOP3PKD7yU+uEifm+U4cQYxGLCqRpk6o5xunAqjTDqj0el0lpSUZGVleeauXvrtK62/KfUvd7W74dhnK5aDqAO1M5yJMJj08A+tpSX6JAtiGKBA3O7rf3n/kx8sRyYOVC8PSQmw/Oz6vUlLFinZfWzObNaWysyfrZS3TipndnJ9ic8xmghgEUr1yWnZGzeYZ996o1dHgFhWn54igtv+wd8QVnvax9QZ5dg7Y+MoJ0+evPfee8dnlEm4xCeL2GojIC5CQTLnz0pdvpwxGT1fRywLEu07+h51ubXQzhuMkpFhsmb7wyin/zaKUQ4dOnT06NH8/PxxehSlLvEdF9kW7ixyUyQqL/eWH/5wbF47f93ed7hBuu7QhEsQkhxOx4en9Fl+MYrLbT9zCkfHxM698Xi8ePHic+fOHTx4cO7cub6Mouhe63Q6q6urrVZrQUHB8FSrtpfrm0uKSN8QQqzovJpcsCr7V2sVTrXqbjh27oknhI5eTZXSQxh7hw9K4GaJKCrwkv2qaO8kjmtUVKdMIUIsf/naZ0880XPiPSX76+Ljs3+1Nrlglei8ihBL+oaaS4raXq6Xtw7Xma2pqfFVZ3Zil8gswnHcmjVrZFwlPP/5K3tvsgiidDBtw4Zby0qU4CoVxavvHvpsxXKQDKrhKqVARSQCIhgoATpRkTCEASMgFHgp+l/uzn35xTv++EfrCzuj5s8BpFJhXIRBMpxdurT73UNUwZMpYzLdWlaStmEDpYMACKPoltLiz1/ZS3geAPR6/erVqzHGlZWVXo0ywR2nq6uroqICAHzGRYw4zFiEUmxiY/5l3ozHlyV89wFDRgoZdPHdXYCwKTcz6X/9b8SMvgO6r1y59od3hM87MjYX5f3HszF33RGVlRl7952W736H7782+NE/VbM7wfbTH+hm+ssoY+IovhhlPJfINeAzMzNLSkp8xkVW/Txz1VNsjKLgzLWjx5tKy9RlEYpcab8oyNlUnnDfv8bcfWfCoq/F/Ou918+cFi51mfKs3l1y9WrPH/5AGbhjz4tI98WPgTEYdKnp3W++TiWVXIKQaHfaTzcaZ00mH4VIjsaTvuIoXhnF58dzOp01NTWjasBf+u0rzUWFpN8ls0jK009nr/0FFx+n5BN1Nxw7+9gKdVmE8oI+MS2zYBUXGyu/gjA23zYru7xM5HuJIFLRyx0EMQxikOG2PGwYXQbCkJoMnJpIixArdPSefWxFd8MxJfvr4uOzf7k25emnbzBKv6u5qPDSb1+Rt/piFO8ucTqdlZWVGOPVq1d/wSL1v2v9Tekwi6QXl8wq2TDqudGrqCj2NBz97LHlIKrHInJLXM6U9asZ4+ipxYkL7kUsQyXJB5AiQKBL87LOBGsyKenqgyuEQTR89tjynoajyhjFOKtkQ3pxyTCjtP6m9PP6343DKF4+YVdXV1lZGc/zciV48IiLYIgCSpERpz692rp2jZKPIM+jaSoqBiHAE878EAGX96dHjA25t4MkEeLNJRgBxmxcrJctBgPC2nhME3RNRcU9hxuUGAUArGvXpD69GhkxUIohqs1W27H/Ddkocvl/nufLysq6urpgrEtkFsnIyLDZbMMs0r7v9Us1W6X+QUCYwlDyTx/LfOpJJb0IAFw7fqK5rNx9uVv1ALwsLiHB6+v67JmUSOC7JDXrIw6kn2lV65F4hBB2X+5uLiu/dvyEkt0ZkzHzqSeTf/oYhSFAWOofvFSztX3f6/JWnU5ns9kyMjKqq6u7urpGfHNeWWRUXGRSLNJz4r2zj63gL19Ti0WoKBGH3TO2wfp4XNdnZgAFr2tKmXOsM3707ynf/573N96RB0PqLxQDN+MoZx9boTCOwsXHZa/9xReM4juOMsIl27ZtQwiNYJGRcZHJssjZnyxVkUUodRusqRm1W7J37TDlWYHwABTrvD+xWxZ/3ZAx06uHsE6X9fTq6DvmeH0jNhhBpeUMvQhhEA1nf7LUb0YZG0dBCI0YE05PTz99+nRcXBzcZJFLNVtv1IA34uSfPpa99hdKLXK4obmsnL98Tb1YghD33SW5FVuMqSkAMNDUcn7V2r6/NNz72TlTRnoAz3OhZlvHlloco6hzDZEo0aUnWis2Wx5YoqSQjjQ41LL9+a4X99AhcqMWfuH61JuFdPr7+0d8hfIqkPLf/R80XrLVSn0D4coiLElZvly2CABE5WTPWPpjJiqKBnoZMS4xEUADXOKpKTJK38AlW23/B43yVjzOkppDHe1CZxdCLHHaw4tFZCEdNmbM9HzFYM1EOh0N9BpRXGwsAT6wx5y6/GYU4rQjxAqdXUMd7cNbJ/6tEzIQRiwyLMSwuriRtsYYIWCMirpD5WIMWi3s5hejeF2hStl3qeD3p6m4CAAgBo8afdTPSOJS0lhzVGBPxERpe7GeScVRfHzRAfvFa4JFPIXQqMcZU1bmbc8+y8UGuIYu5y3apiFNklG8KjDfqEZYZFiUF/QzZ416EXNc/ML7Ap6+itVYsGZSmiyjjFUALtn1jz7+bNlPtMAiX8glGebMDs2psE7rLgG4OdbzyLLrn3zqx7sD8L26e3qQ5laBlrikxNCciY0KMOgET0ig7qtX/XijZn79ARUFwdd4TcDFRgX4oUmDikyXEHBxlhD1JYxh2iXhKsoqCxNPXYhjI/cy3lDEfjxfA/2BF8aswaKhAb8gSBMPrsEQFxe6ddywJVa61o84BReTFyXRCXAjiwUDh0wqr06vRBHrklDiAhsXI13rn3A3Igxy6Skzf16Y8K/3slFm/srVK4ePXHn2RWTW+rN0xLpkOP85BMKxMSAQGHeqCeVdCd/9xqzaWsMtt8ivmHJzYu75SsfWGhaCu1LW1BW5XBLMtadGibMkDt9EvIoIg5YffjtvZ92wRWT1/PkvCDQyAXY8RaxLGH3oBh1ZSwKAz8Ai4Z1xSxbO2lo7dtbS1f/3e8yGzs1+KzJdwujiQdliZwHReM9ThDAxiblbNo+9A4oOp+O9oyjQmQzBUAS6hAoie8uMUJ6RNZt8patR4k598hFjVubYTfZ//FO0OzVRx2AiRaBLAADHhvTxko2PI15dQok+PT3h64uwtxoy/SdOAK+JXJwJFYkukSirLPkyUGKjvbMFlUj0PfOi7/KyerDkcg1+8jHFGkuY9aFIdAmh3AxLKE/os94CJyT92/e95lDyff1Cf19wmxU4RaJLgGctIe1L9AneRhYp1VkSEn2sLi309om9TgRhACUQoS4BrA/pg4PXwhzE4Uj80cPYR+601NcnXXeFy/UPj1ZOShQkNrT0ir3FZggMJP/7D3y9RezrE69fD2ajAqkIdYk5pHntbPToeAkVJX3uHHNurq+3SPZ+acgeFo/BEJEuAQA2NqRcgjAafSX5QcuPvo8Yn5eXShJA2CQbRKZLmEAvzj2BMMuaEjxTTAgICV+d72t3Sog0OBSSlgVGEeoSU0jn2yG9jk275YvaJ5Rig3m8YqyUBnwialAVmS7hQnzHYRkuIeGLG4hITHfezYQwdSHYikyXMKGdSYUYho010ZvDwgRchltnTjCbKzyw9YYi0yVoTDHF4J4OM0x8jOeAnzEt1Vc5HQBACIeanKamyHQJqw8tlzAMGxtNPZ5ZDEmW8crLYISmXaK6Qt2XsIxueJIYpQh0bEziBBU+wyRSIisiXYJQaL8DxLA6j8oD2GzGMROtSxQVi9mocJmfEXEuoRQzxhDPa0cMNlpz2IQ4oBSAsjGmCeefMtFmJoSZuVNUxLkEABmNoV89LXbBguTHV1AYojBk+fH3oubcNv7+TEwME6UPl/BrxM20oBRHR49dcSDYYqPNWWsKLA8swSxjysmdsEASjo5ioqPgSndomjdFRZ5LgI2NhpC7BAAYkyl23lyFO2O9HvRAgaBw6M7DoImTE6FMlAp9yWTFmIwBrwMYPEWaSyhISM9o/zkTc7pxwm5aU6S5BIAyRr36q5FMJMyySqo6a0Rav5p+CEdFqbyUuAIhhgGs9dvisCLPJRLSsyGOqvkjBGHQyJuKNJdQoFjPaahaZEQoAq8m4nTa/5lSSaKS5ipb+lIEugTrddrnEiKIVJh2iXpijUbtP+MQl0tyu9VuhVJp/Wr6IcQw2k8FEwcGiNM9PbdPNQl2h/Zzj8VrfWLvQLhc//BopXIhwPyVHq+LR2tK/OV2odufYt+qKOJcgvUDH30qDWl6tgsVRXfXZSK5tD+SICvSXAIMdrc2uTo61W7HeJJcbue5prAYDZYVNg2dlHr/elLtJownyeHoP/JXhMMmQToCXYJ1sR11L5JAr/UZQDk+/QffeUmVJBj/FIEuQSwjfN7Sc+S42g3xqfaXX8Xh05FARLoEALAx7vP/eE6bDGs/d77vjweRXttrQo5UZLoEcbqhj1quvnNI7YZ4UcvGLZg1hcvTjazIdAkAEBCu1O9xdV1RuyEjdO34n+0fnECaXYLYhyLWJQgYxwcfd/5uP+G1snC4+8rVy889D0LYJDIOK2JdAggAQ+crr/Q0HFW7KQAAxM13vvGm/cOPw/Gah1+LJyHESv1D5372s/4P/652U6C/8dTntdtAROFFJLIi2iUAgDBIhn/88N8GLjar1QRKiPOTf370re9Qng1Hi0DkuwQAACQnbam0CXZ76E9NBKH30OGPv/MQY7IgNmzCaKP0pXAJYvD14+/ZT/4txOclPN/1xv+98Ksi0e0MX4tAQFyit1ioxmeWICzar/e9f5KENj3sYnVtU1Gp0OtAjCYuEOWQfoY/a8IEwCWxd981e99rwLqAjrcqmbrCyND/57+JDmcIzkUl4mr7/O/f/VH7tm1AdJpI6KcEWNfsV/fF3ullgY0JFZgPYFl4X96eel16IqVazfjlGOffG4WeoM/xp6J47dixTx5a6vhLI2sO6WJOvkSpqEtPzNtTb/GxdMKECpjNE7++0FqxWZ+epOUeZeBCU7BPceXg2xc3FA81tyOTNtZ/pUSfnmSt2Jz49YV+H0OZSxSMcSOWtTywJMdWDZxWYp2jhIGxf3YuqKfoevvd86tWCR29CGkCRAAAOD7HVm15YImiack+vuiJXYJx1IWqWiUVsRHLWpYsznttv1YZhXUHM4et/9Tpi089iahJEyACN1gk77X9liWLlVhEGhy6UFWLcdTYTT4/jzE1jUtJplTE5pjOHTtatj8v9E28/DZomlE4vj1YLuF7+9psNdStDX9MnkWEvv6W7c937tiBzTGUilxKsjE1bXjriE9FKSXkRh8Qd+9XM4s2MPFRQAkCY9eLey698J8Ka+xrlFEYLPYFa0ka+/vvOz78FDSyhPQkWUQaHLr0wn92vbgHgREoYeKjMos2xN37VXkrIWSES5YtW7ZlyxZBEAAA63SpSx/KWL+OwAAgRIdIx4665u07lZxVo4yCgQwMBuPARBAcn34qOjSz3s2kWASgefvOjh11dIgAQgQGMtavS136kLxuqSAIW7ZsGeGSdevWUUrr6urcbjcAYJ1u5srl2ZXVhDoAKEKmy9VVYc0oKDgLlkuDQ46P/6mJnHi/WORydRVCJgBKqCO7snrmyuWyRdxud11dHaV0xAczm82FhYWtra27d+8WbmYXZzy+wlplw/FGSkXWPCOMGUUgXFJQ1gYlg4POv3+KsMqPvn6zCGueQamI443WKlvG4ytubBWE3bt3t7a2FhYWjrZ/cnJycXFxW1tbUVERfzN/J23Zw5mF65k4U5gzisilJgfjuGRwkG9vBd8ra4VCU2SROFNm4fq0ZQ/LW3meLyoqamtrKy4uTk5O9vLBkpOTKyoqdDpdcXHxCEYp2hDWjELAbUhLCcaR+d7eYBx2cpoiixRt8GSR4uJinU5XUVGRnJwMvp6EzWZzaWkpIWQEo6x4NGtLpd+MMnvPXvUZJTh1TYR+VVfzlMdo9uxVzCKDo1gka0vlzBWPerIIIaS0tNR8swa6z07SK6Nk/myl1VaD4wx+MErSkkV5e+q51AS1GAUDJq6gjAkTQbVuklKRS03I21OftGSRkv35vr6W57Z/wSJxBqutJvNnK+Wtnixi9iiTP96t1DujLH0obOMoOEjlh7BaNTknzSKDbbte6Hqp3jMukrb0IXnrKBbxfOMEwOWTUfyNoyR98wHrMxXAqvLjQ8TlCsZx2eiQLnLtcWLe+kxF0jcfUMgiTc9u76jbTV3Ua1xkFIt4amIs984oY+Io5yuqpMGJY1aIZZO+9WDe/v3AqMAoVAxOXxL6+TWUAOPK278/6VsPKmSR8xVV7bW148RFRrGIpxQ9vCmJo3Tt2t3y3Ha+r0/JAS0L77vtpZdCzyhUCEqNJMYU0oryclxk9ksvKYyLyCzStWv3hHERrxYB5fklMqO0tLSMF0d5qb5t1wtKehQASFqy2Lq5XJdqCWGPwgZpreeQ9iWU6FIt2Zs3WZYsVrL7aBYZNy7i6yCTCAQlJydXVVVhjH3GUVy0o25307PblRwNsWzSt79prXomhIyCpesqpNEHWCxvrXrGfxYZNy7iS5MLF5rN5vLyckEQdu7c6SuO0l5bq5xRZnzrwdn1e0PEKAgRuQoBpQFeMC80xf4oAcY1u37vDH9ZZFRcZOfOnYIg+GIRTyHqcb1cyh4BOjs7KysrrVbrmjVrOO7GrNfP63/XZquV+gcRYikdTF29KqPgKV18vJIDXn33UHPJRr6jJ7gpXhLh0pMzf/lzECU5vIYAIXmmKCBALCAEGAECYBkAQHjkPLwxAXiEbuzgPHuuzbYVG4L4pEOpqEu1WKuemfGtB5Xsz/f1te16oaNuN0ImSkUmzpRRtGHmikflrfLvvLm5ubS0NCVl4ni0Py4BgM7Ozurqao7jqqurdTodABCe79j/xqWaraRvCAAhA0p+YkX2r9YypokLdVBR7H7nT83lm4WO3uAmehFCpBFogmSLAELysmMIACMqEQBAGI8ox4pHL7sz7BIq8ICCObWTEi41wbq5POnb31TYi7Q8t73rpXrqogAUxxszC9cP32h4npeZobi4WIlFwG+XAIDT6dy8eTMhxGazyT0K4fn2fa83lxRhFA2UUhhKLlh1a1mJkqNRUexuOHruiSdA0kDVBj/uR0HNLGFct730UpKyADwAnK+o6tq1G4ERECLUYa2ypS17eJhFioqKMMbl5eUT3mi+OP+mTZuG/yNOJpyg0+kWLFhw+PDh8+fPz5s3j2VZxDCxc/NxvKXvyNsIOIR0148dEiQSd89XMDdBOQaEcVRujumu/J4D/wUEq5zOI3cMk/oXJFECrHt2/d4ZDy5RUjZdGhy8aNvaXlvL6OMAKAFndmV1xuMr5CXq5LhIb29vRUWFcovAVFwCADqdLj8//8CBAxcvXpw/fz7DMAAQOy+fSUiyn2kkLjejj3Y2npQkyXznHUqWqYuyZhvn3G5vfF9yOJFGcozVE6WiLjVx1vPbZzy4RMn+fF/fpR11nbt2M/o4SkUm3pS1qTxj5XJ5qyAIdXV1zc3NJSUliYmJk2rJlFwCANHR0XPnzj148OCxY8cWLVokGyX69jlMTIz9zCnqEhBwAx9/JEli7PyJexQAMGVl6tPT7WdOEcegVhIEVRElutRE6+bypG8+oLAXubSjruulehBZAMrEm+QxGrkXkVmkt7e3pKREIYt4aqouAYDo6Oj777//xIkTDQ0NixcvZhgGMYz59jk4Oqb3yDsI6UGkjsb3BVFK/Nr9Ex4NYWzKseqzs68d/B/Q+vzjYIp1z3p+u/K4yEXb1s5du0FkASECzqxN5Wkj4yIY44qKisn2IrIC4BLwzSgoJqHv2DvhzSihFyXATZlFVi6fIot4KjAuAR+MEveVudOMMilRKurTLbfW1SUpC8AHj0U8FTCXQJAYJSPD8eEpyf7lYBRK9OkWa8VmyzcWqc4ingqkSyAYjGLNNuTO6vnDfwP5EjAK5761rs7yjUVaYBFPBdglEIQ4ismaHTX/np7fvwlS5DIKJcC5817bb1n0NY2wiKcC7xIYJ45imWE/00iGJs0opsyMqLvutjeeFO0RyCjDLGJZ9DUl+4eGRTwVFJeAL0aZk8fExdnPnKJDk2YUY8ZMfWam40xjpDGKVlnEU8FyCfhilDl5ODa2t+FtfxglOysCGUWrLOKpILoEfDFK/t3TjAKgdRbxVHBdAtOM4kPaZxFPBd0lMM0oYxUOLOKpULgEbjLK8ePHjxw5Ms0oYcEinvI/C8kPORyOoqKinJycgoICvf5GHYe2l+tbSosxRAHCovNq2oYNOb9WlOEGAD0n3vvskWVICGgSa5BFOTT71X0KJ0lIg4NNz25vr61lzTOAEgIDcr6IvNXtdu/atau1tbWqqirgLOKpkLoEANrb2ysrK3Nzc9Ndtp8AAALWSURBVEfnzNZslfoG/MiZvf7Jp3x3d7gACqVEl5SksDTv6NzV+KiMwvV+565ORaF2CQC0t7dXVVUZDIYRObOvv3nJVutHzmykykvuatGG1Id/7Hfu6lSkwk8wLS3NZrMBwIh5PQ//OKNwvR/zeiJVo+fRFK4ftohsDgCoqqoKgUUgZPQ6Snq9fsGCBe++++6FCxemHkeJMCmJi3R3dz/zzDPRoZrFro5LAECv1+fn57/11ltNTU0BiaNEhpTERS5evFhaWmqxBKVGnFep5hIAiImJkQNux48fD0gcJdylJC7S3d1dWlqalpY24dECKJUfDaYZxVNKWMRms4XYIqBuXyJrmlFAZpFKW/u2bdphEU+NcIkUmlnRY/QlZxS+t691+46uF/6PpljEUyNcQgihgZ2Mr1hfWkaRBgdbt++48speEDlNsYinRkTVRFFU5aYzLIfDIbt2xNzj/W80FxWOmHtcUihP+A53IQafr6oZMafXVuM5RlNUVAQAmzZtUuVG80U7PV1CKXWHdv3DsZpwrIc47YQMqNvIAArjKGyO8TVG09TUZLPZ1LUIjHIJAAiCoBadDEsO4efk5Pga61G3eQGXumM0E4phmNEu0UJ3Ar7qo7z+5iVbrRDM9bJUEZeaouIYzYTS6/WjXQIAkiQNF2JUUV7ro/SfOu3q6KSSBlbICJAQwxpSU+LumT+V+iLBE8dxXvoSWapjrCyn01lSUpKVleXJKBEst9u9e/fulpaWYOeLKBTLsizLgq/YK8uynAaeNs1mc3Fx8ag6s5Gq4bqrJSUlWrAIx3HszVQ6732JLEqpKIqqw2xXV1dNTQ1CqKysDCvIEg1HEUIqKioopYWFheMX1QyBGIZhWRZ5JBSP5xJZlFJJkuSAm1oxN6fTuW3btn379qFwzIVWIErpsmXL1q1bp1YvghBCCGGMGYYZe5Endsm0phWZHfi0Aqtpl0xrYv1/8cjMDebQxWoAAAAASUVORK5CYII=)"
+             "![image.png]({image})"
              "<br><br>"
              "<div dir='rtl' align='center'><font size='6' color='#C40C0C'> <b>עיצרו כאן 🛑 <br> חזרו לקובץ ה-doc וענו על שאלות ההמשך ✍")
 
 END_CELL = ("<div dir='rtl' align='center'>\n\n"
-            "![end2.png](data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAA2AAAADKCAIAAABMn7TmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAP+lSURBVHhe7H0HmBzFtXVXdZw8m4NyzhJZRJFzMmDAxjhhjLOfs5/Tc8A4PYff6WFsg7GxjQnGYMAkEUUQEgjlnKWVNofJM53+U9Ot1YaZ2Qk9G2CP+lt11/T0VFe499yqW7fIzdxBziEoPsKLJNpp2NdOwFtFddWMh0z72gm4g5QjXKzLyXwKEvFU0p5m3b52AlTgfDV8z2EnnynI6Xw6+kzk01/Hdzc5+UxCuWAj33XQyWcClZP4zgMOP7NiInt308kWygUn8KFm3XA0p4EGPtphaCknM+qvo+ibatzJZ3qrqZowkxGn89lj4rH2tRPw1dBk1EzFnHwm2ny4zYDEs6+dQKCej3YZWtLRd6+lqKAB7y66iDtAw+26odkpBUH2EDwh0u6kWC5O1BPCeaooRCVecPB3oeYg7SMdTuZTchPZS8KtTj5TVEj1NB75jHebTvV6Jupr+e5DpQompi6rKMoZ2dNTZqDRYfWBunMHSajFyfIEihPLlGdtW3JTlJ5pcKk4E269fXyUd3lq/z+OcYxjHOMYR7GAFgQFL44djipIHgKGYWhmIuwwwxhOgIvEQA0TpqeSkV07dXQAJQzahNbCSMzoyprzAKGEFQ3DKRE2TZN1E9jAMF14cQy8+ThBHMc4xjGOcZQEUWHTR8mokwMhIwK8heJlajEZGeNkF/TDZNQkGTXAESX3aKEjgkTQWsBf3watJX+gLcV7jHCbbs2NyF5GE12B9LCis9NPjmKcII5jHOMYxzhKgjV86OxM2YgAmhs6W0s47DwwgkiEzUTIABfBq9lJIwrFRwhlM63Ouj2MCYAmxrqNSLsBmkgIa2zg7u40TRydGCeI4xjHOMYxjuIhyISXSGrsDwhJbiK5iKEzUjWKh3UKRjJqgpcoXuryE/CSEYSosOl7NnzoqJPx2ALsKIsmosswmugjvmqejSby9g2jB+MEcRzjGMc4xlE8ZA/RU46thBgpQD3bg1tRh9dyjQaocTPaZYgu4gqy1SEjAkaGPIQjLDNvg8HmEoE2BpoY7TRSMROtDm3PV8ODwY8qmugkQYTJVQ6rqyyWXFnyWY6H2v+/AzFm2tLYgeOvzx5YjiJ1PJ9GWd69HM1pbIiRPu/Oi4QX2ZCbfV0sWHk6vSakoGdKbuhmAu4y5Ls4XkXsgU4/ExjQlrSkGWk3wD9K4YilvDsbaRYJqOHA1T/lePdyrC8qQ5fXkhw4YrjNsDwyJQ/1VFHQ6FJJvEP5JJ+rOmSflgYUnOxl1R/rMpwyUAyD81SyMDfWhL0jQD6V9DB7rNukDtFjPFOQiCtAUM1O5RMgPHv9SJtjLZ3lU2b5DLUYTr07gHz6qmlPs6PvTjlfLQvx4+AzAX89i1NgXzgBFGmggQ+16A7KOPbMehpuN0zncoquhGfGupw03PFMfy2FNlUTjnVPPNNbRaHJIC6deibK01vNwrI4mE88E3IcZIJZ/849019HoS0cXBvB6igd4gdF6mQdVdvvjkvIE4j9aGlhX/Du4GeiwqKkOVielqjH6+d+Ju6EYPRUEI6QWLeBV8t2P+601Bzy6aD6EF0EnADszcF3t0R9uLXfM5FOBc5TQVGJ8W7D0NmoXv7Ad9E9ixb17koqyiQRMRKhoyXMRH0NdTAkjfXuiq/UNjkAeCwTy22Gg9QTz7S6vK6yikC22Qp6iTVaRnuiTGRZP5d/geOZvlrHujz5jL/JPi0NyJbiY76WzhLEdBxEmKdOPtOdtp+iXU72cEYQgzTc6iShoQLzYMUz7euSwfLJAkSxeI0OEkTkEwqj+5CTzySUoOfgmQ6WJwAy52wMSBRpsJGHxGRnDgFPQj6ZJNKdJHOBeh59U0s5SRT8tTzEfQ6FWihYl6+mWoJLRp1Ulr4aHjJkDBDEehar0tCcrvduFhTNwTqCRseLQ4FZAe1ANUosW7y74wQR+WRxEDm2enSIZxICRcNLXCrtq5fjZuRT9lJBYgH8HCeI6PJOqiRGEDOoJHwE6eoOEshtCAQQkfwLnKmkKgobu9A6YuXmoSCsusYGzPpKNmQGhMZBu52VpwKCSCPtzo8FgHCbhpOivm+XZ1VzhCaCSXOELWphNDFuGukSy6fYne3yYyBQNlRa6fMXfWFJDZSgdekImKAsR6DsapAPJ5+JxsfyORYCZaM3OvtMoGKi88G3x1Cg7Ei7wxFZIdkTIYcDUFujU9aEi1PoNantayfARiXTstu+dgIwNkKtRQaazgYWNbfTYae63iDhkPkQfUzll/x4MCTodWcDUIMhQUcOKerx07hT10ymqofqdNYrO5tPEETFywiife0EmKivyKqSUCyKnwoyV9CsAlNJRe3dAHkOvYNyA1kf0LXLIerT5NjhwOMAxDLe3dnJ6/RYQIYuj1dAk8BfnKPzoq9B1OTZy95ZgbJLZ8EZUI5nlgNjJZ9lQDnqvSxtaezA8ddnDyxHkZYhn+V4d8efCZRllanjj0w/EKpd9tBU3npraJShjoZ8Ji+y0Sbcloqazppk+SOffDoLVBm4mpYwvVUUvNxOzQPFNU9QcHAdQ3fYmMyBcnQjwPHH4oEZuzzoHewu8DzQdxSdu4LCIpXcZREPOTAGCOI4xjGOcYxjtAHqyjAcHkMdfig+Qvi3VeDD/BEPsfUiIB8gcHZSGUB51lRwkoyMGAUfiwCJR+eKtLOVznrK5CWbJoqu4aOJ4wRxHOMYdgR07iftZP9urnMn17Fj8NG9fqvROjCxlIO074zefpCbnbIzMI5xlALT3mE2FS3LquthA3StmN7V420W+DB/JKNmvMdQ/BRE2U5yGmCHVGCBkFJj3JYYEfTSxHg3G00ETfRUspXOw0MTxwniOMYxvBBM7mdt4mcTnLcMwVeywCQmd6Gm33WIaxz7e+WOYxQAWh+Nd0yrfBbwxc+WArwtAx/mj1TMjHUZ6UUkzodIpALzQ8AJmGhZQs+8M4C+hgK0aKKhmbBqbJqolJcmjhPEcYxjeHFCgntXWI0nhnnIQoslhMU8d13Ivh7HOIoFoYwgsuHDsazy02E32MhW4h28q4cFNWFGOgxR4dwVFJXrIMAO2Qx+csy7IowGoLuBJobbjFgvTayibPVPei1LOTBOEMfxjobJGSka6hH3tcubD7lW7fc8v9P36C7f41v8968P/mlT4G87fY8hZa9n+SHXylZ5Q7e0O853GKT4cThzUYqXRc65WAn5w9B1bs74LPM4SoWlkMb08CFegTnGmenJ5fGRrfT+byx2TzpKolObefAi27oQhZyMvENn8MsBRhMjjCYmQixWruhiQZrKRBPHQJgbNNx4yMnGxcLcEBav0b52AuUKc1NUTIEcQBti+RwLYW6Cjc6HpKmcxLcdjMeE1pC4PyQ0RcT9EaE5RcMqjekkNeRCQmgS3pQF0yUaLrdW61cn+bSJjRVTyOFGQXfZNw0F85Pdwo+79ZRqXw8jeEXS75G5j9fb1yWDBWEOOTw2wMLcJFhsfPvaCVjBop1dQdkb6sW+dgJo85D7+YcdyQcOxrzoRcM8AXLeweDGAAtz42LBou1rJ5BN1EO8pAMfskHQQuOdlSPMDaiq7HU4LAsT9dnD3GQDqCEbREzHCR4ce4WJ+lq++1C+z0T5470gH3IEQkJdlCPMjTvI9oOwrx1COaKPldjlrQVAsoeFoAZxhM2WCBu+6ndSmJtxjKNEGEQPC037PM+9bP72+bqvvFj7jdWVv9weeOiQe3WPtD/Od2kEnQkibIgDjwKPTNKeiNjc5tqwy/+ftZW/f4L7n+dqv/h61U92+h7tknZpJGH9aDYQJzX1OMYx3ID2pTwZ02t+QUbBDg3NTEQc5hBjHWA/IHP4CwINHmynFgV8HYwfUjMxPnxYNqCmEmEz3K5bq6zQsMEOXUHCi/YNJWKcII7jbQuTM0Pivm3+f75S/b0X6r72VuUdO8gLEfFwmsOhO+mM8zHRZR15In0zvn2ENRqcGuM7mt1rNgX/tqL2my/VfnND4M/t8qYhmWJhIIQIlIo8lQR2CDyh5fI7Gcc4soEQTvESNTmG45XwIpG9TPFBpzobk/ztAQhFtuVSMh3auoRZS9kLQ4KNaTk7ej2OwUAzjvcY4TaLJpqSi+1t5gpQNHX7jmIxThDH8TZEgu/a61n+Ss33Xqj9+tbAA53KNh10Lc3qjjBCZ2HzRYPTQ9KB3f4nXq757ku139rivz8kHrBvKRaMFMqCkVQju9va39zT+vL2tpU7e7YdToXiFl90PnjrOMaRBWAMBFrf0X1uhhks8CFlgQ/Hl01kA2RkrNtIRg1PBQvObKcWArQTUSGwIsZ0UxlbsGhipN3eqwYEHTTRHWSzz0WDP477gn1aMqypB2d7HVondDqsGQeBhssRtm7LvnYCeHHQdmcdpyDFZA919plUKE8+vRS2i33tBNhAhY9t42Zf542QuG974F8bA/cc9LwSE9pMTk/TQSfzlgfYzyWFUKey9YB7Rbe0WzBdbr2GWPbYiQl6fsLUh57bAv8D8Wx/fffW3z2/9fblBx5b1/zS1vY39jQ/v6XpqfV7/7m67fVdIKWeiZWiRwJBtb+WHVTgzfUC95jXvi4ZkEHom84Ow6DL44G6o2tpypFP2UN0lcPhINDmUzFmxTgIxct8Op0a8IO+QdWgezr+7oLEXNidnbkeLOrRulAgIEDx7iLLxJ5hd1TN4cXx+s5yqdJFvYY+aLLtCvHXqmtLJQ0p6tE83AFKRaKmN+y2U7PAFvWOqg+8O6p+yJ8uFIqfqWM2wuAcHO/yyJ4gEvB7U2d9Cs1VUiharJGeMCsU4wTRGYwTxBEniF3y9o3Be7YE7u2Qt6kkNuykMCNMg6gR6dAB90vtymbeFL1qI3+CQS6IDUEQCeFlsWPN3jXffHDfw2s8jcHp7zl55gdOm379ydOvXzr5iuMmXrS48pgpqe7Y3gdW73/kTcEjB2bVEwpRnuutxwmig3gHEkRIePT0WJcBGTIWCaK9AoMnybBRNMN75xBEAFWMlgOOCNGCHpQnQRTZ1tIUzZjRlKEa8zhBLEeXx7vjYFVG0q2LrdlnlQgZWFD+x6eYxzHm0SntWF31ixU13z3kXqmSRLq3OSwaSoHV+zvlbW9U/fol//+0KRus9GywnAu3/u7ZlZ+9JzC7/sx7PnbCj65vPH+hZ3KVFHARgRe9sqs+UHvKzMVfu/ysez857bqlG3/6xOqv3qeG4qCA1kPGMQ7HoTCeneaaY9OpAcoY1EFPDT2sNY5eWGuQwfncQZpPUGbcAtsJVBIc2lmTbByFQkuxuou0G6hERsT91FfDKz7mG5onxgniOMYwonzbuoo/vlLzvUPu1w1OHW3UsC9Y3kyzU956SFmVy2CkBCbqutse2X3vyhN+fP2Sb16p1AX0pGqkNFODOZ5eH2OYpm4gRY+nBI804/2nnXH3LfGWEAhlsis6zhHHUQ6wET7J+VGZYYOosEW1EA/xUK7+N47BgFUQ7TR5ifNUMuaXGyhkQWaTAMnoeCmPCtg0sSNNEykbD/ZWs/BDQ1YlME4QxzEmYRBtt/fJl2v/Z693uU5SY0Xkp+cncqlYytPNv3y6+YWtp/zfB+vPmKMn1NyT0SCLuMc7tfq0Oz4s+lyrvvA3LZYcX+A8DschedjY2xhdkQpdaK1NScXGF9UWA101ox0GBAsbR8zOGvARmAdOwA7Hhw9HFdDswREtmkgFVo++mqFp4jhBHMfYQ7e4e2X1j9dX/CnOd6ap4dtE4vOy0PTUhn0Pv7n0F+8Lzp8A5melmwQHwd++SKfYSYaq8y7x+NvenQonNv/qGTI+iDgOR0EFTpTH8PCh4j0S+DA8PqxVJAydA0fECYsxniV+iuRmjqQoZ2d9ScfhFNKDwQbqUU3YNJGNJqZdAjKCfGXSYfu0NJjpII34yXiPkYejQl4wDLZoDq0NgsmpZyKfzJQkbKLBwWcKElH8bBsAp54JEJ7teuTg1gK9+Qy3GdQ504Dls5KGW518d46wnSpCLQOfaXLGFvOJNeR+lXPas3dYAM43++Yzl3z9ClA6O+kIYJ2rkcSL7/vdtGtPmnXTMosdghTqAi+A/2k6TjSB53XD4CkxDDGlmZSmJIE3DJJewsxLQvuafSs/8+eTf/WByuOmmIN+glck/p+K9xuN9nVpQPf0VTNvaMgap6oez0RbghSDgnGwe0KlJSJs6MjBZ7or2OIPy7nHEeCZaPPRLrb80CmwOqphi720VPH5RMZcfqb4kTfWAw1Wnqm4w+8uutjCgliXY2IEz4SoxwmyikZFKYmHjBLbFZ4JNYeiiHU7mU+8OKgVNLeDzyyXSmLdEw/n4j0DGxVIBitngSRCLNJKnr/LvlVFI22OqjmZwCRAedpJTgCP9dVSUCsH1Q57Zg1FW3JwtBXPBOfL3eVxDz4SFCKD0KfDoesq687oKXi7fnU6vtWeI0BvRN8Y32rPKUBqDN5qL853bgjefdj9Oto3GrmVOLaQgyDysrjjzyv2/3vNmX/5GJUE5miY7qnHvbzxhBUbvD3RqN/9xrLFq89cPG3rgWX/eb2muTMliVuPmbHi4pMSLplCb6fHINf8zz8T7dGTf/1+Uxv0E+Nb7TkHSHZoQWdHSkbnVnuUZ4Io1sMmp6wUaEpUkLPvDuIFjuigPQxYoh4A/dISbOwkLTpKAtQcpP3bdau93GCiPr3VHgwGyc2YTd8+hZJR/ExfoxLzZ1EQ9eNb7Y1Ul4eGQadjNo9FE1MmM6QTR1dqj08xj2NsoEPe8mrN9w+7Vw3pxjdGoUUT+x9ZM+26pYJXYYtRCGdQeu4jr57/EBji7Iduumj90rnn/evlG3/18PV3PNZRV/HwBy948bKT567b/d7/+7eYUi02aermtOtP7tnSFNndSoTx3j0OBwD9YehMbdjXYwcQFeBeosJipbG1KW9DsTEyQGEmIoa7gs1OWingjrKHCRwWCMZhYjaOcgE9AmYeCH2si5FUa/wIJjpYozWOOK5CxjEGsM/z/Mrqn4TFQ29X2UMFvmd7sxqK15022xpc1HnauL/1xBfW/eMTl79w+cm75k1+8ZKl999y6eJVW1adteSRD5y/Y+HUNact+NMX313Z1n3cK5twP75l6HpgVr2rIdj62k6SThnHOEoB5cGx0qHaxiC7QubBYKDqkhGHB2nGASIY7zEUH1vogEvZzbbY0ZLj+9OMPQygiXx6OhQHLKtxFTKOUQ2TM7b6H1hb8QcW+/rta5kSnvRsPexqDCo1PjZ8CKpH+Zmb9jRPqtk7Z6KUSAmaLidSe+ZMevy956xetlhMaYKqS0m1uyrw5hmL5q3daRvyJkclvvr4aR1r97EYweMYR2mQ3MQwxuqaA3AXXmCsZewurxnNQKuIdRuKl5EJWBEQPijn8WHafIBu5atJ74PHg5+NiiKDdkX1gSaC9xuaKbqIp8rBpQrjGIfT0ElyQ/DubYF/mpzGuI9DMAwjkUiqqoaeSdJASiqlIlHXHXUwyRsghZG97d7J1bwiMoMOlNE0/Z3hzpqAzlNy5NWR+PKFJ8R8LpxYKdTQ22sr5PjRjUfwiX9WXfxwN1vmYs0TjGMcRYFQpsnG6PChILGVH4bBJcLjk57lgpowo12GkN6he3z4ME8oPhKcwINV+2qpv56n/CiS0owmRsxwm00TxwniOEYpNC65tuKOPb6nHZTuUHTJZCoY8N9w/WW/+cU3Hnvo9lee+9uK5X/9572//MkPvnTD9ZfW1lThBj294GOYocdTcqXHvkBWCddTFahoD/GakWMoEAy3sq0n4ZLt6zTEgJutcRmJt8gHvMhc8l0BZkDjL7R4/pH9xzGcQNXg71gcPgS1VfxschmZ11LjrKWMOCqeCSv2cQwJxc92vYPRhUNyEWut/agC6hRmVaTdGK/PcYxG6CT5Kve7g55XnWWHum5c9+6LHvvX7Xf85js3vveKk09aMmvmlDmzp5617KSPfeS6O37z3eX/ufO/v/xRj9ulqqrBMLyqpY+goIa5f2Zj7aGOyrYuPctIP9ihoOrz1u7cuWDKgCiJoxNUYNFhvNWMF4IjSh7GFJHiq+HZfq/jNHE0AewK2ktNR75wHEQmxEdoIy/MF8QTROlsiT9DIufIyjUuHNIVinS2jEM4SRQWivwkgQQIl95YOU8oXrbW2NA5Zzc4HsdggN+AF7I1s+l4Uujj4xgCfZoktJK1tQlb8ZNutKOHZKP7jBPEcTCzT0xvtWm5puJEco9kM9VJ6q3g73eRl51VTZqmfepj7wULnDdnup00CBMn1H/9y7fcdcf3ceL3exVFSiZTOEAV7TvKBioLqe5Y76Qwr+kHZjQcnlRz5uOrzCwEUZX4JSu3+LvC65fOpX02XFFDMTyGjZ+MJkD2QX+wpoV8QUT2OdDYIByZy8u4dhk1gEygvGPBsUEH+am8dI6ivN/t/bLf8z2/72dB34+Cnm/43V/yez9ZoXykQrq+0nsjO/wfqkIKO74Q8Hzd570NNwe83w94v+pz3eSRz5WFWSINZpVQvAjbg5omGwVxNijJOAZAkO1F4okQiyKE0kYfR/nbH48jE9jsrc4kPQ4UXbTDYF4QugkJ6a4g/jreV0tRjC4/K1uIxBEU5Pxx3Bfs05KBtgKB4qwXAtQJSlBL2peOAIUOS9TZoGh4cVjbzgZvY1rTw+KN2ddOgAoD84kS9rBoBZSXWBhLdkgsIJnsZvLXsPfyyIW0dqdo4vZ1aTA5Y0PwL/u9L/SZunAAqZR65hkn/vrn35BE0U7KjhnTJl1+6dnXXXPRNe+64MzTTxAl8dDhtmg0xvOljnGZmlF13NT6M+ZYK1F6QUQ+ur+j8619Ey9e0isPDJ5vnVB94YMvRQKeg9Pr+f577mki37iv9do//Oe5K0/fPX9K76dUoE1PbtBVY/Llxw4IhUgF3lwvcI957euSAVaHvplPlFfKc+7KtObI3kzQiSAicWhJUz/qVOkA8s9n/pA9RFc5HA5C8aXXCztqjCheFleyUJ6ENghDUU1yGeU5e/fU0O9OXBw/XZBOV5QrZPlqt3yZWz7ZLc/zCBMlPshzacc1yxA1DQOHgVaraezQNSuFzVoCPCUyzwdFcYIizXGJx0vCmaJ0miwskfgGPMLk4px5ZB7ZyjlaGnJuiS9nRb2l5lKOqjnkFs3e2cHOwaK+dFgqqa+oR1FTFHXMXgakJUxeIC4WDZGNP+UD1BeavVPqwwLeHVre8ZVJip+p49L9cVE4eAir8biJ81CLjr8QUGixyDOagXUDq0E3UTxU8rAT3I/yR29gGciZh+K6fEaM3DDROEYBFB8bOERDtAZy+h5oi8xLrCLXzpvlwHb/v/b4nnJWSaJPK4r8pc99GH/tpKEwaWL93DnTTzhuwbuvvvCu333/3w/85pyzloJl2h87Dt0MzG2IHuxMtIV7d1LmNf3QlLrHbjjn8r8uX7RqmyqJvfPIqiTUHWz/4C8e2nrMzDfPWMhrR7mPoRnta/ZWLJrIpnxGDaADcrNDhrRMtFzHxjGyENjQBVRsMd2QeKiwRFRu9nhvDXq/7fe8PyAv9fG1IkdNQ1O1VFxLJXRNhQZDN2f61tZ4AxpHOgUfM4As6qCPmppQk3F8Fx/RKl4+1uO+LuD9ZsB7a8D9aa94kkRYAGeCzJs6lwilw2KPt6WyASQMdBmiupeKocBj3QaajaeCxdKzEscxGDCYwQu7m3QwzgHyDmWopRhTREmGW42eZj1iDTEaJto2G2Ks5f11bK4Pdi8bYiynZ844QXznglknfst+T18PRnr/K3T1YVPY+z0vbvU/mFYYTkLTtCWL5px6yrH2deFYvGjOX/74o2WnHV8mjmhoenD+BNGrtL66g4pHe7ygam+duuDpa5ddc9eTpz31hkmpLvBghzM37bvppw/smjf50RvPZaMsRwqMCjS8uzW6v6Pu1FkgnXbqSAMijA3b55Mdk42mjKuWkQX6u+xJj8AVOObKzxSU97m93/d5vxbwXBwQJsscJbqaxOH4XK9pGLqWfrJp8o2i62y/98sVvh8ElJu83HQhmbBn8cZRJrBG4mVzcamYOSDGJNgMC6MdPBpGexx9QSjHCwQt174eCuiGaoLtJxdpN0ItRrhNj3WxjUOF9G6Kvho+UM/bjt0exhcdHNMZJ4icQfQUjeDQSMJOegcAbSivxVMmG0sYnmVWnfK2DcE/mZyjE2xp6Lqx9MTFQmkTxD6f59bv/FfA7y2TP6LgliZcsnjfQ2+okURfzSZo+qvnHvfPj1x81uOvvff//l1zuOPch199328eWX3mkoc+fCELgtNntpoI/J77X/dOq/HPqgfptFNHGrzEJhPzB0wX+2wcIwHL26SAGTqZE0+WQQq93w54rq4QJigmZ2qphKGzoT77nnICVJH9nKbytZJwlp/7uF/4QkA6V+HGCUrZACsOBMXUuYzDzMlIOkSij7IlLOOV0B+CzLYmKtrjBZaPNcQY7WRDjKEWPdyuW70VdjiYIg4WZLGCFX7aI6J4S+kdTRBBDfd7nn+l5jvL6z+7vP4zz9d9ZX3FXRHhsP3x2xqSi00h5TmoI3nKvsI0yXe/VXGHRuPl0CimaVZVBe2LEnDM4rkgmlqf+VwHYWjGlCuPT7SFmp/fwkv9iltUtY0nzP79f98gJdXP/M+fF63e9o+PX7b8qlPR72kfdkglvntzU9NTG2Z/5EwymmJr8QUtPTGZeT2+WmUEIXvSbqB5bD1CXEQ+X/HdWuH9vF8+3kNEoqXijBc6PQmQJ9JMMc7xpjTf5f1EhfTVAL1YoRXj4yAOgw0fgnwTxg6zER01zkIkyh42sjXOEfsCReegDyu6GhtijLONbSIdbIgx0m4kQmxPFKh4d5D4atOrXtJDjKD1sP3yr453bs/RSGJNxW/fqryjU96RotEUjUXFlj3eZ16p+V67vMm+6e0LPr05d54g6WXO9kUZYHD6+sCfImwnvXLpld6ANWlfeD3jYd2QGycvPUYr08icYQoeWfAqRBQGF4Ogah11Ffd85qp7/uvqO7983fbF0wRV7w2XDRCeapHk2lsfqT9rXu0pM639+sYqCOOI9vk4hheCxEYdhl7cIBPpPMV7a8BzS4U4TTaYe2HC4fU1xQLZsOa1Sb0oXxMEf1WuctPRF21u7EJys7WMhjbEFjswM0BZeIkFtxpmX/ZRC3t+uZw7m6MXqsn0IG4X44uhZj3aadeU4mWhJKyF0syL0cM6e46qeedW2tbA/U3pMHtpoYaysxyi9YTQtabid3G+3b7vbYpCRwShNuyzMmCv95kmz8ryaRdC6e49B3DSdbjltTvvef2Pf3n9zkHHH/+y6s/3dh9usb6SDRMn1ImMwJWhe/MkdqhLiyaD8xrN/guWLfC6blKyfeHUuFcBO7RT0wA7NDUD7NBIaQs/f9GAJdIjjmJKa1ybjxAktkI5Z3BpwpHFovIVv/djQXGKzBwBtdRIDRnmBlvXkkrQWt5zY9Dz3YB0lsSNR2ApGYSwRoKTZHRoz1JdZTOhUDegI+WehhoTgCZlC/TLMguVGeiaqAUQxHiPEW5jq17CbXq8h/VxsENXgK16sbwYFR/z/+4bWOcdShDD5NA+z3MZ1TxoSlxs2+t91r5+m6LQMf/yRWMKiQe3sYUp9mU5IPD866vXR6JxLZXq3H+wa/+BLva3/3HgYNu27W/89R/te/bZX8sEWZJYFPwygAq0e8shKeBWanyUp7wiUpGnkgDyZ9+BWjNNQdP7OR0SgjsTHeHXP//Xnm2Hl/7ifVLQnZFfjiCYNCy0fkcj33j7g60QUkgi+/AhbaSez/npR/zCTAW8ML2geLTD8lAUJsqeT1Z4vuRzzdJ9co9PDhV3eKUej1j81zMeA54p8KO3VKEzwQ7RTizOYafmBLp/pMNAj/aMh0hM+25q5Rw+zAfMizFpJiNHvBhb2UJp1CbliewhvmqeDTGmt4omN3MH7S+VDNBPVD9+0r52At4qioYYDzlZoHjtneLy1crvsw1ZEUKDyRlntH6PcvmaPDALYCGBm9vXTgCcDFXl7DNhMbB8HtZhLjAX47zL1dDZEqqMBYZ8oj11NxWTT4Noq6r+t8W1rnzDhxY0Tbvjt9+7+LRjV9x+F82+vtHQdcHlWnTlJQ0L59tJ/fHgv57+6Ce/xfN8ca7XekKdffOZS75+xeApYF4W1//o0VRPDJ+CKXZvburaeNA3rWbqtSe56gLgfGxckA1ypwfXCBsWJQKvx5JNz27a/MunvZMqj731GndDMMfkMq9I+j0y9/F6+7pk+Oso+qY6lD8NoRzaG6SPfZ0deEdfDa8mzPa9moNGtq+WMos572WD+QBvlIw6vPlssJGHsHZ2dCFQz0e7jDzf3RWgvJBW54MhMndD5V0uoUrR1OToHDIcGorruDUPnrryAb1YL1fW7wlxeJAe3fnIMwVC/r3hmvVNJ1mfFA0m6iucV0nBBtY9oehj3YxS2B/kAZQba10SF+/uNz4N4RBoKFJ9ZIM1MAbqY18fgU7UkLgvLBzUaHpBqklcRoVXbfRoDfno+uAEHqqzFE2FQoAsinYedfAd8S6fEWwenMXm5MjH5SY7rUSYfQhiMaozA1ATkMIoygQIonPPdFeQDfw/1wn3ZSclxKPXntv1A8n02wm5YaJFMjeLULNj7w5AUuP1e/BMp3Akn92HdGtPizyFPJq1rnKMIGa6H/lEo+9uKubd9yjPrvFnZeoOQtP0+fNn3vGjLx166hkjlWKvlAUsPC+lsy84d8ZpS+2kPvjtHfd+5ev/63a77OsCkYMgcpS8fNMfwztb5CqvnlS9k6p8M+o61+1LdkUnnL+wftlc7/QawSXxiojv6nE11tLT9trOpifX44YZ7z9t2rVLqSwMiIw9ACCIxt8U/jN5E0STExUWBR2KASKM8aE+ti8qLVDPItwyPZG76k3oBrar3pDtzeryMG079jmnMEzWPhMhQ4VScKp7mpy3hgW1ZsGNHXom3j04gUbaDN05bcHqqIHGu/N4dxaEkvPV0Fh3mvX2v5k0UuW9XvFYtwlLxcH8DTs0Xly28f5z195TNEEsN0AQ71t3w5qmZfZ1cSiPSqI8VzNdSEYNLcX2/yjMRsDNjCOyIWpYa71tjBHEeqgkJ9UcpJbip+G2o880OWO//PIu1xPdwn6TogHbhYL2LJiugD55UuKUycmzJcNtpWeAybon1HHxyiqdMVeQhlqOPMJk3ROKdWS6fA6kaxb1S75Y78yiXdM0oUjAFWBYOLWu3TBM2EAou2TEsWcin2g6G7R/r9T+kpWXEBI0Jl+q/0DgFDslJ/BMQYLJghapO5VPgKT9NqAw7OuS0ZtPmCws5Gb2vaoGAO+UijOP14xvh3yCboZaCn73KNfxhPB1/EXW7KRyIqVql5x+3IcWT+N0LffvGZoWmDTxtI/fZF9znJpkm/mIsvzlb/zsd3fcq7jyDbg9ADkIop7Sdv5phVzp8c9p8E2rEf0uQRFT4UTLim0HHn0rtLOF8FRwS6JX1uKqHktq8ZRSF5xwwcKJFy121fnxwCFHNUAQ6YOK+6uN9nVOoLWghaAFon7T10hhG2pZs0UAuqevhkffBGscsuqhBpgT0pBKGVQyiDavh9sNeiRgeInAi3ir+USYmdQOihG8DjoF9JyDz/TX8TCwHRxOQB35a/l4aOh3x69DMEI+MAt/QDs6XiRXevhKmQ0cDktXLR9AEE/fcN/Zo5sgPrrrAxvazrCviwJq03GVhGeC24EgRrsMaPniWj4eAp6geAnaJOwrPMGaXhg82lc02LvLRPFRUFgrRee0N+jdW/knkV18aiX2AcsFUivNKSfqH643F9jJ/YEvontmm0bLB3gCagQn8R5bkyLFV8tDsTrY5fFMB8XdO3SKuVXY9Kzy3Wwh99BmJ0eXHdv5Sfs6D6A3sqnbsTPFjJaDbon6ytMKNHQ2jos2N/h+5LO4KeYNwT/tdnrTlBzQDXNS0PudK0/3SGJu49fQ9YrJk0655UM4T0Siu1a82r5zD0qsYmLjD//+xGMvrpaloffry4hcI4isJHkiUDabjAMZNNMCVOQ5w0x2R6P7OhLtYS2apCIvV3k9Eytd9QGcGxq7335EThQ0xSy6SMUEfoANSimbf4SUtC7znGK2YM15DWHUph2Vug/pEJp2ihMYn2Ie8t0pzLzqI+PBR0BkIr/bpVzmgXGSDmo45pGLIOo6ehw7QSsvj59xPgBBvH/NjW/uP92+LhblmGKGOq6cwnfsZd0zT8WREZAt7gBNRIxkxByGKeZd3v9sCP6ZCZfcIFQ0lIXd758SPQcXdmIflD7FzARR/xn20TnF3IsR6wYjiyp9dnVyQbbl3dTgJ8ROsy9GFqUaAFmB7m25ooP35HOASkJz42BbYjiBkLhvn/vFYWOHFgrdTDkZja3+6317X3ol1toabWltemPtpZMqZzdU6eWJlW1oOhikPRaYFsDg40ZKQ7roc1Uumdx4/sIpVx0/8bJjapbOADvEbXpSy5MdFgpIcJCGAc0AmYJ9Bflr31QIILBizHQe+MyjB2Xvi7/uoMP7R1nPdxbleCZQutFfHCyHk74uBKSCuj/r81wV4AjbJdlOfVvCMGhFhfKVrynfu035/g+FM89iZLEXBuE0WpZDR4u3f2T0AyqARbA3matJKewQgFnFwmh7qats+2r2PjZJe0AQ7Yv+wFv047mmoZL4uoo793lesFMGoZTcChLzG+/1PuzFSHX5fPAOJYg8Jy7u/rBLrcnIEdFs1gb/+ELt19ZX3NWqrDOIk8bN6AF6aTKSB7cgbEg83m0YGptiAEeEHVkcReiLnb7HdH60b12z/823Qvv281K6Z1PK8bQx6L3u+Lk8pcMt2MEUNR1kEYzQwJHHhHIpgMjiJft8AEDdpKKDYqazDJnM7AI8o8+BlGSELYQCR7HG46GQ0t8ZR9kBKQjdn4odtdf4ybz3q37lZK+W3svOTn27Ai8oSXTuPLpoMQ5SU8NSLMCimd5OL9hCz9/q9LGFnrmd86TGCkeUPUxbwsxzZGgK3TzaabChxGB5w2i3K5tiQqstelCfpqkZRlLVcOCHvYrcn5+hB+ibgvd0SjvsBOcgKmwHlLHVmd6hBBHwqRNPaf9qRXJGWkH1AxghmlSPvHuP9+lXq3/4avWtndI2+7O3F5KWSkhr6AxIJ4IdwmTEEW5jriemziYIwBGhwqHI0/cVjB5xb5Pr9dHcV0zDSMVih7fuIP0HHUHSplUHgi65rPxsVIMwp4LiABYCHZOKWtuJGskwm2PCX5yH23W0NEPn0u7VJi+xbemdHUccRzZYjL93clmYJ3q/EhRnurTUyJhwaCWUF6gg8oLECyKzFazR7HIjY58mJkcN9tfZAzYmMdPvVP73KhmCzCLkMSuukJXLuQG2FO1kC6IZRywbE+kW9pkmUdncDCOFiiBNqqq45JhFX7zi7Ds//r7ff+x6jzzA48hUaWyr/36dODxqLijMBrMvxgj447gv2KclA22I8myLd/vaCbCJDwNWi33pCNgkKeGSSXWX7zGYFzrJ8XS8ixkXO5rcKwVTqUjNtJMHAS8OIQttZ187AfQZ2cNWdNrXToAK/fLpCrCxQEMzdZW9ApNUvQfH1nLEe/r4JJmcnmLjjjjhBRaB3dqvj5nfLpIIF5DPzcG/9ch7ssjjcgH5DLqVM2dPkng+9w9DPaVi0QOr30p29wwY/8dlUtOXb90HcVPE1ACs18pjptQvmzsi/JIKvLle4B7z2tc5YdWvfdEHSIqnvVFxLnsJ+maeDjSglS4/RS2gqegaWxeP76YHJNh579hVeiiLNQ1RZpu94obS7YiC8pknZA9BtnE4CMXHVkb3FoUjULwUhDtHQGPIGVeQol9bYlZYIno+5+erJN26HlZAnjA6mIpHIl3N3c17Og5uD7U1pWI9aHai7OZFOT22V3yDMCg/uXXTtOb1zJWhL2SZnzjJ7O4yW1uMjRuMfftsN0Q09w6vub3O3Fnj9FFr7q3mNBDffq9DCdl0ePHhnsn2dbEYIOpLBDQFbLZ0ry9M1OeGpdy9NZSdpBxr+Xh3aPlkenvi/a4VXLB1am3l+QvnX3/6Mbecd9otFyy98qT5p86bOqU24FbEZ9ftau0J918SZ8aFjurkfI9eayekofiZOi5OHEH6KR4aDw1cATYiXT5/vHMJ4mbhX9sDD2u52GEvTINorco6j1YXUKfYaf0xFgkitCZaJ4o31mWizzMNqrMI72nNzVJw22D9h+6BO9H+OJOtSYIWh6ZUfJkWP2ZBSDy4MfhXgxturybkPE+CyAA2rGmD+ZEo8FsOdzy3dX+RniOGKXpdky87djiGQwaBlyXjIZl7JXsohz5AS5C9Ay175BrcrncpX0HEC+0EXU9H08rZpNHlrchWrHUpznDEcYKYQ1tAIKAXwxREIQuLBfdn/UIA7DBlfzxcoLwAmdK6d8OG5//x1lN3r1/+t+0rH9/91nN71izfvuqJXW8+07xzrZ5KeCvrJcVbtPbLTBDRrBMJ7bVXtRdf0F583ti/v98iFQqDuGzHIDEwCgkiuiHTFCazDPFMBwmihXQfT3eo1FFDsRT0EkRU7MXvUj/3ngUfPufE84+ddcz0htoKjygwByFN1zXdcEniwbbQ67v2QZz3m+oGRzBpQ+J4dnYEpRBEvB1aHIuK1R+jnCD2F//vGCRJeC/bSQXVkmdto1WYG4J/DgsOhY0caYDNo2nixFoPjxMYcOj5sW42j2wNEeVotdC18R62mtWy0kBkfTXM4zifOcH97ud0Fqe0qH42jBjMACWB74wmHlyzXTOM4vgdFfn2NXuaX9omuCQIJKaZnDiGBiWCW9F3a9yDPjsrQ4EZCSEDQq3vTzEUVW94jpgej8xzigptL5ZeiIeG6hnfpKtsQJ1CdcGqhzoRFonuzwR4vzj87JAXpK7Du1/4y3ef/O3nNz7/j46D23UWUgfZs5qdGQ93Hdj4yop7f/jEbz67Z+1zbChigO0yjvLAaiGM3MSOhnd2Fka6s4MdOuLd3heibJy1NDCjoYLnCVsBmNJUsEIDJM9+EZy+54xjjp82uSEQQBoEu5WOG9qU9Uk+ZF2WDhBWFKB9MXbwDu1jEdISFzqz6Tqk9ndKsGCqfGSH/2H7aozDFWBkDophsE2TPyAv0t5jRioOg5zAwPLV8Iovl+hO0Z5D7tfZLPVYA+zL1/cc+tGTr29v6RSKjoJBiJHU1nzrwd33rVTDCRPSStVKPExVN1XTTGU/VChYjrzE05sbuN1Z1p4MAhXYwFu8h5kN1lAZarnnMBS3GWwsmLFB7vPp7bksayQfgLJEO8c5YnkhKIxrgbXzMwTPp/1CUBjmBcsQFrwo7d/0ypO3f2H3m88YugayOLiymY2Tnn3uPLTr+bu/88ZjvwOlZevGHATIgXUUN0b0NgXsOjQSg8XJd3SYqz9Q5DG2NYvhqaCWJekIKmoTnspEqu+a9P4AW2yo8t7+sWvu+9IH/u/ma2fU1hzhiGaM72hyvZY+LxVozuhl+Yu+0YN3aBzEA+LrK5SfZhQEzLzgTJ/iiqUGzz4TwXCd3fojjzYwkpy17tL5OIg1LPCSfe0EWD6r2Jg2dD8KNtrBlgWUCOQzUM+HWw00AGb/Ec7Q2KKWjCPn+zzPra0cjq1TBkM3zKlVgW9ddsqQcRAzAgTxv//14o6WLkUsNcSuqRvg0676IBUdYT2kLn7s4u4P21eZgPIOcnK0pV8Irtzw1zFJ3bmfxf2y9LXVVHBeMZHXNa67Sc8/DiJ6h+QmiRAbnLaTssBbzeZHeqfG8HNu6AyFiVfIluKaK8tnT79tYEqHr4bFQXR2VCDYyIfbwNCcfGbuoGgobej+hMJ5vuoXJ7Ltle0Pyo/0wDavp5It+za+8OfvxsOdbKOFPGBCfOjagjOvXXrlp8ARC5rzyxoHEZlRXOnpRGKqKU7tz5KdrJA+yESERlUcREJYXFI8KhlmPRdl5q/luw85qZJI/ziIsocNNEBQWHNTxQEZdgdJqMU4Zln7NZ/dZ7L4XNDq6SMTeOaASBRJeHbtrk/f+c+UplpD1y6t8pT2r/rVqdZtwQl8qFkvQgThpSBLe8PH9sXwd/mC8A4dQYwRMCMzpemqrveVL0hRJOlLl5/731ed1zva3Aemzie6pT321dgE9LQEEy29K0bp7NACihDMI9JhWEM+VGBB/KF72NxEHyGIDtrkftW+GIMQKC1+7LAPCM8eEmvqCu9tK/2I7G07eGhVbF+I2ydmO8gBkcvgUZkVlpiOtNm+hmgnvU0FJz2HDVEmYEh20lCA3QiRjS+m4nZK/sC3Yl3p2Dfj44hOA0WKqklRzvVJrzjJNawzy2zrYWP9s39/+Gc3L//D1xKR7jzZIQCZwvPCphcf2PD8P9g8SOnQdVpVxYIg/uLXyi9/I55/Aaf191dl/MHpYyyADR+mVzGWQtcKAn4o3mMoPqr4HCijuqkJCSLs4H4uFGKxLdHGMgnw9NYERiKlLZpaWxf02sMHphkXOldW/+8e75NJvid9Y5FAMTq7NmPY8A5dpLKfrKbVB5dMbQi43J2RGMgi0sEOF0+Z8NP3X3HNqYsggx57Y3NSG7hSFZeB1Iyq1Bz7+gjGyiIVtFSYF6m4mQgXttV6DrB8etkeDDg3NDZtjb+Q22gPgsL839HdkAJExINb/Q8M//IUC8hGAYtUBgFV/9y2/Z3RhDNbwOFxFAcLr1jyQXQx5dcnBtVp9sMzATKXVU0eJoFl06txNsNrJ/UHHoJHeaogxGmsi1V3biheZkCzccE81Ay6PB6o9+EqzPxIsuCIrEUVtWZlfJFKxnp3B6lmcsJ73a6T/DrbunX4wAvixhf+seqR34Aa4oXRjO0P8gQTy6Tj4LbG2Sd4KmrzL7LMi1RMk/j94sWXkkCAuFzGls3G5k02kzAIWXSInreVLDhMFh5y8ljURGa1cYeCXELsyxdHzyIVyHBXECYZe4jVOiyV5OwiFdQkmn3fZ1rdyuWHyVDktKy1SCUVM06/uqXK20WeepTu3EaaDpD2Vk6QOK/Pvq8/BJ629yT+vuLNeCo9gpiGysdbXGubXK+qfKhGmqpHpEKFDwoN7xIPZd6jb5i7fKEosFu+LYCqv/q8hvu++IG7PvWe+7/4gZ+8/0q3LCP5pnNOQcpJcyaCFxps+DBzQxDMIrdZG3HgxV0BSnjmTOYs7+wL9B+0+Eg7C26nqyygnaeSjSaixza73tTpcPu/90URM8tjAoQjh1yvZ9s6slB4KphWyDgh0gsIoJ5mA83JFRiCLkM+gh2yVlGC6QhhN+6P6CxAtXmRcGdIypm+YY53CMMo2t229ZVH2ByzIOKv/UEhoBSsonv7ysec6dIQjjzPRpiE/oNMaN2dbhaVZlcZjr1VpoqmPEqFErqt5Tc8bMOHvUBPR38XZOZeUlTrYPBVqtUNcUOUOJ+Pi8fI4Sa6cR0X6s44iAh2qGnmX198sz0chdFtpwKQXKYZ5zu2+x9ZTn8YFZrt9LzBhmDT4UHGIt6JI4jTF0VuuDniUwTdYK5gCybVBVyuy49fdNN5J0gi1XRDEoXnN+x6bM0mNBr7O30wI3LxYB/EMTGCCHWueFnkwq4DuoNMieXzyAhiX8AKRGNA9TGpKxPBZW6QHojStpESiDDNE6p2wuSGap+7L1OEMMBHqOvc2XJ4BNFhmCkamRg7VTQ9dsIg5DmCiJqy9qQfcoAZIg+kH40qFc0QDqkX6BeSh3kSJ/LzJB48gmgBNWYRRBzQW2Co+bej8RHEwfWOijNnCuL7vSzYirM/ORTACtsObNn6Mlvw1ztUMxisj+JDk5G3bFCT0enHnitKin09FLLGQRRFWlFpthw2DxzQN24wDx60aQR+usfF7a/kDlY4fxwOsg33+r/dKBlBhA2Wjl9NkmGz1/XAUknlHkG0gBaLdmt57xU6aWCNICpK4oTzWkSPaPgDJBblXC5z7kJz9jx8bt93BDwlKzYe/J97n3hy3RbURpb2ZsZIV6e4ozF+Im/KdloecPkp8p/NfWN8BHHUYfLcHlmilosh2l1CVa87bcklJ8zWdLYAnqd0b3P3755+NZWOkwQm0adlErdeE0zNsq/GFKB30dnwMolw5rHucgA/BAkVbjMSISNitHXQXQ53hQIRV7UH3twaTiRlgWcOhTyVBB4COpRIrj3QFk6kcqiiUQ6Nj3bIW+2LYoHX99Uw4RLvyaua4iEWFMlfz0OI20n9gQei4eGEmQolqxWIvFgXW2cD6e8pYWhhHMwrtIrSa928S3RGkxQCkEI1FtFSiRzsEIJXEuhpM6urfHK2oPKE0Hi4M9x5iJDShpQpNbu7k7/5ZfLHP0j+8Pv6a6+y0cRewHIUjLIcvDGAHY4eQFmAZukps5SB/xKBhml5uVhL3NDrC+rynYddLfs8LlD/xknkgsvIxe8ixy/lBJHZHP1BOPLAyjdXbN0JUymXCjCNbmnXLu+T9mUeQIYFiYxgGZaId6KI1WG09YdmsNUq1jkblzDJB88+4QOnLZ03sd6vuEAS4yk1pemo5KmR8yUj6yDNqAX0AewYnKSi9n4JwwlwwnjI3BvdpJHCFyk4CpDCNftbfvzkqhd3HNjT3r3pUPu/3trx06dX//dDL/2/5W90RuL8GCYdpE3ebJ8WC8XPPAFyTy73BYRppMOAyRGoz7zvIhoeDjQAp0SkziIrpTmia5wjFg/ZS8yLZHGKe/hDHtpA08muimFLwFBfOqNqYYN3dr0/632EIP9qIpbjUfkCT5AkTpI5We7HDt+RoALsOgpNmIyOrEWf5ogdhq6xuea0b0kBFa1p5PG7pq5fJUW6SHe32B2Sw51QRgMFESWkK5za39Yti8KQTwc5aHK/mqL5xkeEVAR/GKPzy8A7Ub7u2uAPhXQIIPu6P1CdjTWeD59z4vfff+HfP3/jfV/48C9vuvpzF597xrzpU8ni6ZEL7fvGDqBEWdRDgc3QOTs7UBDahC3Ii30xchB4urWl49fPrfmfR1/5wX9W3rNy0+q9zR2RuGHmtB1HPUzT7JC3arR4Co4W4q2msfRWyHZSfgi3GqAZgYYMroGgcUhEw3NQRPbliN5qQ/FGXN6Qv7rVX92S/stO3IFOxRPmxZF0eB21QEWLJ8j0FJcVjHr4AdIhu/2i7MrIPtD4CCFLZ9TMqnarmlHnFaG4s7dIGAkOaTFdZ9sE4cgQv+KdBdnDXNXR0RxxGBPEksoT1gLbpV1jOUHTLQgt+11/+f7sX31u4a8+u+iXn1n07zummgYaVz9Bz/P0YFfnwc6udLCboWCaMaElJOYbHBD29vCPyDiIMRAHEZrAWVrjCprklL9+7saZiiTkmPdCY0FLopQIlMLq0Azj7ltn7FpXYX/cHzAUYN84Hwexmi/9magXxUd1jUU9hAXmqaLOxlZEPv11RwNZZYROUi/VfrNH2se6+ygAywTLiS0r0AwUUfj2ZadOqw5mCm/EAEPzm4+s2NHSldEzdTSAmsJZrT/2q5Ps6/4INPBoAOhN9vUg+OtYwLOugyzwYZ7ojS8IIyTYyOOLaFq9NYxEME40OWt9iZ06FPAVqKUMfvHE8Fe1+6paqibur5q4t7LxQEVdh+wNSa4QJariDbGIeNaNHJeIu7Skkop5ElF/tLsiFprYum9iy+7pofa6nrY6fJS+sSQgn8ikIxq0FyjDUKvu7HjD4KBorgm8+CUfP0Ee5pjYR0FIKhZ+/Nef7jq8p1fnoyeii1m5PG5K1ZJGD3ol+mcoof5nY0s8BcWe/qwPTMOQvYFLPvWrYD0Uf14yLWscREGg1dXM8w6PDYXMcIhlaCQw4nEQUTBQu4Rm6LZMJRUSmleQjDOuPDzn+NC6lyo3vloZ7s6wvhNSom8cxIxAVTBJIrDobLEeY8hOh3d3BQgMV/v6CE67vPmymw6n+ge5lAT+X69u++rfH85TroMULOi+YWb4Cvs6O5BtXy2NdubagQbvHm4re5cvGuTTPmf2joNsBgvhReY04FTPgr4Bm4EQS4SdfKYcNDZV/+JXXzzJ75LzXNYKOZWI0j9+e3GoM8NGFHgGCKK7goZadAelCvoDOiqeaV8XDmRMcrGM4RxGGPSZKLNL9HAH5+aQT18N7T6U693D9PCTvi/r3Cg1pt4eBBHN9MTYx2ekzrEv+wDNHpKIBRRMZhgoRTuRPQQ3hJqNRCTfvoZnwjBA37Smj2EcVkzkUzEz3MparPVMFkglxSyT/PoZeyY0AWxuKxu8qFZP2lU/bfPEuW/Vz9wUqG72VTVLEvvIyiQea1XXgIkjdoP1l9EO9ik+13Uu2hMMtTW0H5zWtO3Yg9uWtO2bHQ8H7e8UAvwu8omXxWHlpHTgmaiCSLs9WOIIWB3V8+j7jMSn8wm+rrzHRc7zayM0fGiBF8Q3n/jT5uV3T6r0VPq9sWTyYGesK8qytGhi8MQpAct0Z9N/ce3xDYdV3RxczCC4NZPnX/KZXzHFkx8yE0Rdp/X1ytf/h/P7OUrVf96vPvwvtpx5JACC+K/N7197uCSCiMKDqHcFi1FJ6LOSmy0CGzzWY6kkkM58numvUM+/Ye+Ck0LWve2t/OaV1eteqepsdqUTbICJgkWFchJZ3MM4a3rrL1FhK29yiCn73QMUxMtOOoIrb9l5zOmhAQRRFoXv3PfMPS+sEoX8XAsIqdJmnh35tsDlWqrSWwWRtqxLQpFeri7fnVnUFwryuapD9mlpwKvKXjaCCCVUerYsQPR7KinKLhF2TArjmUpATy782zdumq8OiIaaHaIg7N/uuvfn83U9Qz7w7iCIzGRpc+zdAfQHvH6kLe/xnEGADGR+GwJ6lJEIMZEL08odJD3NhlPTMgDyaZmVOd59n/DqCvHn9sXow9uDIMK0naVecJJ6s33dB3inQD2LWQi6NriaUIMVE1h0zIIaG57pr6WJCBtFwzOt1hVsZOvuLS9GtgeDROIhAyl59gs8E5qApz21U96cefxLkxe+Wtm43+uL4tsgeXrJG6Gh2aP28BesMZYgPa0Tmnccs3PtGXvXndrdUsC6UeQBb4cXd5gg1tNIB7SFnVI6WB2lR3m1tLbAT8izeOPjPs7ND//alL6Aqogf2ph84acVooaGiyKMqebLuzoUgT9lehAdzKpkSsn6psjru9szlrGhpU687KPHXXKzoeU7FJqVIDY0KN/7ARcIMIL4j7+pD9xvE0RIyuP2cziK3H09JxKC+cRCs8vN1sEcAQjiv7d/YF1LqQSxdxQt//ZpfQsqA2dRyIpBDMMaXIT6GPKZE2eFLrxhb8MkLanabh48z4s839Njbl8TXPHvSdGQPdRCKOerZTuUWJcZgXvQ3dBt0Ttg4eC9YENCsNitpD/sd/cP9KUWZeP9/72hfqLaV++j6WmqecsdD762fReyZ6cOCUIXqFcu0a6nZlYrAtkA1YadmoMR4R50TxBxB7s8ngnC3dvlS4STU8y9BNG+dgJojo5PMStB45jrX3jXRRXJAfsp9QHaCs9TXTc0g9F/WZJe+U/g0d9nDUScHkFke/vY106AjeeXMMWMxgHzRUrHCEATxFsAVv8f/inmLf4Htgf+OcIOz9nxtiGIVYl5p7V9i2TyLbZM1YyTHWgSkLmdBwqe6YAkguHR12dRdJEg+yE9GTPReg2jgO0cBTkx/ZjVS85/evoxK6oa98ky28/CIoXlADoINILAfPG57o7gvg0nbHrpvG2vnRVqr7PvyImxNMXcabsWMFvu817xFP8wBz4cCBS9luJe/QVp2WggT2mAsqenkU1WI0cK1TDJptZkNDlwwwIAwoSXPQvec5u3elL+ZDcrQWxsVH74v1wwyAjiX/+s/uNemyAiJ8E4CZRndZ1OzVYfx0IhHoWDU8zWdnP2dX6whg9h9sS6M3yRqaQ8pphPvKD1ovcfcnmMwUMwUKyart/1vbl7N/qtFDbFXD/E9n2MIKajn1rmE2gGXg0tKFuwBYsghvubuw3TYh/69haPl22aYieBtlJ6sKPnxl/8rTUchoS3U/MBIY2xk+b1XOfTMrv0AL6aNFHLubspxHJZppiPdPkS4WQcRHGMxEGU3NyyC6PVNSyqjZ3UB2gjSVX7zROvbNrfDN4Q9LhEAS2HvPZ4bfM+t33TIODFJbfDu56gV5QSBxE9RPYyt6x491H5SUsOrz8YLJ+Z4iD2xT7Ps2HpQFrcjlKA9p01e1KFW8k2G4o2MIrjINowiT41ei7lMsy4KVniIEKYQqBEOorhOoqXiem+0g3npm76anlRYbO8WiKv9cuVjfuXXnnvlZ+/9Yz3/mHGwvWKr8cwOTW9WiBLbTgDPF/T2dSz4kpMmLF74bLli89/uGby7mTU29NWb5q5LAG5XHEQ2SSRg+gbFM21WBSv8aQDqo9oTwTR6Nxpbn4knQm7N+GcT/sD9M0ZVHaDX5pcIU8KSgOOyUFhYm21NO8ytkNw3q+TOQ4i46Um191trF9nvPUmi4PY2ckS2UccF5e4Lg/X7Xb+6HGhx6ZzcBRQNs7FQSxMfTBeFUirjJ7MtjzKDM1pyPGaY85sn7MkmW38RVPJ2pdqetrs+VkUM5p97mfiHhZ2h7EL1jtwoN/JXiIpRE2m3Uf6w1Zz/f2Ypy4IHX9W9wClD8K6blfr315+Q8cb6wD+ZD1QMtACgPXdsHT4kHslxFwwNXOwTQ4Wy2JGhobozC5/ebt8iXgnBsquqDVOv7RZlNEkMmdVFoW9rZ13Pvv6jkPtp8+f5ncrqZT54oONkZ6sni6MII6mQNlQz+jqkG6JtPuRndrbc4aXIJrE2OF/JMF32dejEm8LgghhZTbGTpUN2zrvi4wEEbIO7BCsboC1nScyBqBGCppEzTQB7HDI4cOJczec9+FfX/657x977nJ/VVsvLxxmoM7BFPG7Lm9s+sJNoInTjlmlp6TOQ1MMPfMsUtkIosPj7L3agvCc6wNeYap7xNam9ILyXNcebt/LLE9DAVI6Mwzd5BVuxjkcLzlAEFMpY+sWY8smY/Nmxg77zjaiu1OzXMcgOEoQCxD1KAN3gPISGz7EYaf2h6WShiSIPR3SvFNaxQzu+kyKoimuW1FdKEEEEyCU5c3qHd4qWjmJn3qSNGmJVD2Nr5st1M85ejTMFRvmiVVTkE4rKzqr6uNVDclFp3XWT04OEO8Q5jsOt8XV1Mz66tr62tqGmsYsR0N9jculxGOpWDzGSoI5aZk6SbW51if4ztrkEsr1a8yQD/g7pHlc1i5fOsbAKmZdNeP57cGQJ+acFL3xy5sz8gDLOIDwEQW+MxwFU1REEU2h5aD4h68viEezirNyrWIuZMlYL/BFlBsERCo6cKYAJH74p5hVEl3e8Lkkix1Vaj2aqDZocmbFWcsQ7PQigeykc4QaV0Thu1ecNrW2ItsUM29yX3/4pR3NR6aYS/z1I7/LZtF4iiOdWipQKKe0faM2udi+7oNAplXM7iDbBbHzgK4VteSN+beFMgw9QjjWzhSgbA6uV7M9ecKcDadf9+dFZz/h9cdUMC1HRWSJYApJZCOLezcc8/L9H9700gXqoIXPvho2xZxNlRaHYCMPpp5jzWMRYPNN6SWNrsWi/BU/JxCH1VERYARxr/nCDzg1xkhHcTB1zlVFLvgBJ3nyH4HJuop51GCkVjFbgUUhkLI5ogBM1NcOMR0MEGJe+bG9J13QNXiKGfRXTXF//v7cfVt8VgrqH6JpiFXMvfEQOoyZp0unfdg98zS5aiqfVtc5YXKtTy/nwlH8MIRt5jlDwgSwadKqc84QKnItWevqDO/Zc2jFq2888M8nN2zZLgigBpYuIPN6rp0TugZn6RsZmPtNeOhpmbJ2efu6BLwTCeKZ1zVf/N7DgwfA0VBSSaJrJBjk0bLRnsy0BnfJ8psvuu/7ea4NVEYPQUSfcVcwPxK0j0jHwE1TRoQghoWDL9Z+XaNJmxYVBXRuHK6GipoTp1UeM1mpDciVHioJqCL7jgLBqjsU16JJq1PDJDxd5Y/b3I7HDV4wyWtG05TAY3VyLKkyqQTjX+KVKh9rH8XBNJOd0WRXtGvjwfY39oR3toD7UnHoAZXcgJV9XMcnJsXOtK/7YDBBRG+tnMyWNhfdZzMSRJQPpDlamqiwjVy7mgZ62FRN2nvmDb8//sJ/e/zRZKroChwOgCZCp+xZd+Kzf/7E1lfPtlPTGFsEUU+ZzPvwtJH2PjwKYq6+g9v9PMfLrMUUgWIJ4rJ1fz/3rbtLJ4iUFynvPMsEQfzrG+9Zve8M+7pYFEQQUQNsSZlMkmEjh7bNkyACk2ZFPvTtbZLMtiKzkwDTZNYJlf/64zk737T9tfIniFVThPM+5z3xOldBVRfeua/njbcoMZj7QkawwWjDPW1G8MQlND9Dvbs78re/P/aLX/+5ratDEtm8omj4zmz7nledYN3AdHc18ycesmGOE8SSUA6C+N4v7zrmtHAiNTCIriyKG1e5n/nr5BMvaFuyrD0Q5HVdF3g+FDLu+cGsvVu89n2ZMHoIIot66Kdol4OHi4ARIYht8sbXqm8zSPE/qic1d0Ng5o2nTbr8WPeEClh8gwPiFwFTY1KD8Gm/J8LpmjH/pT0LVh2AQOrLEQXVODg18Polc7UKF9u3FknMGjWJUOqwH9OMhCQ7Is0rtu3404qu9fsZRyxOX6YBgjjXtmUHYjBBhBwRZK7zQAGBDwcgI0FEG0O3NXQz2mkG6lkRgSNaP6F4wqdee/fp1/6lqq49qY7AVHIRQGVIEpdK8RteOH/5Xf/VvGuulT6WCGKnwU+kyjcDxE1HfvjQAnR+Mmyuv487sJIzIIqHbvMD7kAPLIIg6pSfu//VhXtf6l0cUxxgT2o7U3oLBIidUgooz/FC2p0OZhvHvbZn2e52u5kVjYIIouRm4c8MjcUfyDE1mT9BhAx79+d2HbfsSEwZCEzDIIIiNzYGFsx66R5672e60zfmSxDnnSff8Otg3exiGHlk94HIlm1auAeCvl9YdYPNSPGyW5k2NbBoDs0zzM0RrFq18TNfuG3bzl2iKELwzum5Zm7oWusj2UtEmUQ6hm6W4wSxJDhOECVF/9hPNjVMUHv31uuFS5afurfq2X9MxHndlPiJ57c2TIv2tLlef6q6dzw8G0YJQbT4H7oTi3qYyftkRAjiIdfKVVW/gJCwrwsE2GH9GbOP+da7/HPqDVVnrM454Gm9PA+k0CRkwYq9C18/YFKbI/K6sX9axRsXzla9EjnCStm3QCtLYHJ9QVBjkpDsjGz+1TO7/vYKmzsv1s0Rcmpq+MIl3R+2r/tgAEGUPSTQyGqtFIqTkSBaA9iWewPaRsVEXktyoWZ91okvXfixn81Ysl7TmMPf2AKqWpG4rvbgi3/72CsPfCCVcI8hgoiKcL3HJVwWGKmtUzIDcooK5vp/cJv/xYRITqDnDRit54lRBEEE0MfNPPhobgiSHHs6lPxd2L4uDegvoBSDAzuXgvwJIuoBepaXSCJk5PYFzJ8gAtMXhd7/9e08D8ZpENmlTJzgnTlDqmDjLHjTH57S1rabzSzkQxDr5wr/9Z+q6mnFj9caSTV6oFnr7Ii3hHBBYMAaslzhlmuqlMZ6KVDk9rnr1+244cNfbjrcDI5YnZh/SvvXrcA3EA6QDANWyWTEKCeI/PHknbVIpao+ecaVhwd7BxNCdMN47bG6tiYWxjPaI25fE3zrhapNr1X2tOeKh2lhNCxSgRkK3QyOjiqI92T+1ogsUulQtra41hZHEMEOJ1606KSf3eBqrDCSGlMUjoLZtVD+aaqXVhqkdUqQ083aphBSwQ53z6lefckc3S32skO8B/uWg8Fu8EDN4BWp4ay5eGzbazvTWbI/LAj4okerb4wvta/7oO8iFTQVCOU0hyupPAcvUoEKcfkpsg/iiN9C51VjXOWk8AU3/+jST32/ZsLhZMrxOhwmgNTK7sT8U1+ZvHhV8+7ZyVjDWFmkYipEvNbNsZgGjj66VJisuXTt4po3MCGSHWhPHZHUC9s7drVHd7dFt7VEEqrRGJBNwUVmnFvQIhUAHav0A79IKk1tlWrmQQKGBIS2IDGbyr52AvmLetiKkocNH7LFyzlvt1TSkItULPR0SBNmROqnU3najIoTjvVOm8S77HUr+MVQi7HjZTaJx0yvnItURBf50F0V007MtOYlbxCBlysDrgn1npmTvbOmemfN8M2e6pk2UamphOC1byocdfVV9bU1Tzy9Aj2Lcvyk+DLelCFd8UbxnozLHAZiNC9SQXVTxe+cnhsLmDAzKst9Am0dAfp8IkYO7e4XyIZV+siB8mZVfey4szqWnNluJ+WEK8DYIRtwzRIdaqSgc0VqUdCmysWTjrv13aLfZaQG+js7AhAy2JL2BS6Zlwy36fSpm06cAIsB7PCNC2cZinCUHSJXuKeQPePzhOVkOe/j505594l6CS+bokOPasCQoDSvGZBCAZ1E0psv99qvE+aueveXbjj96j9RQQU7HNPQdS6R5GYf/8bHf/Whky6/k/Ily+BhAOHkJSKpFw29LD2oNLCBQfs0O6Bpg27RKwvNPcmmnmRSMyZUlLhZIn60pMPUNbnCJR6f7w4uoxZgM5KbSTNQSUfWvfbC0MmGNbMCy5ZVHLtA9A2MEHfKB9zeqrzU6zmf9iy62IG9MS1QnlCBpwJbxOmIEL/yynMuOu8MVdUMTjeh69IjZdDCzhbm8AOl44GaQOMAQ7fT3gGonxYXBQFdfAAEnm854OnuzBrpcNhQ2ZCYv7Trkg/v+8j3Nt/wxY3Xf+7AVR/bN3nuEFofNhmLPGdysT5RD0cJVB6ZH1zkQ8E0eZe48EuXKNU+Qy3XK7GxOqCPlmLr2Thz62lTXrlg5lvnzjBlgaDj9wFoHClPpBvmEWOaCz93YWBWHX7FTi0QQ449Qn65gw7v2GEBZckaIWo8HVmJEOOUq/56009vnjJ/PXjVmPA4zAegubKn5+KPfe/qr3zRW9lmp45WsF3olgj5b0Y3OiFQcsasyosX1p4/t+aShXV1vnx3SS0f8PvCSWL/2CZjDyAA1rBCPvFKC8XO1VJHU+b5t7o5wuLLhqZ9k48VL/rKEP5dIwuekps/dI1LUaghUJO1BhjJfUPLjVEofjbeRD7laVJ8TFuUPgs+/D6IAVfXxIq9VZ52kU8wzZgTbOCHcItu9Fcv8OuDljALonh4ddem+yOwLeyknIgkfG2RhoPdk1Maa+WO+CC6PPr1X9zROD3hC5gU2hUaPB2dUxbF3Vulu787J5XI7ITBfp1tr84N6UQyIj6ImwN/2+F/tNBhdCOlTbz0mKX/733OOh0OBhu6Y5Nd/erd0AxTINRIM8g+LYtxOMMo1J25IPCKuPPPK9767sNFLGomhFYkZy1rvdW+7oNeH8TKSTy4Wm6nnzwxwAcR7BCty9CZq7soRy/99G2nXnMvynaQu+/bBIrM7ds8/77bfnxo20I7qTSUwyGp7ngxcbOHVkrOGwSlg5fMLQ9z6+5lQiQPQBnjb9qMYl2Uq5pBzvwGxF9fA2/YgL5mJo3Id3r0PaW275HyQUSpQ8NSge1/lo83LRP1efsgWrjqNv8lX8/M8Ha+nPr5+e2QSNl8ECFPPvVI1YILhnbxGlmkUtoNH/zShsfVM8L/TSlFEYXb890cZXT6IILLyV62ByBbpAKZTnkW/ajEXjacBLHWd/i0Gc/Ob1jrlyMSzRRvNCMMI1lRmTrzfM7rGzigAbr8+gpl+2Yuv8gFEFRxnWuL1L2+54w39p9mUKV0gjh5bvij398GagheaCcdgSJJT91b/dx9bAHNAIAXWi7GWnp79dyVOEIE8e87/P8ujCCmdcCpt3+w4ZwFZZpc7gvQwb4E0VB1gmpACovanx4vtAYa02ySrYMbwhgpCYSnsUNdL7739nhrT8GejoT4UhPObcmw7TWkMPo4VJGvhnbu1wevcC8CAwiiu4LKHgITRVYOvvtr/73ojBWJ5Ijo7uGDLHHdbdUP/uj7m1660E4qAY5rC/TNmmvcyau96WmF0VcT+RBEyA0oW8IzSXekGzJoCbLwWm7RtdzIzZgIohK5uzP5WKmRg0aKILoCFL+rpzIERMuIIgjipGPEr7xUA25gX/cBavVXl7ZvXp7MRhAv+KL32p8G7IvRjf88seIX794zNXau6CJ42fyrcpgJIjqQ5EEOWYAmXeOSEbaYdYCIRmtEw0iEjGQ0vZcUi6VM2Iii9fHox+KJq245/RdnTH/VJ0d004zpejzPAySlrYV/+XkuHmM79veFoRsdbXHDHPiVLAd+lOP0Bn/zNcc8+P6lv610t9rPKQFVjUme0sHsEEhp2hlXtGScaHb5WfwqQ2OLRt82ytjQTXdDIDh/IguLXX6g24AIWueGlmaHYGYoTDBDSlhIHatg0ZVwXk52CICDuidUBOY1FDfLnHEjZguCxGwJWBGOsMMBgPKAxQ9lXdGw5aaf3rTw9BXxxNucHQLJFOevar/x1s+ffNU9dtJoguyh6lSeF8TRyA7zAWiLfwJbieJvZItR9BRbFoRDS3ITTuRmXTiyLQziQFgiOhLpZvjBi2wVC9oFLLoCZ3cKQNMGdecrmReZQmKc8VEPzTJNMu0k6dJvjrrJ5c7OzubmZvuiD84/75R3X3EJTiADtdE6vww1562hFRN4l58wFugnoKf+eh6WVy/AJcAOGXFML5lin6BxxHtMfGFMOCMumfj6e47/i18JgaVl3SwvB3iBHG7iX3uJS6WYSWoBLCAaJpFIPwt1KOCnVcNI6Pr8up03HP87n2gHdioaEyZ3CtYO8YNgGIbHK5x/4wG+v/8kag0GgVWDo9grtvAOYxjuxgql2ssIWfnBWGDa0ZCxQ6DvuF360qKPLPahg4uXswP58c+uL6LYQGhlI6vN7a2mOgyJrrJoA7Y8hXITZq78wG0fnTR3W2I0BVQpK1QNUjV+9Ze+d84Hf8ucEkYNGGX3E30iPyqXp+QHU+d89dyJt5DzvkfO+ho5/sPctGXc1NPJSR8jJ3+KU/xMe40cULD8FIHWDIdMcByyZ+B6snIAWmn1P+L2xSAsvEiZuHigd6wgkYqJ/HU/D7iDo65g9+/fH4vF7Is+EEXh7I/7GYmSSSrr644wFD9FkYIz9T1cAQK9YN0AieGpYMEuehe/2x+giSTChjtAccdoRo23+fJFD/JEU0vhDYJA9u/lV65gjddihJRwPT1cIl4QQewFOOKkwOFzpt7LwrUXCXPZjCdOVP8aa2nLOMfNU5pIaBtfrjSMozmECehKj/uC749mr1jRdDPqkhMgZimN4K91QOl650w0BUkn/ODDYH8FjUCyFFNfGcBYITFUjf2XiQISykJzA6BudlJ5QVy1/uJqlKQdpQcDwgsqoXRPkowANYR5OWneymu/9qmaiQfG+mrlQqHrnEm0iz/+s/M/+nMWZW90QPZQs5ZyQRiQo9d2HBqggIbGhg+rZnKzLiYnfYJRwxnncoLCBPiIwjQNPiDyk0e31swEkDA2HmRyiUEzjI5j45OJzgOZa0r2klM/OHBhKEjIOZ/xzDxtYPSZw4cPd3R02BcjgUQiAXZYV1dnX/fHjFPFueewrWOcnS92EIoP6s0+7wW6lzUJCRkOdqizaEdHdQR/HGfHQdRTrNGwBTjFrmbCb5Q7DuLFC/45t2ZPsvT1kJSSrnYumTQnTGKkEIWzZyc53DRw3jlv6KZZ72kJJz0Hu6bZSXlD4NVLFz5w/rynaTyETqBV1lGfh3H7IwA7NA3y6F0TVz11dFQJufZUpl0Pk2Y872h2IxIHsUfc1+pah6ZoXw8CiNm8abEvvLfphvNbLzu94/LTO65Y1nXJCc0ncq8e0/3csaHBx7OLwit4U2uWpznF11jPycIOGdhKFbSS8nof9oIKNLKvo+nJ9YWuhsEb+LQJE2On2ddHgLernSmE24rfVS8jeuMgwm6eeeLqq7/4qUBVG8j9Oxazjl8Nprj7rZNZ1PXC4WBQNGhZGPzqHEE+yW84G63RQVCea9/KtWxkQiQjUBb+RjLp5PS5mR4vtIY+nGzGpYDygtGpautKKmGY+lC+wxkHUfFT9Nm+Y0X5gIn6vOMg9iIZNWumC9NOyhxusGISv+E/yb4+iDNOka/7eQDZs6+PYPfu3ZIk+f1++3rYAYaqadqkSZMy8CzWEgh63FsPJQpaDz5scRBRd+4gWmumnFNGsdgUEM82YOtrMPTrlrFuAy+e0Z90BNGb3Qp327z6dQ6wQwuUp9s20XVvsnOTIx0Fh6vo2wpwDkPsgnmPNQb220n5wSOFrz/+zrNmvqgZhkEpH2oXX3jSONzK8TYzoIwd0n/fOWH1U/0MF2tJkJZiM4Z9a3QUQjSU/qXVD5pOpjQkb//Kjpsua77g5M6LTmHHJad1n1K5aVH3i4vDLw0+wA6PCz1746FbT+5+PD2O6ATQ6XObB+gWw9YzTE70uYrbyk/SMwhQV5BRW2fZoY10xU5asPldX/g02GH5FxSNAHhqSqLpkg23Yh+KZIgCi4rQF+iGEE4XfeS3y977BzupcDg1niMqRNdMMkXI3vPG4QzoVJ5k0rv5g9X5MFYTGz5kbuvM+9BOyhvFNc/V98Wy+T0HG/ljrjga7wZ67eof+q2ZsQFA18jmgjUMwK+3trbW1NRkZIcW5pwjNy4oTB+hPMs+hGvBMqyyHK4ggbHGFrn2VxHkyxMP26fpvKLd4NZ4jwkGmr0cMgDflT2EF7hYT2FfzAHk1dogMhFhz5xV8eZ1M+9wjCAC6bIxTjzVmDlH+M+/uJ7uPEcQ8X5J3Tgci0/yummft1V4fk9o2oPb/ytpsO1YhkRAbr1s6l3TA3vifRamEMPQXX592XmkoY43QRvJs/+csv6Vo+wQuQbZdwXY76KmYK/kWeD4oiCxlWvhViObxV4E0LA8lTSEZ2bJxn5z9bPkx/h9+7o/Ykn68asO3/bxvdF4YXkSTHWfa/7tU/6fSmBsloH6OAKUSeHdn4p8+xt7Vtz0R1PV2Ohf3gDJXWhecQL3fvs6XengCv46FgWp64Du4KQcuqe3mu30E6jee+3XP1jbuDs5WgeqiobAmzhau8T1u7xb9rhbOkWUpyKbU+oTi2dGZ0+KgSwmVebW0wu2uskUH7/9tvXPv8dOyg94iL+WLSEqvY7QZDxVNBk3kx/z0EmKoY3WihlyFbOhchNOIKd+zr4cfUCPM3p0/lcRrtjtCaweKrlZAJBC+nou4JlM1PtpuD3DM91Bil9MxYxClTVEPTRyuK3gfIKS3vKPiqlZdkNp26395vLOeIgV4AVf9J73ObYd32CsXr16+vTpVVVV9vXwIhaLbdq0afHixbKcK+zOqnvjD36lx74YCqgmXw2NdTnQ5XvBnlnNRnnVZL/KtX4LTWIwH5XcNBk1upt0LTVQ25Bb+H57MeO7io8tfY+0s6XX+bcDfBG/zYtcpMO5Vg4NVEP1FNtZGOrt/LkPXzDn6USmRb7FA/nmBWPGLLp7R/7h2ijhWuPJcEqbEfAOGL5TePr0tvOf2Xq1fZ0dkyp2X3vsXY2+zr7s0ALjiIrHPO1MbsLUx+9qXP10v7FDKjCvUvRV6GZr0DdPIKeQCyBzaApOEkSB8Q+Qj2zP7JS2r6j8rk4ya6lYgv7X9U3fumk/Tuyk/EA4M8b7fjX19napkTcdbRXOgeiG2SdKTp4gPA3taH7pA3ekemJDjGv2B9TVotAHZkbYejobhO2GrKssC+ibWn+pUQrQPQMNPCWt77v1lhmL1iTeXn6HKCVJMHcfUv78n7oX1wR53pw+Id5YnVJEozsi7D2sNLXJNcHUu89pf9eydpfC/Fftb4L28Jwa99zzzV9tW3mOnZQHUJ6oqdJjXliiWHSRKCXub/toQBi9PohjnyBaiH03pO8ocvAc9QV2CLUbanZMLFuiHmSu57Det79bv+WpoIbBJhO1VIEEEaK+lnZBfRQuQ875jPf6X2ReP4dc3f3hrpV/jc08TfrMY9XZ5jBff/31uXPnBgIjE/gm2q027wnPOLbSvs4CsL3/PbP90Oa8TDK8eMUEh8PcMLHcyCMbA8b48FuCTCon8WAOvbDagyiTQ5u1RDgDl+CPNb+Am3oPzmQLVniRbcuhpqfG+36a48AXwQ4JgV3CGKojByCxwBngwuzyzFn/qfF06NYHTgFFYhikveD55cPRRJVLVga5iCF7Uyr2H+ya3B6u7X2Rwcf8hjXvOf7OKnco84AoIQLI/OHm5auWvfLEpL5fBGD/oaOimqJdbEC476e5D9QRoaxmWVyDQZ8WfYCCwARJhLI+U+f0vZ7nDJJZgJomCXi1C0/uKnz5B5HNxDbvSW3SZBaxcBTCNOWdbZzMmy6poHFEtEo9qe1/ZI0WSRa0LAZfnBQ505ea3Fv44AqKl8l0yUVTUdPQ7PTSD8Dl1y779FcXnPrS24wdMkrPmX99su5r/zddEozPXNv0+fc2XXN2+9nHd59xTM95J3ZfdVbHBSd34a4/PV7/9OuVi6ZH66tS+pEFZCgcSVanHbNy28ozw51VfQstxwHIXjYiW2IdoQ24/Mz5zGjklfNcrNuPWkBZ5e+DOFpBeUHdqmq7tQEVkefBVKdAoD2TUedUpyXq5YGiHg1U8TP1gebB4pj0+SifY0hRn+PoadZPvN4FHmyXWh+wFhugG59IvP/3FbUzM5sKhmE0NTXV1tbmHsArH3a8pL34G33BhTJolp2UCTDMQIE2PZUc8PoZD5S/I12+7wHIHubXOOCZ+C3JRdjCNbb7A7vEiSARxcsaSbiVOSr3vd86MnfLeI+BnjuqIiO6xFiFu1PHa2WCZpSwqhmlVdAgDceB1amG4REFVoT9gWuRapctus+vZI16c8qMZ997wl1eKZrKMl3OI0tEeuzNy9a+NctOOgJYV2igqNpYt8OereWDrPvTC5kzg6fm9v3ucBQvXXAdUlOfHN/i5Hy50yBJjSuibcLa8yhUEbO09+wwqKIdtXFh6XmqyrKrnoVTrv7tsec+/jaLaEMJ9J/5vbum3P5Qw9c+uP/3X9txzgndLpmNEaZUmlRpSiO6wTVWJW+56tC/frRpzpTYB78394W3KmTxaG2pGldZ33rN177i9nfZScMFKb21rho3+RrKixJT5qMOyGHvkQ8KvX9YgVKmjYUtJhspgL6AE0AaJKPDrTw69uqbn8kqKaYvlW7+a+Xglcu90HWdUsofcc0ffmz4T2LHy4m3/jV0DBvw4MrJo649wGj017ORxc4DerSThTm0lELrTi3UogcamNdB+sZ+yKxZDZ3xDzb2OGoiI1a42wOu7v6b4jIgf+Bq+8KxYRODhJBQSnUJfLYdXFTTnODvuHDBg4MZD0/1i+Y/9K5FD/BUY/ZmJlB8zeQf2XDN6/sGzk+hCmFw4AQMftSupR8MnpM8Wm022U6o2dEj7j2sFBFhEI9sTO4STXV0ag6AZUsruKag1EWPzMtCgdqdiKbi0o/66LDAhyoLW2BfO4p5py9fdv1vhiWQ+fCBWYs896N7Jr+8LnDXN7e968x2mGHghYPrQTdIMkUDXu22j+/98OXNX/jl9FWbfZJwtKhTKjf7uHWXfOqHhA5fGSH/kNtgh5DhtEEwC7YwhoJJYIQQneJvcSu100Cueo98UOj9/WESZDidZxbYpRyg1aNU/vQF2obsYWPjYIdlshhzY9U/4tl+F4123nm5hgYNw4AwzLFApKyAjb3xCbZfzjM/j7CNRXKiYiJ/8o1ZB0RGBGCHvjrGDi0vo3Cb0dOsJyLM7zDUYkTaDDXOVgvBeLC/cARHw9wMgOW14vKz9dJ5jlSVNczN9JptJ0xaM5hUUcJFVC2u61WurMaH42iKJqoVNr+c7VV105wYaO6MBQ/3TLaTOE4RY1cf89czZryMt8j2RTaMZtJHN7z7td3nkHRMgWRvyMp0EEvCs2gIRaw+s0BHIswNZFK7vDUk7cso39HlE0n+2DmRY2ZFNL3Q/s8e+Fbg/PQ6FSdfyhkQInRGTZdoeOVCc4dSPfjkhlhTVyGhuQnY4azIFRScPB2DxlNFe5rZ3AGg+FgEVKe80YJ1Te+79b8ClV1vM4IoS8YjL1b/8d8Nt3955+KZ0URqiMKHzsJx8sJQKCbc+e+GC0/u8ijo/XYz1nVu8rwtHU2TDu+Yb6XkRukxL5hVL7NVhhAx0tmyMEV2rMrBCPG+kqpXhtT6TrWxQ21oS01sU+txkvcxoUuX9wlPPMDtf407uJI78BrXuplLRZkUyAzKQXe1b+MOrOT24/6VqWP05IKkWtc+8MlZj06tqkevDBsetl8/1Xmi8cxuK1TSZAchvB7S1FeTRfu5DE+YG7BDycMWfVrNowhYKqlX1CPbipfwAhuSzAcgJUuuUPx1xYyupVKp9vb2xsbGERlE3PRU4sXfRdE923drlROFbKttelExgV99Xxx92b7OjtK7/GAMCHNzlB222z+DevQE2fLa3t3X0PYE5rSKRsimnnuRS/yhbWkp051+0IhjYsUe+2wgSFjVvILALKPyA7+RMgyJEq8o5Iguwz4g3MULHqnzH7JSKj3tN550x9Ipb+Lr2b4GdmiAHa6/FuzQTjoCVIE7QNEh9ZRprfYaW/CrGXaR7oVucBt2enpduPKHSfgKtSWotozeWeaiWyWlcoV7sA9DDsC89qkTeZPFWaA8W7MW74FpWMAT8gTl9Us/c1vj1P2p0bo6tjhQarZ2Sb+6f8Jnr22CxTIkO7SA/qzqBF8J+rQ7H63vazai9mDxXfLJn9RN22EnlROQEiABasLeAYBUOtQp0h1Tq+6OL9oVOXVD9Pit8Xl7k1MPpSa0abWdWl0hR21HakZc97dwe0AQ3+AOrOJCB1leswEfJXrYnTh2v2aYe5NzUgX+aEdqcktixsH4wt2RpRsjJ21KzDpguBOkpBHQfjBNnQYokUarCEoDAkHysPdlc4tOmAzWiodAA18xkQ809lv6kA1gFG/cX+Q2I0VSWieAX37zQRAu+/KZX0SG3Gq5fq5w7FV5RTIpNxg7rOVjnUfZIeBifqhctM/qabxjqEXXVS44gdEMOxXNxv4/C0AwR4MzIuGMBv+BjA0ELC2h6W6x0Mm4IgEdjF872HYR4YaIfKUZRqUretmif/BEnxDc94GTfzuvbkdcHzxJbiM9dsj/e8O1r+05207qA9lLQPBRncz4G3v8kAuoU3NUEHTqpt3uRLLgZgb9KxnJifFtBhl1Ph828NJF+ceipUlBT4GNmqCcWXfhWOAhPCHaUZa2cvzFDx573pNvs4UpANrhv1+q8rj0a85pT6pDt8beUIiGQWTJ+PS7m/7zSuX+FpnvwxFVjauqb7v4kz8UxLKzaYgIyhPbvUziqAsipeQGYFA9EI0dty16wpbUpBZDYW5k1owt41iFHjrhJDF+03naKYs4KrKUfFgau43Xj5kd/9jFZoWX09IpeR9H55epiXdJzN4fOXkT/pqiZnHfEgHJRnxoDfbl6IToYnFzddXMZ1grH7iDhJcYscCheNkqbPuDnHjr4cSQU7QZoaoqynlEhg879+nbXjjqPdm6U3vxjqh9kR3LPuqG1rYvRggWO4x0sJllO4mNWTLXwVi37YPYC4iKULOOxEA9i5FiYYhKxXdiXSPvjOiS0itUBmlL5Ek1DFAxV/bZXmchENIemfD0pve+uONCiQ6xvhR0cGbN9ncfd/f7Trp9gr85R4Aeix0+uuHqlbszsENRsbtfIswCE1iJYws+bYJkeC3uMhiUcofa5ZYuMYtXZy7wptGQ3M2k1CgEqhVVW9wsLCVSZb8NdYYE2EBAZS4N6K2uIA23ORn1sBfBhoPn3fyrtFq0U4YfoGXo8YpkgJaBpYGQ8ZQdSJRFlohz+9a8gaaZTNHHX61899ntXpeeO9wqG58j3Iq1gXAMFcxSUio9cX64Oqi++FZQ6P/rySS3aNkLx130kH1dNrDhw+QRuS9TjrldlFBJaeqWnHYoeuJmtbaTpYBmlT7qpptGhSf2ifPjn71MO3muWRlgRpRmEDW92+bRQ0ciGwDwebRjpsc/flHssxfrkytZYikAIzSoKaUSMw+A8uoVYUYiS4dIyMgsrs0L0PfM+zA9k+jU+AKLrtCncQn5vf7hzeq2F4qxLEVR9Hg8MHrt62HE5mcS3Yf6SdKXfh/NtnlgL6YcLy248GgA8OGHO0h9dXyk3Yj12XwfzUD2UnB0LdMG3NAXPc06RGHwyJBwVh/EXlg6Jh9nxPL5IAbF5mWznh7scI3WElG1lGFUKcPUO0EKX959xp722Xs7ZvlcHdMqD2dba2IBn00KHlbERI7betnhq7vPtZPSsBw+UJ7uCrZDDiy/RKjUsh0RH0SA56QW5a2E2G5f9wc6fSxJz1gSmjkxUehEM+S9SpV1gXMM5o86ykCI0B0DbTECrkGNdwhQke/Z3NT84jac2ElDgK1QmRu6TjI9gXpeSzLHavuTNGBjlO6DiKZ62ad/MH/pypHaMQXMTxJNTSd7m5XXNgaeXFn57xVV/3im9uGXqv/9UjXI2Za97u6I4HMbQZ8Ow6Pv3uW5AZa5v1m5f3ntJ645FPTD6sz6RYgdMNH/+2fjT/8+6YKTumqCqpGmTSCsh9qVtdu9l5zaaaX0Ajmpn7lx4/OXJKI+OykTSnFIgvhFN4wfCW5AvUQ6T6ZuvsjHmbBt9MS8vcmZBznwXdMJFtUL9AX028YK9YTp2omz1GOnmlMb9MYaY0KFPqVGn1qLQ5s3RTtpbvLiJamLjkudvcCYUs3KvYRgFf0BckMMV1Kr66IxhQ97uBJ20GbeTYapvqaafTRxQSi3D2J60Igy96Sekn5igA8i2hsaNuNshAM9YHFz8gBIwrFXuwpleh27iFuq8FUN9zgtzK1H/ifcupPJO8XPlgRAk0MR8wI3//xc/A8vCIr2xv3x3CK3lC6fDYqXoupBGyJtRt/xWlFhAwfJiJGjpSEnqEe8qeShOMmr24+4M+LEiv1SJu2PnhlWNbcgDI9hkV4Qw+9oWYhzA5Ru/Xs2Ns9yDTXoDf6aI3Yjsp7SpfvWvH8AO7SA13KlXQ9R/okx6HrYC2ibqtRsVmOZgNdMpujmPe606igM4IW1yX0eDZKv38OhoE3QGTYPRvoFDB0rIET0KVkKLBOYA+JkRauCCOAlFujeTncUM45/5YRLHxqRHVNQh7JkdIbEvz5Z96Fb57z7aws+8eNZP7h78t2P1T/5WuXyVRXLV1c88FzNT/466WM/mn311+Z/43dTQRbBJvMcluYpd7BNVmS9tqJf+Cn8bl/Zg0uww98+2HjXYw3/+5ndsyfHe1dW4WcWTI8e7pDCcX6AuNI0rm5S89kf/D/7ugxQ2L7Y5tHgBiIsBmSi4A7FgC9RI75gT3JyMxtgK33UcDDwE5rO6YYRdOlzJiTOXxB/3ymxW86PfewC64i//7TEJYv0BZOMGi8bB1X1kkZDMwGiwRS1+KKdakNH6eOIo1bGUIGT3KhELpEmN04BrAA8Q1c5NWlC2uDJ3qq8GMLGJxNtab6VP+Ih48kfRbXICMwvH96i7no1Q3SeV++OtWwf4i3mnCXNOmP41s72whVgW2mEW/uxQ7AIUDg2zDTUCldw4p7DhiBxgfq8F0iObGTEBv8BeyKnPywHxIzxCMsBkdCmnonNoQnWZVJTHlxz076uermQMIp9YbHDf75149oDmSLBmsytmE3um8z1sBzThcOJmuTCHPIJRbhmu7uIcJYmoR49XKfuUUVJFyg7RAqNxmumhBqKpHzdCTGlgSbaXxhO4Ddhu6SKqjnDEP1uKufbtvFTlcnZkiRATEc7y+KKIErJcz/8a0XOPWheFqB5gOc9/GL1e74176u/mfbiW8GusIAUl8wmlCXRPmTRQAosgqZW+a5H69/zzXk//dvEWIIXhXxybLZ2ihU+ze8GbbFbC6ROLEETKWLNWVvs8P8ebLzz3/X/73M7zz6uu++6e3yrOqCmVBJPQlMO/MVUigO3nrTgLfvaUQgSgVXQd2aALesXSbGMgCRmHFQntDIvw3IDXR6FaM0vJ9WjR3qi2SKR9p3lgElMQY8v2K1XhkrgiCabBhpph7NskD2U8Gz/Cy1RXGPIDDQ50+A69mmd+3UQxEgbqyZvDdvSMzcgndb+m4WMyR9P/iiy/aUkPxITtshqPNPEXbjNeOYXEfsiC1BEZ3zUM8yWA1igp4qGWvW+0c1A3twVBQwzwc7sbjIEeSgfxF6AnYxUZERKjVp/0+Alw8iHZpiaabgFvpwi5Cig6zcfOtboM+waSgTuX3NTR8wvFt4K0uxQfPCt9607eJKd1B9szijtOMJcDzN5DIwt+FJTXXplut4ygBAjFq7rCQV5XiNUy3/Gx+SIwKVmHNw5Y23z/Nf2H/vc7pMf23b6w1uW/XPjWfdtOPfv6y68e83p/9rs7UkaRQRaLA1sCFPki+swUO2SX+ElIU8Vj/vrEsfAcIQUiBflBj4kFpz51KzjVw3/8CHYIXjCD+6e/Nmfzdy+3yWJzNEQjC1bn7NoHJhiT1T4+d8nfup/Zx1okfPhiGB4+GLfEUeIFhDNz/xsVjjOWCZjh/9s/OOj9f/v87vOPr578DJn9t0sjn8gQh5v/Mz3/Y4jztcOLEk9xeZ57GtgwIh6/jCoWtuVnHaoLAOH5YTBmRob/ijwMM2UlAzP263CoNSJZjAvx94jX4KNSh+B4a2hkR4+ZEMMyfQ2LQ5C8ZFU2mXFmh7Fw9Mx9jh/Hd93GWxGrP5HXiFgLKz5Z3zlX2OuIJHTEeCHE2rcXPdoVi6Lt9j/1hDScNElypTjh28Q0V1BoQKiHUa8+2jxgrIjHW0gdiSoTT6AMAFHLEBlgqMkI4Y7wBZIDydkPlbtackwakFIVNMkymccXHQclJBwit/assi+PoLDPRPvX/PBqKoUlA3cnNKlB9+6cd3BpXZSf6BSXQFmjaGN9h0YGLtQDH9lck5GZwBNN2bU+D984tk73/jozrXXdrfM01WFUD2vCMPEVA2l/mXz5Ce3Ll6xd+7qg9M2tkzY2VFzsCfYHnWHk9Qwaw/0nPbwpkB7bPg5YvEwOdHnyt8B0a3V1MrTQRRg2jqrCSwonvCy9/4BXK0cD88NtJif/X3i7x5qJNTMbyzQBkikIhvPrg5+4iezmjsk0Dv7g8wg1UG1OyxE4ke7MijjNWe3t3cLX/h/M0NR/o5/NfyRjR1mYYeE6wyJyKEioQoytPNkiltwxnOzTnjFvnYI0MeiQvL0ABsCJjElNTnrQNrvsACBNuIAUakk0vG06jS+9tQCj9O4uqUVruMWRE+cbJ445eixqNH0yuUdwSw3FG9aiSRMHHaSE6A8lx6xHlg08R4jETZ8tZm35ejFwfXq7pV5LVXBnY9+LwwaikY+zMQDOLBOPbwl6zwy+Nazv4zkloeg0ad/ZJiCZlvsMNyqs5nlI8UPUQYigfqyNuYtCOCIQy9S6QstxUZNJVfmlShlWqRS6z540qTnmcLsDzC2zkRS5Ilfkpz8ySyQKN3dMe2VXefhl+2kI+iK1US04Py6jWy1iZ2WC9A/miE9tPaGtQez7jEKIi57mOdy1wHdQQ/WkVqkkgYxiXbI/bp9dQTQpS5J/NTZx06p8qdSSjQ0obN5UVfL/Hi0hg3AKWHKaGJWcYN7ErHqQ7vPNDnepMzp8OiBzsEODufucKqmqad1UiDulUEZ7S+XG5QtUiEpTa/y2in5gxIjoe391xt6LDX0dsyETkictLDiDNRCNj/0EhepLDn3P2dcd8/wh8UG33p6VcVtd00BOyzOTUAQzIMt8uEO6YKl3TAQstU9mnEiyT/yUvUFJ3cFvDBI2Y/hb4VfO+u4ngefr/nTo/WrN/t+9tndZ5/Qk8wUIpHnzader+zsEa49pz3b+J1LMQQlsv7ZSzM26eI81l1pz58BK9hogEpnK4W6IaLbpCa0pia1OLwqpczQOHMprfqQMON0vm4xrVhSxEEqF1ZI8xvN+Q1Hj0UTzLn1ZjhJWkK5uiAzeg2irkgZLUV2D7AfiHqHF6nwxB1E1lju4t3OeCgxUZ9epMKczdKjkvYHR4DfkjxUZOulWPRsK0T/YCAzYAtLLh9izjgeMu79dE/bLpZ1Xy3bngTKy/poePDC/0UPbdKQW7wL0LtIpRewxqefIlVOymXGV08V1j6SyBZxzKlFKhY7jLQZkP9M1B8JlO3yE8lNY13MW7QIFCwFbGdE3/DVU4N3v5wpm6ioqKb7RNH57aQyAf1sa8siM8tEwrqmU54/cHk+i2Vwj8r8Dm94K6PfYRqghtbybVhjjnTsUYLq5EJFC6Is7es0dMO8csnMRY01qm4QYlCKvmjGo9XNe07buupD+zZdbt+XBfhKuHuSrrpyz0rrAg22RU99dFugPYpzO7XMYGHoRD7dPAtvooYpBlx8fiOIePXpEhuKLlPgQ0FKLL36HujIYR4+RHeKJegfHm5Iqhk0NCSAbhig3/GUFkuqCTWrrS9LxuOvVN2/vFoSs5aPrpMp9QmXrL+1zdt3rFHVSGN16tdf3Dm1IfGDT+45+4TuZCpzLzcMsnKj//i5EZDabAWVUrm5p7w0ZfGb9nXJoAJbnDhYVZvQEAlrW/68AUkqaqlJrQN66CiHzplzqf89wtRKIqt9544LPfpPLuPQDa7ay121xJhaxWUNYMtAmBQbNJw2DDAImm2WDY7Tmy6C0qXi/X0PnACIWuYRAQKyy+kaF2k3QFNcgaySdu0j8dyLPKD+nvhBZN+bNq8RJEajrfPhQazLWPNQHCrYHaQZIxqibxm6ufznkdz0Drzt1A+WdxDRU2mNHfZblQIwIuHJGtQmHxSsKcFXmDMirIScY8gOosbTxA92+T6yOliGLHe48WcAXjWSErYPml/ui9cPXbxi1xkyn8vnTKBgh+I/1743BzuEKYmuhZ+E0FcL8+Ud7VD0YG3i2L4sGtr9+Cl1ly6eofaPO8eYIq+iEEJdU9UU5FzWLmhyJNI1xcxjwEPnabA1cuqjWwNtMXtwkadsXtA6rBTHG3Wfly0MJkdFKvpcQzZvlKdPmzDFuxBCuUzmxKyTXp62aN3wh7YReGPrXvfGXZ4BM8tQx6CDKNr6oO/0eZNvuWDJV68688ZlS7LZiumqNn9538TNe93ZJppRzj63dtbx3Q+/WK3p/Uy9FOOIyd9/bfvZx4EdZm5pyOGWve7t+13nnNBv5coAoJl7PMmlV/7dvi4ZsptADmZYf4CWwCaaCmh+xKRaMKJ7Y46Ejx5OLOPrXByvFWGGDQVwRI/MHT9laPKXt9e0Y4gIza9Wf/eFuv9uVdbZSX0gymyUDtzF2fkidBPRRQwjF+lE39FVLtSqC3LWpc1gMw99PZRjvnHl32I47AuIApmAIw4ntr+Uat2lQQuDYEEjW4NifaUxn965eP3jic3PDKGnl97gDjaWy0cV7BBHqLnfqhQAJab4KQhuKZO6xQylgI3iV10BQsv1ykdBiV7rPZAhRDbh4pouUujQYl6hUOBX9nVOb4vU2deZQZ7YdN2bB5YoPJ+xT8g8jauuB956/9oDp9hJg4DvKX5CeOZ6yLbUK75mRykmx86AHrLOoebr/J4PnLKQbT2RiQeBF6bi/lQ8mFX6ElNXlXDX5Ly8FfGLAjhi9OTHtvjWHZQ3H5K3N0v7OoTDPXxnlEaTJKESNe2X3ssa+3LHYgFpWmQ9onn7XP1kUmaQacJSI6rkMctfDGCdnXj5fUKurSXLBZT9pj2eaOJof4JmSqpabcD9wbOX3P6xq//11Q/+/hPv+cY1l37u8rO/cMVZDRU+NCr71v5AE2vulH5yz+SUmnWcX9Ppu89u23HA9dwbQbn/WKNuEEia3EE6b3+o8YS54blTYjkIIgCePf/0Z2sm77Gv+yPr2GMmQAJDW2cMX2JCf+MopN3iGVpFDzdMS/6cAbqWj4j1nKt8Ey1oULVe05UjnAB6iM4Zwz6CCF7YoWyPiM1b/ffrZKBLn+RhvSYZNY5GPnICeKbizTJ8CCAZVlq6JPAXLBCF5q3OvLR5zT/jf7qpa3DEaTVhvvT76KPfZa6H+Lp1iAoB47HvGBaseShupE1i6OJoh8F2H4Bq7pMFZElNsNw+9b+R3EN0VVP5E6/PvPNe+u2KryCULdhhT7Pet0bwQF5kwW5SUaNE84BfqnyRF9h+2wUdqHvZQ2Uf1TXOSqE8mxUVJALTgRf73Vz0QSmpqgyfOvFxkQ60VtD2OxJJiad+SSypAPIDT8jL+85rjs4YkEPrwLuLCtsNLxGjOzoWQ1Y0+JrcooFM4os4hPTfpp4JD2344I6OYwZ8vffAc2BvgfWjEaK+kaIEiJawS7j0g+VTZvlU447VEQ5UujvAHCnyeaaHVjZLa+N8FzoF6vfm0xYvmsgml+2CHgTTFDyBg97gwYyT+4Qa0Z6JLftOZi5T+UkPappdtd69ixtMGe3YJCmdjySErpjQHhbaI0JbWGwLCx1RvieOdIsysq1QjPSaWf4IWTzKGvHXfnIGEAKbgIaTWo2vkKGcNCCLKGl+cUt4ZwvJtbaGiKZrme8jeocXX8lWBShqdwUxmKrIek+2o3HOtgtu+hnhHdUz+UHgzUdfrnpji88KNprS9Gq/65YLTvr2dRdcccKSaXXVIl6GbVVj4iOfS2nrCb++44CQpbjAEXc3uabUJ5fMjGSkemiTNUE1luLvfKT+/KVdPjfYZl7V5pKN+5+r+dfz1T/61N4Kv5b7W/gVry8V6a7av/nkvuVs1ZGWYv2ib3q2I+1kxmZyWNcb/Ck65ukyrRAL8D4jZnL6IcOdHEPLUyA4aohyJl8nFNzB8gX6emeUrD1IwBRZjx8E0B8zahjPJ2GlDqiFfA4mll1siS7YRkF9s0fefVhcgzJI8N3V3PQgmWil44Gyl0KViAoNtRq47P1KiYcgsgB7YHvJaIYmh4OKYFGUl1icFEscoT3LbhZ4xVAhrgcKn+at2tpHEskopyXYWsz2PfpbDyce/U5o/aNJxnIElKd91M4a1t2Nuw7qj30vDGpo5ZMlmVywkcWU6OU8eCktPb3fc0ivnyc2LsgVxLtykrDmoQQYp/Vd60h3YaLn3eUHHIF63lfNRzuNVOxoy8GjkDHUAn4rmUkyFHSQL9Yftt+gQKCVgLqqSRZZBzIa1YlGiYqMdbNL+6bSYBjmnAnb3zX55zwb0u6nnvALO7rCDR6XN+84IEUD2iahuf+86RtdicwjiHh3kCRXgG1uZr17jfvg/Ko36r27BRh2hISTwd09i3Z2HpPQs/oi4CFg2MxpI70cHXYJRDxK2Iov5Qh68xlq1dGM7NSSQXg2jxBq6T8tlx1b6ROr+LtUXb9o4bQPn7Iw98CUoYv1U1+btuhhQ8+who3y6qHdy/ZtuozNR+cDRpC4FVcvaJ5eSS1Wmk7hdJM58zDPIx2MkLIwbEc2/kIicsjyaLJ5SnAWCYdgyKIp8vYh8GnuiHv68EV8hXJCW0Q43JOY33g0PW8Qga75xoO771vJy1lFD1jkbOXUs+kXcvc79B9/LR/vMYpwVT7zhv89+72/To7EzsuyaHz5N9P//lSdIOiablxwzMwvXL5sdmO9qpvGoL3weEpbe3o+/Jt/7DzcKR7xPBlQJKjkaRMS931/c3WAubzaqX2A+zWNfOqnM+NJ/v++vCPo01QtV83hfkUynnsz+MVfzfjGB/dddVZ7Kq9NnLnDu+f8+ev/SsWPrl5C9/TXMXFvjVsMCSaBq2gqaiajWar+kx5+vkdXs/ioDUB6/XLklA2Ga1gJInoXKrJoeqdx5jG04qPCrGJH6YeGQLk395MH19BsZhrlRaMpyf0qwhU1l4d6twhipKMw1bmNPrWS/oHVHKENxuJz9a9TLm1IEc5TwTgiTtv3ak6KesrVzhS6D+mJcJasEqYL2JrZdChW6x4IH9nD9E6si+m1AV/EMy3/OegmfKWvHuyLRZcoV/3Ab1+UH6vujT/wxZ6+qgkZCzbykJ+mYca6TWSbbVXSbre7KSeIt/yj0gpLlw3/+GzPGw/E7Ys08ExfLY9iybPLW8C3UIYoNMVHYAAkI0frwvqoZiafDJv4qPQ+QW7mDtqnhYMNHVWQWJftjiB7mX3Qd+O/0nHWoheumHV/fNAuxjDS94WjU3zuYrbvLRASpZua5/x55X9ZCxszwiqKUMvAd6cEOYfpObTOQKeCuIdJgfq2houpwME+YHsjOgdBZqSz57CTz0Q+odi6m/J9pkrDz9X9d5i03nLG4gsXTEvlXBlrGryvcu/ck+4mBH1oYPkTYmx788aulvnppS1Dg9eNphmVr1w5HzU5cNaaPTv9/L4/gnvAI9IH2hz4ImXhfNPEUU0TSgN6lXVKxh3FdBQWWWALU8AgQRwVge+OC809iQUTwCBZ37VEDv7kpMUWeFlY98NHt/3ued6VlSCCgp5vfsN9aMGQzws0sH05C51vkt3RT9xx9cTZ27VCRJhTAEH8zh+n/u5fdW6F++ylp3z47FMkQYRpYX88CJLAv7x1x6f/+Eh3JOGW2ZqxeFIDcew7pphM0S++7+AXbziQzZsQ3LK9R/yvn89MpMgPP7FnwbQYqhpNYEAJQ+0KgqHp9L5nan5+78SPX33oo1c0o13YH+cEk+cm/8fP37Vj1TI7KQ1oIBhveWoL6FEoJLAKa0ZvMNyf9Cjn+PMliGjjleHoCVtMXh82ggh6N4G4JhD3G0aHNSBfKDTOuJBvvJKfhEzbSU4DbefJzfTF7bDX7JQB4AU5uS4a+1HILLaPgCAqXhagyr7OD3u8T68L3pmWJjDShZPbvlaTZLt84WlWNDo0jAGbCJcIqLn6uULTRjVbk0MVprUYi4k4oBnju1A9sZ6BLnFgWoF6vm8+Wf6DAwniie9xXf+LgH1RZiDnv31Xx/rHB3oWsu7Zoit+tsGgNf3d6/aHF3//74Nn3OyxLjNi5yupn5/XDopsX6cBscw2zS+w5YCFu4LM73Dw6jSwxsrJQvseLf9IkzkwNHHJAfBCZAK1bjkjooyK6eI5UeNpss/6A1ZRjVLJ9lKwE8oIvNOW5mNzsEMLvSy+LwyTz4cd4qswR9CFoL/7VbnT5TkaIBq+KdGzUFxPb97bE09mLLejIGxFs5Z0Z1inRMxU0hcL1edYwjIAOk93HNuIvxl8GpGCHo/D6HPgEvdKvOGSDJ+iV3vVxmBqWnVyTn1ifmN84YTEwsb4/MbUjJpUY1APusERSUIVOqPiwS55Z6uyoUna10FjKWXrYVzKe9uFwz1CR4RGEuzhQ4HwVAq4rdHLjCCENtIFvo75A7hLNhTRPSfNW9cwY8eIsEMLdZVJlyz+8MaLP3nhmTzlc7BDAMbG6XNn/fSDF3/sgpPu+PhVd37qqv++5uwZ9ZV9fRh4wbz36ZqdB11ClpCKms42RLnjq9vnTol/6Na5t/158oEWGfzf2rUFhyKx/VrABV9ZF7jp+7Nvf6jxOzfv/eiVh3OPNfYF6kuW9UVnP2Ff98EQ3eEIcBfzFcm5P75eGOEguiduCuBswyR0oGEbiOtDwowPCjPOpnXpgfqCga/gIX3G7Z0HstUass8zAnzB7NKLZocAq/OS3sAEvd/rWY4T8C1QBObFnrNtFAc8mQUWz/FY1ATlKI9WPPB9wBbAGsH8XP5Br9o/AV/FQwYc3uqSuEpBOLxVBZmzL/oiHcYh3s1mL4IT+L4NFqfP/iqKF7SvM2H6UmnBhbJ9cQTsZQeVVW74aqi7ksU7HMwO00FtCAt+4pDELrXQE2G2+yeL010GQPHXe/cODpGN5hdJBJq6FuDETiob8BPdCde2lgX2dXmAjifILHBUvMf5Xj0KMSV6rseo2NsRemHbAXAqOzUTmP+36opFawezQEp0sMNUMpgnQaS60TylonVykM/u8pgZaIBohDj6ckcA3JENE4q636XXWNyxJjm7LjGvIb6gMbFoAkhkYk5dclatXuE2BZ4kNcYdD3TJu9poSmOyISdMw5SCbhYre2APOAKTzE5eriXK2AvmnfGMPBxhRjMDxTx3inbre8+/aukxSVXLZ5kMOOK5C+d//ZoLzpg39+RZcz554Rl/+OS1CybV9jJLgbKN+P7ynzq0u2wFB47ocem3fXzPbZ/Y89Z2743fmfvRH87+6d8n/v2punufqrv78fpv/X7qdd+Y/9XfTptUm/z797ZcsawjpRZmrGo629jaHei2rwuE6GLORrkHCcxmPfsrZoDuG6RwygwXx/s4tG/yLnHKuUIDG4a3P8kL6JNuTqgmSg4jqkSgjyZUrjuWKw4imqXROswlNxDIQrPrzS5pJ/gBLw4aaHACKAo8PFnCuBRyFWrR0XS9+e3a3Bd0uGKTARseT8SybEaFbEMIgYHhXWRvv1guTRvU1/5ydNn1YFCBO+NmD2rHvi4KYIfW2OHgdUKyFdSmy9RBbkv6kaNwoNBRlLQ8kREDrk6/1DlYK4C0tUfqd7fNEcq/hFkgZF/nzO5YtX1dBqCRWf4i8ZDDK85GLVx65bToBZTQZzbv6YixnWvtDzLANHQxFmoYNCXMEO6cZua9G5Ah0B3HNTocBBGZ6ssdQT17uSOYiCIaPpdeleaOU6uSs9LccdHExIJGQxbZt3LDNEWfkl6hkuFOQugEsjDQziaVygRJic847rWcY3blhaobJ8/1vevk2YmUNlRhHQW+lVT1lKbhiCVTU2uqP3fZaTKo/JECl0Tz4Zeqt+x1ZQt5AzC3Ap2ce0L3Pd/e+qsv7Dx+bmTXQdfDL1b97ema594MplTyoUua779tCxjkxNpkttnqHNA0rmbSwYZZG+3rQoDuAmWQig0R1choM7REAu3Evs4Nauj+aEGEskSAF+4yw3dqOzu5lEhp1RPrg09vZK097yyg8txEqCRS+Wxq5CWUIJFUrkxBauuOOu0UB4Oqe73PyulJThbP2ekcgdihvTHyUQLM9NJmlGY+uzYDvJDixSTPq/6aJFuZb7DwnuU7ODOZCCfX/GsIrwyo7Ei7AX3trqAgzXZqOrB27jn9eefJ05bmWsuSGznYIbLEgtqEHN6FvyQfxF4wz7YKCBi2YC7a6VhvnVGz9SOn/gqyesAbKzx9csvF+zun3XLa7Ykyqy+Z0nvXvO/Nfafb11lgOVgU4S8Iq4J59QosjP4Aq4X5INbwzvoLjgYfRAspGnqp7ptd3OEPnjL/ymNm5fBENAyhunHdzGPuHzDLj8utq24Kd07NJ8YN1Y1DM6peuWLeMGrAUkEloWXFtlc/freJRj6IQ1Minhn+ZqB7nn09FAINfLSjMPExce6GT9xxtSBm2OdymEA0MzUr1fY9zpQzsuR8wFPSFY1d8cM720Mx/ohJmUjRGy9s/fGndqs5Q9JYAI+k1DTSbojIBKqCjT6ml7NY5kBxUCTuiTs/8dTvvmJfp52cwm1DW4lQBu4gDbcP4bpEK3jPbT6hWjL0oSacTGK4kpGlm0xluJcwa8ScR4Kzntz68gMPo3bM95zZc/4C1uDzKFiNM2cQ73+Jc8vEawkhssRvOsT95TX8QNYMgYpFvxXS9xQ/q8fcSb2EMadC0McH0YZkei4hP/AlJ4C+8FBJFcWopGzw17GtmCRPZvXBiylJTqBjeKs5tz8S69J0lRPlhKjYyzJkd4QXWBGJUtId7EyPdKJntQtSUvLwsGR8le34FC/jqeh2+5inHqU620kL3c6gFROJt0ZAJ0w/rFygPIl2K7/90K3Nu6bbSX0QnMDUMTguiFoyyvzr8BauAO1dNgC861b/pd/0WecZ8dpfYnd9sMu+yLvLA/hRUMBwawZ2aNGPVNy0fCID9Xy0q/jg2H3hDEEEYNFCA4FTF9rKc+C0GcuvWfLQ4BUqIuX/8MqnYinPJ5f9mJQkoocAm8tOuX7zwje7Y1V2UhYURxChY/AtWGaoy8HO5m9vggjs9zy3Ovi7Br/7u1ec7k/vX2t/0B+mybs8rQtPvZ3yR4fOUe/xSM2mlbdoqiuDe2ImrLhqfvO0I4uXxwKoyHdtOPji+3+nJwZuJEIInWacvrjpU70FMiSKIIjL3vv7q77wwxFZv2zDIYLYE0tc/oM/toWivQQRbM/r0v9+65ZFM6L5+w46C1nkdqw5/vef/ZuWsj2T8tEWTGhUUWjfAXFxM4Bw3lv90hy3rg1VhekVKpETN2ccpy8j0KoNU3zgFfHptQKh6OoCLxjXL+s+fwGXB0dUOeMMWvteYarjXZrAZheEWCSyfc2aFav3HJp0PWVhmjNkiFDeaNUi3+oxskxK5gOnCCLEwjzjsgWd7weTs0ZtQi02bYXAJOkJfEhLl6+bpJciiUoCvA1paAEuX4gROJPjpaTiiVrfcvu7JSUGU1xQtIqGdi1hCi7C0x7FHTFhNPGqp6KTskdBA6Z4MQGmDnXAvsKWp4MCpkQ5zkwOwsmKKvADi3CoGk7Px6SjC2marqPT2sllhCxxy//yicd/8w37ug8sgojMQC+zlSVpjWdZayBniRDTYLjnqytqqqdlCMpmIdZt/PSs9gPr7HASeXZ5tmbZT7sP6QOW+AAocG8VRRePd9sqdDQSRKByMg+e1LqzeENqAN597J9OmbYq0V+jg7SFk+5fv/AtkVc/uewHHikxOIy2U5B5fl3Twnte/6R9nR3FEUTFx4aFmQGaDgpgpx7B254gGkR9tfq2w+KmD548/8ols1KDLAGmrSCcdCII8dmn/ckVaDENq+NBOGkdB47du+ZqjrIQhWzUw/qbCbxmHJpR+fK75tvXYwSQxLGmruXv+n9aNNmPIBKicN5lbd93JxrslDxQKEFEcb7vtk+ccP5TiTFOEGVBWLd/3wd+eV88pfd1Zkim6HsuYIOIpjHMtMgGyGos7Pv1hx7rODTZSslHWzCFlI6vkc+og+sjHvclAS011I5MBk1OOZxYsGdY91DB+6ua8sBr0jPr2FJh65cNw+KI+YwjpjjjWn7K+XwDmKKdVDIoaA+oYTi8YdXq15959tC+faauCad+ipt2ZsathXlBTqyJxH4cLiULThFEMKgpFe7/ubimIhg3OCK7DEluB4GDEJU9EcUDLgiAOyatZXpUUHnReilTlCBkWAZA46Qjs6BHH93HzbOvvu09xwlOUYf4yxLTFyyxzw1jAnj99kONt3/8nz2t9XbSETCCeEhHZeFAP7VT09rfimBqUbSLvuK75se5IvI884vI/V/osc6H7PKQWFCvkodAaw/2OYZVBYWOE1CI3gEmBwlifu4p+SERMsEVnHJGFPhUQzDDHiogiB2R2lC8IqG6kloZ9/vDk1Hk65tOsK+dBnMa8LHyT4Qd9hsYK6CmuCD0PtFUlm/d3xU7ul0GCwukG2B1Bk9ifuXgnMq3zpj1t+n/fefEH9016Qd3Tf7BXRNuuyf15Ycnf2D92VN2L6rrrPcmPCJuxldw4LuMNB5pOZCEukC3Hzdh2LZgdhC8SxTc0gDhCnt8MXeVT2/sw3ach+SKTpizKWcMojEASeATWvJ3T60Mx9UBrq6SaDyWjsItZt+guaxArbp94fqZW+3r/CB72IRDPuwQ0Hdp6UDZQzcUPRBNa/XhAk+Jqrr+/Lz09Nqj7BCgVNV1et9LgWc2Ep7PkXHkVeZoLVWcyjYhRJTEaCTy+vJn/3jbjx76/R+b9uxBm+F5am59jIt1sWAyGWDqOzTnCGpJMEzO5+856dKHll7y2EkXPbpk2eNzTnp91vFvzD5h9eR5W2onHUgfBytq2vzV7Ti8gR7FHUsfccob6B84dIOLJewj3nskucSRI5k6eqRU+1A15lZr/QWxx0Pwl+0hleaI/QXYqAYkXlXjoYlz19vXA0CY4k71H8aD+o50GLxoh/h5+c7ooU254s0uvcFdMz1DWN/BQHWAHcJ4yMwOCecOsl+MgZiWpwU6qTJ1zQRHBLlGCdpJJSDg6g64ugZvkS4QsrdzDk5iSa+he1w8lSkpx+HmaTQe2NeWa//looFKdQWY+zhq3fHlZmMIFclZs2IXN3VHV+w4KKWH+pAYDShNM6vXnjXtpasXLL9xyatXzNu0dOrWmmO3eE7e4l26xbN0S+CUbfT4HcGZm06bvPqi2c+9d/Hy9x2Dm1ddNHvbCRNbpgTDQUUTeaqbeKCQ0lumVrRMDYI1Wj86ZmDC4hLEgLuvBkSjqSdzZ8Qu9FaxDdohO6wgU46jduouX1VrmX1+ygtKyaYDTZ+986Fn1u0CU7RTjwDiNRqnv3+4ITWQOg4ToDUlkZs0f619nQcEifASyX/7LG23rkdTZKjFfCavG+4E037DA7DDSEL50/PiK1vZiE3/nyVsw3otzRE3cdk5IliHzPHVnOyICQN2qKrqy/956g/fu+2hP9wJasgLAg7WSqjAde83dz3DhmsGwdB1fVvh0efLBsiMVEq0yVxfApfmcNYBDsQ4XJrGoYNbRy+TG0NkrkyAwVI9aY990R9oArzIwkvZ10dgaFw0HePGk471+OyvojkYm7+Onnzj0LvCWOxQ8pDuQxnYIaD4WWi8aKfpVFCbwXByilnxsQX2YNOwcSPtQ6ywGxKzajfffOqvYf/a12lAVlBC73n9Y5sOH6ORFJ39TY+nuUxTzNAnXUnX2tZpZh5yExKYtZv+g7oerbYyNac6uUDRg3ZSGoz4VzDXQz1lso0TshTU236K2YJGYy9Ufs9T1/qJT14cnVfXVeMJVboTbtGE1kbR9xkLPApKpD1tRDeTM2qZPCNcepaZTTFbX5ESmjuc8ISSgfZYsDm8v1Jqnl5l+hTTLbFdT1CfeOSoF4TQlHpSe/nmO9tX76KiZXESmfOc3vUtX3Qail1yMWOM8qzTQYJobHuq9F2ZUOgU83EX//PG734JemUki6m0KWaQwpt+e9/ydds8iu3kNwB4ItrCb76489LTOpJ57IDiOBSJe+v58/7y1Tug13E55HwTOi+kR+5wa/0gksAP/PxUVy43RJMY7njk5E2mxFzQyg6ww3Dc9cflwto9bEuZLDANEyae8Z4ze85bYGYax9Y5s44oXxLnK1z2teh5QxDFHes33P3j/9V0XQAvHACoIdlHzvw6F5zEQiQfAeUFrTkV+Z+w2V2SRHVqilnTyaIp+l++uynoH+CZNY4CALPt8ds/9+yf/su+PoLgBD7ebQyYX+4L0Ed3kPIipyW5zz1ZNW2pZH8wCK07tR+f3hZqMbJ1eYsdolV0NWXwOwTAskAQrc1p7KQjcHCKmT+O+4J9WjJAPqCr4j0mlBaOwfkuCIsnvDm3dtsA8pdeNaI8u+2KhOo65F65nF++JqJuiGrry3CsjWo7ksm41BoTm6NDHRGhOUwGJnbLuw67VzW5XjWpGkxNo5wtd1DrspdC5sS6zRxbn6G1yR5a4mbbA0AFAlbh7DNZPr108NKqPEFNMahN3EZein/ohNTpMyJeSRd4CoWZpoaZuTns/ZQudMW0Wnu9GOOFfb6iizTulXuqPG2TAwdmVycUQeyOCa1hoSXEhxJsb+V0CEPmI4+OOHqB9+QOLd8UARtmwW5wTZeo76npOgnnaD9Q+pAdWnr3c8VLRTeblGMedZnEl+JjixDzN9uOOf/R2Se8oZbNNs0LxOD0Kj12NqSLnVIIeEoffWPz/vau3rUpA4C6T2nkYKty8amdipSLXpcLzE/LXPPENZrKKCzqCEQ/Y/UBrJb9FAK2ANvb4JTpAj/TnWshs0n1YDQ1sdW+LBPQlNHdeJ50hl13LhfW78vBDgE0fcMw+S0HJI87Pq16cC81OHM69Z1Iq9CH7aQSwAvC7s2bN7+5hre2/R4AZD4VI4bKNR5np6RBBVHdmFCfz2+vmuxAzQoSC2RhX+eHbmlXi/KWfZEG5F9d0Lzq7DZFHrnIA2MfaAKrH7/m8I6BPuvonpQH+YMpbqcMhMk2leYFxn9A3ZZc7so06MwAS69zn75nlZqxyzN2WM/YYcZVKYDoYqunEyFjwGS3BegCsK8SR+gslMVoZpERBUaD7Oui0BjYa5/1AQhia7ihJx7USGqX9zGBmjLlJErKcciUsJCWsGRLO+J8x+bAP1ZV/TxFWTx+CIKjrodOcPy3ASpTc+e0X51s6gbDo3qmIcMBMDnDIzN7WdUzagfwRTyK1w2qGRSdtj6QmMciV6em15iKKLaGlS2HXesPSrvahPYIuCZ7iEUWHdA1DsKkoiD6XWhHuAA7nMKdNLH9QuszCygqtCIIo3CbDgXDSywILQ6YudlkU56onbpzTM8v5wlJMNds8979eL3Aj8DbooT91a2eYKd9nROQqLrKxont6zyxTdNTufYrYk66vij7z3HgNy1eiP8TqtAWlrYedv/fU8K6fWxmeUhQkkwmp69tXUZr9EED/qitWuISnRg+tNDT2ann2DKICuaB17jmDf08EdH71o6sCTUOhwFbMhryHN6RIXwYJCqofKrfdsoDgWYK/pOKGdueT+16Ndf6vtNvCSiBDDaSxQ4hwLPNLLM1MQGaihrD4JxWFoII6gozd0Cc8YIgCYlqb/NggS0Qsr9zhmnSdnlTl7wb9Mv+YFTDRD5bXevfqPyVzsddQaa5YRYUai++vTFTvVR5tZ4FRMgLpikx9yBoHdafhgQIFipB5PUKd2pqVXzhhPiCCWpjgBimeKBL2dCkbD4kHuikoTjR2N56NlkccSAvEi/5Xcg8Gk0FP/G4+E1Ezzzugk4HeRHtMCIdbLRI8RG2I1OQOanYdxQCSvWKhv3vBIIICIL5x0caVm/xycO+WgXqRJATFQ2ZNxTtC5jcEKdFqARzn663abk8VYmpByJOmkYWKaSE6CYNJ9CzlC2HXJuaxMM9JJGirT1c3svFYGHPXDD/Wnn6mbS2L0fECfp/PclXwSAvAqU4snmbGoYe6urOQaPZS6lJc8dTLOyhlUB5rTupbRxFDojjKB2yyO1885Tm3WydwwBYsjSf9WHxkBnp0F/6XU/HW3u71u/pXJfh8Jp7T7ioe8CGn+AGbOwwu98h5IC7gjmzFT1lVxDKQhABNWEmI4YrUKQHvU8JVXg6tf4KCpWTMIz9XSyCZZuyfrSN9uSGaeptro07qx9CI0MLi/dA9NkfjQOgnFC7YqnRpefa06oX4Hsib0o8HyskBAsKHEwxPRpnKqJW60/Oqo0vmpCcU6cH3NBk6d2TD8rbmoXmHoIno4Zssmh9fwRgGqZU6SE8LxPPOb5P+KUqT2UuzocsW60r3GpASEHc4H4wRdijfCGTtO5gpzvQPfJN1KSEbyN8J2dmlCMQXw7UDU/N7ojw/T9N6QyJ6Zn8YYUs6cG6oQmi7KGGZmqF++2QuKmvU2m26jeJIeqGK8F6R4mweCFIVlIT2iN2b9rezIcSetCTmNsAqyyxZLI+dwJbHJEHYFdLblfdnBmiSa4WpoAjGn1yKXK0jih9U7KBJzSqJnd0Nm/vPBxJJXBpf3AEyLKmat0dHbkIogXJy14zDeaAuD1lHAk0OI63AQSB6+kMPHv3Z4xMdriocBmndDMCttyahxObH9qjblsf27Qm43HBNVuu/czmhad0iDLrEYwd1vGSK6vfIZPnbEcSFgN1eIRzGcVhMsIW17iD2Wy2XKj2tLiFge706L2xlNLUNRXnMb7NShxDME1zp/h0t9FUmBfROwZkj2KuVKiY305EhDPcMo0U6/2D7mWRRUoMr6JOrEjOa0gsmpiaWmXKgj0HvbFJ2t3Od0bTc9AjNqxIeEpM4VThw3LTLENnUQK81WxokM+5pyfeDyIm2mmE23VYa/iWp4oycinnNfXsreiU3fGRJ4gQUHw373kqfW5xRMKZAuwD/CW0hyPOBGmURGPVZt9P/joJNulwVjJKGO3dX91iX2cBzGzmOhwt0ktSf0PVsoc7NyXVcJewgYplRKEnRZNiU5ey+RA6jniATZqnJleiTyXmN6gTgswnBB2Ip+riKWyZaB4gBpeq8T1dn+rQExJHrxQmTyEeKzQiLEQX4SuJPGR58JRu6Wj63Zrlf1j73B/XPn/7muXbOg8P1km6pvV0dg5R99BA9YuOTDET0zC011Gqw9hcBmDkfvltCUnkkjHXQz/79sEti+2k/oDILWhlRSpGVz5ZrxocL/FUpAMOIrDoTpNnxt/z+X3XfGan4tGHYIfpoDb4SqyrXEFtBqOMBBGyrGhnxIkVe/lBfVVgDoiNkWS/FcFjCqZGkjtSK8ZdDzND48hfAyaLbJRXgzG8EomnrBHBkoCWiofgn0D1Ck9qanV84QSm1RqCRNOlfR3KxvQc9MEuGk5YnHLYyCJ+JNkSOUG4rq5jGdhepIPt6YT8ok9ZNBH9KzdgpOErkXYDYsUwTHeQfdHlZwEH7DsyweXrFuVY6UXrAEye9z4hBO8kfDOuCI0ReRvve0Ssvk2svpXwrUeIY6mQRePvT9fe8XCDwLMF8XZq+YHa9FR02BdZIHvYio2MaiMf6Ls1bY/KVlcOhkl0X8wUCjRY0S7TXYBoBiwoaXeba8NBZWsz3xXTA67EnLr4oonJmbV6lZctBUOuWf9KZ1439LkTzQqffZkTRDfMmY2b5Pif1V2tZiLACafQGusj6MdqTnExB8RczwER7IhHHtn+Rku0B+c42mKhh7ev7krE+nJEvEciHo9HorlGEKGTZT9XMZ2dMMrOa61Jbf1IDh8amp5MpgYcqVQyvaewOn7kf5goyhS3880ld37uzrVPXWWXb39YAlMvMGLx9jf8W1f5mYQy9MGHqWtqKiXyfMPUWNUkarHDbPTACmoT6xrW0SXnw9xAjdnXaVgb/hS66PrGk24/duKGAfssu3j+2R1nPb7hOpyvqfztAc+KMeKDeBSQUZXJOWe0fte+zgnofl817+BmmsAoDHPTD7LJPdTEn6XrQ27fgaKMJuXtzYkFE0wprYScBVSFpSw0ncZVvieOgyZUcAfDK0ML6j7FVESmJgFoO8czACAPJtdx86GZq89G8faqVBQ4W7PsYmOBpg47lXkrDyk1Ag08Cz6lmfgiJBEeAu6YtILjDOpGC8545iM/uyU1WtyrTBbvRq/k9CBHUoTv4ChzFDd1r9r2A1ObArlt3TcAksDf/H/3P79xhzQ4cEkmpEuYfPX9+z921SHDAD/JThecgyJzrz9++b3f/hXOg418qHXgDsuoZbb3a6TIgKlWzAt6tuL9SBDKx049AqLTxKwDidn7OWOowQIUhsWfdJMmUnwowXfHaCxlUmJ4ZD3otnsEbkE2c/A/nrrueEZ8dSsH7pgbhhn/2PnqKXM1Va0k0gm0eg7x/0Pb08ElNc48lVZ/QJiRjt+XFQLlVx/adf/W1/pOK+umcd28U05smN7rwsQLwoGdu/70o58k4/GsMSNRK7XzyLKvWiOIguSK/bsr/ueY9WE2BBr56adK6HG5csmeRgSF7TRhX+cBZPOQuGZD/An7Og002sm16pfed9DrUd8hDsQlA7KFV7WGPW+dunXlmbGeiiNbywwEZCaYTPfhwqLq4ebJs0PHn3kIZ4O/RwlNRIzD6/W2Q/yq5ZNb99BsNIkFtfHly6Oc3GrvE8rQ7i/5AG/fSxD7mmFId/kJeogVGTGHhdYLSYh/dOkPG/ytA3wQBUL+9tbHtrSwQAO7leVrfL8vcsZlBEGIR6s9v+d/RWPoOJlQ4d5qGsqwVqdIoLREmYVg7Dls5DPPmCcYka2h3U3OPNM4OW7ce5hzGWZuRyXwN9VQNhxMzqw10ss47PRywCKLpklUnYaTjClGEjSls1UvfgVkEZSRjZSk+RzuS/91AFQUzB1c/Sdmdm8z1QSoKUvsfVFBYtGFRAU/S2CLgj2wKch0mQ3uZUgPNFIWBxEMIT36iVqT0jHtcY6Hp2Is4lLvw4+98OEb/+dz8VLDdzgLg006IvcsZCDe0DANEMRbHSSIQHq7V/Oj72r+/PUHPS49pab3ry0nZIlb+8L5f//WH1BHwQk03AYSb38EoEYUL5E86dBrhWeF1XsDC5amuanr235aKQyyJEhsyXa1oT0rQUT7YEWC7qbDJLMsJaJqhizofpcRcOseyaZ6yF4+3VDkxde2u+54inGcHDAM0++OfuPdRo2f06EJYAqZPo4NgsbTm3Rczk+6lJ+Qe5M9EMRXD25/ePsqaGI7CRafYbxrzgmnT5zTq18EUdz8xpt//+WvDVT/4M5jQU+RhddyOAwVlpmZMBM/7Db25fr1eRfJV/0kUDtNyBg5p3RoGpcaZEeXVRC+XYHWQXkWdqkcLsgqqikLV7NE9+HN6lO3hne9klLjzGt8ANCFIahdQQL7ARI+W/PsBe7319N4t6EmMyiCQkG+WH/YPi0N4GpQV7zAppUH9jE2d87Sol156c6g1PyRJd8R0QXtBDbfg+8ndPfdm77bk6xCUozrfIz/Spx045etm8YGCPEatZfrP5U4t52SHbBUPZU0kiUmZxFAHcFUdQVoqFWn1tCXE0A+vVU01KJnla0FInlzh/rVbh0dK7e0I0TZ1KRXedWGAJvDGgbg/ax31A2a1Gg4PYgSZctZTJcEfakHFNMlsljcAHJUmrQWXLL/d0Hlj5WRjqx6iwdN9BDmWUg4HZIoxiYiIXQG3M+0bR2L8qqljn6EXFMeRh2LqoWGAcmiJtnXddU87do7L/zQ9xKjiyAOQFkIIoBKUzWy7NieL95w8LjZEZABVaPl07uSyO3ZdPzfvnW/pgqoIxjYfQkiFIanigWwTISzc5fsYPVey8dD6eGEd7mECwJ6332ZTWKKeuTkDYYnntkHES0kpdNQnO9CO2etgQ0WVrhhkoEgsuFzViwFWkSUkJ6450f/pC09uRRyStWWTIv916VHfoUh/UusFHDyEWHWsbQid2hvntCD4c7fr12e1DRrTtkwTYkXbjnm3En+Kh0tPg1RklY+s/yhP9wJpmilDASqn/Dk9C9wDceAIAqior4ZJn+O5WCnsO1veqCyfpaQKNYxIB9kbBLla6tvX4xYkaEG3R7uzX/FH/wspHOG2hRk5nrI7P/8ohdDqvtq7C5fhMQYACenmGUvG0GEtWpf9wHEHDgEtBfe007KAl+FetF7dh47b5sej6eiBpPNiZiodku6umtvzZ1P3aIbtjm20/fopuDfxtgsM1qDWnNW648lw2OnZAcbmXunTTGnYQom+VmbcEtSi+dcXEmJtDu9n8qsOmhCO3HYgL6X1lRsJjKW5HsSfChOEymT0vQctNvwKbYSBSCzCxRBvCxyG6n/lsndG4aW+KB36H2oXJyD3kGUDHamtqaY8al93R/ooaLCpp5B93WVO/WaP1z28e+/MwmihaRKAx7t4lM633tB2/ypUY9b1/5/e98BKLlVnqtzjqTpM3duL9vs3bXX3l1XsLGNMRhjjOkQhxhCCcW0F8h7xEDoJUB4CSGEAIZH4MEzAQyEXpwANi6AAfcOttfbbt3bps+ove+XtHfnTtXM6Jbdnc/yXUkjHZ3yn///TvuPviKDziCIj959xjVv/Jahy9VDzKq9xwYKrm09R+NNc9QwECM88vcJEZWP7N1kMTOazzzpPksG0apKGmPKxIJycN5SZciz0RMCO/RnIyJZBL/0C/VX99fwhohQnQ3gwmrhivNLl5xOG8NVQZbY3yo7R1nIWbPSAOCFN+y9/7/33KvZqVa5fNnW05+8cQfsqPMAAF54/Te++cvvfr8uQcS70UH29PdLgQTRVYNlP7qoNdxv96SnqVd9t5/LrPxDXXRRDVlmc/v1T108s3CgspJzu5NIL9GyZfeWByxVefe6A/jZo0oWs47+hHYrpK1gvIlnxFPOnX/1hx58wjOL2thGc/vJ4vRT5LN38wvOMZ/6DOuy5+8ffvYSOwROzDxrY/ZCmod19ACJF1ZAtoLudVM0yq1jFkxn7F0D4htBoSiNvd6Y0SCtU1mTXaWg9+2p9zQHKxbSNiYLp47md20obeqzBIdlDd5PyznVx2fFfM526N3C0hYuC/OQFf/H4dxjzb2GA9AFaJhBiZi6RW2APnJtQ5MUl3+twcdRQ9F+g1rJL1jQSlwcl5JXhoBi5or8G/89eOV7d/zFe0/51Dc3HJgJqGi6rHDGlJcZTsEO9ULHrWA7SGPC1H5TLF+qwmiFSpZWqNRewmzpyXDhlNG8vbrf6AlbMl8Se/eRdqGfeUKlN0TUYnBBRRjbhwsvuSDz7itKF+2syQ5Nyeq1G0ReIoEK+tTNO197xtMuPeG0Z2zZ/ZozngZ2WBF/0zDmZw6hBaBroJG1GhuWIfVtp0UqliWUgHl/UX+wyfxcWtPgg4Hu4tgHhBENCValcmn0oJd2XCukW6//Pqmp1WNXWkPPiGrQePZrH3/Z3+4ZHtWKxRKjTTJ0ruvcwGHQcjbdePzemPu0DW7JZ8xdtWXxUm4opDNo15JOD69VGlqn8kWvykC2Ary2U7cuypBn4Q8MGe+PS3khgmptagNTFVLAvWjrPJ/qQ5s4bDUtVRh9kdKJA2CKtA56MMYKmrrnUJDWeE4oBxfILw8eRnLqEA3wAzkU4NMi/p5R89aQ900RESoYXuYQGB51EzpdxWCKLTmrRyC+tDuPDYDPB1QTqujOP0b/4asbX/KeU7/600GUs+zb5h1NAIrPeTvOseuh+OOiNl+gBUo2EC4tYeZ1zA8kOqiQexoAyfauHpvCMI3tI+ZQD/E/HJouCW5sHS6+8NzsO16QvfoFpec+wdzYV6+OILpJpkagSj1ECE+gXm5NDj/zxNMv23rG1p4hXFa8hhtPuvSSZ730ytPOe9Lwpk2yopiAjpanZk99NMlWD+ygsRImGcWSdUOxKWWv/EYXXdRHlUiS7EeStlObhdVzalMN//dibuCLATUOKg8Wq8b410Dp2a/Yh/ZpSTZMzioOqI/FLLv5ZyNFXbCAVXaIYemMPn6SGdSMcN6SdSY4l0V7h3CnWjev2QwPB2T8PfIiyhMKtBkY43Fz0yZ+wfJU1DlCVqCHlTSz8n4HBw9LakLyN0yKZ5IVS5VhSlr7rA3ZGYzywvVB6bdBa2ORbzG5imZAFREXXJlKGXHEoM7Y0OoDEcTBJEuRzVjQ6I/iMGMhRF4s5pTplDyVxo9WT1ioaDYSUyT3GxxWm6iwWTKtH4f6/nFUuTe0MN6OaoBRs6chSkKmKunMLzR0Gqx07jcGHg7G+Nj2O7Y/4aZa3TfrBxAG1cxdLJk9do7XAJTBD35//+PTc/X2YvYCFJHgRAoXM/Iv/tA7Oas+aVcqGEC70J9GiRDS/NTwH37855bJyzdmxXfDPVwrUmnaD7aJ8o1ZrYzFYiywM+zOc2RWafNk3QmIKwekLaSK8Xmxdwa8ULtoZ/HFTyo+6yz9tM1WT4R+NRqtTkb27GLJ3bzHe+WAAXba8vU4ZbK/f+uunbvOPee0J517+nnnbd15akYdndOjMElkt1CRdr1YUmOyrOq/y4IgopjcN+ugf6t81hXh6m6hLrqoABqBhYz5h6/ljRItErCNBzm1UQIsO0fOpFuFj3sxr7ibmwqgDeZMRqzYKEaWrd6zM/zdc9ZpBXtRyjIgzzSLzZWUaqVhd8XIpqRrIltcTBtFnZ5uA7alvu8TP5288UGuNpqxZJT03W+7fOTpp5qaWwJcEft+cMfD1/yy8YuAWdI3XXb2Ez/wl9bhdxsDDVd/Ww/ILBI/X8MEYH+XTQKkz0jsHtV6z6D0UDvUDQnvGRXzB+xcUiR2eUZ6ZVo6pyB6Bel5sh/2f4wF7zuoJ0LaaI8Xgr42sDOD8sQ0WUlXivqe7/z+wL37B8/d2nfG5uAAqo1AivhESP5dUvpeVPwudMIT1IkH9cZVqSnIu3KYBSLkKxFaJtLLZvcaTbujQEoCUXbWpZ9/7ps+smpzEBk3OTcc4fQOywjlJ/7B0ragUrq3lqOTOYg1Af1TKPI/u3jmH//6MVn4I3E0B/Ge0695w7edOYjpGXeeKBrSKIv0oUqvN62iwucFS7LYBxNiOGD3MxuZ8+41w4XVI4goYybxbEkZXxAzqeJQzNjUb4VUBvVhVDX/6sCQrCvlEy7kA41XqLQHZm/HxwX/5u3yHXtKslmQMtNSfl4a2snkoJnRtU+kxBR5JHVfqIMdzwi89ro+rnTnIHbRBEKwxSnjS38+tzhOegzW2dRp+WDbrmr8dHOzygQRIMWX5DSJsiwBFrfML07JV5b0gr3FWRXA3mzX2fUUGb1i98c4l62DMUs3fvXyaw79fg8In3uzGpbFBH/KV18/cO7WIwRRlf/05ZvueN93aGFBQxhFbfsrLzzzQy82S54I4lENORTQbjLZi0atdMtD6ssIogM0G3aWtHMPzT35vsDWoBIPkBcYSQpNLgb6oqXNfeuXIJYDMqqI37z5K/u+e7scVkVIUeNhJRTaNHXJieOXySVyftQzJpD2fXeWOmQGDkATHW84CDY7a+YXLbRW64WMh2MD5DNu55O/csXb37sKBFHIGj6XXejJzPWn5wdK2Uh1+7AOLCHU4cEXyWLQ7lSqBJSBqvBXfepbNz3oG0EEoJw0nf/ty/a/9SUHtVqrDlsFCOJDvz/n/7zla5axjCCiIQ3WVHPNX0uothbqJYHI6xNmyTR60pknPkDt61WoOqS8afN05eCCPJc1YgFtY58ZCzbuLKyHtyg7trPYShBEAJID1f5/bhYTKRriJ2WEW+DvaiB73bz0k4Kssi5B7MIvgCCmpo1/B0FcsncQN4021m+vF/DoJohAuWdEF8OG9Mu9bFSyas4RXnkwzrR04Rcv+Jfc+ALtgVMHlmGGR3qe+o03BwdiNPXQBgjiI1+5+c4Pfrc5QSxoO//mmTiop/OYB0yCxaSLN0p329OYWkENgngYi2zvfb3XzvU+KAcVFAdo1nmffkX81DHwe/eJdQwSs0zxpld8fuHBg1wWyJ9oaeTUhStHtXOdB0IJHu0n8Zt9XPdljMAB8nNou6wVLANG1aAdRYugiVXhB6LUawXNcsJpP3rNx9+8on4Q0SLjsn7ggdNv++GVe+48d/bAJq0UQo3yyLlMicXjuav+4Z7eQat6CTvnlmWyX/0k+KGbPj9ZnKrefrcTgNJEQ+a1H3jojJMynXPEgCrd+cvLvvqOz+F8iSCCgkT6bL+VHU8JrWEtZCnyjlhgd6wwfCB7+iNsFfyBc8ZKhjK5KE+nzKBS2thLvkuB1skT6GQPU98qn9LPAitEbMEJ57LSF24RmSKdOxCyWtqTy304rdrTMLoEsQu/QARxyvj3l5QRRIBJxTTtp+9etgIfCeLqLVIpRyFNA+SwhdQnaMMKmzj8H/v0Ds7yUyk9C5Xg3qgJkMLQcCLQH11ihw4aL7Ythxz1vIT5aAf5DuOS4rN+TFibz5t7+ykTL5Fm5NJCIbN/buHhCb4SHk5XAIzz4mwmu3+WC7RC5C3ZSy6c/cASO6QJGP3k1rjDaWfVQMWCrkGTrJQjX6xoy8UGBP6WrxhDZXRWtIA+avlgSac7KwQuDENXrr/m6s+9+ds3f+e144+dopfwbZNLYCuejzqrK2TFyqbEdz699afXjpZ0zfdUQNbm0/KXfjRcTUzbAHVOaRFa9FoGWrxctFZqwZAuFb6eNzJFM1Fc8aW20PGmpYwvhO49wOdzxRMGCqeOup7t22JOeCcuKTFawrxSMYcun8+x8slKjJxhmsVvFczlM6O66GKlYElyEHLnXq0V1ub70Ay5BRPtMDVyRC16HVlaGcByF6YXtXypsVW0DLPn1DHq+ykD3gj0Rj3pK8sK9IRX0PAeH+CWsi3z3CfPvn9D4QJYu9QjM2skyC0DjDm9Z8bIa8nS9icdevsZC68L0BoLFzSqaJCvGa/daC3C0GjIEjQRBBSqx+mtBBdx1JBQaTmLqdOqiFw6Xir4NixbARA7rRj89sf+4adfekchG1WkgkAp+mTvlYA5sSfw1Y+ccvvNI5KsGWxFtgtUZeumOxOPHAh1vqKZc6mQ7Qsn3VKwyJEKFYSPi5erYTymF76fNRM5lIZ7y3eAZ1mWPJ0O3ntAnkqVNiQLu8eMPtv/awedauCF/SwYpF2YVwxMms1KRe2InhZKoHhDVvt9s/0/u+jCP9iTYd3ztcKafR92CBwxGOOy7d13zcGoB3HRyJVoImNDxE8apo6x5ai+UxO0/DmsuhdddIaYtuEJc285f/E9/K6IWTRofH9diFJdcEUWAbV0l7Zr9pVPPvTewcIZ7g82aLfNuJ8b59SDXrIysyZoqFawuExjyqCJapjhQAaW7JXOucXeUj7iuVu8NXBu/fjf3nXbT/9SkYq8zvqSNoCKKyvmPbck/+9HTtn3aEyRDE7sq+X5r16AJBxaVH59b7yD5dEuQJZSM/00ppzk1KFrUfehodEe2e4TK4PSrblSKrPk8sZP2HIj5rKh+8aV/XPaYDy/e4M+FKefOp4ojPdHWWhFKzpKZCZzZDo72GHpsXThOtr+u4suVhNrOKTqYC0JKuxTKWuGe2p7RlxloOGe2T/nXtSBZVpKNBg/sdakJy+wLK7KSiTQSQO6iwoM62ee/LOXFl4fLN5e5AIMDDRx3fFEooZBtfhYIX11afTTz9hWeLawls3LREsxOsCL6eZbDfkF1L4saCLtzkxdVuEkV2F2LbqPXzNzfcV8eCXar0LR7r/5kl//56tkqYgq4d7tGJx6lMwbrhu57pMnLc4GZXvZCiOCuILCcNv98Q6rMkS1VJJm9g8h29FUDvWQe3MlsLLdhy5MielWB8v6agHpYUws5oMPTqiPzujJUGH3mD7WIwnm1xoyFOgwC1HZrhgQ06mUq0RgnMyslv9yzmxlK4suuugUjFryxzVBBGgyok5DXe712sEyzBwIYmNuYVlKIhTZ0m/p7Sg72BKhCDkarJi/2EWH4LoauG6MXb45/0q1cGMJrANsjHXet9M5YCwDCthh6YFS/l0Sv3Rz4F+2yHNR99cyRHo5Fyx9aFXX2UAgwUsyh8zcPG3B4tykBWRBVsjGM3MDK9CDaOmaevPXX6sbAVAG917HkGUrm5K//a8nXv/1LYbOhMs7kbyQpEVXaPIKZ9bBaTWbp3WubcMmiPLcwTEUAZi6rJJ33FXoPgQsy9d8QUo449li4OGJwMOTZkgp7BrTNvVZCri6b9MFEVBYknvJyepK5Q/SkStJqbxjChhjPH9dRn/gOFhT2MXaolyNoKluEDtyL9cOa2xEYaKcyYiBssmIawLLsLIH5hqvNQGxi2zoVXvCFQvTcCnHAtR31aw/gclcbrbSuYv2ILLBwPfG+Au3lF4YL3xNM+Y10EShNtmsb0UAq6LIcihglvTCz0uF16nssk3qpzaL6bD7wHLIARrnpUX9a2GGiCbm7aYqzRmjmYiRPh7pFYcObvU954Sij//x1H33nyUk36Zzyao5uU/9fx876Y6bh2lZuHubyIQwYkJLUF/ZCgANkMWsnMrJrAOihdgWc9H5iY2mIdkLDyXQWzpWQTGnmTUvnOHgjuBQw3wp8MhM8P5x5Eth52jpxAGLunFRCH4aORRkhIkkU1fOMQ+yYzHPMiU6UdRg4RfZ4s9Wyx1oF8crQC0020M+qgsOvUAz0R13V2uLte9loQlPCybNf1o7kPORdL44l208AdEyzMSOkRpE0CJf2c2nIVoW3pVj3R7EFYTQVPWmQeWqbebFY/mrWeHmolHQRRD0XaUCali+HYHcpXGuKuCFKOjiPYXcPxrmZUPihSeo3xwTC7ZTjzqIDZDj+5a2Y/cXYKhCYaZu79S3aKLxqoRYama7752wCPD+X12WLyR8WTyLwlRU475fJ7/8oVP3/jHhDCuXweKS3CPbqyJWBrQJqNGRRBHLnNxQyNAmojAPtGyZxhlom8QVn3hjSuzWcEfL/5F08l+jq48fCt53UNL0wikjxe1DZjjgY69hORBkHwtEVnKFCgjzQk4qlCQlECrclSpcmyMP3l10sZKAhOVTZnrGgAamv374t/IFa08QAVhHWla5csa7KRgrzma0TKFxfoBHxrcN1SaC3kqTKUKmOYjuZRcrB/nxmPrZTfz5W8xnjOTfKeWvLxhzBmRMDgeFqnBZdN6ziNAgDE5noVAUI6sXbsvl/rdVek6CP/ME9f0nyHcludWkwziUoGln6ZVfm9IAiADjqIbknbWYsaChCilzeu9JheIRR1Sdg3Ezu5B44OZLmB8LUxAvQxc3fGvDN/95++KcO+mwGtHCVvfMb6CRGAyYAbWjgpOFNLlnu1ak9gOKQA2xQprGl0HZV4Mj/ixsZEptdiJytKpN5cBc6L4DPF0ELyzuGCHH104fyMoAQQ9LoRWdV4qoT6clrgZLj2Wz12St7FpWzC6OK5gGaeA1GUeqh3VBEIFVm5tfE0yw4qGMlso3WFZO7idCavyk4dquvD1EHyHQYoWQunIKtIsKCC0g35dQP71JvmKr+eQN/C2RwsdY7lc5Y9w0CrocDBC3s0eiUTTEGgWnowKwhc4e3yg+VREBFW/hsAzLnDX0+0r5L+iFNwSNpw/Ll29TP7BZ/c2gyHrydikURo4Pl+8qtMrgMrk/hG5a2l4W5/mUte/eEwu5sI+jzEI29t1/5uSek22nNp2CSVYurf72+k1aCTyqbu71FHbITPZUP1uEabJkTE9EdJy4t1qHaUlTj213zmmREDRhhkaXnDUrK84RfxeyfhyRA637VTAteWIB1FA+lClu7i/sHDWS4RWlhg4Q+hBfWYIIzBaCpcl87jNpa02bbV10sebwkyB2oh/sdz29TPZagan295DzMymjoDXSPKal9oTjW4doJHH560zmSizIVdEkBZYU6A2LgMyWv35UHys3w69tWaoJbsryeDh+w5j8oQ3qc3eYTx7TX9CrvTqq/ZOV/Y9c6RbDeEDS9pa0QwVtrmBqhgm7f/gopQrabL60v6g/bGq/tbLfzqX/qVh6Xbj04rh+0fCm/3Fq4oPblK8NKw8neKk1WxtOMqNkOz5cFdTMUrBDxqgXv2LKy+z42OyBTT6OMlsWu/eGZ2lmo9H2ViHIY3ZdmJKRKG2J6SMm8z+HkVmnbMkF1PblFNleKDGQZuccBYF2smnQVCSIBPg6rS7v4T7MR6wXReTKR/uMPSZXPU+MRmQsPfjQhDK+UBpN5ndvNPrtRVcrP20GHwhKYmAlV6hA/2umPLu/ZHwhYzxet5/bX9XURRf+wycRZW8bnnBPOwPoXSDKhUwTCsngtAhjcyn7zcelBJRjo5Qh5FI6n23mj6ZVgOjs+cZvH/3ar7la1ysYSENy14Yz3vcCLoMILoskEzy7f/aO935HSxcaECZQDYRw5gdeQINJx4aOsazwWDLQE6lH7pkQkZdsEHe3zgmYFB/ki5M0KOze8QPxIZ6acrkC4hxOoiBciTUUXR0r6kGtUDCk+LLPmlmLoe2QleVMUC4sc0+DQBIjwjRoe/XcPK68zpTAk2qYJYYF4lPMLqsy+Ck+JDKzNBfQL5imFR8U+UWa2rIshowWUAtFwk+0ycryyF/2+ned/7xr8wX3shNwYaRnBz79mh/MTW7mfvQgeoSQlPv6P/dA6EfC8tX/qEXk6gvv/OOl5yyU2t1tTxbS3NTwl9/+k+xCH4QhEOFcltIzVO6QAS6TZ0QUjV60svNtkiK33FPURV1PMvVzs/l/npQGJbPU0Kk4s3DwTDiwd8CIHtDGdEu2l6GsFvClgMTfpJx0Ioshh9y7vkJwPjcnXfvWnDVhQS3kFsgeVdRNFJNQyeF8vfx0sO0p6pWfT3a32uuiKdyt9q6YW6i1tWyrgLxF+0Uh3ajKewd7Y/Cge9oZUAuW9mJuI1bWCZr+k8dZDy3ncW/VAgjc1M0P3/mB/yT90Gnay2DPQdTzjbxkI9/VWFBJ2CMplWCmbhRm0qQu68cKIcghNdC7grPmVxlmydj9zudsfPYZZqm2yQdBFJePsTta3l0QFBrkaf4gCKJ7xxf0jImFg24l5AJ8UYCDOmvHglEWiNJcQLA97x/Fi0mEOW6Aa8oqWXcvr+MtfL13kwAnA0GseN4JEyoDQfkFpDExSmPZWvFI9PAh8BLHrwrx0apetjOf+Z0/f9fbDOIr7p22oQS023/ywmvf91l7l7zVM5lckudDD97c/37N0nz0+QehGQ72fP2Df9q8fY+htzkMHFSle266+Nr3fBHiEBvgpawViNk71NuVCXkOdkgcUWWavaoRBdRqdaByH+EgOgihwbvmk7LWRw/xM9AM1k3Drg/lcKhhIaDuH1L3DfF8MHfmn0pjUw17b/2Ho/JfJ28/nSe1OlNOO0QwGHzgl5lrnp9TQgyNSRQEqqFetrsWMgZmTlapmBr37J78dPVV13b3Yu6iOUAQYYY+c9mh+X1+EERTig/z/MIyVd822GulA+5px1giiO51K7BO1Ngv9jYliNAQRkEvLWTdS39AhuO2t147d/c+rtTV9aZu7r768s0vOMsoVpIhZu+fhhAa9yDixc0vOHvX1Zdbun+Wf20BhpEI0d4wdQoNBNG6ZFT6QzsEsWdUzPvRoipHcsORMMM9NJcpN0/iis/BQheztETD+dU7ECZIJ6xAKEG+ptMznohdtJ+jvsztq/0wiGxq0k+CCCRGBLnFXr44jvxjh1khZdb0udW3Ye9bv/zsYCTbaT8R6AWz/t+7PnfHDS9UyD/2agJly24f/MRjgV/52IloMu2M+Tf8/Xu/d+rFP9RLbTquAkH87r+881dfez3oSCjO0tMmyig1bZTPUufyYY6Ypz6tahLfFB537rf6df7aNHtZ2tpQEoEAqoZp6BAX2vI6H1Am+9R9CChocUuyWHHzROHUPWU+hVYJumSew/tfJW+t4rA+gHMuy/L/ffXC779GPanIeTQg0epDE25pei7gEsTZJiWx4xmB117XJYhdNAcI4sKE/qmLD83v9Ufje6zyXnC0EUSAMX/nvTHOwThvfOlnU49MVWyyvAyMPfXrb+o7a0t1bxkIYmbvoRv/4jPF2QzO3btVMAraya+/+PT3PM+sophHL6i86mvA9UYQezeKuf0UJsInYzzlGmNaShy0R/daF94lgggEorD05NGwsZMCJciSG0V6ysinaj+2OgTRWSKDE0S4ps8tIczX/MvLd55/a7Ezr4VC6NP7t/7bX/0wk8L3PAo/s0dxG2WjR3BJzgT23DL43oyV9mXnPYOVxrQzzp788DNf8enL/8dHda0dgojGvVYMffaqb008shOlACaWXzQh8xDCirKgmYhJIiXgiND7rYqod2tBW7mcYFlnFPKb8ka/LjaLwLYEW1TFPNoQKigjlQlgcr1vMfvEB+yXVhX4PGLxHLHh6WJYlcBVW4DFa29xTv6pZEUIuVTSfvmv2R+8p7CU/yijSC9HIwpGDS1Jp453CWIX/mI9E0RxlvS/3NOOAf3CBWkx97olJE32ykUGIuHlbVQ5/w7QzezBuUev/bVZqjvjDTQoNBDb/qoLRVCxnCGY5YelGXu/e7uWajgHsWSMPWPXwBNPJIpZFcLRejQEbWfy1Zg03vJ+ryiHYIwX6vCntgEi6HAy0DhImtNfCANM9xcto+EUrHpAUEvdb0ZJMnTqHURQ9bwVIGnxYYEHQMvcW1UIxjni1ix3WwPyE3VTNw2dF0ym4VCiOgtopVIpnys5dyoO3dLDyamNu/+QzfNiqf1Ds6zb/+tZ9/76aUxOS6JgeThMOSdZglk+7BQMohk0BlQpNBH6A80RrUkTPMNgWo80/MTZ/6kYg4qaPvOy79kqq+UwFUU68NCpv/raG4QiqxHu9A6ijEq2v9xy4BK6HqQE7QohMw16vxXBCEbJy2bTxgaRoSSXQf4eVEq/CEr/HbG+F1EW44FRVBXVkozlSbS04VlJQaAdZWarwMeQ9D9aqcetTNbSJ6X8fivn4cjuN3OTk8GJOT6+yI4cC2wiJY8v8n2/Ljz808JPP5K9+ZpSReaXUGVKVrRPKGGGc/zqmDmcu0/UQf9W+awrwkysav50cTSCc1bImLd9JVdY9Efje6zyXnAU9iD6Da7KM7c9etMrPt+I22nG4PnbL/jCq6mDsMpu48XibOaGl3wmd3CeyY16EM/64Iu2/dVTjLxv20isc6zPHkTYwsTIka6aaB+NNTega41R3oPoACYEHDG/YNZ03hTu4fgV0WjQwlu5HsR568Dve/8ZFMPuOKH7+Eo9Jor7gXA2OXywbkS9AfUqM99bykcY80p6TVbamHrm9rmXgh25tzoC6ij7Y++194a/LVmo5w2nj9WHwUq91tjZs2/tye/SJaNvZO+bvvCixMCkabTcMRkMSD/6zN/8/MtvhTCgLQGCiJs1exAdtN2P6LE7gTq/E9wypKU5ElRNRgU/RzEuj4ikamhlcwOYlTnnASOZXuVpiEtACxt/vX6bWTwfiP52Fy8E3E5QwJK4rJo5PX9dpnR9kTe0O8j2+BAtIVqcMPFXCXR7ELvwDeu5B7FNRXmMAcTOMhtWeMuKbRmQabJdu5lO+kjIjiPZLtYUsIWwwY4ZBpkTKvO3qxI1Mz1twtyG4pUmDGY+0kcjVr7U3jYQNOI6L6TV8ZRyYIHRkZIPpJXaRyZw4JA2/9De8MOdHQjhYCZ3yJyeMWYOeTz02cnwbQYreKcBDYGGpwW6eebia1QWAM+jCtkCqBfPYvom7ZzzZt7Xk99pSiUuGfNTG+YObOa85aYF51JmMfLALZeQ+CmsfIpbPUBcSWxKlhKidUVoQfkIxCEYpRALGVpl5QDMVQ2x1E+KmY8tlh7MyeQP6fBXDS4yoRbz0E/IEsPh7ErY/GBMLqnCFNQysA+cqcGQeaCY/8SC/tNCY3YIINvnDxpo76Hlhsx373bRxbGOrqxT30Jm76Emuo6znlNHGjxDvY9ocTeCRe4So12CuPYIRN2BZpQYOJxWoFEk5ye/AHOemjLUCKelMGWI9nFyiGN3F60JFDPaUzrBllQkudlBI7KWLHw4YKQ58SKvh5DkBWkmr07AmtsR7xwWUnNi6gVPnn3PqHa6xEzQRIv8DiClNeCk36Tt9Ip4uN/acs78W584/c5QcdSU3LkIhqkceGh3GwxWkaXH7z1z4tFTglGGpoJH8aOOxnl62HeOGIwxMCm9YJUO93mjXoR6yM8Uomc8pmc/upj99jzSLRTHzRMTqaPIG4PFSgrTwRUpdVxWwBJz/7WY+fCifp/X/mmIAlp9qNThJI8N+kzQu+hifaIr5gRyrNiwEckVOXHyaL1eRsu05FhIDsmNRxPQkpXDHfjV7aJjIPMDEVAD2s0MlzC0XLBCekXommmQjwyh2kPYNvDpQIw86XgfH1wBsL7SDvd0XYOXeGpBfazt4eBaQMZrydxp502974L5d55YvDAi9QjOTF7UWRFEEIfJdLBGgxe40GRJTbKhbYVLLph/x5MnP7Yp8wzJFDQb7zAsie9/8HT3ohVADu+4/oVCFkJlLS2cX4l+RASlBBmyppB2FRjuxIZoQsJS3Ky8VPhGPvOxhdLD1JXIheDZkGQeHebDggwVFcQWtV1Wg/oBLfPJxfznM1br7TRkyMJBQw6w5AaBTHPvdtHFMYrjniAypudL+enFBhuSWoYZGowFB+MN5kfS6paGPYjQvFyW1WRkNV3LdlEBFFHw8JoSGNdQnJdyrtu5lQCMbmaG1k7GBmgCU3SAF1LLXGasCXqLJzNrvVd81CVUlPngg/jXveUTqP/PkocyF5w9ffXTJj75lPl3PjH1xp2LLz059eIdqT8fKO6K6RvOnH/9+em/fursh54y/okzZ/5mKPNkYYQMqXJgmkvG1GMnZxd7GG9h8pAiS5N7Nz7066fSVIdSy73XTj8imCJoXCjR6WbZXFBnIbK7mHFXuAuFJYZ5MV1jgx/9AT37kVT2awtmRle1Hl4qm9K3joE48mJAVgNW3sh+N5X94IJ2W/uzwLWitTBuaAULHBH5797tootjEce7fDPOtFShOJOmMeI6AEEMb+gLDsZo/XIHoB7EoNLaEsQufAVsKrLfWWgfjNL88ULrjg9bAhoGthMZWsuCy7aXwviIqDkStQYat2fWA8BiZ5VHaITXf4C6l0zJUo1Eb/rcLQvP35V6+WmLrzl98XXbU89XjejW9HOH556dyJ8sGxFTMvGw7XOnEiCIh/ZvSc0MtzQNUXDqPizm+mSV9tZz77YCsENwRDDFQIQGgjspyWCMgxEiQCcmaDWBHVLn93RtymvlrMJ3c+a/LGo/zfMs7WPuzxzRlYRQVZEPFX6dzXwwVbg2Y3Y2wQO5TUt5pk3UZTT8EsOiO9zcxbGK454gMqZn8oWGBBGIbx3kaPh3Ato7SyjxUJcfriFgUPMpMg9cltQIdSWuzmivVqB9dWnrvHVgTSNqrE/a1qG3l1UAk0RWTBWCB5jkg7ObWgB7B/nTDKloEF+kk6g+UhQpfNdmkDTcjMfcx2vAKhajBx/e6Z0iCCHNziTv+OmLIYqGThucuD+0CN3ewhscUQ23zxHlAMPrNLiccitCfFBAUBcnms2CmDZLX84ZL++VfhhlhhCqsj6liasyZ7J1Y6jwHjP7yQVjT43BAmSdkw+8xcmuuQVz/oAhB8k3AkJw73bRxTGEo48ggslRtffrCCrFuZyea7QrDcxI35mbK19cfoigHOyL0aP1YElKIixCKldExbtH9dGYWK8rOHOGnBHeYIz2l2vTZ2eLgGQ5G6nBosMAr7ktgS0clk51L9YxQGELLDMv7101LmtJRtgYlK1gWtnvce6jISn7HzjdOz8Dlbrr+hcuTG2CNLbXfbgEhyOi1dFePyKeD8Yoa1EjHJ4aTvJAjHb9QtVwnmkM6zeKceWA9OIx84chqSREKNDAyddqgglOkbEE/1VIfdOI+cJh46a6EYsO8L7NIrlB9G4SNMLQCpBv8/uRXTQ+QJnZRRfHFo4yP4igI8W5zOLDk+51xwBdm7rljw9/4ca6Hk0pOtbudzynZ8eoWX+LPMbYfZ/82fw9+1idvVhMw4xu6D393c8TAeWY8YyFwopvGwoN1Z2dua78IMYGeaSXTz6kg6LhBILqi68Z2IYKP4gVKHd8CFrguLlpzE1Xzg8i4gm2OmM98jP+HoO15Rl8FWEy7STtotMmr15aOLzSYJL4Xe8/xfSNO1MvtScdNoEuBU4++8bXfPLlQtatZlvPCSFlFxKfft33cosnQAgzh9zNOZbQwA9iPcgqCTOXJdDN/EJlgEA9p2hQ18H4EceHYJmJUZGZMb0ssUdVKmasI7NpwTPP1KQr0+zZWbYJN02oyg4n5LQBWAcmy5wLfdJg10fZ1+PBB4KS6W6nWROoj8mNwuHW+IsUQec0Vs/IN+R5hR9EcOtoH88v0riz83rXD2IXHtHdaq85PBJEroqpm/945we+S311rTaZa4EY53xWzxTqhobvKDw0lGg00AQwqXgoYxTK9nWvgCXxgBzsj9KjxwpMTT/tHc/ZcPnpplZbstcPQYQ9hgbnQgJRI9fERiOz0RIaE0TUiN5NAt9aqhewLohAPnVkiWg1VoggwnqpYYZ6ms3mfxK4OqNMNurzXgcwJaPXOOEp03/PjTBdrTyEpD4Yu25BffTc2atrzjusgCmJWHL6rV+5vGdw3DSaDIUHA9LPvvT6//r8OyEAhXQZwTqMNggi4HBEJojfVHPEmtYCYonqgFccd+6oHRDjQtpMT3vK5EqCeBhs0JKemWMvzFpn50S/sEASV54pMsHRLEfdNhd06+6g9MOo9aOwtI8a6uX7rdcEqgMS7pxDcxuaNLtPb7xqrSZBBBBUfIi2UEIe6iWrSxC78IguQWwO7zupQN2YJeQjHuuYaTHqQbz9Pd/e+59/EMHaG6riW4Pnbzv/c39lGfho3S+C0PzmzV+duvWPXK1tJIyiPnrJqef800vp4tjRGBaNMtfffnr9EMTYAEeFCcQ4rEUowanXxKfFy40JImiZrEpz+5Y9wGXER5Sy5irvxZxbMENx8uyDSvqbyKcOhn+9SnMw2wVyJyDERVMfixW2+bSlShNwSZkM3v5A4toLpz8sW6GmHBHtR87N13zyFTvOu6HxpswCjZOJ4c9e9d1iYUQJscxMjd6+9ggiAMoSTjIuk8/tCo5Y01qAHSIOWt4C0UGrCTIMYWvcEV6OegRxCWyHIZ2fl56dlXYV+AiTBPnU9JEsMkEuayTOmMWMKVN6IGj9d5jdFLbukctLrClBdNLurF0DDF0qZa1ilkhzvZpRjyACqNfxIaEEWGrKOOF8tUsQu/CC7k4qfgJ0RI6ociRg/+3wCKDZ2HiFimWaiR2jSjzY5IvRoJqMNFIFlqXGw3Y4Ve8excd6mXXUGGi30HYpaQs2BfodzMwvdtgYgSjDQY4PlwsGvg4TArMUXs1dGSwaUAOHAP+A7hgo7HLvr2OgWhbM4kLgEft0NWBJRkwb01ghJw55+SiYRckMHXhod9N1KtAxN177xtTssBqGBPpMG/SSs67ZQuBN5yPiGTnAwAid9gk4DSK/OOmVHXqB9ZCwvhS1XjwkPX2TecWA9amEdaMqTSjU16cqIqCKoMoVtC09zC/FI5yhJU9v4VAVzhVpRjZvVawvxI2X9UuXbrSeOyL9a9y6axk79AJkglawnC3UHf81aDuB/yFPIr0cJ+5z3oB6vThu5BdNNMaqd1Hqoot6YIyh8roX6wlHH0EELBhcPw5YAz1Xyk8uMF43H1ByPaeM4qTi3YoDQYmwQvalDmAQlEQI7NaCHq56/eg96qd4HQHK2jHJMI3ASru2ccAFdVvCWtTsaLHsjRmEQs/4MVeiOUACVHsOfilPWdFTOpGbMpnf9Q5rLviAe7rygEAHzZ6AGU+pe7k39QiOePDB3XpJZvWdAgZU6U+3n3P7T/4sECGO3vbi5QZY4oiN16xALNFGQqTRTEJTgfbTC9Oy5RVqMlkHmHV9yHxXj/mcUesZG8xnjJlvHLA+lzCvC1i3Bdj+AEvLksYliyoml2Uu7EOWbZ3MJJ2zjCyNq9IdAfN7AesLMet/9ZuXjUjP2GhdNmb+z6T1/bD1qKByawvIK2B2rz63z8Ch5cktZWbWTE8byMlIH22aYisN9/mmQM3C62DbauSotK1drD5M04r380vfEYO8ubfWDUiP+HIAFSetHmsAJmnpfOFQpp6XbBAgORaMbu4Hq3NvNUCzR0RQaUHTHCsoL+JWjw5fdw4uS3KQvNvgRAnRvikgZxXPtH04MYQgld+kO5JE08KYO+Oi4lfnAJxxRqcLZ+kx56Q6zE4OQKiSHCAXbmAnuBM3xsLGAL6y3mGJOeVRXV7wdUuVBrCEFYhqo4vKPioDD2CSMf7IqcVcpJ7XaMGlfDb4s2uuNs3IwFY51s+Thxe9VpRRh4UOcpNftEyDGkJHfGjbP9G/9t8lx4eFtIWGE6QUZMgRCY+HA+ek/H7z4yBnd6jS1yLW23ukVw9Lzx2TLhljF21mF26Szt+kvGBj8H+MSq8YkV45wl41wp63gV2wiT15k3TRJvb0DdLlY9LLh6239VpfjLLfBaS9tLKk8VGOip9wAFAI4SStGEOOIUPK1YLTvZqaNIoZSAOLD4twD60EctEs7XgrM+PrBJEujl3ABFicXfTG6Bt/1L/tKYEKWWr1IBw+Kb/f5vG2kQk7yI5h0YAaqlB+wXLqT0swNpWy33xcStidUqsFrojp3z5y62v/3TTMmtTNMszwSM/F33mL2hOpt8+eAy6LP/zdN/d863ciUG8uo37a3z335KueZhTW+9JRH8GEiPzFBnF3yL32DJQG2u6pSdqGpCNYUqiHyjY3b4WTLDEsJh/WUSF9A+jdMEws8bwjsMBEac5fesYspptXh1CCKQGa1US9OHiYKCOnS/9MDKoVqAmZvUUTHMK5eSv/t0f5r8gwrm8Izp46+fF4aZu1KtMQhRT4U/T7U8E7zjv0biqMZrAkrgayb7jmik2n3m3oNaYghwLSz//jr2/6j6t7N4ueETAS6BLK9YWDhl60S9yBXe7gK0ZnqVSCkCjaha+UJb7o7N9DH5LQUqJpeagOWXtaXs+owAPZ2dZqGWQp2i+0vD0HscPquQS7dx8xR+b4GGYwTnWfBL5WmNF+btiUutEX7fJH4yoQoamHND2UMeQAiqnBxCRg21PUK69JducgduEdgQDLp61b/0/21i9mUXndu63CIs9NbpXvuCqxq4Q/i1RQC0JxtE2pg70W12oC60TN+i9Pi1R8hAgqe6677fa/u66ub5qSPvTkky744mvoomG8uCLf9fff+9OXbqq92AVNBMM468N/duKV5xnF44sgsktHpdvbWKTCekbJNUwbslQOLtD6J6LJhBTrp4n504/oHYZZDoh970Yxf9BYJh6MboLtLYx7pXjBGA/a2zTr9nZnyQ0CcTa99Ft7A/JzbLeMxtvCBHnbcXJgT/jnd/V80XeCiGYVjCK+2GDmRkuwmHZO9jWb5l7kxe9M5+CSPBO4767k5y+a/qhshpvUfBu6FLjy3W950gu/rhUrqz8NLt915pff9pViLrbpTJX4Soo0JI7UNK1tX5JGlAPKvb1FKhVQgjS9FRyxkLLUCMvNm1rBQl2I9nE5QHsuF7NW7yahF0gePKRvGRDP+JBwVnIsRb5DoB4FowzVE8n3LUyTOggRmk3m3JsOHGuFnElNeq2heMWZpBEfpmUoUE2gyIZeNwd2XBJ49Te6i1S6aA0wmEJID99Y+MG70gfuakfdQewTo+Q3wxkW6BDk78OXA9GCPTt80s6xBmAsN75g1HHRAoCtxk8apj1UmtZxLimxhjSIczkaQJDu5XEDs0156EiWlg6YnGKG5hUFwuSXuJQjOlTxTCeHE5q1/GYwymGMU1PUBejxyC2YaFlFemn473AMKQf8OtByA0p58g2+lAPJwnZ/pyESNdTN8GhPYvtwoDeK9hXZ1Y5hStYM32NJqKe+RbUBLMmMaaOgpRl5wuO4tiXx/Q+ebhqV0YOuT80lvv9PH8qnYkKmVcPFDM1wWCqXZef48OHzDg+Iesbe4BHyH4jQehR8CNQQzSTIABhqtJ8W9aMBg2ZM+YteDoonErE88h0eS0H5GSaa5QgN0lOVsaieapjWGlfcb3BQUDpxa3BKh3FG+ngoQTW94kn3WO/98l2sRxiGVSpJp1wcfMP3+85/XYTVk676B4m9c+JHVVqdaT3rFJamgyA2mBfIOE+cNNJ4KOEIGplC6lChcWqUXherBSjxQJRmH8JMOquY3R9WEuRhrt/2wm33BXoHyCvewruIrXvLJ0DAneUpICjOHQdRfTSqj/hFuizdCI30nPWRP7voP95kH2/c8canc1XuXOaZJVLhh3WRYatCEJEUxYwGzFhK3udxnQqX9AMPnKaXVPfaBrId//38K+9cnD0NTAKiWMiYmj3Ui5/A4chrOk1UtZ/2G1rBys2Dx9lrVuLkgAztFugotJfwUXLFQl3U7sPHG6J9vJBuf10OuDXyNj1tWAZlZqsLWbrooiGsQsEKJfkVn+x5xf9N9p9Y23He6uA4JoiMGSUjd2CuHv+DYZPDauzEAa++uxraQXxFiQQaP9OFvwhGUcQWzAC5tslZhubbiFgDkMNFWk/aTgcCjHp62gwnOGLu3vIDIMc4nOUp7i0b3FJ6S/5sygwiIkeDT/z4S7a+7PzQUAKiHtvcv/sdzznlzZdYeqd9KYjhojmfVbz253UItMBlKRTXNi2oj+HcvdsQTDLnJzfMT45xcYRzBVTp9z/5y/tuulIOUDdeuIdoGa2W3U/HwriRmqKHEyMt7/DmETZHpA5jcFPHLXYpTz6xwVbx6VYbMMcMkHzTpDU67nW7AL2mhSxTBoJyFrLYHYrur1100QkgorpuPeGK0Jt/2v+Ev2h5Er9fOH4JIriCWdJzE/P1ljBLpqUmI9EtIIgeVAljIihT924t4K7dgxjqEsRVA8o3EOX5RdLdnLNiZjWGfPAtNVLD8aF3gMWmpg01THzCvdUxnO4NrVhjtmGydFKTlo03mJo+esmuwSdt03NFZw6iqZuoXydccU58+3CHHBG8UOPZueCDTFo182v1lLamlH0mjWs3B5fM9OLA9N5tnLspDarSw7dfcMPX3mGZHNkuVFqKhCLgMvXjOlMdcGTnaBoiyjravyJdidRWsf1mM04DTwCYYuYQTR+0fz/uIKvkmhR57l53DOQtChTtOmebov4T5PgQV+xt37vookMUCjRX+GX/nvyLzybjI2vQ+Dj6CCKYlggoPhwhtXAobeQ1LhBijXyAnYtvGwr0RnlAVL5b45DlcIC2FaG5+VXawbJEKCBHgzwgV714dB8NtlFZW4CoGbplGlYwxguZ1RhNW3J8WDGS2yrAG2BshL1/mnurA5BznyDNa6wZq2RxO6NpiJ0CDLTn1DFy6FL2EdSgQH8surnP7Hj/DMR/Tn3YWq3Noy3JTGhbCmK+KOa9dVuiFakcfHC3cxFQpYl923/0mU+U8nEQCKEQLcstWHqROrMriKBWoGltpi7FhwWE1vdZKIZOuYdQ5YDUt5n202uve/sYAHI+0sfzCyvi9BFNO71I051pyCLOIqvpA7+LYxe6DpXAnnJV+I0/GthxacvLPTvEUbbVHuhIdt/s5K8eIh3e2dAYk8Xiw+OPf/v31EGhCFMjtwXlo8mmZvQ/4YSNzznDS/8HIrb/h3fO3rUXFJBJpOXJLc7hpCBRaiK0/VUXgiNKq7hMe6WBNA6ef1J8+1C9Ufg13GqPdpabN8GNhOq6GwR6N4q5/T5TxeThrfbADgNRGkPsnIzSVntThuORBGSxE86AWhmMc7BDZAWCqhhYNFjxpsH3Lqp763V+e4RZ1He/8zk73vh0I79s5R1q1i2v/ffJGx+stwWlR1iSkZCGLhr/Z9kMeRz2XYLt3s5qSVlAJZR4+uaB950+/7qB0i7wRZsmErUzyNVOjQjokrrzSf/96k++XBVifnr4Z1/+fwceOgXKEJIcH+TFLI1pUjwsKtCa65RB5cd2Kqlp08d9IIHB7bKpW1pBSo4JJGz6T3puoVOC2HSrvTYQiNAqZmSOe+0HqBu+bKu9cJKGgDv8BCpUva32aJG4U8uK1s7LA3/1te4q5i58g6qyQs666TPZn/9jOr/YSIaP372YuSqmb33k7o/9gBQtqev2gZdz4wtatkgdfvhmVWDgfOGRHjmsmiCIzT4FNpndP1vXcjFJBNXIhiQeoAR2FPF1BKR61/+8bOyZu3Hi3lqOtSKIapgGknLztFEEzMPS3LuVI4gwDLZvGpqQ5P7QAZb2YoZJk1WJxqzbMmqoItEBWhmdnaVxTNTNCoII3JW8Zm/0xhrDz63ALOnDTz3l/GteRZ88XIXBDjP7Zn/18msKU6ka3eqtAPVGYfJFc+9LZE8zJa/9iA417B0spheUQokYKpesZZ2cdYA2HpeUW/s/PJQ/e3v2OXl+KCcfSssH0sqBLZlLw0Y/KKP76GGYktw/suetX34Rqve3Pn7NzP5zwKKQ4Y7zvNyCO/8VegtlUV0KDlDuDpUvpE1fBAlfHzlFzqdIflApwOogVJ0HfjQSRORqpI8vThidSXpzgojyhcLZ8YxAdy/mLvwF50xVpUduLX73HanHb6vrBOf4JYgAHqhHR1qCZZq3vPqLc3fvgxlzby0HKvbgk7ad9aEXh4YTRrFRix4hzN7x+K1XfcnUjXqL2bgq73jjxdtfcSFMnd3fdmyQRIvLosEo81oRRNQQWrxszwQqF8iVIojjBv6arTg+bIwlggiE4kyN8PZ6lWBxI73c1K3UFO0PW5OaHAjf8oe+TxNz6QT0Ojvt3c/b9ooLkOmopEzmWqZ45/u+s/c/b0e7zn2sA5i8ePb8m05MP9eLN0TERpd4Mlm86EUHd18wt3hI3fdwbM/98fHHwgvTAfyEZwR1KzqpRqXFAQ7LqQUn6RpPZ+XpB+PfSMvjMWMkI6a4JBQzHNM2npJ6ScjoqyaICESW9Vf+79ff8V+v23PP+cgPFBzYOYgUMn9JKyD09KG6RQmZT01TqTurm7NztLLK+akNoBJFkjy5UYCvGBr55YbWcYY+UTsQMeexNnDUEURkhWM1O5z+AXQJYhdrCzXAMnPmf30sdcsXcjXl+bgmiEA9EuYdsF7px2Z+deVniwvZBvzGLBm9p2086yN/1rt7Izm4rhM1HpD/9KWb7vzgd2t7ybbhpGvry87b9bbL5UgAHPcYYYj2f/WwJgQRvDCUYPmURX1myynRShBEkDm9YIWTfG6fbytDywkiEIiyUJzWFrQaPniGGmaFlIncqEcQM/LEjYN/p/Oce90uIOFoLWx83pljl+5SY6HcxMLj3/7d1K8f4XLd+tUSDKadqJ139uQ7zRrkbBnAgzizTr/w0MVXHBzYmDd1BnHi3DINll5QZg6EwBTBF8cfDecyig4hlXSdZzPyeFrZv6jsTSn78mKBWSxsDET0obi2OaGdENEHA2ZMSEFTQg7WLgUhqclNU7rej3OHIDp7IqemDK1ADBRkBaRqacSzGpD5JUfZ5J4mYY9Np9qcYwCFHIjwvi0Cgcw+rju9hpAHhzYh2Lb7EY86ggjqhsuarK5VdAliF2sOx5/2vT8ufP9di1MPVTY3fSSI4izpf7mnHUMOMC7IGax73RKSJnvlIgORWJXaxGQxddNDe779e66IBnQT3DE3Pj9xwwPhkZ7ESSMmSF6t2s4s6cHP/TL1yBTZwjqh4Sv44dAfHk89PNF31pZgb9TUfWYq6xC0l8ZXY9J4y/PPkFm0uCTVjjSAFcF0wd7AKlfYMFhcUCX3wifEBmhtAQyGjytDg3EywEuyZpRoqUG0n+Ov935EtNYQDgJBki2T8hN1s3p+pLCC0+HbC/JCh3WPBNw05+7Zf/D6e/f/6M4DP7k7s/dQve75NoDqY0jGxtxF3KqrJnBXl/jwhvzzr9rz1BePRxK6oSEHmGUysEOcBEJG70hx2+mLu8+bPe0ps5tOzvT056/P/fs9weumw3fmxbxqxgaLp5+Yeda2zHO3ZJ8+Vji/V9seNvpkK4AoNN7rj0uipIXVICkJiB9ofWqShpgjSRJI3KSN3ew1xfWAMqInbe5haCS9Dk3EeXXBNQa+ixfloBQfEPP7jSVC4wSFRhSoDC71tvamQaxIJn1dMoQIQ2IrKmyHcMYQgECU2le+GBfHzJVqmTmQb267Q0cl7d8qn3VFmIna5qCLLjoBdIhpsrFT5Z3PCaGld/DuZVUxGOVoorSqMWrieCWIjIHPZfbMmJqhZ8kxB2U5WvtV9A4cUUsXJm98ED/1n72FGE+FgodZ1Iy5u/dpCzmjoBl5KGDqYqgx6YpBfQh8d+qWPyZOHolu7m+8v/MxgNUniLbPOfJEiJNqY7wSBHHgRFFMW+kpP4uygiACMDl6kboowB48GmZYcTXE0I50BhPrEUTQmlzP47PsMR/qHkk4VRBTN8m3kE99h4fBLTk3UjwjrI3WGuGl2KsB87zLJ1/4xsc278iYBocOdX87jCWyyLgUiuojJ2Q3bsvd94sT+mYuPjnzgs3Zi0cL5ya17SGzV1gq0gNGCF5nf6555tgeJXU1xJUQWilicYpcnyDzlRDt25GeNsnjTEMxKSeIAAQAlyiyaC8H8/DeJYDqA1F3Ogvx1tz+ZYPanXPEo4UgQgkImdhhbp72lfEFXYLYxTqBrkvhBD/tuaG+E+X9d2hL5rJLEDuFZVqJk4a3vPiJoxef0nfm5mAygptGroQDZBGWmQzI4aoNUweDN3XLw4WZdP8TT5RDasU4OLjgyFN3bHr+WUMXnpw4eVjgAcPUUnmjZNCOS0Q7j6gJcMTioczEL+8P9MWSOzcc2wMQq08QI72wiLRxSDFLXkUq4DtBDERZ7yYx/Yjhr7GsJogAKjzMEpgHMrU6aRUgApTgkEyk1yEH9Qgiqq2aLO0xf+tb3XME3m/LiPA0qdSjn9hbPKUmQTQkvuOs+Sve8qiimobenJuilqNJ+Mc7ex742ZkRE9QbUgpGCDrolRFWgTRHIE6dyrkFS8sRNYemzs6aQgZTYWhIuA/WQQVBdIDigzBDpEM99s6oHrqQwVQQVIz27LcgAA7LLEeHHLGaIHKZeqxx0rY+W6EexGg/zy/Q3tPurY7hkSAObOsSxC5WHPZOkmzLWcqOZwYWDhrTD5N26BJEP2BR72BwKAGWNnrJro3PPmP0kp3J0zYHesL4UcsUjKLuroaBuYMl4Xzu7r3z9+wfPG+rEg9VKkJLkoNqZFNf39knbLj89I3POg1kMbq5XwQVs6hrmaJZMsAayW7iENzIa5M3PmSZZv8TTvDdlK4frDJBpEHVGI3Dgh7BKrh3y+AvQeSCJo1BOhY6cMdTEzUJIgDqgPoV7hFIKVSAe7cWYBoDUW5o9o4R9oP1CGJ8SAhLecS40WAeqMfagplBoYxmaKWXe6cMaIoNb8rtOm+uuuOwHpiQbvne6L7HwsybQ2wv6B0TNLchS8VHdMeellLKo+lCc9caM5WaBJFge2MGIYv0kBNmvdioXQmxDCfBDgXCmXnUUIMkKtXl3glHrCaIoThH20wrtjAFogIrQRBpDm6Q0eoc/+CRIEb7xBP+MoRWQYOS6qILX6DrNJPktOeFwv18/x80omHHGEFkPaa0ygTRgUlrinFwRQ4NJXp3bxi7dBcY3tgzd4M4BvoiqN76YbLIyXXiBB4bPG9bTeeIlh0awpQjgeiWATy28fLTEdrwU3ZEN/XJERW80MhptN6FOgbM+bv3gZUiwIouyWMGq0wQI0mOFhUsDVhgufVagr8E0fEgA4HPL/pcfPUIIkBsI2sFYzR83KCuhRMUNwSy1NdYkyDCpEX6eGEqeED+XUGed++uV9CqY8vamL9AmKFqTQGCOLQht/v8OTSp3VsNgVZEZkH5+dc3FrKyj220YBTsgQQY/MwhiACd56VovwB7a8CB6hJEGyg7FD3EG/wPz9SUcADCkxjiaoTPPKKDxzToTijniJArcD6PqCaICESoRJvWD0FE+fZuFJlZ01/S6ZEgZufMLecENu2S0VyhHgbePbrHCh6ov7LCTr5Q3fa04PwBc/qPui8Ecd2sYt5aYr/cz+JQjn5W5vZA/YWCch3WqLSYyx2cn7t739yde2fveBw08eyP/vng+dvczsWmYESSKDTBjIJWnM0sPjw5d9feuXv2Lzwwntgxcu4/v1SJBY9ZgriKq5i5LMUHBa3SteouV/RxFbMSIseHixMGSOfiODnK9hEVq5irAf4RoXlptV0kohpG++1lm2U+mWuuYkaG4CsL48a9PV95LPbTutxk3YBz88kzH+zPn1HtDVGX+GlPOnTl3/7JYw+irJgP/Lb32o+f5CM7RH2PD9B8QZwauoX8L89R8CqUAm7Wc1Vdvoq5AWyOSCYByraCkIG+JMdEYoRPP6Kn7HmxTZc0gtY4q33zi15931SvYkYIgSgt1WqvgwBA5vi7ihlVAGGi8da5Y/ByeFzFjMveLeLy98a3PzVAO6EDeMMeQapRyZbu2ycu7HPnfm31YndOVwPKk+7TPPha3zoM/Ao0eKAmGofZHuqGieQfPnFhp5f+1MyQJRzON8pAO/B6+rmlTPCedu/Beg/TI6ABShnzxk9nb/zXjHurA6wLgshOLlkfOcQuzq9D++SSRcEt3Syl85BLJRpok885Q9VEPZmRL2nZor1bnXysskNgNQliOMmVACkSSGAFDVqCXwQReicJamU7PnQcZddTQO2hKUF0AKsMm5qernwSnBWVEfa7vDJWE0RYdLAHZDLs2Xjott/1/XMzvbv2MJl2Zu4vts6+3KzyhtgGQfzOp7f+7pdDcq0ZjW2AS0ISRnSAJokC1QQRCMVZbJDaFTXHmj0SRAcIKkC97Ee81UAsUcp9W0R62gRBdG568Xnh+FHCCbiUl/629U8QIf8IzekTXSuC6KB3kwAFLxWs3LwFWo8alqua/aKGmBqVMjO0tA7POOLrPIRSRlPQ0CVYfciMYTtboweYpOWsXNXYBRqNYMbpKRO2GEE5jYSaCIQZF1Kxan5qAyDwWD9fnPQzP6Hq40N8caJRmMgRNLoQW1mROA6ZbClRbturg16iuoaKtlTXkI3BOP2ErMvMkJMv94flwKej/bbJmPWUCWh3oWY1fbKlYBPDPDOLYq0dw3ZgST0jIpc2UuM+FBO7SvhDEGEgoWKEQp03roB7AejzlSnpvfN8VDIKnkY4iGPJa7BrNSXKSRg1Bu1b7cINCgfJuH+SsepACkwNJrCuIIIgsktHpdvbIIgMtRHcxcnypnCeR22EfYI9qPcWyFx7vhXLATUEvRPpsx0fFmkz9fmDho/MCtKVBEGcgiZqEqhT6WCYHVbhpBpZEaNOLCLKMOHOTcQZpBN1ExFeyhzEHLoVZAV3MvLUDX3v1Mgb4roWSBDEDcUnnjvzHrsSLotqSwSRcyubUj7/zp2z00EoIfduZxBSUA4XIRjOJYy6TRCXBY5Yg0agMYNGRSl/pCwAlBHkMwULpNuvkIYgK1gvdvhFyMQeYJBQ1iAlCHb4ZBl28cC9miMPCDMxSntO4tfyb1UjEOXgIgiT+hGzjR5GmPEhUcwue2yJIC6JXEvAd4NRonSQ5DZeLwdli8LAOVKTJqKE0JA5yCJfQPGMcTlAu3dWh4miV2yC6JQsHgZTQXHjJ0gCtBOoGwh9Zblb1ImLYNEmRA5QgS7/FWGiRguVJpah/iKHoeVwHycVug43HUfoSDKCgjw4tbsm8DBQ79eaAEuLD3Kou5beagxHdTedJ+rE1gFyngtan46CBuVArHAHYgmFSXyxaIFKJjfSDpOoTXk0D2xjWw1HVeLELp061ewwEAF7yKiyRlfDe7AU5lgLbUIv8F7lvYBdvWHCPe0MSCqagCgztGk8RssY0gt/O6NfTh2hHp0CMsFTj0zt/+Gd9D0fhbSLtmAZ5thlpyV3baCZl7UAghh96Qb5npB77Rko2+gAL9+CogEgC7Bt0LB6ifrMUEPqITZITUD3oi3gW7JKZCs3ZzrNd5iipb2efQGCghZGQrw0avEwrAuST8tm86gU9oghec6zs+JwrHACnQXb78wbwyX1TPSRXgZHRCZbkvlj6d0z7E/02zoG6FKc9zxl4uOqNmAtX1nSEkGUFfOeW/q+8YmTKOl+gDZi4dLQSVyNuF9H8dWURiqLfnoMDEYr4+u4v1TuOLdJAyukiRDUqwVOWTlPWgaJN8jE1B/JJ7ZDX/B1KveU6ZRyYzjh4MRZ+Fz3o2gg9dF81nKiA3FSIxT59swSpTfEiF3Nd0oQASQZ8UcqQgkiiDjpPEwHiCeZOQXVrUY8qUffTsJSJjh3SjnSFUggCGu1SCBMPIPMB7PESaiH4lwOPICWANKCZ5DtaHiAAIEJgY5Th+vhh/EW7qNoEA6egZpC6zF9yIf8XALCB+nsnMSXA4IKDo0w3WtvcCTfAecwNDZlBFkEdwSLHeJow8w8ppN7I+plJOKIV8rfQhLwaYeOO5WuMfAuqifyvIF9ceAEi5Oa1b8cCBOyCllC9PwChYl2SNoq1y1tY82GmK1nZ9mHDokdzCgWvatorohDv3/s/n+53r3uYk0BWr/jDU8fedop9WZkdjLEnBihoVv3uiFQDdBmwgkai41XifrSg0grlzltXOaomzUcYl6CHKCOB6fViBOYGacfyP3ZRvkQM3KMdmDLW+V6+f7E1x6J/3AdTvOoAGPWU2Y+3F84q8JttU0Qp1/2joe9EEQmzG98YusdNw/4Mr5sm+aAiBbQSnFvUe2w6pkT5D8tHldJispLGaKVmnZ9FoJM0JqqZiLtAAI5ulOJJPnsXn127zK5aWlbBbCfYJx6VHOLjQaLYdUQK5Aw99qe1UDsZ/noakugIeZg7aHbloCY0ECWPVSNc2T1qg0xO1UPPzm57dRKyyQxQJmCLEJLoGI6D5dDCbGgPQ6AkIlbVMsvwiPfluR0HbYfjB90E6EhmSgIfA4EnRJrO8BanCQBoK8nuXPuF2iIeYAmSLjXfqAlVe8FyEDoZNQ+VASni9HJTxQBbuqahMYzWlPIPXya+ncZZaMXtQe1jLR7IYjOFHBUh6Y6HGlvbxvVBvBxJ5W1IIh9hvS3c/yqjKRIpuZrxnSxzrA6cxChHKMDopCi9nRjotb5HER8KzZEW1MsGcL1QBABVD2YbcQKNgaX1Rv+lhNE2KqIPURePrQxEfrdbX2fsG3RuobFjFPNizZkLzQrCKLFTtmtveBluaYEkXMrn1b/8x/OXZwLdDi+DGrIJcWUNCVihUGtyr5ccw7iEiDhyTEBsVkYP2Jyyucggm+hmEBuvCwciQ3yoe0yWgj5FPn8AwtZCrNVa+EQU+KI9ecjrts5iBB+Gnk4XHcQK5QIssX+0R80IIjlcxBBTFHFwNKQUSgONCBAGvKL5BfTfboMapg6F9PTpsMp8W5NQFrAC5H5qNpgFQgN1Rkvou4jBGfmq2lKCAdfXCGCGB+krefdaz/gI0GkPO/loR4aKsG50/rFCRPUBQumiIxCEri9hwWqJ4QEhB6ijtL0MsjrUS0jRVDFOIEwN324pWnHHnE0E8Tz89LHD8lnW0ax1P70u3oVqIvVR0NmtDoEsXcTdR9CLTbtveiQIEK59G2SC2mzvONtnRBEAEZoYKssZGlhwqw2iksEEY8hxwppoi/ubzbyYu6GobeV1v00RAAMD0q+MpaWJLhQqcegCSzJCOoD5+39R0UK1J3iByGUBIyLe+r+gxP3jv0PM1lRKFyJUI+Off8IGhNEAOIEgdQKEsrakZ/2CCKo1eguBcxs5jG9lLVgIGH28KLD1dqwFsQRG65ZWZ8EEUUCIQc5WOpzXUOCSLMJbW9ETlMNl2hbonBryoNHgghATlDBQYJRxLN7DYdX4btgn44I4V0kH5rzeCOISDiyBXK7OGEY1F9be4EOHlsajwZdQWbinNYC2C7oUfVs30+1F5cchwTRbnSsDkIme/sc+9akONPQ88WOFmegKnSPdXKsNaBYYZthF5uyw84BRQxV4nESxeoDpQHaR90JVWSlHLCajLFqqxk0euLapsoJUOsSpsk0Q9IrDlMqakYqX0gVmh35QqZYoG1TaoFLspACXFIkbkhCt7huMc2U8MGSwYpMLbFAUYSKkdFSfLMW7mXhPppe5r7cCmCQFsZNkANnQKo9OK0Cy6DFRo53bpQsRDScINLQXmFSp1eKJrdBVBA99+66B5gx2j9L7HCtgCJAtgej1JooZt3pZeBztAC5Y82BkME5QH1Q0xPDnEZIJUnzgwoc1UC2EDtMECFuLAAoHZQIyBOEHDUFHC49Y9AEbpgPewI3CDoqDhheOEluksCzQfiWUG3xHE6Ph48cULCoeZx64pfdTxKtd187SrBaBPG0onTdJH9/WgqbjpvoLrrwBVCR0I9Ql+71igG6IxinydRNG4VrBdAU6DK079EerUcOwCegttC+rE4Fk3iytJ3+PRoA81vjQAa4yrnhYT/jBnQYDi9EJtgWpAgKqgQhXQJmOD4iIGaKyvGJUA/sgejdJEZOVmRFEip9uG3AUIHYOYbEvdUiEOgsZZ0AABrrSURBVBMlxGAX84vEDh0g2NQUdVzFh8XSopmW4AyM4oS6BtsKYZUB04sa6m9nYQPQkLHdb1d+CJW6tWnGC84VOkescI48lFXaJ9N9uT5MnRYmo3qWH073UiFddnOO3BjNPEaS0zMmjJKE0qcKwIk+IgQntOMHsUG377Bpd3sFiC+ibVnFF53CIr5ImxLRgazGZQVfBIRMj5UfqI+OPsJJ+X3UIw/DG+sLK08QZUt69SL73rh4WskolBq4ROmii1YRiNKGcrl5movj3loZOKMGUCKtKqBVg6OPcALV5oxkQWlW6DJoQxAR8AjH9lejt7iD5m8fN7BNqiJLQZzalqKIvzgoH8mNiJSZNajtYVLekqW3aRx1Woft5ah+yEIpR2QOgSNY95ZnoIhjAyIzYxZonfKy2CBuIAqwdogqRJe3vJnRkX5EmEZHtNYtUIooGpTIqjXe0MIAV6g4nKYCaCIxRRs4wX0UAc4NDzoK8dfy5I6g/HD6HbVC5U8gNHP7Dc6lnjEO+jh/wEhN0p11q6NWAsjz+BAPxuy+w44TXs0XU9MuX8SH0AIH13f4otNwognfaAjgsxWHg+U38ZgvGmM1scIEcYvGvjwpPjUv9VrdjsMufEd80PbHllnxVgfUAZf93ObBdwiFtBXYHSwHLmEscRIfEkeYAXlls7sP5+quVE5q2xQzzJgo725b5wexA9Jj3MJh0eFc4qh4cvmBln8QGtuk0ekCTDPRwCrAWoAggmbhL5S7EmRB21+gl9lF3oHAESAKS43QdCiHZzh/HeC8/HCAaCTHaModyEG9YTXT9sWoFSzwSDzv3vUMmMli2h1rXs+jY5EkB/1yJH/V0IQWOHDOGTlz7lBglsq9HIZG0w1RTIkRATKKJgHIjfvbcQDkCdpIwbb6Dr2AKB0UhMMXF8yM7VcoN2/PvnUciiXJvdqR4j7msJKLVF6c5u+f59skvVA6+phzF35gRRepoAE3sFU+tIe8vrm3mqG9RSogXr2b6u6Qtk4WqYTtGTOOInNv2X1dYISZGepeSgwLoVDGzu2rG1uTGQ/Gv76o7KN2cRWQD0TGDgOB4I4zobvCeuEnGGyPeVIerBumSX7Lqi1ijWDBCmVDDYAaMFnWhFo0TVkvBPALTkwrxAWpeASlFctpsREwk2fMX8UtFQ9C3NzbDQGqDSICSbDJN815gp3AUdNyA00XqSwByXd6JvpPlMfv15wwcZMLyt6KEJDbuXlTDrKBE2gRdG6BSrwBN6IZ69S1Rv6PECDOW+1uB7MMxGi9xdKH1tUiFdhpCHlqqob/EcQKZevvuLOzSCWfqjuLoyay841yBklA7tVz0Rq1V0MjZxoUHF5HAwOfoKkFtt7AK8f2IhVkvrsqparvEGmvt0ilE1SrZUQ+GKXa4Ykj1trN0vsiFaTXmcOAhxur1nW/inlQZ++ak16VZpx3Hdkcz1hRggh2CLM3t7cFctYeQYRe4FxCZGp+aD0QRNCg2AB5Z4SFrtALMLpgBuCIiRFikLN7m0zitoEHapg+MlS2VwgHsMcuUVi+MwSAn6r97NQEafnDk7cAvIhLkDkEW219awbLGEiiwSyaPciYKVnMxDlgMcsUZCZ7ed9mAcO5ML6UObUT2BiOTIJkawW6RDz9IohLxTe6U0aAEFFKI4J1Irs8fJiH/KKVHKOph2BseL4xASq3FhAAcCm8AkPVksQe4Yi2r831QxCRdfFharzVNIfrhCCS3M40qs6dE0QAz8SH0AaQFiepFI5tgkh6ow47BFaNIAJ2P6JXglhMV+77550gkqgPiaayBKzvVcxPz0k/GBdXFSToxi47PM4BBVpnrWiHgDkh17LTfm5hUhMwjVABNKtvhT/UCWBZmZBgP6rnOcFUgB2GkwwUBEzO2xpPb3ZvfcACETRk0xSmLhuaaugKLukwyfkRtOTiBKghKVQ0D6CO7aHSlhMIg2TPZ7CZ6wpoTQswid9D9eND9ImlgsJJ2UExGaLd3ojkGTQK7D7mAYg/iDKZ+WEnH7yC3CumaXM52EJYX4rJ+gDYf8n2FO1er0Mwaip4aSd0CGQCGrFg7Wg8oBng3j0WcYQdrszI8kqBtkfiaFxBaNHMQAWkat6KKoIN8jou4xP8FCMrYpaunmH/McVPtR3ZrGeL2sUqAPUYiju/ImyDtptcrOvI1y/AlEb73X0t3VvrD8hmx80KuGDNOgfiCDUKmqvl3TvHG1B8C+Mm7SHLqccXLWxiOa0g2k+7F9LinhURZxsI2ZJA4BDJmO1HrSYgkChKmhNpSoVMyx7UQEAzNI8KbQYyVGSivOEIR+yhrr71oN0DUcZl2jTIvV63WK3VCRCJ1BR5aYW4JoZbKNyjCEhUfEgEoxytPm/N3XUEKCKoYtRB6J9QglaPRWlnduo/Bl+EuYEyX1fwT4LOyev/MW79TY4FoblMJnj3OM4PJRy0fqNKj9KEMH+B5lcwSlvZutcrBtRe02wyhLfmgK4Rir08pT6LDcZpYFEo9qDb8QeoXRwg0PMHqDcRirh3o00TD682bQxwKZilzKxJlp4c6kLFWxZNvrRPHOkoCwk3qdOorYE4GA9wRJQpbLx76zBAMkDOYEtgY/BRvWSV2jWQEJWU7Z0bmQC66d5thsMckcapK1w/ugRoFe01ChHRyM6u6659f4Cc9lpEBDBmyLlQWc+oVwk/WoBqSBIbYQsT1Ffq3j1aYPclI9ooIDTSwOOzczSkA0WhOHyxX0QHqNkWiq8XvujTHMQXpqW3z/N+Syo28WNDmpovSzY0XYNXuD2476rghnBCBvBwY5WxtCUR4LzV9JWmcMJpPDOgVZBaEJ7CxNc5jadVAu9WpGuV4snskbC7gtL7e6VHVfdmK0AkG8xBHNwu60Vrbl/LyWhpDiIMZ4+9+WbjUYw1n4MI+oKogivUXEMD4NfEiEBFQn5CDUHaieu0jvU5B9EL4kOVu5wFIjQ3Ed8tpMzcgtWgHw6EzJnqhK8DjpJBbCnt9ogzNVfiHAKJn8j7nUQrafBTvQ7daqDyItUgXolhjqIxNEkJ2puCkEs8Nx8QFOKMhOABpAV3aLmJh6HViglJSohsD6yUcwdMlJYA69QK8ihvSG//CTISTtPND0OolHa9QL0j5QBXxpNe8qHVOYjIf71Ye2vjJayLOYhMQrY0rnGooQ3mICJbhEzukFrS23hr+GS5kLIyh4yKeW9tA5RlDecg0pPDNPUWEUDlcu/WAqR6fc5BhLiiOriXNpB2mlOoU+q4IFII6aL9XYgdusv1oJ3Iy7pFEypoa+9mLhQqqnwnWNWt9pBmWFOQ5SV94VQwm0rXfgs2iUZ2msk3QsaT+Dpyv56ZXEKF1kABoyWKTG91sKYcKFQUnu8zgmPedkYH70EqKrQw8haGlpasluUH2QPE09fd1hHP+FA7y9AaALWlHkFE62pgqzx+v663uBgT8E4QEQE8rJdogwr3Vh2sLUEkIem3l6fUmcMOMUAM8RP4h7PVns1FpEzrsyqPJYIIIHzUmoitN0AToVKrQ4Y1Qn1J2U6nKxAbIIIIsw3TDpVC60Wylhpx3OESC4eCLqQ9eeisIIj4FooGwcYHSS852k8OSD0jopAh84DiQ/54HFqtsBaIKhQ17iwZKuQDCC6inU8139YPwNdHTlGQmWSkl8rIea+qyKBUEWHkRlO0RBCpiyXUnAEcGwSxPTjUH3UTgoqS9VgKjUGqfo0IIj3mjR0CRxFBrLdIBek9sh+gQirC3gaANIPTukM0TL1208tHgriq403BGC9nhwDOcUAFo0TdW20BTXzkI3QxeXZtEchuCFw4ucyFx1EEVFqyr1VAxkKRtTQVff0DGjlh1ygvdrcTQLeuc8eHDmims7M8pU7zBoaH9oedO/IrEmWUiNPX7HU+foAKAoY3v99IT5M36b5NMkw+atMSUH3AiZFdHikpBZghL+UwA6ZBu/EiQFJurQ/zQc4RFFgFQkDcUFIwzChlNKTxE8q6kG5TMh2VWw5cIsKINigaGD8UqftDM1A4S4eD8jtLh99ADAMxcufpXndRHyjZ+YMGShatxDbksCkgjZ5Ycmc4wg4PNmeHxwbA5lHNQU5QglBBaDyA8zk1F3wxlCDVFLWnMDqNJSiulSiIVeVE9XYsRdogwe5F60CTDhkEQp1faHOxmEMrwTKdy2MGkBjv6v6oQKiH2hi+Nw0rQA3Q3k47lVcBKN/Gy1OgWCN9HCqmIiG2exTyzHyMiUcbQL4V0tTRnjlkgEz3bZahc+3mO62UzLXeEIcKchxfF1LUZwN6B5IXJkfr7gMegcLNL1q5BeoBgnWUGI20OPrNWaHiLyAhqFYQJHwOJse9u/6AbEEBVYt0F/WAMiXHSYaU3Cgg4e5dnxBKEE1xL1YGy9jhOl4suKKAmjJ1Srtlz4kHX0wfIu/9qAXQ4aiwqBRo3eGvTYeIRPrCF/0sWqShppVaAiXSJAVafTTozGgcJlpFgQg56ILKaKFXafmDeB1Nc6HSiJJ7q3V4nXDUEjwEadpbj9fMWNx0pOpoRHV2QlPAeqWm27cNHosI1ayU9TqEt4YAkeUyM0ruzqHVCEZp3+Gl+Rvlyc+nqDsKKW2px2i5dJHI0186Kn/y3nVU8eLh0CrDxNFSsOWg1xu+iF+RIbOP272JdndLYkRABor1V4FQbjg/2tlSETFqr6as1LQBmmgatITc0d2Q4ZqwE0j56aTUORBm1h5xhsYnb+egqrab3JYHj8ofx0ecwGsBJmdx0oBIwNjUZbQUSYpJzTKqPpZ9vT6ctDcF8hA54GUoHPAYZquwi35JUJsfDSbZOyBBarFIvYDkyQZECOwKshQfFJHejoz+4SBd2E2pjplI/bSD5SDOcoDmT7fEDpHt/oPK3T1dAglDVYk3OCpAr1cHWgeuyNnRQJmC+kPJZGZNNO3QeszN0ywaxpka5pEkj/Qd8afT9mAR+5u+cfe0MyDGaJ1As4De1qSueIBa0jVH6+1pIkihs3xkCahXSKGjDmqGCenEA/go8sXjRBNEIxinTTPRNC//HMU/wpCbyG5Da419413w1FCCvOW19GJjMEGpg2Fwr+sAXw/3UOuhWvhgmVCvlpJD8bRXS0GeKrK6EyCesX6+OOln2iES8SGaf7kUJiUzyXtG+fSfkKIWNEU5YPUbzynEVyADsUGaE0OVrVmK8DzCTE0ZPup3CnOYpw+Rl7sGcDIEzKOQNgupWlFlNI0SFCeDoOwwnU2ry7MULSKoEjDFponFw9A45VNEoK1whybEQHEvfxk/IUxPI7N2hxCqsBMsXkSijJJUytn7nyxHC8GWASFD80CHeCxQKFOUKbQqxAyfQwaiZlW86OQGFDR+hcCEEtSnVVNN4UlqxEbtvXo5NdjwCl50ZjI5zzs1HVUyOkA+lZyfCJalRqhXAIHgRVRb5wSxqq7sNQEV6sy/BKfEt/A6qn8gWje2DvAYIhyK80LGLNp7DJY/iVQMbpMhSEhFdRlVwGNs8QlIMvIcDzeIFXISRQna7WWFOJ53VD2S3yyaXuHkDMS1mKHGVdPkA3iksXlCmKiGsD6opz7G01H16ekjYTqRRxtbL0rIQ9SjVj+HNgNSvaTqESDkFh9KdTD5HuJEzf6ag0LEDqHiaHI/9IzH2DppR60EIXZv+QEES2r5cC++A9yE3ML+4qQpEH9nmm95iaB6etRpjp1FjaYKVSu/nTg4YaJxCzUCYg1ZJRJvr0zFYegWtCuIASmZMr5bM2/xK/vr+EH3qjMgrGCMGp0NCCKKDU3z6l+RAIhseubIwnXnGeQFxBH8BiawZpihHjKQeIDa2YYnAUKYKE48mZ2vJEmIIRQ9dBBNKF7KOQ+gpIEg9vD09BFC0zm4TBPkEaZ7XR+IgEu+y4CYaAV7/w/TzRmnCJB81DcfCSLiia+T9xAfSSenBZsI80jMVda7WVAPx0T7H2pMEPEVpKVvk8jZ2256+Qpe6RkV0Jh05hMQEuJJmshoFKaT7TiBXanuJ0YgEB7Is70tB9n4xDCRj3KCCOA+NIjDn6C8GiSZAqwkiDbxAt2pIl74CRnYOP4uGHWtCcXNP7yIaCOSCLYiTKCFYMuAkGMDkJzmJBhwGqVCJqZCzM/2CpRfoJUijoZxQnBy4zBBRD4zsBCQhprhO0lDPsM805xRook09RkHwsRPTk3HfZhDlJFhWwu8pYZo2QqasuBzEAkkH00RUndEuTxlApJD5W5v0Yu4IUyIBKLRILYO8CIXNNMfGgNRctYhOc+jbjpuBKoXJ1UDKfUSW0psM4KIz9tkl7yfNv0u4Kh6nOAVL897AeIJeg1xRX2BAHgJFs94JIjVXSRtA2Gi4FDWFSYJ9yFsyEZnog4aAPjVe+aQoPZx0EHnFeQwKi8+1BlBpO7qihAQT2fNFgKHxoakec8Zys8gbZGcOdR+rKqBYEktTy8TZtxskSAuq3d4Kz4s7FGC5u8zQYoaSgDPN6hQKJT4EDlA0OwqDyAniSMKsqFgaFBu4JrEDu1pjtAn9Bc6Bw3hqpbwqq5iBpCV1NdVljpECJUNxDYY5ahIMADlAyiQP1gL0AL3ugwoGFQApBNfxDPuXQ9wtEbNxc6IDCoAsgw6xb3lDch6qHj/VzH3g3x4ChO5AaaCkkYdRipwAllEiUBBo4ItZTjqG8XzaFjFjNpYHibqBhqa04+0330IoH1Sc2X0EiCcsMogVag8HoEwEU8vCsI7vKxidvp4UGVq1jiog15iukcsE4gCKlfN3MPDtM9KrnIbqApAcqB5l1IKJRUbFNB35H97uVrBT/iWp2axXeNQfZxg8WK0X0ADQCdUhAlQsM1cPNQEitXpRXOv6wO5CkUEHubEB3IIJQOehI8inylWh+GS47wF0w4e6fTJub/VB1KKT6AaOpW0kKEQkP/IBI5G0TA59rOVNVUr1GhoNupcIR5Py7PwMCqv0yXsEWADTs+xcxmyN80jzufNjRyiiuTrJWLJbp4waeQUGY1PCqGqjCqANJI98/ApZCOkC2LjXlcBehsZ1eCBaqDsENuaqr5tOGYOrSko56bJBxCBepV0CSCItC9Us8GilkCqvs5We1Tp0Hrsob6rpWL1AjJJyx1rIByHw7nXraNa1QN00947fnGinfWIiJLTe+pe+wSoZTKmy0NtjSBCSyyftWL3BXjyzOBoadPWgY3NE7Ku8SpmZC9kGNlLf2Vc003LsBc72l51luLjU4PFO+xWLPgyMovaBJZUSNHuTyhLZ/F870aa/YMCdh4H8GQ1oGep8nOpmG1rQWudio24wZCAIqDU3VtrC8+xQG6gmQVmg5oGDoQT2ADULqGSXUFGHXUoL3dYDlRC2LlO2CFQU5aW4DQ5mla/9QAUKIkok+rNPnS6kwuHF/Xj+QBNRnGuKgH2k5o2aLi54fwkyj27v+HwQSzH/r/8pnO0UH3o2bIXnctaYeLA/+5bLcF5vSkcXZ8+dITuQxJQj+b2GaWshVZQ32YBfuAEdSRMb4E7gLJCgDhwIuxV0mj24Ls0kcsJx/6LJj6IHZ6HNOIvig+KOz1Ny2gal1E5HCEJxngQpBDEN0aHo1rtLpZlB/hZzVTAzDjEBWoZEkK3KJIUWzeqzQ560iPqP4lPqxHyzuNee0NrX/cMO134301g48N5rDGcx1YNEG/wbJhdyBKKFbTPO6rT0jR1rQJMKDlG8w7bY4cOfI+Vg9rBLi/xegcVcdXr9k+e47oUVGeAWnMa4VBE0DBoJ4CGaUVa74KGCpQSlA8awLCGq0ocoK3w1fSUMbuXGAzxmH0GmjhOlwCaWeCI8wcNyAdoIqKIE4jykrJeAhRfqIfmXdIQj7fZyt4BCoLWIbIGmeXeWvdAVKHf0TpBwSMbcTgUB2lZOGjK4IjDNUb2jxZQcSeouBu3wjsEvhIb5MV0o3UJ6wcw8yh0lG/NZiJ+cvj0Umcb7jjeENzrKkBg0EhDJoOvHL2i0gnQ5oRmBBmqbs0jG2FQiSbmiCYmbbejuF+tmrwAb1GX0izpZRQfaCI4XHme4wEauVMZTDg+7fyEv1qByijUUzmZpB7wyhL/C8VBE+lwXE5Sl9XhO84B+lWPozgsGTkQTpDZQE1pM+XtAl90Zso6aq0LXwDTOb/f3VWogWZYZUAF9YwSZ4Xlapsdrjmofth9YatbUdoBYgiNB40EeUAVgwJETc8tuLOWV48gosjB+WCA8ymiL870nWoJwH0Qx8UJ2myqb7MMc8XlStmFsoP2dJjcShQAzACiEe6pu+RwvQEGwDRoSpN7XQbk0vwB6keEYaPrdS+v1YAxDkQ4xGZF9QU5PhQs7eu0lZWD491GP9wSqEA46dYO99oG1ZSG+YcHiB4ZRJSPFsn3C9BO0QGiIDUJtwNkKfIHjVso08SI6BkTaJXRD21JJXIbSga6mNp15SHY60iCcRpw1EvLegtwDp2JFj9YWsCbvxKEvHRQPJ2Dfqg6mgE5QzMgSxZam4HoqsoH6ia1e9eZA7zyojlKAY0KawuhSo4JNCndu2uHY4MdUl/DAEeWgvDIql31jiqAL6KyF9K058gqyQTqUnxQIKfSM54MMEQWjRtn2AvtG7SYIToOoJTR2IVdzC8eGSn3HWRc2dHhGRF5C3OC3KjXvIZhWxw3lZA9aHW0KTUoi2DM/+0QKoDWCGQMpnflJMpHCIUGClHcpbx7pxzO7Iu2u1vwolag5gRy/jiBrdAFGtBeOo+JJk5TbyJRpRGaD+P0JnrhWNVAGYH6uBe4tCQot2gfzUREZKopCHHEDI1Qo4CUVfeBj+ihnQbmik+DpAp5NYwfshfSvqLVvw3IARSGe35UAxIIeUaZokBB/Zfs7Orj2GCHQKSX/J5CQsAfYoOCJvkdtVglAgSLBcWXmmphgjlUD/WBHzBgsUJx1ruJmjjQFE7TmabGr6TPTFSb/ALtheBq/3UMxJALVnMdzxJQ3xbGzUCE5hYcXQ1fxFkoUsleKuveWgGgwYfwl2bsrXOoIeI0aOSBrLi3ygD1pNvjBe5168gvmoU0uUwD13RvHdOAaURmItXutQc4vYloxFqmTRNtR77uby2CFhXaryIoZDhEEWWXW6jBDh2gsoOloYBgTdekgMCMM7PkUjti7+KAO01oYgcVF6SBWm7elrmsDhATkBiyC+smSp0Dwj+33wCnSW7w35m2Fxwz7BDNBjSfLIJkokYHJLlsYd/RAigf0j+S9P8BVaGa/InGJWcAAAAASUVORK5CYII=)"
+            "![end2.png]({image})"
             "<br><br>")
 
+BANNER_IMAGES = {OPEN_CELL: "up.png", STOP_CELL: "stop.png", END_CELL: "end2.png"}
+
 
-def extract_row(row):
-    element_type = str(row['Element_Type']).strip()
+INSTRUCTIONS_CELL = (f"<div align='center' dir='rtl'> <font color='Grey'> "
+                     f"<ul style='direction: rtl; text-align: right; list-style-position: inside;'>"
+                     f" <li> צרו עותק של המחברת </li> <li> שנו את שם העותק לשמכם הפרטי, ועבדו עם עותק זה </li> "
+                     f"</ul>  בהצלחה! </font> </div> </div>")
 
-    serial_number = str(int(row['Serial_Number'])).strip() if pd.notna(row['Serial_Number']) else ""
-    raw_content = str(row['Raw_Content']).strip() if pd.notna(row['Raw_Content']) else ""
-    cell_type = str(row['Cell_Type']).lower().strip()
-    header_level = int(row['Header_Level']) if pd.notna(row['Header_Level']) else 0
-    return element_type, serial_number, raw_content, cell_type, header_level
+REQUIRED_COLUMNS = ['Element_Type', 'Serial_Number', 'Raw_Content', 'Cell_Type', 'Header_Level', 'Anchor_ID']
+# Text columns are read as text when streaming, so chunks agree on their types.
+TEXT_COLUMNS = ['Element_Type', 'Raw_Content', 'Cell_Type']
+STREAM_CHUNK_ROWS = 5000
 
+_HEADER_INDENT = " " * 32
 
-def generate_notebook(input_file, output_notebook):
+
+def _template(html, element_key=None):
     """
-    :param input_file: Path to the CSV/Excel file with notebook structure.
-    :param output_notebook: Path to save the generated .ipynb file.
+    Splits an HTML template around its {content} slot and fills in the color/size of element_key.
+    :return: (prefix, suffix) tuple.
+    """
+    prefix, suffix = html.split("{content}")
+    if element_key is not None:
+        style = {"color": colors[element_key], "size": font_sizes[element_key]}
+        prefix, suffix = prefix.format(**style), suffix.format(**style)
+    return prefix, suffix
+
+
+def _raw_content(rows):
+    return rows['raw_content']
+
+
+def _serial_number(rows, element_type):
+    serial_number = rows['serial_number']
+    if (serial_number == "").any():
+        raise ValueError(f"Serial_Number is required for Element_Type: {element_type}")
+    return serial_number
+
+
+def _section_title(rows):
+    return "חלק " + _serial_number(rows, 'SECTION_TITLE') + " - " + rows['raw_content']
+
+
+def _question_title(rows):
+    title = "שאלה " + _serial_number(rows, 'Q_TITLE')
+    return title.where(rows['raw_content'] == "", title + ": " + rows['raw_content'])
+
+
+def _sub_question_title(rows):
+    title = "סעיף " + rows['serial_number']
+    return title.where(rows['raw_content'] == "", title + ": " + rows['raw_content'])
+
+
+def _no_content(rows):
+    return pd.Series("", index=rows.index)
+
+
+# Element_Type -> (content of the row, (html before it, html after it)).
+# Every template starts and ends with a tag, so the rendered cells need no strip().
+ELEMENT_TEMPLATES = {
+    'HEADER': (_raw_content, _template(f"<div dir='rtl' align='center'>\n"
+                                       f"{_HEADER_INDENT}<font color='{{color}}' size='{{size}}'>\n"
+                                       f"{_HEADER_INDENT}<b> {{content}} </b>\n"
+                                       f"{_HEADER_INDENT}</font></div>", "header_title")),
+    'SECTION_TITLE': (_section_title, _template("<div dir='rtl' align='center'>"
+                                                "<hr color='{color}' style='border: 1px solid {color}'>"
+                                                "<hr color='{color}' style='border: 1px solid {color}'>"
+                                                "<font color='{color}' size={size}>"
+                                                "<b>{content}</b> </font>"
+                                                "<hr color='{color}' style='border: 1px solid {color}'>"
+                                                "<hr color='{color}' style='border: 1px solid {color}'>"
+                                                "</div>", "section_title")),
+    'SECTION_TEXT': (_raw_content, _template("<div dir='rtl' align='center'>"
+                                             "<font color='{color}' size='{size}'>"
+                                             " {content} "
+                                             "</font></div>", "section_text")),
+    'Q_TITLE': (_question_title, _template("<div dir='rtl' align='right'>"
+                                           "<font color='{color}' size='{size}'>"
+                                           "<b> {content} </b>"
+                                           "</font></div>", "question_title")),
+    'SUB_Q_TITLE': (_sub_question_title, _template("<div dir='rtl' align='right'>"
+                                                   "<font size='{size}' color='{color}'>"
+                                                   "<b> {content} </b>"
+                                                   "</font></div>", "sub_question_title")),
+    'Q_CONTENT': (_raw_content, _template("<div dir='rtl' align='right'>"
+                                          "<font color='{color}' size='{size}'>"
+                                          " {content} "
+                                          "</font></div>", "question_text")),
+    'IMAGE': (_raw_content, _template("<div dir='rtl' align='center'>"
+                                      "![]({content})"
+                                      "</div>")),
+    'HINT_CONTENT': (_raw_content, _template("<div dir='rtl' align='right'>"
+                                             "<font color='{color}' size='{size}'>"
+                                             " {content} "
+                                             "</font></div>", "hint_text")),
+    'EXPLANATION': (_raw_content, _template("<div dir='rtl' align='right'>"
+                                            "<font color='{color}' size='{size}'>"
+                                            "<b>{content} </b>"
+                                            "</font></div>", "explanation_text")),
+    'STOP_CELL': (_no_content, (STOP_CELL, "")),
+}
+ELEMENT_TEMPLATES['TEXT'] = ELEMENT_TEMPLATES['Q_CONTENT']
+
+DEFAULT_TEMPLATE = (_raw_content, _template("<div dir='rtl' align='right'>"
+                                            " {content} "
+                                            "</div>"))
+
+
+def _as_str(column, missing):
+    return column.astype(object).where(column.notna(), missing).astype(str)
+
+
+def normalize_rows(df):
+    """
+    Normalizes a whole sheet column by column: missing values become "" (Element_Type/Cell_Type "nan"),
+    text is stripped, Cell_Type lower-cased, Serial_Number an integer string and Header_Level an int (0 if missing).
+    :param df: DataFrame with the required columns.
+    :return: DataFrame with element_type, serial_number, raw_content, cell_type and header_level columns.
     """
+    serial_number = pd.Series("", index=df.index, dtype=object)
+    has_serial = df['Serial_Number'].notna()
+    if has_serial.any():
+        serial_number[has_serial] = pd.to_numeric(df.loc[has_serial, 'Serial_Number']).astype('int64').astype(str)
+
+    rows = pd.DataFrame({
+        'element_type': _as_str(df['Element_Type'], "nan").str.strip(),
+        'serial_number': serial_number.astype(str),
+        'raw_content': _as_str(df['Raw_Content'], "").str.strip(),
+        'cell_type': _as_str(df['Cell_Type'], "nan").str.lower().str.strip(),
+        'header_level': pd.to_numeric(df['Header_Level']).fillna(0).astype(int),
+    })
+    return rows.reset_index(drop=True)
+
+
+def render_rows(rows):
+    """
+    Renders normalized rows in bulk, one group of rows per (Cell_Type, Element_Type).
+    :param rows: DataFrame returned by normalize_rows.
+    :return: List aligned with rows, each item a tuple of (cell_type, source) cells for that row.
+    """
+    unsupported = ~rows['cell_type'].isin(['ignore', 'code', 'text'])
+    if unsupported.any():
+        row = rows.loc[unsupported.idxmax()]
+        raise ValueError(f"Unsupported Cell_Type: {row['cell_type']} for Element_Type: {row['element_type']}")
 
+    sources = np.empty(len(rows), dtype=object)
+    for (cell_type, element_type), positions in rows.groupby(['cell_type', 'element_type'], sort=False).indices.items():
+        if cell_type == 'ignore':
+            continue
+        group = rows.iloc[positions]
+        if cell_type == 'code':
+            raw_content = group['raw_content']
+            sources[positions] = raw_content.where(raw_content != "", DEFAULT_CODE_TEMPLATE).to_numpy(dtype=object)
+            continue
+        content, (prefix, suffix) = ELEMENT_TEMPLATES.get(element_type, DEFAULT_TEMPLATE)
+        sources[positions] = (prefix + content(group) + suffix).to_numpy(dtype=object)
+
+    rendered = []
+    for cell_type, element_type, source in zip(rows['cell_type'], rows['element_type'], sources):
+        if cell_type == 'ignore':
+            rendered.append(())
+        elif cell_type == 'code':
+            rendered.append((('code', source),))
+        elif element_type == 'HEADER':
+            rendered.append((('markdown', source), ('markdown', INSTRUCTIONS_CELL)))
+        else:
+            rendered.append((('markdown', source),))
+    return rendered
+
+
+def check_columns(columns):
+    if not all(col in columns for col in REQUIRED_COLUMNS):
+        missing_cols = [col for col in REQUIRED_COLUMNS if col not in columns]
+        raise ValueError(f"Input file must contain the following columns: {REQUIRED_COLUMNS}. Missing: {missing_cols}")
+
+
+def read_sheet(input_file):
     if input_file.endswith(".csv"):
         df = pd.read_csv(input_file)
     elif input_file.endswith(".xlsx"):
         df = pd.read_excel(input_file)
     else:
         raise ValueError("Unsupported file format --> CSV / Excel only.")
+    return df
+
+
+def _xlsx_chunks(input_file, chunk_rows):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(input_file, read_only=True, data_only=True)
+    try:
+        sheet_rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(sheet_rows, ())
+        columns = [str(col) if col is not None else f"Unnamed: {i}" for i, col in enumerate(header)]
+        check_columns(columns)
+        yield None
+
+        chunk = []
+        blank_rows = []
+        for values in sheet_rows:
+            values = tuple(values) + (None,) * (len(columns) - len(values))
+            if all(value is None for value in values):
+                # Blank rows only count when a non-blank row follows, like pd.read_excel.
+                blank_rows.append(values)
+                continue
+            chunk.extend(blank_rows)
+            blank_rows = []
+            chunk.append(values[:len(columns)])
+            if len(chunk) >= chunk_rows:
+                yield pd.DataFrame(chunk, columns=columns, dtype=object)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=columns, dtype=object)
+    finally:
+        workbook.close()
+
+
+def _csv_chunks(input_file, chunk_rows):
+    check_columns(pd.read_csv(input_file, nrows=0).columns)
+    yield None
+    yield from pd.read_csv(input_file, chunksize=chunk_rows, dtype={col: str for col in TEXT_COLUMNS})
+
+
+def read_sheet_chunks(input_file, chunk_rows=STREAM_CHUNK_ROWS):
+    """
+    Reads a sheet incrementally: CSV in chunks, XLSX through openpyxl's read-only row iterator.
+    The required columns are checked against the header before this returns.
+
+    Unlike read_sheet, text columns are not given a type inferred for the whole column: CSV text columns are
+    read as written and XLSX cells keep their own type. The visible difference: in a text column that holds
+    only numbers and blanks, read_sheet turns the whole column into floats, so a 3 renders as "3.0" with
+    read_sheet and as "3" here (and a CSV "2.50" as "2.5" and "2.50").
+    :return: Iterator of DataFrames with at most chunk_rows rows each.
+    """
+    if input_file.endswith(".csv"):
+        chunks = _csv_chunks(input_file, chunk_rows)
+    elif input_file.endswith(".xlsx"):
+        chunks = _xlsx_chunks(input_file, chunk_rows)
+    else:
+        raise ValueError("Unsupported file format --> CSV / Excel only.")
+    next(chunks)
+    return chunks
 
-    required_columns = ['Element_Type', 'Serial_Number', 'Raw_Content', 'Cell_Type', 'Header_Level', 'Anchor_ID']
-    if not all(col in df.columns for col in required_columns):
-        missing_cols = [col for col in required_columns if col not in df.columns]
-        raise ValueError(f"Input file must contain the following columns: {required_columns}. Missing: {missing_cols}")
 
-    notebook = nbf.v4.new_notebook()
-    notebook.cells.append(nbf.v4.new_markdown_cell(OPEN_CELL))
+class BannerCells:
+    """
+    Builds the OPEN/STOP/END banner cells of one notebook, resolving each image at most once.
+    """
 
-    for _, row in df.iterrows():
-        element_type, serial_number, raw_content, cell_type, header_level = extract_row(row)
+    def __init__(self, assets=notebook_assets.DEFAULT_ASSET_MODE, asset_base_url=notebook_assets.DEFAULT_ASSET_BASE_URL):
+        self.assets = assets
+        self.asset_base_url = asset_base_url
+        self._resolved = {}
 
-        if cell_type == 'ignore':
-            continue
+    def new_cell(self, template):
+        if template not in self._resolved:
+            self._resolved[template] = notebook_assets.image_cell(template, BANNER_IMAGES[template],
+                                                                  self.assets, self.asset_base_url)
+        return new_markdown_cell(self._resolved[template])
 
-        if cell_type == 'code':
-            final_code = DEFAULT_CODE_TEMPLATE if not raw_content else raw_content
-            notebook.cells.append(nbf.v4.new_code_cell(final_code))
-            continue
 
+def new_cells(rendered, banners):
+    """
+    :param rendered: Output of render_rows.
+    :param banners: BannerCells used for the stop cells.
+    :return: Iterator of notebook_writer cells.
+    """
+    for row_cells in rendered:
+        for cell_type, source in row_cells:
+            if cell_type == 'code':
+                yield new_code_cell(source)
+            elif source == STOP_CELL:
+                yield banners.new_cell(STOP_CELL)
+            else:
+                yield new_markdown_cell(source)
 
-        elif cell_type == 'text':
-            markdown_content = ""
-            color = colors["basic"]
-            text_size = colors["basic"]
-
-            if element_type == 'HEADER':
-                element_key = "header_title"
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-
-                markdown_content = f"""<div dir='rtl' align='center'>
-                                <font color='{color}' size='{text_size}'>
-                                <b> {raw_content} </b>
-                                </font></div>"""
-
-            elif element_type == 'SECTION_TITLE':
-
-                element_key = "section_title"
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-
-                title = f"חלק {int(serial_number)} - {raw_content}"
-                markdown_content = (f"<div dir='rtl' align='center'>"
-                                    f"<hr color='{color}' style='border: 1px solid {color}'>"
-                                    f"<hr color='{color}' style='border: 1px solid {color}'>"
-                                    f"<font color='{color}' size={text_size}>"
-                                    f"<b>{title}</b> </font>"
-                                    f"<hr color='{color}' style='border: 1px solid {color}'>"
-                                    f"<hr color='{color}' style='border: 1px solid {color}'>"
-                                    f"</div>")
-
-            elif element_type == 'SECTION_TEXT':
-                element_key = "section_text"
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-                markdown_content = (f"<div dir='rtl' align='center'>"
-                                    f"<font color='{color}' size='{text_size}'>"
-                                    f" {raw_content} "
-                                    f"</font></div>")
-
-            elif element_type == 'Q_TITLE':
-
-                element_key = "question_title"
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-                title = f"שאלה {int(serial_number)}"
-                if raw_content.strip() != "":
-                    title += f": {raw_content}"
-                markdown_content = (f"<div dir='rtl' align='right'>"
-                                    f"<font color='{color}' size='{text_size}'>"
-                                    f"<b> {title} </b>"
-                                    f"</font></div>")
-
-            elif element_type == 'SUB_Q_TITLE':
-                element_key = "sub_question_title"
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-                title = f"סעיף {serial_number}"
-                if raw_content.strip() != "":
-                    title += f": {raw_content}"
-
-                markdown_content = (f"<div dir='rtl' align='right'>"
-                                    f"<font size='{text_size}' color='{color}'>"
-                                    f"<b> {title} </b>"
-                                    f"</font></div>")
-
-            elif element_type == 'Q_CONTENT' or element_type == 'TEXT':
-
-                element_key = "question_text"
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-
-                markdown_content = (f"<div dir='rtl' align='right'>"
-                                    f"<font color='{color}' size='{text_size}'>"
-                                    f" {raw_content} "
-                                    f"</font></div>")
-
-            elif element_type == 'IMAGE':
-
-                markdown_content = (f"<div dir='rtl' align='center'>"
-                                    f"![]({raw_content})"
-                                    f"</div>")
-
-            elif element_type == 'HINT_CONTENT':
-                element_key = "hint_text"
-
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-                markdown_content = (f"<div dir='rtl' align='right'>"
-                                    f"<font color='{color}' size='{text_size}'>"
-                                    f" {raw_content} "
-                                    f"</font></div>")
-
-            elif element_type == 'EXPLANATION':
-                element_key = "explanation_text"
-                color = colors[element_key]
-                text_size = font_sizes[element_key]
-
-                markdown_content = (f"<div dir='rtl' align='right'>"
-                                    f"<font color='{color}' size='{text_size}'>"
-                                    f"<b>{raw_content} </b>"
-                                    f"</font></div>")
-
-            elif element_type == 'STOP_CELL':
-                markdown_content = STOP_CELL
 
-            else:
-                markdown_content = (f"<div dir='rtl' align='right'>"
-                                    f" {raw_content} "
-                                    f"</div>")
-
-            markdown_content = markdown_content.strip()
-            notebook.cells.append(nbf.v4.new_markdown_cell(markdown_content))
-            if element_type == "HEADER":
-                instructions = (f"<div align='center' dir='rtl'> <font color='Grey'> "
-                                f"<ul style='direction: rtl; text-align: right; list-style-position: inside;'>"
-                                f" <li> צרו עותק של המחברת </li> <li> שנו את שם העותק לשמכם הפרטי, ועבדו עם עותק זה </li> "
-                                f"</ul>  בהצלחה! </font> </div> </div>")
-                notebook.cells.append(nbf.v4.new_markdown_cell(instructions))
-        else:
-            raise ValueError(f"Unsupported Cell_Type: {cell_type} for Element_Type: {element_type}")
+class StageTimings:
+    """
+    Wall time per generation stage (read, check_columns, normalize, cache, render, cells, write),
+    summed over all chunks in stream mode. Pass one to generate_notebook to instrument a build.
+    """
+
+    def __init__(self):
+        self.seconds = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
 
-    notebook.cells.append(nbf.v4.new_markdown_cell(END_CELL))
 
-    with open(output_notebook, 'w', encoding='utf-8') as f:
-        nbf.write(notebook, f)
+def _stream_notebook(input_file, output_notebook, banners, cache, force, options_key, chunk_rows, timings):
+    """
+    Renders and writes the notebook chunk by chunk, so memory does not grow with the sheet.
+    :return: Hash of all rows when a cache is used, else None.
+    """
+    with timings.stage("check_columns"):
+        chunks = read_sheet_chunks(input_file, chunk_rows)
+    rows_hasher = cache.rows_hasher(options_key) if cache is not None else None
+
+    with NotebookWriter(output_notebook) as writer:
+        writer.write_cell(banners.new_cell(OPEN_CELL))
+        while True:
+            with timings.stage("read"):
+                df = next(chunks, None)
+            if df is None:
+                break
+            with timings.stage("normalize"):
+                rows = normalize_rows(df)
+            if cache is None:
+                with timings.stage("render"):
+                    rendered = render_rows(rows)
+            else:
+                with timings.stage("cache"):
+                    row_keys = cache.row_keys(rows)
+                    for row_key in row_keys:
+                        rows_hasher.update(row_key)
+                with timings.stage("render"):
+                    rendered = cache.render_rows(rows, row_keys, force)
+            with timings.stage("cells"):
+                cells = list(new_cells(rendered, banners))
+            with timings.stage("write"):
+                for cell in cells:
+                    writer.write_cell(cell)
+        with timings.stage("write"):
+            writer.write_cell(banners.new_cell(END_CELL))
+    return rows_hasher.hexdigest() if rows_hasher is not None else None
+
+
+def generate_notebook(input_file, output_notebook, cache=None, force=False,
+                      assets=notebook_assets.DEFAULT_ASSET_MODE, asset_base_url=notebook_assets.DEFAULT_ASSET_BASE_URL,
+                      stream=False, chunk_rows=STREAM_CHUNK_ROWS, timings=None):
+    """
+    :param input_file: Path to the CSV/Excel file with notebook structure.
+    :param output_notebook: Path to save the generated .ipynb file.
+    :param cache: Optional notebook_cache.NotebookCache, used to skip unchanged notebooks and reuse rendered cells.
+    :param force: Rebuild even when the cache says the notebook is up to date.
+    :param assets: How banner images are stored: "inline" or "linked" (see notebook_assets).
+    :param asset_base_url: Where the images are hosted in "linked" mode.
+    :param stream: Read, render and write chunk_rows rows at a time instead of the whole sheet at once.
+                   Output is the same, except for numbers in all-numeric text columns (see read_sheet_chunks).
+    :param chunk_rows: Rows per chunk in stream mode.
+    :param timings: Optional StageTimings that receives the time spent in each stage.
+    """
+    if assets not in notebook_assets.ASSET_MODES:
+        raise ValueError(f"Unsupported asset mode: {assets} --> {' / '.join(notebook_assets.ASSET_MODES)} only.")
+    banners = BannerCells(assets, asset_base_url)
+    timings = timings if timings is not None else StageTimings()
+
+    file_key = options_key = None
+    if cache is not None:
+        # Stream mode is part of the key, since it can render numbers differently (see read_sheet_chunks).
+        options_key = (notebook_assets.assets_fingerprint(BANNER_IMAGES.values(), assets, asset_base_url)
+                       + f";stream={bool(stream)}")
+        with timings.stage("cache"):
+            file_key = cache.file_key(input_file, options_key)
+        if not force and cache.is_fresh(output_notebook, file_key=file_key):
+            print(f"Notebook {output_notebook} is up to date")
+            return
+
+    if stream:
+        rows_key = _stream_notebook(input_file, output_notebook, banners, cache, force, options_key, chunk_rows,
+                                    timings)
+    else:
+        with timings.stage("read"):
+            df = read_sheet(input_file)
+        with timings.stage("check_columns"):
+            check_columns(df.columns)
+        with timings.stage("normalize"):
+            rows = normalize_rows(df)
+        if cache is None:
+            with timings.stage("render"):
+                rendered = render_rows(rows)
+        else:
+            with timings.stage("cache"):
+                row_keys = cache.row_keys(rows)
+                rows_key = cache.rows_key(row_keys, options_key)
+                fresh = not force and cache.is_fresh(output_notebook, rows_key=rows_key)
+            if fresh:
+                cache.mark_built(output_notebook, file_key, rows_key)
+                print(f"Notebook {output_notebook} is up to date")
+                return
+            with timings.stage("render"):
+                rendered = cache.render_rows(rows, row_keys, force)
+
+        with timings.stage("cells"):
+            cells = [banners.new_cell(OPEN_CELL)]
+            cells.extend(new_cells(rendered, banners))
+            cells.append(banners.new_cell(END_CELL))
+        with timings.stage("write"):
+            write_notebook(cells, output_notebook)
+
+    if cache is not None:
+        with timings.stage("cache"):
+            cache.mark_built(output_notebook, file_key, rows_key)
+            cache.evict()
 
     print(f"Notebook generated and saved to {output_notebook}")
 
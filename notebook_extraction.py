@@ -0,0 +1,292 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+import notebook_creation as nc
+from build_course import CELLS_DIR, CELLS_SUFFIX, mirrored_dir, run_jobs
+
+OLD_NOTEBOOKS_DIR = "old_notebooks"
+OUTPUT_FORMATS = ("csv", "xlsx", "parquet")
+# Element_Type written for markdown that only matches the default template, e.g. hand-written cells.
+MARKDOWN_ELEMENT = 'MARKDOWN'
+
+_CELLS_START = re.compile(r'"cells"\s*:\s*\[')
+
+
+def iter_notebook_cells(notebook_path, block_size=1 << 16):
+    """
+    Yields the cells of an .ipynb file one at a time, reading the file incrementally
+    instead of loading the whole document (and every embedded image) at once.
+    """
+    decoder = json.JSONDecoder()
+    with open(notebook_path, encoding='utf-8') as f:
+        buffer = ""
+        while True:
+            match = _CELLS_START.search(buffer)
+            if match:
+                buffer = buffer[match.end():]
+                break
+            block = f.read(block_size)
+            if not block:
+                raise ValueError(f"No cells found in {notebook_path}")
+            buffer = buffer[-block_size:] + block
+
+        while True:
+            buffer = buffer.lstrip().lstrip(",").lstrip()
+            if buffer.startswith("]"):
+                return
+            try:
+                cell, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                block = f.read(max(block_size, len(buffer)))
+                if not block:
+                    raise
+                buffer += block
+                continue
+            yield cell
+            buffer = buffer[end:]
+
+
+def _source(cell):
+    source = cell.get("source", "")
+    return "".join(source) if isinstance(source, list) else source
+
+
+def _banner_pattern(template):
+    before, after = template.split("{image}")
+    return re.compile(re.escape(before) + r"(?P<image>[^)]*)" + re.escape(after) + r"\Z", re.DOTALL)
+
+
+_BANNERS = [(template, _banner_pattern(template)) for template in nc.BANNER_IMAGES]
+
+
+def _titled(prefix, content):
+    """
+    Inverse of "<prefix> <serial>" / "<prefix> <serial>: <raw>".
+    """
+    if not content.startswith(prefix + " "):
+        return None
+    serial_number, _, raw_content = content[len(prefix) + 1:].partition(": ")
+    return serial_number, raw_content
+
+
+def _section_title(content):
+    if not content.startswith("חלק "):
+        return None
+    serial_number, separator, raw_content = content[len("חלק "):].partition(" - ")
+    return (serial_number, raw_content) if separator else None
+
+
+_TITLE_PARSERS = {
+    'SECTION_TITLE': _section_title,
+    'Q_TITLE': lambda content: _titled("שאלה", content),
+    'SUB_Q_TITLE': lambda content: _titled("סעיף", content),
+}
+
+# Longest prefixes first, so a template is never mistaken for a shorter one it starts like.
+# TEXT renders exactly like Q_CONTENT, so only Q_CONTENT is extracted.
+_TEMPLATES = sorted(((element_type, prefix, suffix)
+                     for element_type, (_, (prefix, suffix)) in nc.ELEMENT_TEMPLATES.items()
+                     if element_type not in ('TEXT', 'STOP_CELL')),
+                    key=lambda template: len(template[1]), reverse=True)
+_TEMPLATES.append((MARKDOWN_ELEMENT,) + nc.DEFAULT_TEMPLATE[1])
+
+
+def _row(element_type, cell_type, raw_content="", serial_number="", anchor_id=""):
+    return {'Element_Type': element_type, 'Serial_Number': serial_number, 'Raw_Content': raw_content,
+            'Cell_Type': cell_type, 'Header_Level': "", 'Anchor_ID': anchor_id}
+
+
+def parse_markdown(source, anchor_id=""):
+    """
+    Maps one markdown cell produced by generate_notebook back to its row.
+    :return: Row dict, or None for the OPEN/END banners and the instructions cell, which have no row.
+    """
+    for template, pattern in _BANNERS:
+        if pattern.match(source):
+            return _row('STOP_CELL', 'text', anchor_id=anchor_id) if template == nc.STOP_CELL else None
+    if source == nc.INSTRUCTIONS_CELL:
+        return None
+
+    for element_type, prefix, suffix in _TEMPLATES:
+        if len(source) >= len(prefix) + len(suffix) and source.startswith(prefix) and source.endswith(suffix):
+            content = source[len(prefix):len(source) - len(suffix)]
+            if element_type in _TITLE_PARSERS:
+                title = _TITLE_PARSERS[element_type](content)
+                if title is None:
+                    continue
+                serial_number, raw_content = title
+                return _row(element_type, 'text', raw_content, serial_number, anchor_id)
+            return _row(element_type, 'text', content, anchor_id=anchor_id)
+    return _row(MARKDOWN_ELEMENT, 'text', source.strip(), anchor_id=anchor_id)
+
+
+def extract_rows(notebook_path):
+    """
+    :return: DataFrame with the columns generate_notebook expects, one row per notebook element.
+    """
+    rows = []
+    for cell in iter_notebook_cells(notebook_path):
+        source = _source(cell)
+        anchor_id = cell.get("id", "")
+        if cell.get("cell_type") == "code":
+            raw_content = "" if source == nc.DEFAULT_CODE_TEMPLATE else source
+            rows.append(_row('CODE', 'code', raw_content, anchor_id=anchor_id))
+        elif cell.get("cell_type") == "markdown":
+            row = parse_markdown(source, anchor_id)
+            if row is not None:
+                rows.append(row)
+    return pd.DataFrame(rows, columns=nc.REQUIRED_COLUMNS)
+
+
+def write_rows(df, output_file):
+    if output_file.endswith(".csv"):
+        df.to_csv(output_file, index=False)
+    elif output_file.endswith(".xlsx"):
+        df.to_excel(output_file, index=False)
+    elif output_file.endswith(".parquet"):
+        # Needs pyarrow or fastparquet; pandas raises an ImportError naming them otherwise.
+        df.to_parquet(output_file, index=False)
+    else:
+        raise ValueError(f"Unsupported output format --> {' / '.join(OUTPUT_FORMATS)} only.")
+
+
+def cells_path_for(notebook_path, output_dir=CELLS_DIR, file_format="csv"):
+    """
+    Maps old_notebooks/<name>.ipynb to <output_dir>/<name>_cells.<file_format>.
+    """
+    name = os.path.splitext(os.path.basename(notebook_path))[0]
+    return os.path.join(output_dir, f"{name}{CELLS_SUFFIX}.{file_format}")
+
+
+def mirrored_cells_path(notebook_path, notebooks_dir=OLD_NOTEBOOKS_DIR, output_dir=CELLS_DIR, file_format="csv"):
+    """
+    Maps old_notebooks/<dir>/<name>.ipynb to <output_dir>/<dir>/<name>_cells.<file_format>.
+    """
+    return cells_path_for(notebook_path, mirrored_dir(notebook_path, notebooks_dir, output_dir), file_format)
+
+
+def iter_notebook_files(notebooks_dir=OLD_NOTEBOOKS_DIR):
+    """
+    Yields every .ipynb file under notebooks_dir, subdirectories included (hidden ones such as
+    .ipynb_checkpoints are skipped), in the same order as build_course.iter_cells_files.
+    """
+    for root, dirs, names in os.walk(notebooks_dir):
+        dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+        for name in sorted(names):
+            if name.endswith(".ipynb") and not name.startswith("."):
+                yield os.path.join(root, name)
+
+
+def _detect_assets(notebook_path):
+    """
+    Finds the asset mode and base URL a notebook was generated with, from its OPEN banner.
+    """
+    first_cell = next(iter_notebook_cells(notebook_path), None)
+    match = _BANNERS[0][1].match(_source(first_cell)) if first_cell else None
+    if match is None:
+        return nc.notebook_assets.DEFAULT_ASSET_MODE, nc.notebook_assets.DEFAULT_ASSET_BASE_URL
+    image = match.group("image")
+    if image.startswith("data:"):
+        return "inline", nc.notebook_assets.DEFAULT_ASSET_BASE_URL
+    return "linked", image.rsplit("/", 1)[0]
+
+
+def roundtrip_differences(notebook_path):
+    """
+    Extracts a notebook, generates it again from the extracted rows and compares the two.
+    :return: Indexes of the cells that differ (a length mismatch shows up as the missing indexes).
+    """
+    assets, asset_base_url = _detect_assets(notebook_path)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cells_file = os.path.join(tmp_dir, "roundtrip_cells.csv")
+        regenerated = os.path.join(tmp_dir, "roundtrip.ipynb")
+        extract_rows(notebook_path).to_csv(cells_file, index=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            nc.generate_notebook(cells_file, regenerated, assets=assets, asset_base_url=asset_base_url)
+
+        def comparable(cell):
+            return cell.get("cell_type"), _source(cell)
+
+        original = [comparable(cell) for cell in iter_notebook_cells(notebook_path)]
+        generated = [comparable(cell) for cell in iter_notebook_cells(regenerated)]
+    return [index for index in range(max(len(original), len(generated)))
+            if index >= len(original) or index >= len(generated) or original[index] != generated[index]]
+
+
+def extract_notebook(job, check_roundtrip=False):
+    """
+    Extracts one (notebook_path, output_file) pair.
+    :return: Result dict for build_course.run_jobs, with the number of extracted rows; errors are reported in it.
+    """
+    notebook_path, output_file = job
+    start = time.perf_counter()
+    error = None
+    rows = 0
+    try:
+        df = extract_rows(notebook_path)
+        rows = len(df)
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        write_rows(df, output_file)
+        if check_roundtrip:
+            differences = roundtrip_differences(notebook_path)
+            if differences:
+                error = f"Round trip differs in {len(differences)} cells, first at cell {differences[0]}"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {"input": notebook_path, "output": output_file, "ok": error is None, "rows": rows,
+            "seconds": time.perf_counter() - start, "error": error}
+
+
+def extract_notebooks(jobs, workers=None, check_roundtrip=False):
+    """
+    Extracts all notebooks in jobs, spread over a pool of worker processes.
+    :param jobs: List of (notebook_path, output_file) pairs.
+    :param check_roundtrip: Also check that generating from the extracted rows reproduces each notebook.
+    :return: List of per-notebook results (see extract_notebook), in the order of jobs.
+    """
+    if not jobs:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return run_jobs(pool, partial(extract_notebook, check_roundtrip=check_roundtrip), jobs,
+                        summary=lambda result: f"{result.get('rows', 0)} rows, {result['seconds']:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract cells sheets from existing notebooks.")
+    parser.add_argument("--notebooks-dir", default=OLD_NOTEBOOKS_DIR, help="Directory tree with the .ipynb files.")
+    parser.add_argument("--output-dir", default=CELLS_DIR, help="Directory for the *_cells files.")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output file format.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    parser.add_argument("--check-roundtrip", action="store_true",
+                        help="Check that generating from each extracted sheet reproduces its notebook.")
+    args = parser.parse_args(argv)
+
+    jobs = [(notebook, mirrored_cells_path(notebook, args.notebooks_dir, args.output_dir, args.format))
+            for notebook in iter_notebook_files(args.notebooks_dir)]
+    if not jobs:
+        print("No notebooks found.")
+        return 0
+
+    start = time.perf_counter()
+    results = extract_notebooks(jobs, args.workers, args.check_roundtrip)
+    failed = [result for result in results if not result["ok"]]
+    print(f"Extracted {len(results) - len(failed)}/{len(results)} notebooks in {time.perf_counter() - start:.2f}s.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
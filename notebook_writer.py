@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NBFORMAT = 4
+NBFORMAT_MINOR = 5
+
+_INDENT_2 = re.compile(rb"\n((?:  )+)")
+
+
+def _dumps(obj):
+    """
+    Serializes obj as UTF-8 JSON with sorted keys and a 1-space indent, the layout nbformat and Jupyter write.
+    orjson is used when installed. It only indents by 2, so its indentation is halved
+    (JSON strings cannot hold a raw newline, so every newline is followed by indentation only).
+    Both encoders produce the same bytes for notebook cells.
+    """
+    if orjson is not None:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        return _INDENT_2.sub(lambda match: b"\n" + b" " * (len(match.group(1)) // 2), text)
+    return json.dumps(obj, indent=1, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
+def new_markdown_cell(source):
+    return {"cell_type": "markdown", "metadata": {}, "source": source}
+
+
+def new_code_cell(source):
+    return {"cell_type": "code", "execution_count": None, "metadata": {}, "outputs": [], "source": source}
+
+
+class NotebookWriter:
+    """
+    Writes an nbformat 4 notebook to output_notebook one cell at a time, without holding it in memory
+    and without schema validation (see validate_notebook).
+    Cell ids are derived from the cell contents, so the same sheet always gives the same file.
+    The notebook is written to <output_notebook>.partial and only replaces output_notebook once closed.
+    """
+
+    def __init__(self, output_notebook, metadata=None):
+        self.output_notebook = output_notebook
+        self._partial = f"{output_notebook}.partial"
+        self._metadata = {} if metadata is None else metadata
+        self._cells = 0
+        self._repeats = {}
+        self._f = open(self._partial, 'wb')
+        self._f.write(b'{\n "cells": [')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _cell_id(self, cell):
+        cell_id = hashlib.sha1(f"{cell['cell_type']}\x1f{cell['source']}".encode('utf-8')).hexdigest()[:8]
+        # Repeated cells (stop cells, empty code cells) get -2, -3, ... which no plain hash id can clash with.
+        repeat = self._repeats.get(cell_id, 0) + 1
+        self._repeats[cell_id] = repeat
+        return cell_id if repeat == 1 else f"{cell_id}-{repeat}"
+
+    def write_cell(self, cell):
+        """
+        :param cell: Cell made by new_markdown_cell / new_code_cell, its source as a single string.
+        """
+        cell = dict(cell, id=self._cell_id(cell), source=cell['source'].splitlines(True))
+        self._f.write((b",\n  " if self._cells else b"\n  ") + _dumps(cell).replace(b"\n", b"\n  "))
+        self._cells += 1
+
+    def close(self):
+        self._f.write(b"\n ]," if self._cells else b"],")
+        self._f.write(b'\n "metadata": ' + _dumps(self._metadata).replace(b"\n", b"\n ") + b",")
+        self._f.write(f'\n "nbformat": {NBFORMAT},\n "nbformat_minor": {NBFORMAT_MINOR}\n}}\n'.encode('utf-8'))
+        self._f.close()
+        os.replace(self._partial, self.output_notebook)
+
+    def abort(self):
+        self._f.close()
+        os.remove(self._partial)
+
+
+def write_notebook(cells, output_notebook, metadata=None):
+    """
+    :param cells: Iterable of cells made by new_markdown_cell / new_code_cell.
+    :param output_notebook: Path to save the .ipynb file.
+    """
+    with NotebookWriter(output_notebook, metadata) as writer:
+        for cell in cells:
+            writer.write_cell(cell)
+
+
+def validate_notebook(output_notebook):
+    """
+    Full nbformat schema validation of a written notebook, raises nbformat.ValidationError if it is invalid.
+    Kept out of the write path; run it once per batch or in tests.
+    """
+    import nbformat as nbf
+
+    with open(output_notebook, encoding='utf-8') as f:
+        notebook = nbf.read(f, as_version=NBFORMAT)
+    nbf.validate(notebook)
@@ -0,0 +1,267 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+import pandas as pd
+
+from notebook_cache import CACHE_DIR
+from notebook_creation import check_columns, read_sheet
+
+SYSTEM_INSTRUCTION = (
+    "You are a Hebrew language assistant. Your task is to rephrase the given text "
+    "into clearer Hebrew while keeping the original meaning. The text is for 15-year-old "
+    "kids learning AI. Format the text to be more understandable by adding line breaks, "
+    "commas, and other punctuation where needed to improve clarity. Simplify the language "
+    "if necessary to suit their understanding level."
+)
+
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_MODEL = "gpt-3.5-turbo"
+DEFAULT_TEMPERATURE = 0.8
+
+# Only free text is rephrased; titles, images, banners and code are left as they are.
+REPHRASE_ELEMENT_TYPES = ['SECTION_TEXT', 'Q_CONTENT', 'TEXT', 'HINT_CONTENT', 'EXPLANATION']
+ORIGINAL_COLUMN = 'Original_Content'
+REPHRASED_COLUMN = 'Rephrase_Text'
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def _retry_delay(retry_after, attempt):
+    """
+    Seconds to wait before retrying: Retry-After as seconds or as an HTTP-date, else exponential backoff.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    return 2 ** attempt
+
+
+def _default_api_key():
+    if os.environ.get("OPENAI_API_KEY"):
+        return os.environ["OPENAI_API_KEY"]
+    try:
+        import config
+    except ImportError:
+        return None
+    return getattr(config, "OPENAI_API_KEY", None)
+
+
+class ChatCompletionsBackend:
+    """
+    Rephrases through an OpenAI-compatible /chat/completions endpoint.
+    Point base_url at a local stub server to run the stage offline.
+    """
+
+    def __init__(self, api_key=None, base_url=OPENAI_BASE_URL, model=DEFAULT_MODEL, temperature=DEFAULT_TEMPERATURE,
+                 timeout=60, max_retries=5):
+        self.api_key = api_key if api_key is not None else _default_api_key()
+        self.base_url = base_url.rstrip('/')
+        self.model = model
+        self.temperature = temperature
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+    @property
+    def name(self):
+        """
+        Part of the cache key: the same text sent to another model is rephrased again.
+        """
+        return f"{self.model}@{self.temperature}"
+
+    def _post(self, text, prompt):
+        body = json.dumps({
+            "model": self.model,
+            "messages": [{"role": "system", "content": prompt}, {"role": "user", "content": text}],
+            "temperature": self.temperature,
+        }).encode('utf-8')
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        request = urllib.request.Request(f"{self.base_url}/chat/completions", data=body, headers=headers)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return json.load(response)["choices"][0]["message"]["content"]
+            except urllib.error.HTTPError as e:
+                if e.code not in _RETRY_STATUS or attempt == self.max_retries:
+                    raise
+                delay = _retry_delay(e.headers.get("Retry-After"), attempt)
+            except urllib.error.URLError:
+                if attempt == self.max_retries:
+                    raise
+                delay = 2 ** attempt
+            time.sleep(delay)
+
+    async def rephrase(self, text, prompt, executor=None):
+        return await asyncio.get_running_loop().run_in_executor(executor, self._post, text, prompt)
+
+
+class RateLimiter:
+    """
+    Spaces request starts at least 60 / requests_per_minute seconds apart.
+    """
+
+    def __init__(self, requests_per_minute=None):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+            self._next = max(now, self._next) + self.interval
+
+
+class RephraseCache:
+    """
+    Persistent rephrased texts, keyed by a hash of backend, prompt and source text.
+    Each answer is stored as soon as it arrives, so an interrupted run resumes where it stopped.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        os.makedirs(cache_dir, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(cache_dir, "rephrase.sqlite"), timeout=60)
+        self._db.execute("CREATE TABLE IF NOT EXISTS rephrased (key TEXT PRIMARY KEY, text TEXT NOT NULL)")
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    @staticmethod
+    def key(backend_name, prompt, text):
+        return hashlib.sha256("\x1f".join([backend_name, prompt, text]).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        entry = self._db.execute("SELECT text FROM rephrased WHERE key = ?", (key,)).fetchone()
+        return entry[0] if entry else None
+
+    def put(self, key, text):
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO rephrased VALUES (?, ?)", (key, text))
+
+
+async def rephrase_texts(texts, backend, cache, prompt=SYSTEM_INSTRUCTION, concurrency=8, requests_per_minute=None):
+    """
+    Rephrases texts concurrently, sending only texts that are not in the cache (each distinct text once).
+    :param backend: Object with a `name` and an `async rephrase(text, prompt, executor)` method.
+    :param concurrency: Maximum number of requests in flight.
+    :param requests_per_minute: Optional rate limit on request starts.
+    :return: List aligned with texts, None where the request failed.
+    """
+    keys = [cache.key(backend.name, prompt, text) for text in texts]
+    results = {key: cache.get(key) for key in set(keys)}
+    pending = {key: text for key, text in zip(keys, texts) if results[key] is None}
+    print(f"Rephrasing {len(pending)} texts ({len(results) - len(pending)} cached)")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(requests_per_minute)
+    done = 0
+
+    async def rephrase_one(key, text, executor):
+        nonlocal done
+        async with semaphore:
+            await limiter.wait()
+            try:
+                rephrased = await backend.rephrase(text, prompt, executor)
+            except Exception as e:
+                print(f"Failed to rephrase text: {type(e).__name__}: {e}")
+                return
+        cache.put(key, rephrased)
+        results[key] = rephrased
+        done += 1
+        if done % 50 == 0 or done == len(pending):
+            print(f"Rephrased {done}/{len(pending)}")
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        await asyncio.gather(*(rephrase_one(key, text, executor) for key, text in pending.items()))
+    return [results[key] for key in keys]
+
+
+def rephrase_sheet(input_file, output_file=None, backend=None, cache=None, prompt=SYSTEM_INSTRUCTION,
+                   concurrency=8, requests_per_minute=None):
+    """
+    Rephrases the free-text Raw_Content of a cells sheet before it goes into generate_notebook.
+    The source text is kept in Original_Content, so running the stage again only sends rows that are new
+    or whose Original_Content was edited. Raw_Content is only replaced when a row gets a new rephrasing,
+    so edits made to it by hand survive later runs.
+
+    :param input_file: Path to the CSV/Excel cells file.
+    :param output_file: Where to save the rephrased sheet, defaults to input_file.
+    :return: Number of rows that could not be rephrased.
+    """
+    df = read_sheet(input_file)
+    check_columns(df.columns)
+
+    backend = backend if backend is not None else ChatCompletionsBackend()
+    cache = cache if cache is not None else RephraseCache()
+
+    if ORIGINAL_COLUMN not in df.columns:
+        df[ORIGINAL_COLUMN] = None
+    # Rows added since the last run have no Original_Content yet, their source text is still in Raw_Content.
+    df[ORIGINAL_COLUMN] = df[ORIGINAL_COLUMN].astype(object).fillna(df['Raw_Content'])
+    previous = df[REPHRASED_COLUMN] if REPHRASED_COLUMN in df.columns else pd.Series(None, index=df.index)
+    original = df[ORIGINAL_COLUMN].astype(object).where(df[ORIGINAL_COLUMN].notna(), "").astype(str).str.strip()
+    selected = (df['Cell_Type'].astype(str).str.lower().str.strip().eq('text')
+                & df['Element_Type'].astype(str).str.strip().isin(REPHRASE_ELEMENT_TYPES)
+                & original.ne(""))
+
+    rephrased = asyncio.run(rephrase_texts(original[selected].tolist(), backend, cache, prompt,
+                                           concurrency, requests_per_minute))
+    rephrased = pd.Series(rephrased, index=original[selected].index, dtype=object).str.replace('\n', '<br>')
+
+    updated = rephrased.notna() & rephrased.ne(previous[rephrased.index])
+    df[REPHRASED_COLUMN] = rephrased
+    df['Raw_Content'] = df['Raw_Content'].astype(object)
+    df.loc[updated[updated].index, 'Raw_Content'] = rephrased[updated]
+
+    output_file = output_file or input_file
+    if output_file.endswith(".csv"):
+        df.to_csv(output_file, index=False)
+    else:
+        df.to_excel(output_file, index=False)
+
+    failed = int(rephrased.isna().sum())
+    print(f"Rephrased sheet saved to {output_file}" + (f" ({failed} rows failed, run again to retry)" if failed else ""))
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rephrase the free text of a cells sheet with an LLM.")
+    parser.add_argument("input_file", help="CSV/Excel cells file.")
+    parser.add_argument("--output", help="Where to save the rephrased sheet (default: overwrite the input).")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum number of requests in flight.")
+    parser.add_argument("--rpm", type=float, default=None, help="Maximum requests per minute.")
+    parser.add_argument("--base-url", default=OPENAI_BASE_URL, help="OpenAI-compatible API base URL.")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Directory of the rephrase cache.")
+    args = parser.parse_args(argv)
+
+    backend = ChatCompletionsBackend(base_url=args.base_url, model=args.model)
+    failed = rephrase_sheet(args.input_file, args.output, backend, RephraseCache(args.cache_dir),
+                            concurrency=args.concurrency, requests_per_minute=args.rpm)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
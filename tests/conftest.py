@@ -0,0 +1,30 @@
+import os
+
+import pandas as pd
+import pytest
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+@pytest.fixture
+def sample_csv():
+    """
+    Cells sheet with every element type, an ignored row, custom and empty code cells and two stop cells.
+    """
+    return os.path.join(DATA_DIR, "sample_cells.csv")
+
+
+@pytest.fixture
+def sample_xlsx(sample_csv, tmp_path):
+    path = str(tmp_path / "sample_cells.xlsx")
+    pd.read_csv(sample_csv).to_excel(path, index=False)
+    return path
+
+
+@pytest.fixture
+def baseline_cells_file():
+    """
+    (cell_type, source) of every cell the original row-by-row generate_notebook wrote for sample_cells.csv,
+    with each embedded image replaced by the sha256 of its data URI.
+    """
+    return os.path.join(DATA_DIR, "sample_baseline_cells.json")
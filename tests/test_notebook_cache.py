@@ -0,0 +1,99 @@
+import os
+
+import pandas as pd
+import pytest
+
+from notebook_cache import NotebookCache
+from notebook_creation import generate_notebook
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = NotebookCache(str(tmp_path / "cache"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def sheet(sample_csv, tmp_path):
+    path = str(tmp_path / "week_cells.csv")
+    pd.read_csv(sample_csv).to_csv(path, index=False)
+    return path
+
+
+def _read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_unchanged_sheet_is_skipped(stream, sheet, cache, tmp_path, capsys):
+    output_notebook = str(tmp_path / "week.ipynb")
+    generate_notebook(sheet, output_notebook, cache=cache, stream=stream)
+    built = os.stat(output_notebook).st_mtime_ns
+
+    generate_notebook(sheet, output_notebook, cache=cache, stream=stream)
+    assert "is up to date" in capsys.readouterr().out
+    assert os.stat(output_notebook).st_mtime_ns == built
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_edited_sheet_is_rebuilt(stream, sheet, cache, tmp_path, capsys):
+    output_notebook = str(tmp_path / "week.ipynb")
+    generate_notebook(sheet, output_notebook, cache=cache, stream=stream)
+
+    df = pd.read_csv(sheet)
+    df.loc[4, 'Raw_Content'] = "טענו את הקובץ train.csv"
+    df.to_csv(sheet, index=False)
+    capsys.readouterr()
+    generate_notebook(sheet, output_notebook, cache=cache, stream=stream)
+    assert "is up to date" not in capsys.readouterr().out
+
+    uncached = str(tmp_path / "uncached.ipynb")
+    generate_notebook(sheet, uncached)
+    assert _read_bytes(output_notebook) == _read_bytes(uncached)
+
+
+def test_resaved_sheet_with_same_rows_is_skipped(sheet, cache, tmp_path, capsys):
+    output_notebook = str(tmp_path / "week.ipynb")
+    generate_notebook(sheet, output_notebook, cache=cache)
+
+    # Same rows, different bytes: Excel re-saves are detected through the row hashes.
+    pd.read_csv(sheet).to_csv(sheet, index=False, lineterminator="\r\n")
+    capsys.readouterr()
+    generate_notebook(sheet, output_notebook, cache=cache)
+    assert "is up to date" in capsys.readouterr().out
+
+
+def test_rebuilt_when_options_or_output_change(sheet, cache, tmp_path, capsys):
+    output_notebook = str(tmp_path / "week.ipynb")
+    generate_notebook(sheet, output_notebook, cache=cache)
+
+    capsys.readouterr()
+    generate_notebook(sheet, output_notebook, cache=cache, assets="linked")
+    assert "is up to date" not in capsys.readouterr().out
+
+    with open(output_notebook, 'a', encoding='utf-8') as f:
+        f.write("\n")
+    generate_notebook(sheet, output_notebook, cache=cache, assets="linked")
+    assert "is up to date" not in capsys.readouterr().out
+
+    generate_notebook(sheet, output_notebook, cache=cache, assets="linked", force=True)
+    assert "is up to date" not in capsys.readouterr().out
+
+
+def test_switching_stream_mode_rebuilds(cache, tmp_path, capsys):
+    # Stream mode renders this all-numeric text column differently, so the two modes must not share an entry.
+    sheet = str(tmp_path / "numbers_cells.csv")
+    with open(sheet, 'w', encoding='utf-8') as f:
+        f.write("Element_Type,Serial_Number,Raw_Content,Cell_Type,Header_Level,Anchor_ID\n"
+                "Q_CONTENT,,3,text,,a\nQ_CONTENT,,,text,,b\nQ_CONTENT,,2.50,text,,c\n")
+    output_notebook = str(tmp_path / "numbers.ipynb")
+    generate_notebook(sheet, output_notebook, cache=cache)
+
+    capsys.readouterr()
+    generate_notebook(sheet, output_notebook, cache=cache, stream=True)
+    assert "is up to date" not in capsys.readouterr().out
+    streamed = str(tmp_path / "streamed.ipynb")
+    generate_notebook(sheet, streamed, stream=True)
+    assert _read_bytes(output_notebook) == _read_bytes(streamed)
@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+import notebook_extraction
+from build_course import find_cells_files
+from notebook_assets import ASSET_MODES
+from notebook_creation import generate_notebook
+from notebook_extraction import extract_rows, iter_notebook_cells, roundtrip_differences
+
+
+@pytest.mark.parametrize("assets", ASSET_MODES)
+def test_roundtrip_reproduces_notebook(assets, sample_csv, tmp_path):
+    notebook_path = str(tmp_path / "week.ipynb")
+    generate_notebook(sample_csv, notebook_path, assets=assets)
+    assert roundtrip_differences(notebook_path) == []
+
+
+def test_roundtrip_reports_changed_cells(sample_csv, tmp_path):
+    notebook_path = str(tmp_path / "week.ipynb")
+    generate_notebook(sample_csv, notebook_path)
+    with open(notebook_path, encoding='utf-8') as f:
+        text = f.read()
+    # A cell whose source was hand-edited out of its template no longer regenerates the same.
+    with open(notebook_path, 'w', encoding='utf-8') as f:
+        f.write(text.replace("<font color='white' size='4'> טענו", "<font color='red' size='4'> טענו", 1))
+    assert roundtrip_differences(notebook_path) == [6]
+
+
+def test_extract_rows(sample_csv, tmp_path):
+    notebook_path = str(tmp_path / "week.ipynb")
+    generate_notebook(sample_csv, notebook_path)
+    df = extract_rows(notebook_path)
+
+    assert df['Element_Type'].tolist() == [
+        'HEADER', 'SECTION_TITLE', 'SECTION_TEXT', 'Q_TITLE', 'Q_CONTENT', 'CODE', 'Q_TITLE', 'Q_CONTENT',
+        'SUB_Q_TITLE', 'CODE', 'SUB_Q_TITLE', 'IMAGE', 'HINT_CONTENT', 'EXPLANATION', 'MARKDOWN', 'STOP_CELL',
+        'SECTION_TITLE', 'CODE', 'STOP_CELL']
+    assert df.loc[6, ['Serial_Number', 'Raw_Content']].tolist() == ["2", "ממוצע"]
+    assert df.loc[9, 'Raw_Content'] == "df = pd.read_csv('data.csv')\ndf.mean()"
+    assert df.loc[5, 'Raw_Content'] == ""
+
+
+def test_iter_notebook_cells_small_blocks(sample_csv, tmp_path):
+    notebook_path = str(tmp_path / "week.ipynb")
+    generate_notebook(sample_csv, notebook_path)
+    assert list(iter_notebook_cells(notebook_path, block_size=16)) == list(iter_notebook_cells(notebook_path))
+
+
+def test_cli_mirrors_subdirectories(sample_csv, tmp_path):
+    notebooks_dir, cells_dir = tmp_path / "old_notebooks", tmp_path / "extracted_cells"
+    (notebooks_dir / "week_1" / ".ipynb_checkpoints").mkdir(parents=True)
+    generate_notebook(sample_csv, str(notebooks_dir / "intro.ipynb"))
+    generate_notebook(sample_csv, str(notebooks_dir / "week_1" / "home_assignment.ipynb"))
+    generate_notebook(sample_csv, str(notebooks_dir / "week_1" / ".ipynb_checkpoints" / "home_assignment.ipynb"))
+
+    assert notebook_extraction.main(["--notebooks-dir", str(notebooks_dir), "--output-dir", str(cells_dir),
+                                     "--workers", "1"]) == 0
+    extracted = sorted(os.path.relpath(os.path.join(root, name), cells_dir)
+                       for root, _, names in os.walk(cells_dir) for name in names)
+    assert extracted == ["intro_cells.csv", os.path.join("week_1", "home_assignment_cells.csv")]
+
+    # build_course finds the same tree and writes the notebooks back to the same relative paths.
+    assert [os.path.relpath(output_notebook, tmp_path / "new_notebooks")
+            for _, output_notebook in find_cells_files(str(cells_dir), str(tmp_path / "new_notebooks"))] == \
+        ["intro.ipynb", os.path.join("week_1", "home_assignment.ipynb")]
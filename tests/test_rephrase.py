@@ -0,0 +1,111 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+import rephrase
+from rephrase import ORIGINAL_COLUMN, REPHRASED_COLUMN, RephraseCache, rephrase_sheet
+
+
+class StubBackend:
+    name = "stub"
+
+    def __init__(self):
+        self.sent = []
+
+    async def rephrase(self, text, prompt, executor=None):
+        self.sent.append(text)
+        return f"rephrased {text}"
+
+
+def _row(element_type, raw_content, cell_type='text', serial_number=None):
+    return {'Element_Type': element_type, 'Serial_Number': serial_number, 'Raw_Content': raw_content,
+            'Cell_Type': cell_type, 'Header_Level': None, 'Anchor_ID': None}
+
+
+def test_second_run_keeps_added_and_edited_rows(tmp_path):
+    sheet = tmp_path / "week_cells.csv"
+    pd.DataFrame([_row('Q_TITLE', "title", serial_number=1), _row('Q_CONTENT', "body"),
+                  _row('HINT_CONTENT', "hint"), _row('CODE', "x = 1", 'code')]).to_csv(sheet, index=False)
+    cache = RephraseCache(str(tmp_path / "cache"))
+
+    assert rephrase_sheet(str(sheet), backend=StubBackend(), cache=cache) == 0
+    df = pd.read_csv(sheet)
+    assert df['Raw_Content'].tolist() == ["title", "rephrased body", "rephrased hint", "x = 1"]
+    assert df[ORIGINAL_COLUMN].tolist() == ["title", "body", "hint", "x = 1"]
+
+    # The author fixes a rephrasing by hand, rewrites a source text and adds new rows.
+    df.loc[1, 'Raw_Content'] = "hand edit"
+    df.loc[2, ORIGINAL_COLUMN] = "new hint"
+    added = pd.DataFrame([_row('Q_TITLE', "new title", serial_number=2), _row('Q_CONTENT', "new body")])
+    pd.concat([df, added], ignore_index=True).to_csv(sheet, index=False)
+
+    backend = StubBackend()
+    assert rephrase_sheet(str(sheet), backend=backend, cache=cache) == 0
+    df = pd.read_csv(sheet)
+    assert sorted(backend.sent) == ["new body", "new hint"]
+    assert df['Raw_Content'].tolist() == ["title", "hand edit", "rephrased new hint", "x = 1",
+                                          "new title", "rephrased new body"]
+    assert df[ORIGINAL_COLUMN].tolist() == ["title", "body", "new hint", "x = 1", "new title", "new body"]
+    assert df[REPHRASED_COLUMN].notna().tolist() == [False, True, True, False, False, True]
+    cache.close()
+
+
+class _ChatCompletionsStub(BaseHTTPRequestHandler):
+    """
+    Answers the first request with a 429 and every later one with a chat-completions payload.
+    """
+    requests = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append((self.path, body))
+        if len(type(self).requests) == 1:
+            self.send_response(429)
+            # An HTTP-date in the past: retry right away.
+            self.send_header("Retry-After", "Wed, 21 Oct 2015 07:28:00 GMT")
+            self.end_headers()
+            return
+        text = body["messages"][1]["content"]
+        payload = json.dumps({"choices": [{"message": {"role": "assistant", "content": f"stub\n{text}"}}]})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(payload.encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _ChatCompletionsStub.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionsStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1", _ChatCompletionsStub.requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_cli_against_local_stub_server(stub_server, tmp_path, monkeypatch):
+    base_url, requests = stub_server
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    sheet = tmp_path / "week_cells.csv"
+    pd.DataFrame([_row('Q_TITLE', "title", serial_number=1), _row('Q_CONTENT', "body")]).to_csv(sheet, index=False)
+
+    assert rephrase.main([str(sheet), "--base-url", base_url, "--model", "stub-model",
+                          "--cache-dir", str(tmp_path / "cache")]) == 0
+    df = pd.read_csv(sheet)
+    assert df['Raw_Content'].tolist() == ["title", "stub<br>body"]
+
+    # The 429 was retried with the same request.
+    assert len(requests) == 2
+    assert requests[0] == requests[1]
+    path, body = requests[1]
+    assert path == "/v1/chat/completions"
+    assert body["model"] == "stub-model"
+    assert body["messages"] == [{"role": "system", "content": rephrase.SYSTEM_INSTRUCTION},
+                                {"role": "user", "content": "body"}]
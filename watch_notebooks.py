@@ -0,0 +1,171 @@
+import argparse
+import io
+import os
+import queue
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from build_course import CELLS_DIR, CELLS_SUFFIX, NOTEBOOKS_DIR, iter_cells_files, mirrored_notebook_path
+from notebook_assets import ASSET_MODES, DEFAULT_ASSET_BASE_URL, DEFAULT_ASSET_MODE
+from notebook_cache import CACHE_DIR, NotebookCache
+from notebook_creation import REQUIRED_COLUMNS, StageTimings, generate_notebook
+
+POLL_INTERVAL = 0.1
+DEBOUNCE_SECONDS = 0.25
+
+
+def scan_cells_files(cells_dir):
+    """
+    :return: Dict of every cells file under cells_dir (see build_course.iter_cells_files) to its (mtime_ns, size).
+    """
+    files = {}
+    for path in iter_cells_files(cells_dir):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def warm_up():
+    """
+    Reads an empty workbook once, so the first saved sheet does not pay for importing openpyxl
+    and pandas' Excel reader.
+    """
+    workbook = io.BytesIO()
+    pd.DataFrame(columns=REQUIRED_COLUMNS).to_excel(workbook, index=False)
+    workbook.seek(0)
+    pd.read_excel(workbook)
+
+
+class NotebookWatcher:
+    """
+    Keeps pandas/openpyxl imported (see warm_up) and regenerates the notebook of every cells sheet that is saved.
+    Changes are debounced: a sheet is rebuilt once it has stopped changing for debounce seconds,
+    and a sheet saved again while it is queued is only rebuilt once.
+    """
+
+    def __init__(self, cells_dir=CELLS_DIR, output_dir=NOTEBOOKS_DIR, cache_dir=CACHE_DIR,
+                 assets=DEFAULT_ASSET_MODE, asset_base_url=DEFAULT_ASSET_BASE_URL,
+                 poll_interval=POLL_INTERVAL, debounce=DEBOUNCE_SECONDS):
+        self.cells_dir = cells_dir
+        self.output_dir = output_dir
+        self.cache_dir = cache_dir
+        self.assets = assets
+        self.asset_base_url = asset_base_url
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._queue = queue.Queue()
+        self._queued = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def output_path_for(self, input_file):
+        """
+        extracted_cells/<dir>/<name>_cells.xlsx -> new_notebooks/<dir>/<name>.ipynb
+        """
+        return mirrored_notebook_path(input_file, self.cells_dir, self.output_dir)
+
+    def _enqueue(self, input_file, saved_at=None):
+        with self._lock:
+            if input_file in self._queued:
+                return
+            self._queued.add(input_file)
+        self._queue.put((input_file, saved_at))
+
+    def _work(self):
+        # SQLite connections stay in the thread that opened them.
+        cache = NotebookCache(self.cache_dir) if self.cache_dir else None
+        while not self._stop.is_set():
+            try:
+                input_file, saved_at = self._queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+            with self._lock:
+                self._queued.discard(input_file)
+
+            output_notebook = self.output_path_for(input_file)
+            timings = StageTimings()
+            start = time.perf_counter()
+            try:
+                os.makedirs(os.path.dirname(output_notebook) or ".", exist_ok=True)
+                generate_notebook(input_file, output_notebook, cache=cache, assets=self.assets,
+                                  asset_base_url=self.asset_base_url, timings=timings)
+            except Exception as e:
+                print(f"[FAIL] {input_file}: {type(e).__name__}: {e}")
+                continue
+            finally:
+                self._queue.task_done()
+            generated = time.perf_counter() - start
+            # Initial builds have no save to measure from.
+            latency = f", {(time.time() - saved_at) * 1000:.0f} ms after save" if saved_at is not None else ""
+            print(f"[OK  ] {input_file} -> {output_notebook}: generated in {generated * 1000:.0f} ms{latency}")
+        if cache is not None:
+            cache.close()
+
+    def run(self, initial_build=True):
+        """
+        Watches cells_dir until stop() is called or the process is interrupted.
+        :param initial_build: Bring every notebook up to date on start (unchanged ones are skipped by the cache).
+        """
+        warm_up()
+        worker = threading.Thread(target=self._work, daemon=True)
+        worker.start()
+
+        known = scan_cells_files(self.cells_dir)
+        if initial_build:
+            for input_file in sorted(known):
+                self._enqueue(input_file)
+        print(f"Watching {self.cells_dir} for changes to *{CELLS_SUFFIX}.xlsx / *{CELLS_SUFFIX}.csv")
+
+        changed = {}
+        try:
+            while not self._stop.is_set():
+                time.sleep(self.poll_interval)
+                now = time.time()
+                current = scan_cells_files(self.cells_dir)
+                for input_file, signature in current.items():
+                    if known.get(input_file) != signature:
+                        changed[input_file] = now
+                known = current
+                for input_file, changed_at in list(changed.items()):
+                    if input_file not in current:
+                        del changed[input_file]
+                    elif now - changed_at >= self.debounce:
+                        del changed[input_file]
+                        self._enqueue(input_file, current[input_file][0] / 1e9)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._stop.set()
+            worker.join()
+
+    def stop(self):
+        self._stop.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate notebooks whenever their cells sheet is saved.")
+    parser.add_argument("--cells-dir", default=CELLS_DIR, help="Directory tree with *_cells.xlsx / *_cells.csv files.")
+    parser.add_argument("--output-dir", default=NOTEBOOKS_DIR, help="Directory for the generated notebooks.")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Directory of the incremental build cache.")
+    parser.add_argument("--no-cache", action="store_true", help="Always regenerate the whole notebook.")
+    parser.add_argument("--assets", choices=ASSET_MODES, default=DEFAULT_ASSET_MODE)
+    parser.add_argument("--asset-base-url", default=DEFAULT_ASSET_BASE_URL)
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE_SECONDS,
+                        help="Seconds a sheet must stay unchanged before it is rebuilt.")
+    parser.add_argument("--skip-initial", action="store_true", help="Only rebuild sheets saved after start.")
+    args = parser.parse_args(argv)
+
+    watcher = NotebookWatcher(args.cells_dir, args.output_dir, None if args.no_cache else args.cache_dir,
+                              args.assets, args.asset_base_url, debounce=args.debounce)
+    watcher.run(initial_build=not args.skip_initial)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())